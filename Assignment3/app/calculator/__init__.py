@@ -5,6 +5,14 @@ from app.operations import Operations
 class Calculator:
     """A command-line calculator with a REPL interface."""
 
+    # Operation name -> function, looked up once per line instead of an if/elif chain
+    OPERATIONS = {
+        "add": Operations.addition,
+        "subtract": Operations.subtraction,
+        "multiply": Operations.multiplication,
+        "divide": Operations.division,
+    }
+
     def run(self):
         print("Welcome to the calculator REPL! Type 'exit' to quit")
 
@@ -24,21 +32,15 @@ class Calculator:
 
                 continue
 
-            if operation == "add":
-                result = Operations.addition(num1, num2)
-            elif operation == "subtract":
-                result = Operations.subtraction(num1, num2)
-            elif operation == "multiply":
-                result = Operations.multiplication(num1, num2)
-            elif operation == "divide":
-                try:
-                    result = Operations.division(num1, num2)
-                except ValueError as e:
-                    print(e)
-                    continue
-            else:
+            function = self.OPERATIONS.get(operation)
+            if function is None:
                 print(f"Unknown operation '{operation}'. Supported: add, subtract, multiply, divide.")
                 continue
+            try:
+                result = function(num1, num2)
+            except ValueError as e:  # division by zero
+                print(e)
+                continue
 
             print(f"Result: {result}")
 
@@ -0,0 +1,313 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Date: 10/18/2026
+# Project: Assignment 4 - Professional Calculator CLI
+# ----------------------------------------------------------
+
+"""
+Streaming aggregates over calculation results.
+
+An Aggregator summarizes any number of results without storing them. Each
+add() costs O(1) amortized (results are folded in by blocks of BUFFER_SIZE)
+and keeps:
+
+- exact statistics: count, min, max, and mean/variance with Welford's
+  algorithm (merged by blocks), which stays accurate where sum-of-squares
+  formulas cancel out
+- result counts grouped by operation
+- QuantileSketch, a KLL-style sketch giving approximate p50/p99 from a few
+  hundred retained values
+- HyperLogLog, an approximate count of distinct results in 4 KiB
+
+Memory is bounded whatever the number of results. Batch runs feed one with
+`--aggregate` (see BatchSummary.results), and the REPL feeds one per session,
+shown by the `aggregate` command.
+"""
+
+import math
+import operator
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from app import numeric
+
+DEFAULT_K = 200  # quantile sketch size: about 600 values kept, rank error around 1%
+HLL_PRECISION = 12  # 2**12 one-byte registers, about 1.6% standard error
+BUFFER_SIZE = 256  # results an Aggregator collects before updating its statistics
+
+_MASK64 = (1 << 64) - 1
+
+
+# -------------------------------
+# Quantile Sketch (KLL)
+# -------------------------------
+class QuantileSketch:
+    """
+    Approximate quantiles in bounded memory, after Karnin, Lang and Liberty (KLL).
+
+    Values are kept in levels; each value at level h stands for 2**h inputs.
+    When a level fills up it is sorted and every other value moves up a level,
+    so the sketch holds O(k) values however many are added. Lower levels get
+    smaller capacities (a factor 2/3 each), which is what keeps it small, and
+    compaction waits until the sketch as a whole is full (the "lazy" variant),
+    so most adds are a single list append.
+    """
+
+    __slots__ = ("k", "count", "levels", "_size", "_max_size", "_offset", "_capacities")
+
+    def __init__(self, k: int = DEFAULT_K) -> None:
+        if k < 8:
+            raise ValueError("Quantile sketch size k must be at least 8.")
+        self.k = k
+        self.count = 0
+        self.levels: List[List[float]] = [[]]
+        self._size = 0  # values retained over all levels
+        self._max_size = k  # sum of the level capacities: compaction starts beyond it
+        self._offset = 0  # alternates which half of a level survives, so neither end is favoured
+        self._capacities = [k]  # per level; they only change when a level is added
+
+    def add(self, value: float) -> None:
+        """Add one value."""
+        self.count += 1
+        self.levels[0].append(value)
+        self._size += 1
+        if self._size >= self._max_size:
+            self._compress()
+
+    def update(self, values: Sequence[float]) -> None:
+        """Add several values at once."""
+        self.count += len(values)
+        self.levels[0].extend(values)
+        self._size += len(values)
+        while self._size >= self._max_size:
+            self._compress()
+
+    def _compress(self) -> None:
+        """Compact the lowest full level into the one above it (one level per call: lazy KLL)."""
+        # The sketch is over its total capacity, so at least one level is full
+        level = next(h for h, (items, capacity) in enumerate(zip(self.levels, self._capacities))
+                     if len(items) >= capacity)
+        if level + 1 == len(self.levels):
+            self.levels.append([])
+            depth = len(self.levels)
+            self._capacities = [max(2, int(self.k * (2 / 3) ** (depth - h - 1)))
+                                for h in range(depth)]
+            self._max_size = sum(self._capacities)
+        items = self.levels[level]
+        items.sort()
+        kept = [items.pop()] if len(items) % 2 else []  # an odd one out waits for the next round
+        self._offset ^= 1
+        self.levels[level + 1].extend(items[self._offset::2])
+        self._size -= len(items) // 2
+        items[:] = kept
+
+    def __len__(self) -> int:
+        """Number of values retained (not added)."""
+        return sum(map(len, self.levels))
+
+    def quantile(self, fraction: float) -> Optional[float]:
+        """Return an approximate value below which `fraction` of the values lie (None if empty)."""
+        if not self.count:
+            return None
+        weighted = sorted((value, 1 << level)
+                          for level, items in enumerate(self.levels) for value in items)
+        target = fraction * self.count
+        seen = 0
+        for value, weight in weighted:
+            seen += weight
+            if seen >= target:
+                return value
+        return weighted[-1][0]
+
+
+# -------------------------------
+# Distinct Count (HyperLogLog)
+# -------------------------------
+class HyperLogLog:
+    """
+    Approximate number of distinct values, after Flajolet et al.
+
+    Each value is hashed to 64 bits; the first `precision` bits pick a register
+    and the register keeps the longest run of leading zeros seen in the rest.
+    Equal numbers of different types (2, 2.0, Fraction(2)) hash alike, so they
+    count once.
+    """
+
+    __slots__ = ("precision", "registers", "_shift", "_low")
+
+    def __init__(self, precision: int = HLL_PRECISION) -> None:
+        if not 4 <= precision <= 16:
+            raise ValueError("HyperLogLog precision must be between 4 and 16.")
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+        self._shift = 64 - precision  # hash bits left after the register index
+        self._low = (1 << self._shift) - 1
+
+    def add(self, value: object) -> None:
+        """Add one (hashable) value."""
+        self.update((value,))
+
+    def update(self, values: Iterable[object]) -> None:
+        """Add several values at once."""
+        registers, shift, low = self.registers, self._shift, self._low
+        # A repeated value cannot change a register: drop repeats in C before the Python loop
+        for h in map(hash, set(values)):
+            # Two multiply-xorshift rounds spread Python's numeric hashes
+            # (hash(2.0) == 2) over 64 bits
+            h = h * 0x9E3779B97F4A7C15 & _MASK64
+            h = (h ^ (h >> 32)) * 0xD6E8FEB86659FD93 & _MASK64
+            h ^= h >> 32
+            index = h >> shift
+            rank = shift + 1 - (h & low).bit_length()
+            if rank > registers[index]:
+                registers[index] = rank
+
+    def estimate(self) -> int:
+        """Return the estimated number of distinct values added."""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / math.fsum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if raw <= 2.5 * m and zeros:
+            # Linear counting is more accurate for small counts
+            return round(m * math.log(m / zeros))
+        return round(raw)
+
+
+# -------------------------------
+# Aggregator
+# -------------------------------
+class Aggregator:
+    """
+    Exact running statistics plus approximate quantiles and distinct count of results.
+
+    add() only appends to a small buffer; every BUFFER_SIZE results (and before
+    anything is read) the buffer is folded into the statistics in one pass,
+    where min(), max(), sum() and the sketches' bulk updates do most of the
+    work in C. Mean and variance are merged per block with Chan's update, the
+    blockwise form of Welford's algorithm.
+    """
+
+    __slots__ = ("_count", "_mean", "_m2", "_min", "_max", "_operations", "_pending",
+                 "_pending_ops", "_quantiles", "_distinct")
+
+    def __init__(self, k: int = DEFAULT_K, precision: int = HLL_PRECISION) -> None:
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0  # sum of squared differences from the mean
+        self._min = math.inf
+        self._max = -math.inf
+        self._operations: "Counter[str]" = Counter()
+        self._pending: List[object] = []  # results not folded in yet
+        self._pending_ops: List[str] = []
+        self._quantiles = QuantileSketch(k)
+        self._distinct = HyperLogLog(precision)
+
+    def add(self, operation: str, result: object) -> None:
+        """
+        Add one result.
+
+        Args:
+            operation (str): group for the per-operation counts, e.g. "add"
+            result: the number; exact types are summarized as floats
+        """
+        self._pending.append(result)
+        self._pending_ops.append(operation)
+        if len(self._pending) >= BUFFER_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        """Fold the buffered results into the statistics."""
+        if not self._pending:
+            return
+        try:
+            values = list(map(float, self._pending))
+        except OverflowError:  # an exact result beyond float range
+            values = [numeric.to_float(result) for result in self._pending]
+        self._operations.update(self._pending_ops)
+        self._pending.clear()
+        self._pending_ops.clear()
+
+        count = len(values)
+        try:
+            mean = math.fsum(values) / count
+        except (OverflowError, ValueError):  # a sum beyond float range, or inf - inf
+            mean = sum(values) / count
+        deviations = [value - mean for value in values]
+        # Products saturate to inf where ** 2 would raise
+        m2 = sum(map(operator.mul, deviations, deviations))
+        total = self._count + count
+        delta = mean - self._mean
+        self._mean += delta * count / total
+        if self._count:  # inf * 0 would make the first block's m2 nan
+            m2 += delta * delta * self._count * count / total
+        self._m2 += m2
+        self._count = total
+        self._min = min(self._min, min(values))
+        self._max = max(self._max, max(values))
+        self._quantiles.update(values)
+        self._distinct.update(values)
+
+    # -------------------------------
+    # Results
+    # -------------------------------
+    @property
+    def count(self) -> int:
+        self.flush()
+        return self._count
+
+    @property
+    def mean(self) -> float:
+        self.flush()
+        return self._mean
+
+    @property
+    def min(self) -> float:
+        self.flush()
+        return self._min
+
+    @property
+    def max(self) -> float:
+        self.flush()
+        return self._max
+
+    @property
+    def operations(self) -> Dict[str, int]:
+        """Number of results per operation."""
+        self.flush()
+        return dict(self._operations)
+
+    @property
+    def quantiles(self) -> QuantileSketch:
+        self.flush()
+        return self._quantiles
+
+    @property
+    def distinct(self) -> HyperLogLog:
+        self.flush()
+        return self._distinct
+
+    @property
+    def variance(self) -> float:
+        """Sample variance of the results (0.0 for fewer than two)."""
+        self.flush()
+        return self._m2 / (self._count - 1) if self._count > 1 else 0.0
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+    def render(self) -> str:
+        """Return a human-readable summary, as shown by `aggregate` and batch summaries."""
+        if not self.count:
+            return "No results yet."
+        by_operation = ", ".join(f"{name} {count}"
+                                 for name, count in sorted(self.operations.items()))
+        return "\n".join([
+            f"Results: {self.count} (min {self.min:g}, max {self.max:g}, "
+            f"mean {self.mean:g}, std dev {self.stdev:g})",
+            f"Quantiles (approx.): p50 {self.quantiles.quantile(0.5):g}, "
+            f"p99 {self.quantiles.quantile(0.99):g}",
+            f"Distinct results (approx.): {self.distinct.estimate()}",
+            f"By operation: {by_operation}",
+        ])
@@ -0,0 +1,167 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Date: 10/18/2026
+# Project: Assignment 4 - Professional Calculator CLI
+# ----------------------------------------------------------
+
+"""
+Batch (non-interactive) mode for the Professional Calculator.
+
+The REPL is built for a person at a terminal: it prints a prompt, flushes
+after every line and loads readline. When thousands of calculations are
+piped in, that work dominates the run time. This module evaluates the same
+`<operation> <num1> <num2>` lines in bulk instead:
+
+- Input is consumed from any iterable of lines (a file or stdin).
+- Each line is evaluated through CalculationFactory.try_evaluate, which
+  reports invalid lines (e.g. division by zero) with a status code rather
+  than an exception, so failing lines cost no more than good ones.
+- Output is collected and written in large chunks through one writer.
+- A BatchSummary records how many lines succeeded or failed and, on request,
+  summary statistics of the results (see app.aggregates).
+
+Blank lines and lines starting with '#' are skipped, so scripts can carry comments.
+
+The grammar is deliberately narrower than the REPL's: exactly one
+`<operation> <num1> <num2>` per line, with float operands. There are no
+`;`-separated statements, infix expressions, variables, vectors or n-ary
+operations, and no numeric backend other than float. That keeps each line
+to one split, two float() calls and one dispatch, and it is the format the
+parallel runner (app.parallel) packs into shared memory. Use the REPL (or
+pipe a script into it) for the full grammar.
+"""
+
+from typing import TYPE_CHECKING, Iterable, List, Optional, TextIO
+from app.calculation import STATUS_DIVISION_BY_ZERO, STATUS_OK, CalculationFactory
+
+if TYPE_CHECKING:  # pragma: no cover
+    from app.aggregates import Aggregator
+
+# Number of output lines collected before they are written in one call.
+FLUSH_EVERY = 4096
+
+
+# -------------------------------
+# Batch Summary
+# -------------------------------
+class BatchSummary:
+    """
+    Counts collected while running a batch.
+
+    A plain class rather than a dataclass: importing `dataclasses` (and the
+    `inspect` module it loads) would take longer than a whole small batch run.
+    """
+
+    COUNTS = ("processed", "succeeded", "format_errors", "operation_errors", "division_errors")
+    __slots__ = COUNTS + ("results",)
+
+    def __init__(self, processed: int = 0, succeeded: int = 0, format_errors: int = 0,
+                 operation_errors: int = 0, division_errors: int = 0,
+                 results: Optional["Aggregator"] = None) -> None:
+        self.processed = processed
+        self.succeeded = succeeded
+        self.format_errors = format_errors
+        self.operation_errors = operation_errors
+        self.division_errors = division_errors
+        self.results = results  # statistics of the successful results, when requested
+
+    def _counts(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.COUNTS)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BatchSummary):
+            return NotImplemented
+        return self._counts() == other._counts()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)}" for name in self.COUNTS)
+        return f"BatchSummary({fields})"
+
+    @property
+    def errors(self) -> int:
+        """Total number of lines that failed."""
+        return self.format_errors + self.operation_errors + self.division_errors
+
+    @property
+    def exit_status(self) -> int:
+        """Process exit status: 0 when every line succeeded, 1 otherwise."""
+        return 1 if self.errors else 0
+
+    def __str__(self) -> str:
+        text = (
+            f"Processed {self.processed} calculations: {self.succeeded} succeeded, "
+            f"{self.errors} failed (format: {self.format_errors}, "
+            f"operation: {self.operation_errors}, division by zero: {self.division_errors})"
+        )
+        if self.results is not None:
+            text += "\n" + self.results.render()
+        return text
+
+
+def new_summary(aggregate: bool = False) -> BatchSummary:
+    """Return an empty BatchSummary, with an Aggregator for the results when asked."""
+    if not aggregate:
+        return BatchSummary()
+    from app.aggregates import Aggregator  # deferred: plain batch runs never need it
+
+    return BatchSummary(results=Aggregator())
+
+
+# -------------------------------
+# Batch Runner
+# -------------------------------
+def run_batch(lines: Iterable[str], out: TextIO, flush_every: int = FLUSH_EVERY,
+              aggregate: bool = False) -> BatchSummary:
+    """
+    Evaluate every calculation line and write one output line per calculation.
+
+    Args:
+        lines (Iterable[str]): input lines, e.g. an open file or sys.stdin
+        out (TextIO): destination for results and per-line error messages
+        flush_every (int): number of output lines buffered before each write
+        aggregate (bool): also collect result statistics in summary.results
+
+    Returns:
+        BatchSummary: counts of processed, successful and failed lines
+    """
+    summary = new_summary(aggregate)
+    add_result = summary.results.add if aggregate else None
+    buffer: List[str] = []
+    evaluate = CalculationFactory.try_evaluate
+
+    for line_no, raw_line in enumerate(lines, start=1):
+        line = raw_line.strip()
+        if not line or line.startswith("#"):  # LBYL: skip blanks and comments
+            continue
+        summary.processed += 1
+
+        try:
+            operation, num1_str, num2_str = line.split()
+            num1, num2 = float(num1_str), float(num2_str)
+        except ValueError:
+            summary.format_errors += 1
+            buffer.append(f"Error (line {line_no}): Invalid format. "
+                          "Use: <operation> <num1> <num2>\n")
+        else:
+            # A status code: failing lines raise nothing
+            result, status = evaluate(operation, num1, num2)
+            if status == STATUS_OK:
+                summary.succeeded += 1
+                buffer.append(f"{result}\n")
+                if add_result is not None:
+                    add_result(operation.lower(), result)
+            elif status == STATUS_DIVISION_BY_ZERO:
+                summary.division_errors += 1
+                buffer.append(f"Error (line {line_no}): Division by zero is not allowed.\n")
+            else:
+                summary.operation_errors += 1
+                message = CalculationFactory.status_message(status, operation)
+                buffer.append(f"Error (line {line_no}): {message}\n")
+
+        if len(buffer) >= flush_every:
+            out.write("".join(buffer))
+            buffer.clear()
+
+    if buffer:
+        out.write("".join(buffer))
+    return summary
@@ -11,18 +11,180 @@ Calculation module for the Professional Calculator.
 This module defines:
 1. An abstract Calculation class (blueprint for all operations).
 2. A CalculationFactory (responsible for creating calculation objects).
-3. Concrete calculation classes (Add, Subtract, Multiply, Divide).
+3. Concrete calculation classes (Add, Subtract, Multiply, Divide, Min, Max, Mean).
 
 Key OOP Concepts Demonstrated:
 - Abstraction: Using an abstract base class to define a contract.
 - Encapsulation: Each calculation keeps its own numbers (`a`, `b`).
 - Inheritance: All operations inherit from the Calculation base class.
 - Polymorphism: All operations share the same interface (`execute`) but behave differently.
+
+Each concrete class may also name a `kernel` (a binary function from the
+`operator` module) so that CalculationFactory.execute_batch can apply the
+operation to whole columns of operands in one vectorized pass, and a
+`reduction` (see app.reductions) that CalculationFactory.reduce applies to any
+number of operands; types without one take exactly two.
+
+Results are memoized: a Calculation runs its operation at most once and keeps
+both the result and its display string. An optional process-wide LRU cache
+(CalculationFactory.enable_result_cache) also shares results between separate
+Calculation objects with the same type and operands.
+
+Either operand may be a vector (see app.vectors): execute() then applies the
+class kernel element by element, repeating a plain number for every element,
+and returns a new vector. Vector results are memoized but never cached.
+
+Calculations are small immutable value objects: the hierarchy uses __slots__
+(no per-instance __dict__), operands are read-only, and equal calculations
+compare and hash equal. create_calculation(..., intern=True) returns one shared
+(flyweight) instance for repeated (type, a, b) requests, from a plain dict of at
+most INTERN_SIZE instances (the oldest is dropped first).
+
+Callers that only need the number can skip objects entirely:
+CalculationFactory.evaluate(calc_type, a, b) looks the name up in a precompiled
+dispatch table and calls the class kernel directly.
+
+Bulk callers that expect many invalid rows can avoid exceptions as well:
+try_evaluate() returns (result, status) pairs and try_execute_batch() a result
+column plus an error bitmap. Each class states its operand check once, as a
+`validate` function returning a STATUS_* code; these non-raising paths use it,
+execute() makes the same check (inlined for divide, the hottest path), and the
+arithmetic below it does not check again.
+
+While metrics are enabled (see app.metrics), execute() and the dispatch table
+are swapped for timed versions; nothing is timed or counted otherwise.
+
+Calculation types from other packages are found through entry points (see
+app.plugins). They are listed by available_calculations() but imported only
+when first used, and only if the built-in types do not already match.
 """
 
+import functools
+import math
+import operator
 from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+from app import metrics, numeric, reductions
 from app.operations import Operations
 
+# Marks "no value yet", since None could in principle be a result
+_UNSET = object()
+
+INTERN_SIZE = 1024  # instances kept by create_calculation(..., intern=True)
+
+# Status codes of the non-raising API (try_evaluate, try_execute_batch, app.parallel)
+STATUS_OK = 0
+STATUS_DIVISION_BY_ZERO = 1
+STATUS_ERROR = 2  # any other arithmetic failure, e.g. an exact result beyond float range
+STATUS_UNSUPPORTED_OPERATION = 3
+
+STATUS_MESSAGES = {
+    STATUS_DIVISION_BY_ZERO: "Division by zero is not allowed.",
+    STATUS_ERROR: "Calculation failed.",
+}
+
+
+# -------------------------------
+# Result Cache (process-wide LRU)
+# -------------------------------
+class ResultCache:
+    """Least-recently-used cache of calculation results, keyed by calc_type and typed operands."""
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize (int): maximum number of results kept before evicting the oldest
+        """
+        if maxsize <= 0:
+            raise ValueError("Cache size must be a positive integer.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached result for `key`, or _UNSET on a miss."""
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return _UNSET
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a result, evicting the least recently used one when full."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every cached result and reset the counters."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> Dict[str, int]:
+        """Return the cache counters as a dictionary."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _memoize_execute(execute: Callable[["Calculation"], float]) -> Callable[["Calculation"], float]:
+    """Wrap a concrete execute() so the operation runs at most once per object."""
+
+    @functools.wraps(execute)
+    def wrapper(self: "Calculation") -> float:
+        result = self._result
+        if result is not _UNSET:
+            return result
+
+        a, b = self._a, self._b
+        cache = CalculationFactory.result_cache
+        if type(a) is memoryview or type(b) is memoryview:
+            # Vectors are not hashable: never shared through the cache
+            result = _execute_elementwise(self)
+        elif cache is None or self.calc_type is None:
+            result = execute(self)
+        else:
+            # Typed: 1.0 == Fraction(1) but gives a float result
+            key = (self.calc_type, type(a), a, type(b), b)
+            result = cache.get(key)
+            if result is _UNSET:
+                result = execute(self)
+                cache.put(key, result)
+
+        self._result = result
+        return result
+
+    return wrapper
+
+
+def _execute_elementwise(calculation: "Calculation") -> Any:
+    """Run a calculation with a vector operand element by element (see app.vectors)."""
+    from app.vectors import elementwise  # deferred: only sessions that use vectors
+
+    calc_class = type(calculation)
+    kernel = calc_class.kernel
+    if kernel is None:
+        kernel = lambda x, y: calc_class(x, y).execute()  # noqa: E731
+    return elementwise(kernel, calculation.a, calculation.b)
+
 
 # -------------------------------
 # Abstract Base Class: Calculation
@@ -30,6 +192,28 @@ from app.operations import Operations
 class Calculation(ABC):
     """Blueprint for all calculations (add, subtract, multiply, divide)."""
 
+    __slots__ = ("_a", "_b", "_result", "_text")
+
+    # Element-wise function used by batch execution (None → per-object fallback)
+    kernel: Optional[Callable[[float, float], float]] = None
+
+    # N-ary form used by CalculationFactory.reduce (None → exactly two operands)
+    reduction: Optional[Callable[[Iterable[Any]], Any]] = None
+
+    # Operand check returning a STATUS_* code (None → every pair of numbers is valid)
+    validate: Optional[Callable[[Any, Any], int]] = None
+
+    # Registered type name, set by CalculationFactory.register_calculation
+    calc_type: Optional[str] = None
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Memoize every concrete execute() defined by a subclass."""
+        super().__init_subclass__(**kwargs)
+        execute = cls.__dict__.get("execute")
+        if execute is not None and not getattr(execute, "__isabstractmethod__", False):
+            cls._raw_execute = execute  # kept for metrics, which re-wrap it (see _instrument)
+            cls.execute = _memoize_execute(execute)
+
     def __init__(self, a: float, b: float) -> None:
         """
         Initialize with two numbers.
@@ -38,8 +222,11 @@ class Calculation(ABC):
             a (float): First number
             b (float): Second number
         """
-        self.a = a
-        self.b = b
+        self._a = a
+        self._b = b
+        self._result = _UNSET  # filled in by the first successful execute()
+        # _text (the __str__ output) is only set when first asked for:
+        # most objects are never printed
 
     @abstractmethod
     def execute(self) -> float:
@@ -51,11 +238,38 @@ class Calculation(ABC):
         """
         pass  # pragma: no cover  # abstract method intentionally not executed
 
+    @property
+    def a(self) -> float:
+        """First number (read-only)."""
+        return self._a
+
+    @property
+    def b(self) -> float:
+        """Second number (read-only)."""
+        return self._b
+
+    def __eq__(self, other: object) -> bool:
+        """Calculations are equal when they have the same type and operands."""
+        if not isinstance(other, Calculation):
+            return NotImplemented
+        return type(self) is type(other) and self._a == other._a and self._b == other._b
+
+    def __hash__(self) -> int:
+        return hash((type(self), self._a, self._b))
+
     def __str__(self) -> str:
-        """Return a user-friendly string of the calculation result."""
-        result = self.execute()
-        operation_name = self.__class__.__name__.replace("Calculation", "")
-        return f"{self.a} {operation_name} {self.b} = {result}"
+        """Return a user-friendly string of the calculation result (built once)."""
+        try:
+            return self._text
+        except AttributeError:
+            result = self.execute()
+            self._text = f"{self.a} {self.operation_name()} {self.b} = {result}"
+            return self._text
+
+    @classmethod
+    def operation_name(cls) -> str:
+        """Return the display name of the operation, e.g. "Add"."""
+        return cls.__name__.replace("Calculation", "")
 
     def __repr__(self) -> str:
         """Return a technical string for debugging."""
@@ -70,29 +284,396 @@ class CalculationFactory:
 
     _calculations = {}
 
+    # Flyweight pool used by create_calculation(..., intern=True): (name, type(a), a, type(b), b)
+    # → instance, at most INTERN_SIZE entries in insertion order
+    _interned: Dict[tuple, "Calculation"] = {}
+
+    # Process-wide LRU of results; None means caching across objects is off
+    result_cache: Optional[ResultCache] = None
+
+    # Precompiled dispatch for evaluate(): every accepted spelling of a type name
+    # ("add", "ADD", "Add") → a binary function, plus its display name
+    _dispatch: Dict[str, Callable[[Any, Any], Any]] = {}
+    _display_names: Dict[str, str] = {}
+    # The same spellings → (function, validate, class), for try_evaluate()
+    _checked: Dict[str, Tuple[Callable[[Any, Any], Any], Optional[Callable[[Any, Any], int]],
+                              type]] = {}
+
+    # Plugin types not imported yet: name → "module:Class"; the manifest is read on first need
+    _plugins: Dict[str, str] = {}
+    _plugins_discovered = False  # set by add_plugins(), so a given manifest is not overridden
+
     @classmethod
     def register_calculation(cls, calc_type: str):
         """Decorator to register calculation classes in the factory."""
 
         def decorator(subclass):
-            if calc_type.lower() in cls._calculations:
+            name = calc_type.lower()
+            pending = cls._plugins.get(name)
+            # A plugin may register itself when it is loaded, but nothing else may take its name
+            if name in cls._calculations or pending not in (None, _target(subclass)):
                 raise ValueError(f"Calculation type '{calc_type}' is already registered.")
-            cls._calculations[calc_type.lower()] = subclass
+            if pending is not None:
+                del cls._plugins[name]
+            cls._calculations[name] = subclass
+            subclass.calc_type = name
+            if metrics.enabled:
+                _instrument(subclass)
+            cls._add_dispatch(subclass)
             return subclass
 
         return decorator
 
     @classmethod
-    def create_calculation(cls, calc_type: str, a: float, b: float) -> "Calculation":
-        """Create and return a Calculation object based on type."""
+    def add_plugins(cls, manifest: Dict[str, str]) -> None:
+        """
+        Make plugin calculation types available without importing them.
+
+        Args:
+            manifest (dict): type name → "module:Class", as in app.plugins.load_manifest()
+
+        Raises:
+            ValueError: when a name is already taken by a different class
+        """
+        plugins = dict(cls._plugins)  # applied only once every name is checked
+        for calc_type, target in manifest.items():
+            name = calc_type.lower()
+            registered = cls._calculations.get(name)
+            if registered is not None and _target(registered) == target:
+                continue  # the plugin was imported (and registered) already
+            if registered is not None or plugins.get(name, target) != target:
+                raise ValueError(f"Calculation type '{calc_type}' is already registered.")
+            plugins[name] = target
+        cls._plugins = plugins
+        cls._plugins_discovered = True
+
+    @classmethod
+    def _discover_plugins(cls) -> Dict[str, str]:
+        """Load the plugin manifest on first need and return the types still to import."""
+        if not cls._plugins_discovered:
+            from app.plugins import load_manifest  # deferred: built-in types never need it
+
+            cls.add_plugins(load_manifest())
+        return cls._plugins
+
+    @classmethod
+    def _load_plugin(cls, name: str) -> Optional[type]:
+        """Import the plugin providing `name` and return its registered class (None if unknown)."""
+        target = cls._discover_plugins().get(name)
+        if target is None:
+            return None
+        from app.plugins import import_target
+
+        try:
+            loaded = import_target(target)  # a decorated class registers itself here
+        except (ImportError, AttributeError) as e:
+            raise ValueError(f"Cannot load calculation type '{name}' from {target}: {e}") from None
+        if name not in cls._calculations:
+            if not (isinstance(loaded, type) and issubclass(loaded, Calculation)):
+                raise ValueError(f"Plugin {target} for '{name}' is not a Calculation class.")
+            cls.register_calculation(name)(loaded)
+        return cls._calculations[name]
+
+    @classmethod
+    def available_calculations(cls) -> List[str]:
+        """Return every calculation type name: registered ones, then plugins not loaded yet."""
+        pending = (name for name in cls._discover_plugins() if name not in cls._calculations)
+        return [*cls._calculations, *pending]
+
+    @classmethod
+    def enable_result_cache(cls, maxsize: int = 1024) -> ResultCache:
+        """Turn on the shared LRU result cache (replacing any existing one)."""
+        cls.result_cache = ResultCache(maxsize)
+        return cls.result_cache
+
+    @classmethod
+    def disable_result_cache(cls) -> None:
+        """Turn off the shared LRU result cache."""
+        cls.result_cache = None
+
+    @classmethod
+    def cache_info(cls) -> Optional[Dict[str, int]]:
+        """Return hit/miss/eviction counters, or None when the cache is off."""
+        return None if cls.result_cache is None else cls.result_cache.info()
+
+    @classmethod
+    def _add_dispatch(cls, calc_class: type) -> None:
+        """Precompute the evaluate() entries of one registered class."""
+        name = calc_class.calc_type
+        if calc_class.kernel is not None and numeric.get_backend() is numeric.FLOAT:
+            function = calc_class.kernel
+            if metrics.enabled:
+                function = metrics.timed(function, name)
+        else:  # no plain kernel, or an exact backend: go through the (timed) Calculation object
+            function = lambda a, b: calc_class(a, b).execute()  # noqa: E731
+        for spelling in (name, name.upper(), name.capitalize()):
+            cls._dispatch[spelling] = function
+            cls._display_names[spelling] = calc_class.operation_name()
+            cls._checked[spelling] = (function, calc_class.validate, calc_class)
+
+    @classmethod
+    def _rebuild_dispatch(cls) -> None:
+        """
+        Recompute every evaluate() entry (e.g. after a numeric backend switch).
+
+        Interned instances are dropped as well.
+        """
+        cls._interned.clear()  # keyed by name, so they could outlive their class
+        cls._dispatch.clear()
+        cls._display_names.clear()
+        cls._checked.clear()
+        for calc_class in cls._calculations.values():
+            cls._add_dispatch(calc_class)
+
+    @classmethod
+    def evaluate(cls, calc_type: str, a: Any, b: Any) -> Any:
+        """
+        Return the result of one calculation without creating a Calculation object.
+
+        Uses the precompiled dispatch table, so the common case is one dict lookup
+        and one operator call. Raises the same errors as create_calculation(...).execute();
+        results are not memoized or cached.
+
+        Args:
+            calc_type (str): registered calculation name, e.g. "add" (any case)
+            a: first number
+            b: second number
+        """
+        function = cls._dispatch.get(calc_type)
+        if function is None:
+            # A rare spelling
+            function = cls._dispatch[cls.get_calculation_class(calc_type).calc_type]
+        try:
+            return function(a, b)
+        except TypeError:  # operand types the plain operator cannot mix, e.g. Decimal and Fraction
+            return cls.get_calculation_class(calc_type)(a, b).execute()
+
+    @classmethod
+    def try_evaluate(cls, calc_type: str, a: Any, b: Any) -> Tuple[Any, int]:
+        """
+        Like evaluate(), but report a failure as a status code instead of raising.
+
+        The class `validate` check runs first, so invalid operands (e.g. a zero
+        divisor) and unknown types cost no exception at all.
+
+        Args:
+            calc_type (str): registered calculation name, e.g. "divide" (any case)
+            a: first number
+            b: second number
+
+        Returns:
+            (result, STATUS_OK), or (nan, status) with STATUS_DIVISION_BY_ZERO,
+            STATUS_UNSUPPORTED_OPERATION or STATUS_ERROR (see status_message)
+        """
+        entry = cls._checked.get(calc_type)
+        if entry is None:
+            calc_class = cls._find(calc_type)
+            if calc_class is None:
+                return math.nan, STATUS_UNSUPPORTED_OPERATION
+            entry = cls._checked[calc_class.calc_type]
+        function, validate, calc_class = entry
+        if validate is not None:
+            status = validate(a, b)
+            if status:
+                if metrics.enabled and status == STATUS_DIVISION_BY_ZERO:
+                    metrics.METRICS.record_error(metrics.DIVISION_BY_ZERO, calc_class.calc_type)
+                return math.nan, status
+        try:
+            try:
+                return function(a, b), STATUS_OK
+            except TypeError:  # mixed exact operand types, as in evaluate()
+                return calc_class(a, b).execute(), STATUS_OK
+        except (ArithmeticError, ValueError):
+            return math.nan, STATUS_ERROR
+
+    @classmethod
+    def status_message(cls, status: int, calc_type: str = "") -> str:
+        """Return the error message for a failure status, as the raising API would report it."""
+        if status == STATUS_UNSUPPORTED_OPERATION:
+            return cls._unsupported_message(calc_type)
+        return STATUS_MESSAGES[status]
+
+    @classmethod
+    def binary_function(cls, calc_type: str) -> Callable[[Any, Any], Any]:
+        """
+        Return the function evaluate() calls for a type, for callers that apply it many times.
+
+        Under the float backend (and with metrics off) this is the class kernel itself,
+        e.g. operator.add; otherwise it builds and executes a Calculation per call.
+        The function belongs to the current backend: look it up again after a switch.
+        """
+        function = cls._dispatch.get(calc_type)
+        if function is None:
+            function = cls._dispatch[cls.get_calculation_class(calc_type).calc_type]
+        return function
+
+    @classmethod
+    def reduce(cls, calc_type: str, values: Iterable[Any]) -> Any:
+        """
+        Apply an n-ary calculation type (add, multiply, min, max, mean) to any number of operands.
+
+        `values` may be any iterable, e.g. a list, an array('d'), a generator or
+        app.reductions.read_numbers(file); it is consumed once and never copied.
+
+        Args:
+            calc_type (str): registered calculation name, e.g. "add" (any case)
+            values: the operands
+
+        Raises:
+            ValueError: for a type that takes exactly two operands, or no operands where one
+                is needed
+        """
+        calc_class = cls.get_calculation_class(calc_type)
+        if calc_class.reduction is None:
+            raise ValueError(f"Calculation type '{calc_type}' takes exactly two numbers.")
+        return calc_class.reduction(values)
+
+    @classmethod
+    def display_name(cls, calc_type: str) -> str:
+        """Return the display name of a registered type, e.g. "add" → "Add"."""
+        name = cls._display_names.get(calc_type)
+        if name is None:
+            name = cls.get_calculation_class(calc_type).operation_name()
+        return name
+
+    @classmethod
+    def get_calculation_class(cls, calc_type: str) -> type:
+        """Return the registered Calculation class for a type name."""
         calc_class = cls._calculations.get(calc_type.lower())
         if not calc_class:
-            raise ValueError(
-                f"Unsupported calculation type: '{calc_type}'. "
-                f"Available: {', '.join(cls._calculations.keys())}"
-            )
+            calc_class = cls._load_plugin(calc_type.lower())
+        if not calc_class:
+            raise ValueError(cls._unsupported_message(calc_type))
+        return calc_class
+
+    @classmethod
+    def _find(cls, calc_type: str) -> Optional[type]:
+        """Return the class for a type name, or None if there is none (or its plugin is broken)."""
+        calc_class = cls._calculations.get(calc_type.lower())
+        if calc_class is None:
+            try:
+                calc_class = cls._load_plugin(calc_type.lower())
+            except ValueError:
+                return None
+        return calc_class
+
+    @classmethod
+    def _unsupported_message(cls, calc_type: str) -> str:
+        available = ", ".join(cls.available_calculations())
+        return f"Unsupported calculation type: '{calc_type}'. Available: {available}"
+
+    @classmethod
+    def create_calculation(cls, calc_type: str, a: float, b: float,
+                           intern: bool = False) -> "Calculation":
+        """
+        Create and return a Calculation object based on type.
+
+        Args:
+            calc_type (str): registered calculation name, e.g. "add"
+            a (float): first number
+            b (float): second number
+            intern (bool): return the shared instance for this (type, a, b) if one exists
+        """
+        if intern:
+            # Keyed by the name as well as the operand types, so add(1, 2) and add(1.0, 2.0) stay
+            # distinct and a repeat costs one tuple and one dict lookup (no class lookup)
+            key = (calc_type.lower(), type(a), a, type(b), b)
+            calculation = cls._interned.get(key)
+            if calculation is None:
+                calculation = cls.get_calculation_class(calc_type)(a, b)
+                if len(cls._interned) >= INTERN_SIZE:
+                    del cls._interned[next(iter(cls._interned))]  # the oldest entry
+                cls._interned[key] = calculation
+            return calculation
+
+        # The registry lookup inline: get_calculation_class() is only needed for plugins and errors
+        calc_class = (cls._calculations.get(calc_type.lower())
+                      or cls.get_calculation_class(calc_type))
         return calc_class(a, b)
 
+    @classmethod
+    def execute_batch(cls, calc_type: str, a: Any, b: Any) -> Any:
+        """
+        Apply one calculation type to two columns of operands.
+
+        Args:
+            calc_type (str): registered calculation name, e.g. "multiply"
+            a: first operands (array('d'), memoryview, NumPy array or sequence)
+            b: second operands, same length as `a`
+
+        Returns:
+            array('d') or numpy.ndarray: results in operand order
+        """
+        from app.kernels import apply_kernel, check_lengths  # deferred: may import NumPy
+
+        calc_class = cls.get_calculation_class(calc_type)
+        if calc_class.kernel is not None:
+            return apply_kernel(calc_class.kernel, a, b)
+
+        # No kernel registered: fall back to one Calculation object per pair
+        check_lengths(a, b)
+        return array("d", (calc_class(x, y).execute() for x, y in zip(a, b)))
+
+    @classmethod
+    def try_execute_batch(cls, calc_type: str, a: Any, b: Any) -> Tuple[Any, bytearray]:
+        """
+        Like execute_batch(), but rows that fail give NaN instead of stopping the batch.
+
+        Args:
+            calc_type (str): registered calculation name, e.g. "divide"
+            a: first operands (array('d'), memoryview, NumPy array or sequence)
+            b: second operands, same length as `a`
+
+        Returns:
+            (results, bitmap): results in operand order, and a bitmap with bit
+            `i % 8` of byte `i // 8` set when row `i` failed (see app.kernels.error_rows)
+
+        Raises:
+            ValueError: for an unknown type or columns of different lengths
+        """
+        from app.kernels import apply_checked  # deferred: may import NumPy
+
+        calc_class = cls.get_calculation_class(calc_type)
+        kernel = calc_class.kernel
+        if kernel is None:
+            kernel = lambda x, y: calc_class(x, y).execute()  # noqa: E731
+        return apply_checked(kernel, calc_class.validate, a, b)
+
+
+def _target(calc_class: type) -> str:
+    """Return the "module:Class" entry point value that names a class."""
+    return f"{calc_class.__module__}:{calc_class.__qualname__}"
+
+
+def _forget_results(_backend: numeric.NumericBackend) -> None:
+    """Drop shared results, instances and dispatch entries of the previous numeric backend."""
+    if CalculationFactory.result_cache is not None:
+        CalculationFactory.result_cache.clear()
+    # Kernels only apply to the float backend; this also drops interned instances
+    CalculationFactory._rebuild_dispatch()
+
+
+numeric.add_backend_listener(_forget_results)
+
+
+def _instrument(calc_class: type) -> None:
+    """Give a registered class a timed execute() while metrics are on, the plain one otherwise."""
+    execute = calc_class.__dict__.get("_raw_execute")
+    if execute is not None:
+        if metrics.enabled:
+            execute = metrics.timed(execute, calc_class.calc_type)
+        calc_class.execute = _memoize_execute(execute)
+
+
+def _switch_metrics(_enabled: bool) -> None:
+    """Swap timed wrappers in or out of every registered class and the dispatch table."""
+    for calc_class in CalculationFactory._calculations.values():
+        _instrument(calc_class)
+    CalculationFactory._rebuild_dispatch()
+
+
+metrics.add_listener(_switch_metrics)
+
 
 # -------------------------------
 # Calculation Classes
@@ -101,6 +682,10 @@ class CalculationFactory:
 class AddCalculation(Calculation):
     """Performs addition of two numbers."""
 
+    __slots__ = ()
+    kernel = staticmethod(operator.add)
+    reduction = staticmethod(reductions.total)
+
     def execute(self) -> float:
         return Operations.addition(self.a, self.b)
 
@@ -109,6 +694,9 @@ class AddCalculation(Calculation):
 class SubtractCalculation(Calculation):
     """Performs subtraction of two numbers."""
 
+    __slots__ = ()
+    kernel = staticmethod(operator.sub)
+
     def execute(self) -> float:
         return Operations.subtraction(self.a, self.b)
 
@@ -117,15 +705,64 @@ class SubtractCalculation(Calculation):
 class MultiplyCalculation(Calculation):
     """Performs multiplication of two numbers."""
 
+    __slots__ = ()
+    kernel = staticmethod(operator.mul)
+    reduction = staticmethod(reductions.product)
+
     def execute(self) -> float:
         return Operations.multiplication(self.a, self.b)
 
 
+def _check_divisor(_a: Any, b: Any) -> int:
+    """The `validate` check of divide: only the divisor matters, but checks take both operands."""
+    return STATUS_DIVISION_BY_ZERO if b == 0 else STATUS_OK
+
+
 @CalculationFactory.register_calculation("divide")
 class DivideCalculation(Calculation):
     """Performs division of two numbers (with divide-by-zero check)."""
 
+    __slots__ = ()
+    kernel = staticmethod(operator.truediv)
+    validate = staticmethod(_check_divisor)
+
     def execute(self) -> float:
-        if self.b == 0:
+        b = self._b
+        if b == 0:  # validate's check, inlined on this hot path
             raise ZeroDivisionError("Cannot divide by zero.")
-        return Operations.division(self.a, self.b)
+        return Operations.quotient(self._a, b)  # already checked: no second test
+
+
+@CalculationFactory.register_calculation("min")
+class MinCalculation(Calculation):
+    """Returns the smaller of two numbers (or the smallest of many, through reduce)."""
+
+    __slots__ = ()
+    kernel = staticmethod(min)
+    reduction = staticmethod(reductions.minimum)
+
+    def execute(self) -> float:
+        return min(self.a, self.b)
+
+
+@CalculationFactory.register_calculation("max")
+class MaxCalculation(Calculation):
+    """Returns the larger of two numbers (or the largest of many, through reduce)."""
+
+    __slots__ = ()
+    kernel = staticmethod(max)
+    reduction = staticmethod(reductions.maximum)
+
+    def execute(self) -> float:
+        return max(self.a, self.b)
+
+
+@CalculationFactory.register_calculation("mean")
+class MeanCalculation(Calculation):
+    """Returns the arithmetic mean of two numbers (or of many, through reduce)."""
+
+    __slots__ = ()
+    reduction = staticmethod(reductions.mean)
+
+    def execute(self) -> float:
+        return reductions.mean((self.a, self.b))
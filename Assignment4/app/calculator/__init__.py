@@ -8,20 +8,49 @@
 Professional Calculator REPL (Read-Eval-Print Loop)
 
 Features:
-- Perform arithmetic operations: add, subtract, multiply, divide
+- Perform arithmetic operations: add, subtract, multiply, divide, min, max, mean
+- Any number of operands for add, multiply, min, max and mean, e.g. add 1 2 3 4
 - Input validation and graceful error handling
-- History tracking for calculations
-- Helpful commands: help, history, exit
+- Infix expressions with precedence and parentheses, e.g. (3 + 4) * 2 / 7
+- Several `;`-separated calculations per line, answered in one write
+- Bounded history tracking for calculations (see app.history.HistoryStore)
+- Indexed history queries, e.g. history divide result > 1e6 (see app.history_query)
+- Exact arithmetic on request (int, fraction and decimal numeric backends)
+- Optional metrics: call counts, latency histograms and errors (see app.metrics)
+- Running statistics of the session's results (see app.aggregates)
+- Spreadsheet-style variables that update their dependents, e.g. x = add 3 4 (see app.sheet)
+- Optional session recording, one input line per line, for replay (see bench/bench_repl_load.py)
+- Vector operands, element-wise: multiply [1,2,3] [4,5,6] or add @prices.bin 1.05 (see app.vectors)
+- Helpful commands: help, history, aggregate, cells, backend, stats, exit
 - Demonstrates LBYL (Look Before You Leap) and EAFP (Easier to Ask Forgiveness than Permission)
 """
 
 # -------------------------------------------------------------------
 # Imports and Setup
 # -------------------------------------------------------------------
+# Only what every session needs is imported here. readline (terminal line
+# editing) and the persistent history log load inside calculator(), and only
+# when a terminal or history file is actually in use, to keep startup fast.
 import sys
-import readline  # Enables arrow-key navigation and history for user input
-from typing import List
-from app.calculation import Calculation, CalculationFactory
+import time
+from typing import TYPE_CHECKING, List, Optional, TextIO, Union
+from app import metrics, numeric
+from app.aggregates import Aggregator
+from app.calculation import CalculationFactory
+from app.expression import ExpressionError, compile_expression, evaluate
+from app.history import DEFAULT_CAPACITY, HistoryStore
+from app.sheet import Sheet
+from app.statements import (COMMANDS, Assignment, Statement, StatementError, VectorStatement,
+                            parse_statement, split_statements)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from app.history_log import HistoryLog
+    from app.history_query import HistoryIndex
+
+History = Union[HistoryStore, "HistoryLog"]
+
+# Described in the help text
+BUILT_IN_OPERATIONS = ("add", "subtract", "multiply", "divide", "min", "max", "mean")
 
 
 # -------------------------------------------------------------------
@@ -33,16 +62,32 @@ def display_help() -> None:
 Calculator REPL - Help
 ----------------------
 Usage: <operation> <num1> <num2>
+   or: <expression>   e.g. (3 + 4) * 2 / 7
+   Several calculations can share a line: add 1 2; multiply 3 4
+   or: <name> = <definition>   e.g. x = add 3 4, then y = multiply x 2
+       (when x is defined again, y is recomputed)
 
 Supported operations:
     add       → Adds two numbers
     subtract  → Subtracts second number from first
     multiply  → Multiplies two numbers
     divide    → Divides first number by second
-
+    min       → Smallest of the numbers
+    max       → Largest of the numbers
+    mean      → Average of the numbers
+    add, multiply, min, max and mean take any number of operands: add 1 2 3 4
+    Operands may be vectors, used element by element: multiply [1,2,3] [4,5,6]
+    or a file of 8-byte floats: add @prices.bin 1.05
+{plugins}
 Special commands:
     help      → Show this message
-    history   → Show past calculations
+    history   → Show past calculations; add a query to filter them:
+                history divide result > 1e6 | history a 1..10 last 5 | history top 3
+    aggregate → Show statistics of this session's results (mean, p50/p99, distinct count)
+    cells     → Show every variable with its value and definition
+    backend   → Show or switch the number system: backend float|int|fraction|decimal
+    stats     → Show metrics; stats on|off|reset, or stats save <file> (Prometheus format)
+    compact   → Shrink the history log to the most recent entries
     exit      → Quit the calculator
 
 Examples:
@@ -51,113 +96,340 @@ Examples:
     multiply 6 9
     divide 15 3
 """
-    print(help_message)
+    # Types added by installed plugins are listed by name (they are imported on first use)
+    plugins = [name for name in CalculationFactory.available_calculations()
+               if name not in BUILT_IN_OPERATIONS]
+    print(help_message.format(plugins=f"    plugins   → {', '.join(plugins)}\n" if plugins else ""))
 
 
 # -------------------------------------------------------------------
 # History Display Function
 # -------------------------------------------------------------------
-def display_history(history: List[Calculation]) -> None:
+def display_history(history: History) -> None:
     """Display past calculations stored in history."""
     if not history:  # LBYL: check before accessing
         print("No calculations yet.")
     else:
-        print("Calculation History:")
-        for i, calc in enumerate(history, start=1):
-            print(f"{i}. {calc}")
+        lines = [f"{i}. {entry}" for i, entry in enumerate(history, start=1)]
+        print("Calculation History:\n" + "\n".join(lines))
+
+
+def run_history_query(index: "HistoryIndex", text: str) -> str:
+    """
+    Handle `history <query>` and return the matching calculations to show.
+
+    Args:
+        index (HistoryIndex): the session's index over its history
+        text (str): the words after `history`
+    """
+    from app.history_query import QueryError, parse_query
+
+    try:
+        matches = index.select(parse_query(text))
+    except QueryError as e:
+        return (f"{e}. Use: history [<operation>...] [result|a|b <|<=|>|>=|= <number>] "
+                "[last N] [top K]")
+    if not matches:
+        return "No matching calculations."
+    lines = [f"{position + 1}. {entry}" for position, entry in matches]
+    return f"Matching calculations ({len(matches)} of {len(index.history)}):\n" + "\n".join(lines)
+
+
+# -------------------------------------------------------------------
+# Statement Evaluation
+# -------------------------------------------------------------------
+def evaluate_statement(statement: Statement, history: History, results: Optional[Aggregator] = None,
+                       sheet: Optional[Sheet] = None) -> str:
+    """
+    Evaluate one statement, record it in history (and `results`) and return its output.
+
+    Names in the statement are cells of `sheet`.
+    """
+    operation = statement.operation
+    num1 = num2 = None  # stay None when there is no two-operand step for history
+    try:
+        if operation is None:
+            # Infix expression (compiled once, then served from the cache)
+            compiled = compile_expression(statement.source)
+            if compiled.variables and sheet:
+                result = evaluate(compiled.tree, sheet.values(compiled.variables))
+            else:
+                result = compiled.evaluate()
+            if compiled.step is not None:  # a folded expression has no single step to record
+                operation, num1, num2 = compiled.step
+        elif len(statement.operands) == 2:
+            num1, num2 = statement.operands
+            result = CalculationFactory.evaluate(operation, num1, num2)  # no Calculation object
+        else:
+            # n-ary, e.g. add 1 2 3 4; history keeps two operands per entry, so it is not recorded
+            result = CalculationFactory.reduce(operation, statement.operands)
+    except ExpressionError as e:
+        if metrics.enabled:
+            metrics.METRICS.record_error(metrics.PARSE)
+        return f"Invalid expression: {e.message} at column {statement.position + e.position + 1}"
+    except ZeroDivisionError:  # counted by the timed operation itself
+        return "Error: Division by zero is not allowed."
+    except ValueError as e:  # unsupported operation
+        if metrics.enabled:
+            metrics.METRICS.record_error(metrics.UNSUPPORTED_OPERATION)
+        return str(e)
+    except Exception as e:
+        return f"An error occurred during calculation: {e}\nPlease try again.\n"
+
+    if num1 is not None:
+        history.append(CalculationFactory.display_name(operation), num1, num2, result)
+    if results is not None:
+        results.add(operation.lower() if operation is not None else "expression", result)
+    return f"Result: {result}\n"
+
+
+def run_assignment(assignment: Assignment, sheet: Optional[Sheet]) -> str:
+    """Define a variable; return its value and those of the variables recomputed because of it."""
+    if sheet is None:
+        return "Variables are not available here."
+    try:
+        changed = sheet.define(assignment.name, assignment.words)
+    except ValueError as e:  # bad name, unknown variable, circular reference or operation
+        return str(e)
+    return "\n".join(map(str, changed)) + "\n"
+
+
+def run_vector_statement(statement: VectorStatement) -> str:
+    """Evaluate an operation on vector operands and return a summary of the resulting vector."""
+    from app.vectors import summarize  # deferred: only sessions that use vectors
+
+    try:
+        a, b = statement.operands
+        result = CalculationFactory.create_calculation(statement.operation, a, b).execute()
+    except ZeroDivisionError:
+        return "Error: Division by zero is not allowed."
+    except ValueError as e:  # unsupported operation, or vectors of different lengths
+        return str(e)
+    # Vector results are not kept in history or aggregated: both hold one number per result
+    return f"Result: {summarize(result)}\n"
+
+
+def run_statements(line: str, history: History, results: Optional[Aggregator] = None,
+                   sheet: Optional[Sheet] = None) -> str:
+    """
+    Evaluate every `;`-separated statement of a line in one pass.
+
+    Returns:
+        str: the output of all statements, to be written at once
+    """
+    lookup = sheet.lookup if sheet else None
+    if ";" not in line:  # one statement, the common case: no generator and no list of outputs
+        statement = parse_statement(line, lookup)
+        if statement is None:
+            return ""
+        return run_statement(statement, history, results, sheet) + "\n"
+    output = [run_statement(statement, history, results, sheet)
+              for statement in split_statements(line, lookup)]
+    return "\n".join(output) + "\n" if output else ""
+
+
+def run_statement(statement: Union[Statement, Assignment, VectorStatement, StatementError],
+                  history: History, results: Optional[Aggregator] = None,
+                  sheet: Optional[Sheet] = None) -> str:
+    """Run one parsed statement of any kind and return its output."""
+    if isinstance(statement, Statement):  # checked first: calculations are most of the input
+        return evaluate_statement(statement, history, results, sheet)
+    if isinstance(statement, StatementError):
+        return _statement_error(statement)
+    if isinstance(statement, Assignment):
+        return run_assignment(statement, sheet)
+    return run_vector_statement(statement)
+
+
+def _statement_error(error: StatementError) -> str:
+    """Return the message for a statement that could not be parsed."""
+    if metrics.enabled:
+        metrics.METRICS.record_error(metrics.PARSE)
+    return f"{error}. Use: <operation> <num1> <num2>"
+
+
+def run_stats_command(args: List[str]) -> str:
+    """
+    Handle `stats [on|off|reset|save <file>]` and return the text to show.
+
+    Args:
+        args (List[str]): the words after `stats`, with their original case (file names)
+    """
+    action = args[0].lower() if args else ""
+    if action == "on":
+        metrics.set_enabled(True)
+        return "Metrics collection is on."
+    if action == "off":
+        metrics.set_enabled(False)
+        return "Metrics collection is off."
+    if action == "reset":
+        metrics.METRICS.reset()
+        return "Metrics reset."
+    if action == "save" and len(args) == 2:
+        try:
+            metrics.METRICS.write_prometheus(args[1])
+        except OSError as e:
+            return f"Cannot write metrics: {e}"
+        return f"Metrics written to {args[1]}."
+    if action:
+        return "Usage: stats [on|off|reset|save <file>]"
+    if not metrics.enabled:
+        return "Metrics collection is off. Use 'stats on' to start it."
+    return metrics.METRICS.render()
 
 
 # -------------------------------------------------------------------
 # Main REPL Loop
 # -------------------------------------------------------------------
-def calculator() -> None:
+def calculator(history_capacity: int = DEFAULT_CAPACITY, history_path: Optional[str] = None,
+               backend: Optional[str] = None, metrics_path: Optional[str] = None,
+               record_path: Optional[str] = None) -> None:
     """
     Run the main calculator REPL loop.
     Handles commands, calculations, and errors gracefully.
+
+    Args:
+        history_capacity (int): number of past calculations kept for `history`
+        history_path (str): optional history log file that keeps history across restarts
+        backend (str): numeric backend for the session ("float" unless given)
+        metrics_path (str): collect metrics and write them here (Prometheus format) on exit
+        record_path (str): append every input line to this file, as typed, so the session can be
+            replayed
     """
-    history: List[Calculation] = []  # Store past calculations
+    if sys.stdin.isatty():
+        import readline  # noqa: F401  Enables arrow-key navigation and history for user input
 
-    print("Welcome to the Professional Calculator REPL!")
-    print("Type 'help' for usage or 'exit' to quit.\n")
+    session_backend = numeric.get_backend()  # restored when the session ends
+    if backend is not None:
+        numeric.set_backend(backend)
+    session_metrics = metrics.enabled  # likewise
+    if metrics_path is not None:
+        metrics.set_enabled(True)
 
-    while True:
-        try:
-            # -------------------------------------------------------------------
-            # User Input Handling
-            # -------------------------------------------------------------------
-            user_input: str = input(">> ").strip()
+    history_log: Optional[HistoryLog] = None
+    if history_path is not None:
+        from app.history_log import HistoryLog
 
-            if not user_input:  # LBYL: skip empty input
-                continue
+        history_log = HistoryLog(history_path)  # Persistent history (reloaded through mmap)
+        history: History = history_log
+    else:
+        history = HistoryStore(history_capacity)  # Store past calculations (oldest evicted first)
+    results = Aggregator()  # Running statistics of every result, in bounded memory
+    history_index: Optional[HistoryIndex] = None  # built by the first history query
+    sheet = Sheet()  # the session's variables
+    # Line-buffered: each line is on disk as soon as it is entered, even if the session crashes
+    session_record: Optional[TextIO] = None
+    if record_path is not None:
+        session_record = open(record_path, "a", encoding="utf-8", buffering=1)
 
-            # -------------------------------------------------------------------
-            # Special Commands
-            # -------------------------------------------------------------------
-            command = user_input.lower()
-            if command == "help":
-                display_help()
-                continue
-            elif command == "history":
-                display_history(history)
-                continue
-            elif command == "exit":
-                print("Exiting calculator. Goodbye!")
-                sys.exit(0)  # pragma: no cover
+    print("Welcome to the Professional Calculator REPL!")
+    print("Type 'help' for usage or 'exit' to quit.\n")
+    if history_log is not None:
+        print(f"Loaded {len(history_log)} calculations from {history_path}.")
+        if history_log.truncated_bytes:
+            print("Discarded an incomplete record left by an earlier crash.")
 
-            # -------------------------------------------------------------------
-            # Parse and Validate Input
-            # -------------------------------------------------------------------
+    try:
+        while True:
             try:
-                operation, num1_str, num2_str = user_input.split()
-                num1, num2 = float(num1_str), float(num2_str)
-            except ValueError:
-                print("Invalid format. Use: <operation> <num1> <num2>")
-                continue
+                # -------------------------------------------------------------------
+                # User Input Handling
+                # -------------------------------------------------------------------
+                line = input(">> ")
+                if session_record is not None:
+                    session_record.write(line + "\n")
+                user_input: str = line.strip()
 
-            # -------------------------------------------------------------------
-            # Create Calculation Object
-            # -------------------------------------------------------------------
-            try:
-                calculation = CalculationFactory.create_calculation(operation, num1, num2)
-            except ValueError as e:
-                print(e)
-                continue
+                if not user_input:  # LBYL: skip empty input
+                    continue
 
-            # -------------------------------------------------------------------
-            # Execute Calculation
-            # -------------------------------------------------------------------
-            try:
-                result = calculation.execute()
-            except ZeroDivisionError:
-                print("Error: Division by zero is not allowed.")
-                continue
-            except Exception as e:
-                print(f"An error occurred during calculation: {e}")
-                print("Please try again.\n")
-                continue
+                # -------------------------------------------------------------------
+                # Special Commands
+                # -------------------------------------------------------------------
+                command = user_input.lower()
+                word = command.split(None, 1)[0]
+                # One set lookup keeps calculations clear of the command checks
+                if word in COMMANDS:
+                    if command == "help":
+                        display_help()
+                        continue
+                    elif command == "history":
+                        display_history(history)
+                        continue
+                    elif word == "history":
+                        if history_index is None:
+                            # deferred: only sessions that query
+                            from app.history_query import HistoryIndex
+
+                            history_index = HistoryIndex(history)
+                        print(run_history_query(history_index, user_input.split(None, 1)[1]))
+                        continue
+                    elif command == "aggregate":
+                        print(results.render())
+                        continue
+                    elif command == "cells":
+                        print(sheet.render())
+                        continue
+                    elif command == "compact":
+                        if history_log is None:
+                            print("No history log in use; nothing to compact.")
+                        else:
+                            removed = history_log.compact(history_capacity)
+                            print(f"Compacted history log: removed {removed} old calculations.")
+                        continue
+                    elif word == "stats":
+                        print(run_stats_command(user_input.split()[1:]))
+                        continue
+                    elif word == "backend":
+                        try:
+                            _, *name = command.split()
+                            selected = (numeric.set_backend(name[0]) if name
+                                        else numeric.get_backend())
+                        except ValueError as e:
+                            print(e)
+                            continue
+                        print(f"Numeric backend: {selected.name}")
+                        continue
+                    elif command == "exit":
+                        print("Exiting calculator. Goodbye!")
+                        sys.exit(0)  # pragma: no cover
+
+                # -------------------------------------------------------------------
+                # Calculations: one or more `;`-separated statements, one write
+                # -------------------------------------------------------------------
+                if metrics.enabled:
+                    start = time.perf_counter_ns()
+                    output = run_statements(user_input, history, results, sheet)
+                    metrics.METRICS.lines.observe(time.perf_counter_ns() - start)
+                else:
+                    output = run_statements(user_input, history, results, sheet)
+                sys.stdout.write(output)
 
             # -------------------------------------------------------------------
-            # Display Result and Store History
+            # Graceful Exit Handling
             # -------------------------------------------------------------------
-            print(f"Result: {result}\n")
-            history.append(calculation)
-
-        # -------------------------------------------------------------------
-        # Graceful Exit Handling
-        # -------------------------------------------------------------------
-        except KeyboardInterrupt:  # Ctrl+C
-            print("\nKeyboard interrupt detected. Exiting calculator. Goodbye!")
-            sys.exit(0)  # pragma: no cover
-        except EOFError:  # Ctrl+D
-            print("\nEOF detected. Exiting calculator. Goodbye!")
-            sys.exit(0)  # pragma: no cover
-        except Exception as e:  # Final fallback
-            print(f"\nUnexpected error: {e}")
-            sys.exit(1)  # pragma: no cover
+            except KeyboardInterrupt:  # Ctrl+C
+                print("\nKeyboard interrupt detected. Exiting calculator. Goodbye!")
+                sys.exit(0)  # pragma: no cover
+            except EOFError:  # Ctrl+D
+                print("\nEOF detected. Exiting calculator. Goodbye!")
+                sys.exit(0)  # pragma: no cover
+            except Exception as e:  # Final fallback
+                print(f"\nUnexpected error: {e}")
+                sys.exit(1)  # pragma: no cover
+    finally:
+        numeric.set_backend(session_backend)
+        if metrics_path is not None:
+            metrics.METRICS.write_prometheus(metrics_path)
+        metrics.set_enabled(session_metrics)
+        if history_log is not None:
+            history_log.close()  # flush and fsync any buffered records
+        if session_record is not None:
+            session_record.close()
 
 
 # -------------------------------------------------------------------
 # Entry Point
 # -------------------------------------------------------------------
 if __name__ == "__main__":  # pragma: no cover
-    calculator()
\ No newline at end of file
+    calculator()
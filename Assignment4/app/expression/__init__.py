@@ -0,0 +1,491 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Date: 10/18/2026
+# Project: Assignment 4 - Professional Calculator CLI
+# ----------------------------------------------------------
+
+"""
+Infix expression engine for the Professional Calculator.
+
+Turns text such as `(3 + 4) * 2 / 7` into a small abstract syntax tree (AST):
+
+- Number(value)                    → a numeric literal
+- Variable(name, position)         → a value supplied when the expression is evaluated
+- BinaryOp(calc_type, left, right) → one registered CalculationFactory type
+                                     ("add", "subtract", "multiply", "divide")
+
+Parsing follows the usual rules: `*` and `/` bind tighter than `+` and `-`,
+operators are left-associative, parentheses group and unary `+`/`-` are allowed.
+Any other registered calculation type is written as a call with two
+arguments, e.g. `max(x, 0) * rate`.
+
+compile_expression() parses the text and folds every constant subtree into a
+single Number. Compiled expressions are kept in an LRU cache keyed by the source
+text, so an expression that is entered again skips parsing entirely.
+Literals are read with the session numeric backend (see app.numeric), so
+`0.1 + 0.2` is exactly 0.3 under the decimal backend.
+
+For evaluating one formula over many variable bindings, a CompiledExpression
+also turns into a single Python function (see compile_function): the tree is
+translated into the Python syntax tree of one lambda taking the variables
+positionally, with the plain operators inlined and any other operation bound
+once, and compiled, so a call costs no parsing, no tree walk and no factory
+lookup. map() streams binding rows
+through it and evaluate_many() fills an array('d') from one column per
+variable, or runs one NumPy ufunc per operation when NumPy is installed.
+"""
+
+import ast
+import functools
+import operator
+import re
+from array import array
+from itertools import starmap
+from typing import (Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence,
+                    Tuple, Union)
+
+from app import numeric
+from app.calculation import CalculationFactory
+
+DEFAULT_CACHE_SIZE = 1024
+
+# Infix symbol → registered calculation type
+OPERATORS = {"+": "add", "-": "subtract", "*": "multiply", "/": "divide"}
+PRECEDENCE = {"+": 1, "-": 1, "*": 2, "/": 2}
+
+# Kernel → infix operator inlined into compiled functions
+INFIX = {operator.add: ast.Add, operator.sub: ast.Sub, operator.mul: ast.Mult,
+         operator.truediv: ast.Div}
+
+# A name followed by a call or an infix operator: `max(3, 4) * 2`, `x * 2`, `x - 1`
+# (but not `add -1 2`)
+_NAME_START_RE = re.compile(r"[A-Za-z_]\w*\s*(?:\(|[*/]|[+-](?:\s|$))")
+
+_TOKEN_RE = re.compile(
+    r"\s*(?:(\d+\.?\d*(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?)|([A-Za-z_]\w*)|(\S))"
+)
+
+
+class ExpressionError(ValueError):
+    """Raised when an expression cannot be parsed."""
+
+    def __init__(self, message: str, position: int) -> None:
+        super().__init__(f"{message} at column {position + 1}")
+        self.message = message
+        self.position = position
+
+
+# -------------------------------
+# AST Nodes
+# -------------------------------
+class Number(NamedTuple):
+    """A numeric literal."""
+
+    value: float
+
+
+class Variable(NamedTuple):
+    """A named value bound at evaluation time."""
+
+    name: str
+    position: int
+
+
+class BinaryOp(NamedTuple):
+    """An operation applied to two sub-expressions."""
+
+    calc_type: str
+    left: "Node"
+    right: "Node"
+
+
+Node = Union[Number, Variable, BinaryOp]
+
+
+# -------------------------------
+# Tokenizer and Parser
+# -------------------------------
+class Token(NamedTuple):
+    kind: str  # "number", "name", "op", "(", ")", "," or "end"
+    text: str
+    position: int
+
+
+def tokenize(source: str) -> Iterator[Token]:
+    """Yield the tokens of an expression, ending with an "end" token."""
+    position = 0
+    for match in _TOKEN_RE.finditer(source):
+        number, name, symbol = match.groups()
+        start = match.start(1) if number else match.start(2) if name else match.start(3)
+        if number:
+            yield Token("number", number, start)
+        elif name:
+            yield Token("name", name, start)
+        elif symbol in OPERATORS:
+            yield Token("op", symbol, start)
+        elif symbol in "(),":
+            yield Token(symbol, symbol, start)
+        else:
+            raise ExpressionError(f"Unexpected character '{symbol}'", start)
+        position = match.end()
+    yield Token("end", "", position)
+
+
+class _Parser:
+    """Precedence-climbing parser producing Number/Variable/BinaryOp trees."""
+
+    def __init__(self, source: str) -> None:
+        self.tokens: List[Token] = list(tokenize(source))
+        self.index = 0
+
+    def peek(self) -> Token:
+        return self.tokens[self.index]
+
+    def advance(self) -> Token:
+        token = self.tokens[self.index]
+        self.index += 1
+        return token
+
+    def parse(self) -> Node:
+        node = self.parse_binary(1)
+        token = self.peek()
+        if token.kind != "end":
+            raise ExpressionError(f"Unexpected '{token.text}'", token.position)
+        return node
+
+    def parse_binary(self, min_precedence: int) -> Node:
+        left = self.parse_unary()
+        while True:
+            token = self.peek()
+            if token.kind != "op" or PRECEDENCE[token.text] < min_precedence:
+                return left
+            self.advance()
+            right = self.parse_binary(PRECEDENCE[token.text] + 1)
+            left = BinaryOp(OPERATORS[token.text], left, right)
+
+    def parse_unary(self) -> Node:
+        token = self.peek()
+        if token.kind == "op" and token.text in "+-":
+            self.advance()
+            operand = self.parse_unary()
+            if token.text == "+":
+                return operand
+            return BinaryOp("multiply", Number(-1.0), operand)
+        return self.parse_primary()
+
+    def parse_primary(self) -> Node:
+        token = self.advance()
+        if token.kind == "number":
+            return Number(numeric.parse(token.text))  # exact under int/fraction/decimal backends
+        if token.kind == "(":
+            node = self.parse_binary(1)
+            closing = self.advance()
+            if closing.kind != ")":
+                raise ExpressionError("Missing ')'", closing.position)
+            return node
+        if token.kind == "name":
+            if self.peek().kind == "(":
+                return self.parse_call(token)
+            return Variable(token.text, token.position)
+        if token.kind == "end":
+            raise ExpressionError("Unexpected end of expression", token.position)
+        raise ExpressionError(f"Unexpected '{token.text}'", token.position)
+
+
+    def parse_call(self, name: Token) -> Node:
+        """Parse `name(left, right)` into the registered calculation type `name`."""
+        try:
+            calc_type = CalculationFactory.get_calculation_class(name.text).calc_type
+        except ValueError:
+            raise ExpressionError(f"Unknown operation '{name.text}'", name.position) from None
+        self.advance()  # "("
+        arguments = [self.parse_binary(1)]
+        while self.peek().kind == ",":
+            self.advance()
+            arguments.append(self.parse_binary(1))
+        closing = self.advance()
+        if closing.kind != ")":
+            raise ExpressionError("Missing ')'", closing.position)
+        if len(arguments) != 2:
+            raise ExpressionError(f"'{name.text}' takes exactly two arguments", name.position)
+        return BinaryOp(calc_type, arguments[0], arguments[1])
+
+
+def parse(source: str) -> Node:
+    """Parse an infix expression into an AST (without folding)."""
+    return _Parser(source).parse()
+
+
+# -------------------------------
+# Evaluation and Constant Folding
+# -------------------------------
+def evaluate(node: Node, bindings: Optional[Dict[str, Any]] = None) -> float:
+    """Evaluate an AST through the CalculationFactory, reading variables from `bindings`."""
+    if isinstance(node, Number):
+        return node.value
+    if isinstance(node, Variable):
+        if bindings is None or node.name not in bindings:
+            raise ExpressionError(f"Unknown variable '{node.name}'", node.position)
+        return bindings[node.name]
+    return CalculationFactory.create_calculation(
+        node.calc_type, evaluate(node.left, bindings), evaluate(node.right, bindings)
+    ).execute()
+
+
+def walk(node: Node) -> Iterator[Node]:
+    """Yield every node of a tree, parents before children, left to right."""
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        yield node
+        if isinstance(node, BinaryOp):
+            stack.append(node.right)
+            stack.append(node.left)
+
+
+def fold_constants(node: Node) -> Node:
+    """
+    Replace every constant subtree by its value.
+
+    A subtree whose evaluation fails (e.g. division by zero) is left in place,
+    so the error is raised when the expression is evaluated rather than compiled.
+    """
+    if not isinstance(node, BinaryOp):
+        return node
+    folded = BinaryOp(node.calc_type, fold_constants(node.left), fold_constants(node.right))
+    if isinstance(folded.left, Number) and isinstance(folded.right, Number):
+        try:
+            return Number(evaluate(folded))
+        except (ZeroDivisionError, ValueError):
+            return folded
+    return folded
+
+
+# -------------------------------
+# Compilation to Python Functions
+# -------------------------------
+def compile_function(tree: Node, variables: Sequence[str]) -> Callable[..., Any]:
+    """
+    Turn a tree into one Python function of its variables, taken positionally.
+
+    The tree is translated node for node into a Python syntax tree (ast) of a
+    single lambda, e.g. `(x * 2) + max(y, 0)` becomes the equivalent of
+    `lambda _v0, _v1: _v0 * 2.0 + _n0(_v1, 0.0)`, which compile() turns into
+    bytecode. An operation whose evaluate() function is a plain operator kernel
+    is inlined as that operator; any other one (min/max, plugins, Calculation
+    objects under an exact backend) is looked up once and bound by name, as
+    are constants other than int and float. A subtree holding a constant the
+    backend promoted (e.g. `1e999` kept as a Decimal) goes through
+    CalculationFactory.evaluate, which handles the mixed operand types.
+    No source text is generated: the function holds only these internal
+    names, number constants and operators, never input text.
+
+    Args:
+        tree (Node): the (folded) expression tree
+        variables (Sequence[str]): variable names, in argument order
+
+    Returns:
+        Callable: f(*values) → the value of the expression
+    """
+    arguments = {name: f"_v{i}" for i, name in enumerate(variables)}
+    namespace: Dict[str, Any] = {"__builtins__": {}}
+
+    def bind(value: Any) -> ast.expr:
+        name = f"_n{len(namespace) - 1}"
+        namespace[name] = value
+        return ast.Name(name, ast.Load())
+
+    def call(function: Any, left: ast.expr, right: ast.expr) -> ast.expr:
+        return ast.Call(bind(function), [left, right], [])
+
+    def emit(node: Node) -> Tuple[ast.expr, bool]:
+        """Return the ast of a subtree and whether it holds a promoted constant."""
+        if isinstance(node, Number):
+            value = node.value
+            if type(value) not in (int, float):
+                return bind(value), numeric.get_backend() is numeric.FLOAT
+            return ast.Constant(value), False
+        if isinstance(node, Variable):
+            return ast.Name(arguments[node.name], ast.Load()), False
+        (left, left_promoted), (right, right_promoted) = emit(node.left), emit(node.right)
+        if left_promoted or right_promoted:
+            function = functools.partial(CalculationFactory.evaluate, node.calc_type)
+            return call(function, left, right), True
+        function = CalculationFactory.binary_function(node.calc_type)
+        operator_node = INFIX.get(function)
+        if operator_node is not None:
+            return ast.BinOp(left, operator_node(), right), False
+        return call(function, left, right), False
+
+    signature = ast.arguments(posonlyargs=[], args=[ast.arg(name) for name in arguments.values()],
+                              kwonlyargs=[], kw_defaults=[], defaults=[])
+    lambda_tree = ast.Expression(ast.Lambda(signature, emit(tree)[0]))
+    code = compile(ast.fix_missing_locations(lambda_tree), "<expression>", "eval")
+    return eval(code, namespace)  # runs the compiled tree above, which only defines the lambda
+
+
+def _evaluate_numpy(node, columns, np):  # pragma: no cover - requires NumPy
+    """NumPy path of evaluate_many: one ufunc call per operation, over whole columns."""
+    from app.kernels import UFUNC_NAMES  # deferred: may import NumPy
+
+    if isinstance(node, Number):
+        return node.value
+    if isinstance(node, Variable):
+        return columns[node.name]
+    left, right = _evaluate_numpy(node.left, columns, np), _evaluate_numpy(node.right, columns, np)
+    kernel = CalculationFactory.get_calculation_class(node.calc_type).kernel
+    if kernel is operator.truediv and not np.all(right):
+        raise ZeroDivisionError("Cannot divide by zero.")
+    return getattr(np, UFUNC_NAMES[kernel])(left, right)
+
+
+class CompiledExpression:
+    """A parsed and constant-folded expression, ready to evaluate."""
+
+    def __init__(self, source: str, tree: Node) -> None:
+        """
+        Fold the tree and remember the top-level step for history.
+
+        Args:
+            source (str): the original expression text
+            tree (Node): the parsed AST
+        """
+        self.source = source
+        # (calc_type, a, b) of the outermost operation, when its operands are constant
+        self.step: Optional[Tuple[str, float, float]] = None
+        if isinstance(tree, BinaryOp):
+            tree = BinaryOp(tree.calc_type, fold_constants(tree.left), fold_constants(tree.right))
+            if isinstance(tree.left, Number) and isinstance(tree.right, Number):
+                self.step = (tree.calc_type, tree.left.value, tree.right.value)
+        self.tree = fold_constants(tree)
+        # name → column of its first use; their order of appearance is the argument order
+        self._positions: Dict[str, int] = {}
+        for node in walk(self.tree):
+            if isinstance(node, Variable):
+                self._positions.setdefault(node.name, node.position)
+        self.variables: Tuple[str, ...] = tuple(self._positions)
+        self._function: Optional[Callable[..., Any]] = None
+
+    def evaluate(self, *values: Any) -> float:
+        """
+        Return the value of the expression by walking its tree.
+
+        Args:
+            *values: one value per variable, in the order of `variables`
+
+        Raises:
+            ExpressionError: if the expression has variables and no values are given
+            ValueError: if the number of values does not match the variables
+        """
+        if len(values) != len(self.variables):
+            self._check_count(values)
+        tree = self.tree
+        if isinstance(tree, Number):
+            return tree.value
+        return evaluate(tree, dict(zip(self.variables, values)) if values else None)
+
+    def to_function(self) -> Callable[..., Any]:
+        """Return the expression compiled to one Python function of its variables (built once)."""
+        if self._function is None:
+            self._function = compile_function(self.tree, self.variables)
+        return self._function
+
+    def map(self, rows: Iterable[Sequence[Any]]) -> Iterator[Any]:
+        """Lazily evaluate the compiled function for each row of variable values."""
+        return starmap(self.to_function(), rows)
+
+    def evaluate_many(self, *columns: Any) -> Any:
+        """
+        Evaluate the expression once per row of equally long columns, one column per variable.
+
+        Columns may be `array('d')`, memoryview, NumPy arrays or any sequence of
+        numbers. With NumPy installed (float backend, plain operator kernels only)
+        every operation is one ufunc call over whole columns; otherwise the compiled
+        function is driven over the columns by `map()`.
+
+        Returns:
+            array('d') or numpy.ndarray: one result per row; NumPy input gives a NumPy result
+
+        Raises:
+            ValueError: for a wrong number of columns or columns of different lengths
+            ZeroDivisionError: if a row divides by zero
+        """
+        from app.kernels import UFUNC_NAMES, np  # deferred: may import NumPy
+
+        if not columns or len(columns) != len(self.variables):
+            names = ", ".join(self.variables) or "none"
+            raise ValueError(f"Expected one column per variable ({names}), got {len(columns)}.")
+        lengths = sorted({len(column) for column in columns})
+        if len(lengths) > 1:
+            raise ValueError(f"Operand columns must have the same length "
+                             f"(got {lengths[0]} and {lengths[-1]}).")
+        vectorize = np is not None and numeric.get_backend() is numeric.FLOAT and all(
+            CalculationFactory.get_calculation_class(node.calc_type).kernel in UFUNC_NAMES
+            for node in walk(self.tree) if isinstance(node, BinaryOp))
+        if vectorize:  # pragma: no cover - requires NumPy
+            data = {name: np.asarray(column, dtype=np.float64)
+                    for name, column in zip(self.variables, columns)}
+            result = _evaluate_numpy(self.tree, data, np)
+            if any(isinstance(column, np.ndarray) for column in columns):
+                return result
+            return array("d", np.broadcast_to(result, (lengths[0],)).tobytes())
+        try:
+            return array("d", map(self.to_function(), *columns))
+        except ZeroDivisionError:
+            raise ZeroDivisionError("Cannot divide by zero.") from None
+
+    def _check_count(self, values: Sequence[Any]) -> None:
+        if not values:
+            name = self.variables[0]
+            raise ExpressionError(f"Unknown variable '{name}'", self._positions[name])
+        names = ", ".join(self.variables) or "no variables"
+        raise ValueError(f"Expected {len(self.variables)} values ({names}), got {len(values)}.")
+
+    def __repr__(self) -> str:
+        return f"CompiledExpression({self.source!r})"
+
+
+# -------------------------------
+# Compile Cache
+# -------------------------------
+def _compile(source: str) -> CompiledExpression:
+    return CompiledExpression(source, parse(source))
+
+
+_compile_cached = functools.lru_cache(maxsize=DEFAULT_CACHE_SIZE)(_compile)
+
+# Literals and folded constants depend on the numeric backend, so a switch starts afresh
+numeric.add_backend_listener(lambda backend: _compile_cached.cache_clear())
+
+
+def compile_expression(source: str) -> CompiledExpression:
+    """Parse and fold an expression, reusing the cached result for the same text."""
+    return _compile_cached(source)
+
+
+def cache_info() -> "functools._CacheInfo":
+    """Return hit/miss counters of the compile cache."""
+    return _compile_cached.cache_info()
+
+
+def set_cache_size(maxsize: int) -> None:
+    """Replace the compile cache with an empty one holding up to `maxsize` expressions."""
+    global _compile_cached
+    if maxsize <= 0:
+        raise ValueError("Cache size must be a positive integer.")
+    _compile_cached = functools.lru_cache(maxsize=maxsize)(_compile)
+
+
+def looks_like_expression(text: str) -> bool:
+    """
+    Return True when REPL input should be read as an infix expression.
+
+    That is input starting with a number, `(` or a sign, or with a name that is
+    called or followed by an infix operator: `max(3, 4) * 2`, `x * 2`. A lone
+    word such as `add` is the operation of a statement.
+    """
+    if not text:
+        return False
+    if text[0].isdigit() or text[0] in ".(+-":
+        return True
+    return not text.isidentifier() and _NAME_START_RE.match(text) is not None
@@ -0,0 +1,168 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Date: 10/18/2026
+# Project: Assignment 4 - Professional Calculator CLI
+# ----------------------------------------------------------
+
+"""
+Bounded, columnar calculation history for the Professional Calculator.
+
+Instead of keeping a list of Calculation objects forever, HistoryStore keeps
+each field of an entry in its own compact column:
+
+- a, b and result → parallel `array('d')` columns (8 bytes per value)
+- operation       → `array('B')` of one-byte opcodes
+
+The store has a fixed capacity and works as a ring buffer: once full, each
+append overwrites the oldest entry. Appending is O(1) and iterating yields
+plain tuples, so displaying the history never builds Calculation objects.
+
+Entry number `evicted + i` (counting every entry ever appended) always refers
+to the same calculation, which lets indexes such as app.history_query keep up
+with the store incrementally.
+"""
+
+from array import array
+from typing import Dict, Iterator, List, NamedTuple, Union
+
+from app import numeric
+
+DEFAULT_CAPACITY = 100_000
+
+
+class HistoryEntry(NamedTuple):
+    """One stored calculation, as produced while iterating a HistoryStore."""
+
+    operation: str
+    a: float
+    b: float
+    result: float
+
+    def __str__(self) -> str:
+        return f"{self.a} {self.operation} {self.b} = {self.result}"
+
+
+class HistoryStore:
+    """Fixed-capacity ring buffer of calculations stored in parallel columns."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        """
+        Initialize an empty history.
+
+        Args:
+            capacity (int): maximum number of entries kept; older ones are evicted
+        """
+        if capacity <= 0:
+            raise ValueError("History capacity must be a positive integer.")
+        self.capacity = capacity
+        self.evicted = 0  # entries overwritten or cleared since the store was created
+        self._a = array("d")
+        self._b = array("d")
+        self._result = array("d")
+        self._ops = array("B")
+        self._op_names: List[str] = []
+        self._op_codes: Dict[str, int] = {}
+        self._start = 0  # index of the oldest entry once the buffer is full
+
+    # -------------------------------
+    # Opcodes
+    # -------------------------------
+    def _opcode(self, operation: str) -> int:
+        """Return the one-byte code for an operation name, assigning one if new."""
+        code = self._op_codes.get(operation)
+        if code is None:
+            if len(self._op_names) > 255:
+                raise ValueError("HistoryStore supports at most 256 distinct operations.")
+            code = len(self._op_names)
+            self._op_names.append(operation)
+            self._op_codes[operation] = code
+        return code
+
+    # -------------------------------
+    # Writing
+    # -------------------------------
+    def append(self, operation: str, a: float, b: float, result: float) -> None:
+        """
+        Record one calculation, evicting the oldest entry when full.
+
+        Args:
+            operation (str): display name of the operation, e.g. "Add"
+            a (float): first operand
+            b (float): second operand
+            result (float): result of the calculation
+        """
+        code = self._opcode(operation)
+        try:
+            if len(self._ops) < self.capacity:
+                self._a.append(a)
+                self._b.append(b)
+                self._result.append(result)
+                self._ops.append(code)
+                return
+
+            slot = self._start
+            self._a[slot] = a
+            self._b[slot] = b
+            self._result[slot] = result
+        except OverflowError:  # an exact number beyond float range: recorded as ±inf
+            count = len(self._ops)
+            for column in (self._a, self._b, self._result):
+                del column[count:]  # drop the part of the entry already appended
+            to_float = numeric.to_float
+            self.append(operation, to_float(a), to_float(b), to_float(result))
+            return
+        self._ops[slot] = code
+        self._start = (slot + 1) % self.capacity
+        self.evicted += 1
+
+    def clear(self) -> None:
+        """Remove every entry (the opcode table is kept)."""
+        self.evicted += len(self._ops)
+        del self._a[:], self._b[:], self._result[:], self._ops[:]
+        self._start = 0
+
+    # -------------------------------
+    # Reading
+    # -------------------------------
+    def __len__(self) -> int:
+        return len(self._ops)
+
+    def __getitem__(self, index: int) -> HistoryEntry:
+        """Return the entry at `index`, counted from the oldest (negative indexes allowed)."""
+        size = len(self._ops)
+        if not -size <= index < size:
+            raise IndexError("history index out of range")
+        slot = (self._start + index) % size
+        return HistoryEntry(self._op_names[self._ops[slot]], self._a[slot], self._b[slot],
+                            self._result[slot])
+
+    def __iter__(self) -> Iterator[HistoryEntry]:
+        """Yield entries from oldest to newest."""
+        return self.entries()
+
+    def entries(self, start: int = 0) -> Iterator[HistoryEntry]:
+        """Yield entries from index `start` (counted from the oldest) to the newest."""
+        names = self._op_names
+        a, b, result, ops = self._a, self._b, self._result, self._ops
+        size = len(ops)
+        for offset in range(start, size):
+            slot = (self._start + offset) % size
+            yield HistoryEntry(names[ops[slot]], a[slot], b[slot], result[slot])
+
+    def column(self, field: str) -> Union[array, List[str]]:
+        """
+        Return one field of every entry, oldest first, without building entries.
+
+        Args:
+            field (str): "a", "b" or "result" (an array('d')), or "operation" (a list of names)
+        """
+        start = self._start
+        if field == "operation":
+            return list(map(self._op_names.__getitem__, self._ops[start:] + self._ops[:start]))
+        values = {"a": self._a, "b": self._b, "result": self._result}[field]
+        return values[start:] + values[:start]
+
+    def nbytes(self) -> int:
+        """Return the bytes held by the column buffers."""
+        return sum(column.buffer_info()[1] * column.itemsize
+                   for column in (self._a, self._b, self._result, self._ops))
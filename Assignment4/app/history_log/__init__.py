@@ -0,0 +1,295 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Date: 10/18/2026
+# Project: Assignment 4 - Professional Calculator CLI
+# ----------------------------------------------------------
+
+"""
+Persistent, append-only history log for the Professional Calculator.
+
+File layout:
+- A 4096-byte header: magic bytes, the number of known operations and a table
+  of operation names (16 bytes each). A record stores an index into this table.
+- Fixed-size 40-byte records: opcode, a, b, result and a Unix timestamp.
+
+Writes are appended through a buffered file and fsync'd in batches
+(every `sync_every` records, on `sync()` and on `close()`), so a calculation
+never waits for the disk. Reads go through `mmap`: opening a log only looks at
+its size, and entries are decoded on demand, so even logs with millions of
+records are available immediately.
+
+A crash can leave a partially written last record. It is detected from the
+file size and cut off when the log is reopened. `compact()` rewrites the log
+to keep only the most recent entries.
+"""
+
+import mmap
+import os
+import struct
+import time
+from array import array
+from operator import itemgetter
+from typing import Iterator, List, Optional, Tuple, Union
+
+from app import numeric
+from app.history import HistoryEntry
+
+MAGIC = b"CALCLOG\x01"
+HEADER_SIZE = 4096
+NAME_SIZE = 16
+NAMES_OFFSET = 16
+MAX_OPERATIONS = (HEADER_SIZE - NAMES_OFFSET) // NAME_SIZE
+COUNT = struct.Struct("<H")
+RECORD = struct.Struct("<B7xdddd")  # opcode, padding, a, b, result, timestamp
+DEFAULT_SYNC_EVERY = 256
+CHUNK_RECORDS = 4096  # records decoded per slice of the mapping while iterating
+FIELD_INDEX = {"operation": 0, "a": 1, "b": 2, "result": 3}  # position in an unpacked RECORD
+
+# One decoded record: (operation, a, b, result, timestamp)
+LogRecord = Tuple[str, float, float, float, float]
+
+
+class HistoryLog:
+    """Append-only binary log of calculations, read back through mmap."""
+
+    def __init__(self, path: str, sync_every: int = DEFAULT_SYNC_EVERY) -> None:
+        """
+        Open (or create) a history log.
+
+        Args:
+            path (str): location of the log file
+            sync_every (int): number of appended records between fsync calls
+        """
+        if sync_every <= 0:
+            raise ValueError("sync_every must be a positive integer.")
+        self.path = path
+        self.sync_every = sync_every
+        self.evicted = 0  # entries removed by compact() since the log was opened
+        self._load()
+
+    # -------------------------------
+    # Opening and Recovery
+    # -------------------------------
+    def _load(self) -> None:
+        """Open the file and read its header; records stay on disk until needed."""
+        self.truncated_bytes = 0  # size of a torn record removed when opening
+        self._pending = 0
+        self._map: Optional[mmap.mmap] = None
+        self._mapped = 0
+        self._file = self._open()
+        self._op_names = self._read_op_names()
+        self._op_codes = {name: code for code, name in enumerate(self._op_names)}
+        self._count = (os.fstat(self._file.fileno()).st_size - HEADER_SIZE) // RECORD.size
+        self._file.seek(0, os.SEEK_END)
+
+    def _open(self):
+        """Open the file, writing a header if new and cutting off a torn record."""
+        if not os.path.exists(self.path):
+            open(self.path, "wb").close()
+        log_file = open(self.path, "r+b")
+        size = os.fstat(log_file.fileno()).st_size
+
+        if size < HEADER_SIZE:
+            head = log_file.read(len(MAGIC))
+            if head != MAGIC[:len(head)]:
+                log_file.close()
+                raise ValueError(f"{self.path} is not a calculator history log.")
+            # New file, or a crash while the header was being created
+            log_file.seek(0)
+            log_file.truncate()
+            log_file.write(MAGIC + bytes(HEADER_SIZE - len(MAGIC)))
+            log_file.flush()
+            os.fsync(log_file.fileno())
+            return log_file
+
+        if log_file.read(len(MAGIC)) != MAGIC:
+            log_file.close()
+            raise ValueError(f"{self.path} is not a calculator history log.")
+
+        torn = (size - HEADER_SIZE) % RECORD.size
+        if torn:
+            log_file.truncate(size - torn)
+            os.fsync(log_file.fileno())
+            self.truncated_bytes = torn
+        return log_file
+
+    def _read_op_names(self) -> List[str]:
+        """Read the operation-name table from the header."""
+        self._file.seek(len(MAGIC))
+        (count,) = COUNT.unpack(self._file.read(COUNT.size))
+        self._file.seek(NAMES_OFFSET)
+        table = self._file.read(count * NAME_SIZE)
+        return [
+            table[i:i + NAME_SIZE].rstrip(b"\0").decode("utf-8")
+            for i in range(0, len(table), NAME_SIZE)
+        ]
+
+    def _opcode(self, operation: str) -> int:
+        """Return the code for an operation, adding it to the header if new."""
+        code = self._op_codes.get(operation)
+        if code is not None:
+            return code
+
+        encoded = operation.encode("utf-8")
+        if len(encoded) > NAME_SIZE:
+            raise ValueError(f"Operation name '{operation}' is longer than {NAME_SIZE} bytes.")
+        if len(self._op_names) >= MAX_OPERATIONS:
+            raise ValueError(f"History log supports at most {MAX_OPERATIONS} distinct operations.")
+
+        code = len(self._op_names)
+        # The name is made durable before any record that refers to it
+        self._file.flush()
+        os.pwrite(self._file.fileno(), encoded.ljust(NAME_SIZE, b"\0"),
+                  NAMES_OFFSET + code * NAME_SIZE)
+        os.pwrite(self._file.fileno(), COUNT.pack(code + 1), len(MAGIC))
+        os.fsync(self._file.fileno())
+        self._op_names.append(operation)
+        self._op_codes[operation] = code
+        return code
+
+    # -------------------------------
+    # Writing
+    # -------------------------------
+    def append(self, operation: str, a: float, b: float, result: float,
+               timestamp: Optional[float] = None) -> None:
+        """
+        Append one calculation to the log.
+
+        Args:
+            operation (str): display name of the operation, e.g. "Add"
+            a (float): first operand
+            b (float): second operand
+            result (float): result of the calculation
+            timestamp (float): Unix time of the calculation (defaults to now)
+        """
+        code = self._opcode(operation)
+        timestamp = time.time() if timestamp is None else timestamp
+        try:
+            record = RECORD.pack(code, a, b, result, timestamp)
+        except (OverflowError, struct.error):  # an exact number beyond float range: kept as ±inf
+            to_float = numeric.to_float
+            record = RECORD.pack(code, to_float(a), to_float(b), to_float(result), timestamp)
+        self._file.write(record)
+        self._count += 1
+        self._pending += 1
+        if self._pending >= self.sync_every:
+            self.sync()
+
+    def sync(self) -> None:
+        """Flush buffered records and fsync them to disk."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending = 0
+
+    def close(self) -> None:
+        """Sync pending records and release the file and its mapping."""
+        if self._file.closed:
+            return
+        self.sync()
+        self._unmap()
+        self._file.close()
+
+    def __enter__(self) -> "HistoryLog":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # -------------------------------
+    # Reading (through mmap)
+    # -------------------------------
+    def _unmap(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+            self._mapped = 0
+
+    def _ensure_mapped(self) -> mmap.mmap:
+        """Return a mapping that covers every appended record."""
+        if self._map is None or self._mapped < self._count:
+            self._file.flush()
+            self._unmap()
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._mapped = self._count
+        return self._map
+
+    def __len__(self) -> int:
+        return self._count
+
+    def record(self, index: int) -> LogRecord:
+        """Return (operation, a, b, result, timestamp) for the entry at `index`."""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("history index out of range")
+        code, a, b, result, timestamp = RECORD.unpack_from(
+            self._ensure_mapped(), HEADER_SIZE + index * RECORD.size
+        )
+        return self._op_names[code], a, b, result, timestamp
+
+    def __getitem__(self, index: int) -> HistoryEntry:
+        return HistoryEntry(*self.record(index)[:4])
+
+    def records(self, start: int = 0) -> Iterator[LogRecord]:
+        """Yield full records (including timestamps) from `start` to the end."""
+        names = self._op_names
+        end = self._count
+        for chunk_start in range(start, end, CHUNK_RECORDS):
+            chunk_end = min(chunk_start + CHUNK_RECORDS, end)
+            chunk = self._ensure_mapped()[HEADER_SIZE + chunk_start * RECORD.size:
+                                          HEADER_SIZE + chunk_end * RECORD.size]
+            for code, a, b, result, timestamp in RECORD.iter_unpack(chunk):
+                yield names[code], a, b, result, timestamp
+
+    def __iter__(self) -> Iterator[HistoryEntry]:
+        """Yield entries from oldest to newest."""
+        return self.entries()
+
+    def entries(self, start: int = 0) -> Iterator[HistoryEntry]:
+        """Yield entries from index `start` to the newest."""
+        for operation, a, b, result, _ in self.records(start):
+            yield HistoryEntry(operation, a, b, result)
+
+    def column(self, field: str) -> Union[array, List[str]]:
+        """
+        Return one field of every entry, oldest first, without building entries.
+
+        Args:
+            field (str): "a", "b" or "result" (an array('d')), or "operation" (a list of names)
+        """
+        data = self._ensure_mapped()[HEADER_SIZE:HEADER_SIZE + self._count * RECORD.size]
+        values = map(itemgetter(FIELD_INDEX[field]), RECORD.iter_unpack(data))
+        if field == "operation":
+            return list(map(self._op_names.__getitem__, values))
+        return array("d", values)
+
+    # -------------------------------
+    # Compaction
+    # -------------------------------
+    def compact(self, keep_last: int) -> int:
+        """
+        Rewrite the log keeping only the most recent `keep_last` entries.
+
+        The new log is written to a temporary file, fsync'd, and then atomically
+        renamed over the old one, so a crash leaves either the old or the new log.
+
+        Returns:
+            int: number of entries removed
+        """
+        if keep_last < 0:
+            raise ValueError("keep_last must not be negative.")
+        start = max(0, self._count - keep_last)
+        kept = list(self.records(start))
+        self.close()
+
+        tmp_path = f"{self.path}.compact"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        with HistoryLog(tmp_path, sync_every=max(1, len(kept))) as new_log:
+            for operation, a, b, result, timestamp in kept:
+                new_log.append(operation, a, b, result, timestamp)
+        os.replace(tmp_path, self.path)
+
+        self._load()
+        self.evicted += start
+        return start
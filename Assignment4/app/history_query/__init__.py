@@ -0,0 +1,376 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Date: 10/18/2026
+# Project: Assignment 4 - Professional Calculator CLI
+# ----------------------------------------------------------
+
+"""
+Indexed queries over the calculation history.
+
+`history` followed by a query lists only the matching calculations:
+
+    history divide result > 1e6      divisions with a result above a million
+    history a -5..5 last 10          the 10 most recent with a first operand in [-5, 5]
+    history add multiply top 3       the 3 largest results of additions and multiplications
+
+Clauses can be combined in any order: operation names (any of them may
+match), `result`, `a` or `b` compared with `<`, `<=`, `>`, `>=`, `=` or a
+`low..high` range (all of them must match), `last N` (the N most recent
+matches) and `top K` (the K largest results among them).
+
+A HistoryIndex answers queries without scanning the whole history:
+
+- a posting list per operation: the entry numbers in that operation, ascending
+- a SortedColumn per queried field: its values in sorted order, so a range is
+  found with `bisect` (built the first time the field is queried)
+- `top K` walks the result column from the largest value down, or keeps the K
+  largest matches in a heap (heapq.nlargest) when a filter narrows the search
+
+Entries are numbered `history.evicted + index`, so a number always refers to
+the same calculation. The index catches up with new entries before each query
+and rebuilds itself when most of what it holds has been evicted.
+"""
+
+import heapq
+import math
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import compress, islice
+from typing import (TYPE_CHECKING, Dict, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional,
+                    Sequence, Tuple, Union)
+
+from app.calculation import CalculationFactory
+from app.history import HistoryEntry, HistoryStore
+
+if TYPE_CHECKING:  # pragma: no cover
+    from app.history_log import HistoryLog
+
+History = Union[HistoryStore, "HistoryLog"]
+
+FIELDS = ("result", "a", "b")
+BLOCK_SIZE = 1024  # values per block of a sorted column; a block splits at twice this
+COMPARISONS = {">": (False, True), ">=": (False, False), "<": (True, True), "<=": (True, False)}
+
+_TOKEN = re.compile(r"[<>]=?|==?|[^\s<>=]+")
+
+
+class QueryError(ValueError):
+    """Raised when a history query cannot be parsed."""
+
+
+# -------------------------------
+# Queries
+# -------------------------------
+class FieldRange(NamedTuple):
+    """A condition on one numeric field: low <= value <= high, either end possibly open."""
+
+    field: str
+    low: float = -math.inf
+    high: float = math.inf
+    low_open: bool = False
+    high_open: bool = False
+
+    def matches(self, value: float) -> bool:
+        if self.low_open:
+            if not self.low < value:
+                return False
+        elif not self.low <= value:
+            return False
+        return value < self.high if self.high_open else value <= self.high
+
+
+class HistoryQuery(NamedTuple):
+    """A parsed `history` query."""
+
+    operations: FrozenSet[str] = frozenset()  # lower-case names; empty matches every operation
+    ranges: Tuple[FieldRange, ...] = ()
+    last: Optional[int] = None
+    top: Optional[int] = None
+
+
+def parse_query(text: str) -> HistoryQuery:
+    """
+    Parse the words after `history`.
+
+    Raises:
+        QueryError: for an unknown keyword, a missing number or a bad count
+    """
+    tokens = _TOKEN.findall(text.lower())
+    operations = set()
+    ranges = []
+    counts: Dict[str, int] = {}
+    i = 0
+    while i < len(tokens):
+        word = tokens[i]
+        if word in FIELDS:
+            ranges.append(_parse_range(word, tokens[i + 1:i + 3]))
+            i += 2 if ".." in tokens[i + 1:i + 2][0] else 3
+        elif word in ("last", "top"):
+            counts[word] = _parse_count(word, tokens[i + 1:i + 2])
+            i += 2
+        elif word[0].isalpha():
+            operations.add(word)
+            i += 1
+        else:
+            raise QueryError(f"Unexpected '{word}' in history query")
+    return HistoryQuery(frozenset(operations), tuple(ranges), counts.get("last"), counts.get("top"))
+
+
+def _parse_range(field: str, tokens: List[str]) -> FieldRange:
+    """Parse `<cmp> <number>` or `<low>..<high>` following a field name."""
+    if not tokens:
+        raise QueryError(f"Expected a comparison after '{field}'")
+    if ".." in tokens[0]:
+        low, _, high = tokens[0].partition("..")
+        return FieldRange(field, _parse_number(field, low), _parse_number(field, high))
+    comparison = tokens[0]
+    if comparison not in COMPARISONS and comparison not in ("=", "=="):
+        raise QueryError(f"Expected <, <=, >, >=, = or a low..high range after '{field}'")
+    number = _parse_number(f"{field} {comparison}", tokens[1] if len(tokens) > 1 else "")
+    if comparison in ("=", "=="):
+        return FieldRange(field, number, number)
+    is_upper_bound, is_open = COMPARISONS[comparison]
+    if is_upper_bound:
+        return FieldRange(field, high=number, high_open=is_open)
+    return FieldRange(field, low=number, low_open=is_open)
+
+
+def _parse_number(after: str, token: str) -> float:
+    try:
+        return float(token)
+    except ValueError:
+        raise QueryError(f"Expected a number after '{after}'") from None
+
+
+def _parse_count(keyword: str, tokens: List[str]) -> int:
+    if not tokens or not tokens[0].isdigit() or int(tokens[0]) == 0:
+        raise QueryError(f"Expected a positive whole number after '{keyword}'")
+    return int(tokens[0])
+
+
+# -------------------------------
+# Sorted Column
+# -------------------------------
+class SortedColumn:
+    """
+    One field's values in ascending order, each beside its entry number.
+
+    The values are cut into blocks (an array('d') of values and an array('q')
+    of entry numbers each), with the largest value of every block kept in
+    `_maxes`. bisect over `_maxes` picks a block and bisect inside it the
+    position, and an insert only shifts the values of one block. Equal values
+    are kept in entry order. NaN is left out: it has no place in the order and
+    matches no range.
+    """
+
+    __slots__ = ("_keys", "_seqs", "_maxes")
+
+    def __init__(self, values: Sequence[float] = (), first: int = 0) -> None:
+        """Index `values`, the field of entries number `first`, `first + 1`, ..."""
+        values = list(values)  # floats already: cheaper to sort by than array('d') items
+        positions: Iterable[int] = range(len(values))
+        if any(map(math.isnan, values)):
+            positions = [i for i in positions if not math.isnan(values[i])]
+        order = sorted(positions, key=values.__getitem__)  # stable: equal values keep entry order
+        self._keys = [array("d", map(values.__getitem__, order[i:i + BLOCK_SIZE]))
+                      for i in range(0, len(order), BLOCK_SIZE)]
+        self._seqs = [array("q", map(first.__add__, order[i:i + BLOCK_SIZE]))
+                      for i in range(0, len(order), BLOCK_SIZE)]
+        self._maxes = [keys[-1] for keys in self._keys]
+
+    def __len__(self) -> int:
+        return sum(map(len, self._keys))
+
+    def insert(self, value: float, seq: int) -> None:
+        """Add entry `seq` (newer than every entry already indexed) with its value."""
+        if math.isnan(value):
+            return
+        if not self._keys:
+            self._keys.append(array("d", [value]))
+            self._seqs.append(array("q", [seq]))
+            self._maxes.append(value)
+            return
+        i = min(bisect_right(self._maxes, value), len(self._maxes) - 1)
+        keys, seqs = self._keys[i], self._seqs[i]
+        j = bisect_right(keys, value)  # after equal values: the newest entry goes last
+        keys.insert(j, value)
+        seqs.insert(j, seq)
+        self._maxes[i] = keys[-1]
+        if len(keys) > 2 * BLOCK_SIZE:
+            self._keys.insert(i + 1, keys[BLOCK_SIZE:])
+            self._seqs.insert(i + 1, seqs[BLOCK_SIZE:])
+            del keys[BLOCK_SIZE:], seqs[BLOCK_SIZE:]
+            self._maxes.insert(i, keys[-1])
+
+    def _locate(self, value: float, after: bool) -> Tuple[int, int]:
+        """Return (block, offset) of the first value >= `value` (> `value` when `after`)."""
+        bisect = bisect_right if after else bisect_left
+        i = bisect(self._maxes, value)
+        return (i, bisect(self._keys[i], value)) if i < len(self._maxes) else (i, 0)
+
+    def _spans(self, condition: FieldRange) -> Iterator[Tuple[int, int, int]]:
+        """Yield (block, start, stop) for the values matching `condition`, in order."""
+        first_block, start = self._locate(condition.low, condition.low_open)
+        last_block, stop = self._locate(condition.high, not condition.high_open)
+        for i in range(first_block, min(last_block, len(self._keys) - 1) + 1):
+            lo = start if i == first_block else 0
+            hi = stop if i == last_block else len(self._keys[i])
+            if lo < hi:
+                yield i, lo, hi
+
+    def count(self, condition: FieldRange) -> int:
+        """Number of indexed values matching `condition`."""
+        first_block, start = self._locate(condition.low, condition.low_open)
+        last_block, stop = self._locate(condition.high, not condition.high_open)
+        if first_block >= last_block:
+            return max(stop - start, 0) if first_block == last_block else 0
+        between = sum(map(len, self._keys[first_block + 1:last_block]))
+        return len(self._keys[first_block]) - start + between + stop
+
+    def ascending(self, condition: FieldRange) -> Iterator[int]:
+        """Yield the entry numbers whose value matches `condition`, smallest value first."""
+        for i, lo, hi in self._spans(condition):
+            yield from self._seqs[i][lo:hi]
+
+    def descending(self, condition: FieldRange) -> Iterator[int]:
+        """Yield the entry numbers whose value matches `condition`, largest value first."""
+        for i, lo, hi in reversed(list(self._spans(condition))):
+            yield from reversed(self._seqs[i][lo:hi])
+
+
+# -------------------------------
+# History Index
+# -------------------------------
+class HistoryIndex:
+    """Posting lists and sorted columns over a HistoryStore or HistoryLog, updated lazily."""
+
+    def __init__(self, history: History) -> None:
+        self.history = history
+        self._postings: Dict[str, array] = {}  # lower-case operation → ascending entry numbers
+        self._columns: Dict[str, SortedColumn] = {}  # only the fields queried so far
+        self._base = 0  # number of the oldest entry still held (it may have been evicted since)
+        self._end = 0  # number after the newest entry indexed
+
+    def sync(self) -> None:
+        """
+        Catch up with the history: index new entries one by one, or rebuild
+        when there are many of them or evicted entries outnumber live ones.
+        """
+        history = self.history
+        first = history.evicted
+        end = first + len(history)
+        live = end - first
+        if (self._end < first or first - self._base > live
+                or end - self._end > max(BLOCK_SIZE, live // 8)):
+            self._rebuild()
+            return
+        postings, columns = self._postings, self._columns.items()
+        for seq, entry in enumerate(history.entries(self._end - first), self._end):
+            name = entry.operation.lower()
+            if name not in postings:
+                postings[name] = array("q")
+            postings[name].append(seq)
+            for field, column in columns:
+                column.insert(getattr(entry, field), seq)
+        self._end = end
+
+    def _rebuild(self) -> None:
+        """Index the whole history again, reading it a column at a time."""
+        history = self.history
+        first = history.evicted
+        entries = range(first, first + len(history))
+        operations = list(map(str.lower, history.column("operation")))
+        self._postings = {
+            name: array("q", compress(entries, map(name.__eq__, operations)))
+            for name in set(operations)
+        }
+        self._base, self._end = first, entries.stop
+        for field in self._columns:
+            self._columns[field] = SortedColumn(history.column(field), first)
+
+    def _column(self, field: str) -> SortedColumn:
+        """Return the sorted column of `field`, building it on first use (call after sync())."""
+        column = self._columns.get(field)
+        if column is None:
+            column = SortedColumn(self.history.column(field), self.history.evicted)
+            self._columns[field] = column
+        return column
+
+    def nbytes(self) -> int:
+        """Return the bytes held by the posting lists and sorted columns."""
+        arrays = list(self._postings.values())
+        for column in self._columns.values():
+            arrays += column._keys + column._seqs
+        return sum(values.buffer_info()[1] * values.itemsize for values in arrays)
+
+    # -------------------------------
+    # Queries
+    # -------------------------------
+    def select(self, query: HistoryQuery) -> List[Tuple[int, HistoryEntry]]:
+        """
+        Return the (index, entry) pairs matching `query`, oldest first (largest
+        result first for `top`). Indexes count from the oldest entry, from 0.
+
+        Raises:
+            QueryError: if the query names an unknown operation
+        """
+        self.sync()
+        unknown = query.operations.difference(CalculationFactory.available_calculations(),
+                                              self._postings)
+        if unknown:
+            raise QueryError(f"Unknown operation '{min(unknown)}' in history query")
+        first = self.history.evicted
+
+        # Candidates: every entry, the operations' posting lists or one field range,
+        # whichever is smallest
+        size = len(self.history)
+        candidates: Sequence[int] = range(first, first + size)
+        start = 0  # candidates before `start` are known to be evicted
+        if query.operations:
+            postings = [self._postings[name] for name in query.operations if name in self._postings]
+            size = sum(len(posting) - bisect_left(posting, first) for posting in postings)
+            if len(postings) == 1:
+                candidates, start = postings[0], len(postings[0]) - size
+            else:
+                candidates = sorted(seq for posting in postings for seq in posting if seq >= first)
+        narrowest = None
+        for condition in query.ranges:
+            count = self._column(condition.field).count(condition)
+            if count < size:
+                size, narrowest = count, condition
+        if narrowest is not None:
+            candidates, start = sorted(self._column(narrowest.field).ascending(narrowest)), 0
+
+        if query.top is not None and query.last is None:
+            # Walking the results down from the largest meets a match about every
+            # walked/size steps: cheaper than a heap over the candidates unless they are few
+            walk = next((condition for condition in query.ranges if condition.field == "result"),
+                        FieldRange("result"))
+            column = self._column("result")
+            if query.top * column.count(walk) < size * size:
+                matching = self._matching(column.descending(walk), query, first)
+                return list(islice(matching, query.top))
+
+        positions = range(start, len(candidates))
+        if query.last is not None:
+            newest = self._matching(map(candidates.__getitem__, reversed(positions)), query, first)
+            matches = list(islice(newest, query.last))[::-1]
+        else:
+            matches = list(self._matching(map(candidates.__getitem__, positions), query, first))
+        if query.top is not None:
+            matches = heapq.nlargest(query.top, matches, key=lambda match: match[1].result)
+        return matches
+
+    def _matching(self, seqs: Iterable[int], query: HistoryQuery,
+                  first: int) -> Iterator[Tuple[int, HistoryEntry]]:
+        """Yield (index, entry) for the entries among `seqs` that match every clause of `query`."""
+        history, operations, ranges = self.history, query.operations, query.ranges
+        for seq in seqs:
+            if seq < first:  # evicted since it was indexed
+                continue
+            entry = history[seq - first]
+            if operations and entry.operation.lower() not in operations:
+                continue
+            if all(condition.matches(getattr(entry, condition.field)) for condition in ranges):
+                yield seq - first, entry
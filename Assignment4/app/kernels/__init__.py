@@ -0,0 +1,152 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Date: 10/18/2026
+# Project: Assignment 4 - Professional Calculator CLI
+# ----------------------------------------------------------
+
+"""
+Vectorized kernels for applying one operation to many operand pairs.
+
+A kernel is a plain binary function from the `operator` module (for example
+`operator.add`) or the built-in min/max. `apply_kernel` applies it element-wise to two equally long
+columns of numbers in a single pass:
+
+- With NumPy installed, the matching ufunc (np.add, np.divide, ...) is used.
+- Without NumPy, `map()` drives the operator over the columns at C speed and
+  the results are collected into an `array('d')`.
+
+Columns may be `array('d')`, memoryview, NumPy arrays or any sequence of numbers.
+NumPy input gives a NumPy result; anything else gives an `array('d')`.
+
+`apply_checked` is the non-raising form: rows that a validate function rejects
+get NaN operands before the kernel runs (so the kernel cannot fail on them)
+and are marked in an error bitmap instead of stopping the batch.
+"""
+
+import math
+import operator
+from array import array
+from itertools import compress
+from typing import Any, Callable, Iterator, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+# Maps each supported operator to the name of its NumPy ufunc.
+UFUNC_NAMES = {
+    operator.add: "add",
+    operator.sub: "subtract",
+    operator.mul: "multiply",
+    operator.truediv: "divide",
+    min: "minimum",
+    max: "maximum",
+}
+
+
+def check_lengths(a: Any, b: Any) -> int:
+    """Ensure both operand columns are equally long and return that length."""
+    if len(a) != len(b):
+        raise ValueError(
+            f"Operand columns must have the same length (got {len(a)} and {len(b)})."
+        )
+    return len(a)
+
+
+def apply_kernel(kernel: Callable[[float, float], float], a: Any, b: Any) -> Any:
+    """
+    Apply a binary kernel element-wise to two operand columns.
+
+    Args:
+        kernel (Callable): binary function such as operator.add
+        a: first operand column
+        b: second operand column
+
+    Returns:
+        array('d') or numpy.ndarray: one result per operand pair
+
+    Raises:
+        ValueError: if the columns differ in length
+        ZeroDivisionError: if a division kernel meets a zero divisor
+    """
+    check_lengths(a, b)
+    if np is not None and kernel in UFUNC_NAMES:  # pragma: no cover - requires NumPy
+        return _apply_numpy(kernel, a, b)
+
+    try:
+        return array("d", map(kernel, a, b))
+    except ZeroDivisionError:
+        raise ZeroDivisionError("Cannot divide by zero.") from None
+
+
+def _apply_numpy(kernel, a, b):  # pragma: no cover - requires NumPy
+    """NumPy path: one ufunc call, written into a buffer of the right type."""
+    left = np.asarray(a, dtype=np.float64)
+    right = np.asarray(b, dtype=np.float64)
+    if kernel is operator.truediv and not right.all():
+        raise ZeroDivisionError("Cannot divide by zero.")
+
+    ufunc = getattr(np, UFUNC_NAMES[kernel])
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        return ufunc(left, right)
+    result = array("d", bytes(8 * len(left)))
+    ufunc(left, right, out=np.frombuffer(result, dtype=np.float64))
+    return result
+
+
+def apply_checked(kernel: Callable[[Any, Any], Any], validate: Optional[Callable[[Any, Any], int]],
+                  a: Any, b: Any) -> Tuple[Any, bytearray]:
+    """
+    Apply a binary kernel element-wise, giving NaN for the rows that fail.
+
+    Args:
+        kernel (Callable): binary function such as operator.truediv
+        validate (Callable): (a, b) → nonzero status for a row that must fail, or None
+        a: first operand column
+        b: second operand column
+
+    Returns:
+        (results, bitmap): results as from apply_kernel, and a bitmap with bit
+        `i % 8` of byte `i // 8` set when row `i` failed
+
+    Raises:
+        ValueError: if the columns differ in length
+    """
+    count = check_lengths(a, b)
+    bitmap = bytearray((count + 7) // 8)
+    if validate is not None:
+        failed = list(compress(range(count), map(validate, a, b)))
+        if failed:
+            a, b = _copy(a), _copy(b)
+            for i in failed:
+                a[i] = b[i] = math.nan  # every kernel maps NaN operands to NaN without raising
+                bitmap[i >> 3] |= 1 << (i & 7)
+    try:
+        return apply_kernel(kernel, a, b), bitmap
+    except (ArithmeticError, ValueError):  # a failure no check predicted: find the rows one by one
+        pass
+    results = array("d", bytes(8 * count))
+    for i, (x, y) in enumerate(zip(a, b)):
+        try:
+            results[i] = kernel(x, y)
+        except (ArithmeticError, ValueError):
+            results[i] = math.nan
+            bitmap[i >> 3] |= 1 << (i & 7)
+    return results, bitmap
+
+
+def error_rows(bitmap: bytearray) -> Iterator[int]:
+    """Yield the indexes of the rows marked in an error bitmap, in order."""
+    for index in compress(range(len(bitmap)), bitmap):
+        byte = bitmap[index]
+        for bit in range(8):
+            if byte >> bit & 1:
+                yield index * 8 + bit
+
+
+def _copy(column: Any) -> Any:
+    """Writable float copy of an operand column, keeping NumPy input as NumPy."""
+    if np is not None and isinstance(column, np.ndarray):  # pragma: no cover - requires NumPy
+        return np.array(column, dtype=np.float64)
+    return array("d", column)
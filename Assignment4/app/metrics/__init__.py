@@ -0,0 +1,236 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Date: 10/18/2026
+# Project: Assignment 4 - Professional Calculator CLI
+# ----------------------------------------------------------
+
+"""
+Built-in metrics for the Professional Calculator.
+
+While enabled, the calculator records:
+
+- calls and latency per operation, in log-bucketed histograms (powers of two,
+  from 64 ns to about 1 s)
+- errors by kind: division by zero, unparsable input, unsupported operations
+- the time taken by every REPL line
+
+Metrics are off by default and cost nothing then: instead of checking a flag
+on every call, CalculationFactory swaps timed wrappers in and out of its
+dispatch table and Calculation.execute whenever set_enabled() switches them
+(see add_listener). Only the REPL loop reads `enabled`, once per line.
+
+Results are shown by the REPL `stats` command and can be written in the
+Prometheus text format with Metrics.write_prometheus().
+"""
+
+import functools
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+MIN_BITS = 6  # the first bucket holds everything up to 2**6 ns
+BUCKET_COUNT = 25  # upper bounds 2**6 ... 2**30 ns; slower values go to the +Inf bucket
+BUCKET_BOUNDS_NS = [2 ** (MIN_BITS + i) for i in range(BUCKET_COUNT)]
+# bucket index by (ns - 1).bit_length(): one list lookup instead of min()/max() on every call
+_BUCKET_OF_BITS = [min(max(bits - MIN_BITS, 0), BUCKET_COUNT) for bits in range(65)]
+
+# Error kinds
+DIVISION_BY_ZERO = "division_by_zero"
+PARSE = "parse"
+UNSUPPORTED_OPERATION = "unsupported_operation"
+
+
+class Histogram:
+    """Latency histogram with power-of-two buckets; observing is one list update."""
+
+    __slots__ = ("counts", "total_ns")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (BUCKET_COUNT + 1)  # the last one is the +Inf bucket
+        self.total_ns = 0
+
+    def observe(self, elapsed_ns: int) -> None:
+        """Record one duration in nanoseconds."""
+        self.counts[_BUCKET_OF_BITS[(elapsed_ns - 1).bit_length()]] += 1
+        self.total_ns += elapsed_ns
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Upper bound (ns) of the bucket holding `fraction` of the values (inf past the last)."""
+        total = self.count
+        if not total:
+            return None
+        seen = 0
+        for bound, count in zip(BUCKET_BOUNDS_NS, self.counts):
+            seen += count
+            if seen >= fraction * total:
+                return float(bound)
+        return float("inf")
+
+    def clear(self) -> None:
+        self.counts[:] = [0] * (BUCKET_COUNT + 1)
+        self.total_ns = 0
+
+
+class Metrics:
+    """Per-operation histograms, error counters and REPL line latency."""
+
+    def __init__(self) -> None:
+        self.operations: Dict[str, Histogram] = {}
+        self.errors: Dict[Tuple[str, str], int] = {}  # (kind, operation or "") → count
+        self.lines = Histogram()
+
+    def histogram(self, operation: str) -> Histogram:
+        """Return the latency histogram of an operation, creating it on first use."""
+        histogram = self.operations.get(operation)
+        if histogram is None:
+            histogram = self.operations[operation] = Histogram()
+        return histogram
+
+    def record_error(self, kind: str, operation: str = "") -> None:
+        """Count one error of the given kind."""
+        key = (kind, operation)
+        self.errors[key] = self.errors.get(key, 0) + 1
+
+    def reset(self) -> None:
+        """Zero every counter; histograms stay in place, since timed wrappers hold them."""
+        for histogram in self.operations.values():
+            histogram.clear()
+        self.errors.clear()
+        self.lines.clear()
+
+    # -------------------------------
+    # Reports
+    # -------------------------------
+    def render(self) -> str:
+        """Return a human-readable summary, as shown by the REPL `stats` command."""
+        rows = [(name, histogram) for name, histogram in sorted(self.operations.items())
+                if histogram.count]
+        if not rows and not self.errors and not self.lines.count:
+            return "No calculations recorded yet."
+
+        def row(label: str, histogram: Histogram) -> str:
+            mean = _duration(histogram.total_ns / histogram.count)
+            p50, p99 = ("≤" + _duration(histogram.percentile(fraction)) for fraction in (0.5, 0.99))
+            return f"{label:<12}{histogram.count:>10}{mean:>12}{p50:>12}{p99:>12}"
+
+        lines = [f"{'Operation':<12}{'Calls':>10}{'Mean':>12}{'p50':>12}{'p99':>12}"]
+        lines.extend(row(name, histogram) for name, histogram in rows)
+        if self.lines.count:
+            lines.append(row("REPL lines", self.lines))
+        if self.errors:
+            errors = ", ".join(
+                f"{kind} ({operation}): {count}" if operation else f"{kind}: {count}"
+                for (kind, operation), count in sorted(self.errors.items())
+            )
+            lines.append(f"Errors: {errors}")
+        return "\n".join(lines)
+
+    def to_prometheus(self) -> str:
+        """Return every metric in the Prometheus text exposition format."""
+        out: List[str] = [
+            "# HELP calculator_operation_seconds Time spent in each calculation, by operation.",
+            "# TYPE calculator_operation_seconds histogram",
+        ]
+        for name, histogram in sorted(self.operations.items()):
+            out.extend(_histogram_lines("calculator_operation_seconds", histogram,
+                                        f'operation="{name}"'))
+        out += [
+            "# HELP calculator_repl_line_seconds Time spent evaluating each REPL line.",
+            "# TYPE calculator_repl_line_seconds histogram",
+            *_histogram_lines("calculator_repl_line_seconds", self.lines, ""),
+            "# HELP calculator_errors_total Failed calculations and rejected input, by kind.",
+            "# TYPE calculator_errors_total counter",
+        ]
+        for (kind, operation), count in sorted(self.errors.items()):
+            labels = f'kind="{kind}",operation="{operation}"' if operation else f'kind="{kind}"'
+            out.append(f"calculator_errors_total{{{labels}}} {count}")
+        return "\n".join(out) + "\n"
+
+    def write_prometheus(self, path: str) -> None:
+        """Write to_prometheus() to a file, replacing it atomically (e.g. for a node exporter)."""
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as dump:
+            dump.write(self.to_prometheus())
+        os.replace(temp_path, path)
+
+
+def _duration(ns: float) -> str:
+    """Format nanoseconds for the stats table."""
+    if ns == float("inf"):
+        return "inf"
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("µs", 1e3)):
+        if ns >= scale:
+            return f"{ns / scale:.1f} {unit}"
+    return f"{ns:.0f} ns"
+
+
+def _histogram_lines(name: str, histogram: Histogram, labels: str) -> List[str]:
+    """Cumulative bucket, sum and count samples of one histogram."""
+    prefix = labels + "," if labels else ""
+    lines, cumulative = [], 0
+    for bound, count in zip(BUCKET_BOUNDS_NS, histogram.counts):
+        cumulative += count
+        lines.append(f'{name}_bucket{{{prefix}le="{bound / 1e9:.12g}"}} {cumulative}')
+    total = cumulative + histogram.counts[-1]
+    label_set = f"{{{labels}}}" if labels else ""
+    lines += [
+        f'{name}_bucket{{{prefix}le="+Inf"}} {total}',
+        f"{name}_sum{label_set} {histogram.total_ns / 1e9:.9g}",
+        f"{name}_count{label_set} {total}",
+    ]
+    return lines
+
+
+# -------------------------------
+# Switching Metrics On and Off
+# -------------------------------
+METRICS = Metrics()
+enabled = False
+_listeners: List[Callable[[bool], None]] = []  # notified when metrics are switched on or off
+
+
+def set_enabled(flag: bool) -> None:
+    """Switch metrics collection on or off (recorded values are kept)."""
+    global enabled
+    if flag != enabled:
+        enabled = flag
+        for listener in _listeners:
+            listener(flag)
+
+
+def add_listener(listener: Callable[[bool], None]) -> None:
+    """Call `listener(enabled)` whenever metrics are switched on or off."""
+    _listeners.append(listener)
+
+
+def timed(function: Callable[..., Any], operation: str) -> Callable[..., Any]:
+    """
+    Wrap a calculation function so that each call is counted and timed.
+
+    Only completed calls are timed; a ZeroDivisionError is counted as an error
+    of the operation. Other exceptions pass through unrecorded (e.g. the
+    TypeError that sends CalculationFactory.evaluate to its fallback path).
+    """
+    histogram = METRICS.histogram(operation)
+    counts = histogram.counts
+    clock = time.perf_counter_ns
+    bucket_of = _BUCKET_OF_BITS
+
+    @functools.wraps(function)
+    def wrapper(*args: Any) -> Any:
+        start = clock()
+        try:
+            result = function(*args)
+        except ZeroDivisionError:
+            METRICS.record_error(DIVISION_BY_ZERO, operation)
+            raise
+        elapsed = clock() - start
+        counts[bucket_of[(elapsed - 1).bit_length()]] += 1
+        histogram.total_ns += elapsed
+        return result
+
+    return wrapper
@@ -0,0 +1,328 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Date: 10/18/2026
+# Project: Assignment 4 - Professional Calculator CLI
+# ----------------------------------------------------------
+
+"""
+Numeric backends for the Professional Calculator.
+
+A backend decides how operands are parsed and how arithmetic is done:
+
+- float    → IEEE-754 doubles, the default and fast path
+- int      → exact integers
+- fraction → exact rationals (fractions.Fraction)
+- decimal  → exact decimals (decimal.Decimal), e.g. for money values
+
+Exact backends promote automatically instead of losing precision:
+
+- int      → fraction when a division has a remainder or an operand is not whole
+- decimal  → fraction when a result would be rounded or overflow the exponent range
+- float    → decimal when a literal is out of range or a whole number too large
+             to be stored exactly as a float (e.g. 9007199254740993)
+
+The session backend is chosen with set_backend() (or temporarily with
+`using()`); apply() also takes a backend per call. Operands carry their type,
+so a Fraction or Decimal operand raises the backend of the operation to at
+least its own (int < decimal < fraction; plain int/float values never force
+an exact backend).
+
+While the session backend is float, Operations keeps its plain arithmetic and
+only calls into this module for operand types Python cannot mix (e.g. Decimal
+and Fraction), so float arithmetic costs exactly what it did before. Selecting
+another session backend routes every Operations call through apply().
+
+The decimal and fractions modules are imported lazily, on first use: a session
+that only ever sees floats does not pay for loading them at startup.
+"""
+
+import contextlib
+import functools
+import importlib.util
+import math
+import operator
+import re
+import sys
+from abc import ABC, abstractmethod
+from types import ModuleType
+from typing import Callable, Dict, Iterator, List, Union
+
+
+def _lazy_import(name: str) -> ModuleType:
+    """Return module `name`, deferring its actual loading until an attribute is used."""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+decimal = _lazy_import("decimal")
+fractions = _lazy_import("fractions")
+
+Number = Union[float, int, "fractions.Fraction", "decimal.Decimal"]
+
+# Registered calculation type → exact binary operator
+OPERATORS: Dict[str, Callable[[Number, Number], Number]] = {
+    "add": operator.add,
+    "subtract": operator.sub,
+    "multiply": operator.mul,
+    "divide": operator.truediv,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def decimal_context() -> "decimal.Context":
+    """Exact decimal arithmetic: every rounding or overflow raises instead of passing silently."""
+    return decimal.Context(
+        prec=28,
+        traps=[decimal.Inexact, decimal.Overflow, decimal.InvalidOperation, decimal.DivisionByZero],
+    )
+
+
+_INTEGER_RE = re.compile(r"\s*[+-]?\d+\s*")
+_FLOAT_EXACT_DIGITS = 15  # every whole number with at most this many digits is exact as a float
+
+
+# -------------------------------
+# Backends
+# -------------------------------
+class NumericBackend(ABC):
+    """Abstract base class: parse operands and apply operations in one number system."""
+
+    name = ""
+    rank = 0  # position in the promotion order; the higher rank wins when mixing
+
+    @abstractmethod
+    def parse(self, text: str) -> Number:
+        """Convert user input to a number of this backend (or a promoted one)."""
+        pass  # pragma: no cover  # abstract method intentionally not executed
+
+    @abstractmethod
+    def apply(self, calc_type: str, a: Number, b: Number) -> Number:
+        """Apply a registered calculation type, promoting when the result would be inexact."""
+        pass  # pragma: no cover  # abstract method intentionally not executed
+
+    def __repr__(self) -> str:
+        return f"<{self.name} backend>"
+
+
+class FloatBackend(NumericBackend):
+    """IEEE-754 doubles: fast, with the usual rounding (and inf on overflow)."""
+
+    name = "float"
+    rank = 0
+
+    def parse(self, text: str) -> Number:
+        value = float(text)
+        if value - value == 0 and (len(text) <= _FLOAT_EXACT_DIGITS or not value.is_integer()):
+            return value  # finite, and short or not a whole number: exact enough
+        if value - value != 0 and not re.search(r"inf|nan", text, re.IGNORECASE):
+            return DECIMAL.parse(text)  # out of float range: keep it as an exact decimal
+        if _INTEGER_RE.fullmatch(text) and int(text) != value:
+            return DECIMAL.parse(text)  # whole number beyond float precision
+        return value
+
+    def apply(self, calc_type: str, a: Number, b: Number) -> Number:
+        try:
+            a, b = float(a), float(b)
+        except OverflowError:  # an int or Fraction beyond float range
+            return FRACTION.apply(calc_type, a, b)
+        return OPERATORS[calc_type](a, b)
+
+
+class IntBackend(NumericBackend):
+    """Exact integers; anything that is not whole is promoted to a Fraction."""
+
+    name = "int"
+    rank = 1
+
+    def parse(self, text: str) -> Number:
+        if _INTEGER_RE.fullmatch(text):
+            return int(text)
+        return FRACTION.parse(text)
+
+    def apply(self, calc_type: str, a: Number, b: Number) -> Number:
+        if not (_is_whole(a) and _is_whole(b)):
+            return FRACTION.apply(calc_type, a, b)
+        a, b = int(a), int(b)
+        if calc_type == "divide":
+            quotient, remainder = divmod(a, b)
+            return quotient if remainder == 0 else fractions.Fraction(a, b)
+        return OPERATORS[calc_type](a, b)
+
+
+class DecimalBackend(NumericBackend):
+    """Exact decimals with 28 significant digits; rounding promotes to a Fraction."""
+
+    name = "decimal"
+    rank = 2
+
+    def parse(self, text: str) -> Number:
+        try:
+            return decimal.Decimal(text.strip())
+        except decimal.InvalidOperation:
+            raise ValueError(f"Invalid number: '{text}'") from None
+
+    def apply(self, calc_type: str, a: Number, b: Number) -> Number:
+        try:
+            result = getattr(decimal_context(), calc_type)(_to_decimal(a), _to_decimal(b))
+        except (decimal.Inexact, decimal.Overflow, decimal.InvalidOperation, TypeError):
+            return FRACTION.apply(calc_type, a, b)  # TypeError: a Fraction operand
+        return result
+
+
+class FractionBackend(NumericBackend):
+    """Exact rationals; the top of the promotion order."""
+
+    name = "fraction"
+    rank = 3
+
+    def parse(self, text: str) -> Number:
+        try:
+            return fractions.Fraction(text.strip())
+        except ZeroDivisionError:  # e.g. "1/0"
+            raise ValueError(f"Invalid number: '{text}'") from None
+
+    def apply(self, calc_type: str, a: Number, b: Number) -> Number:
+        try:
+            a, b = fractions.Fraction(a), fractions.Fraction(b)
+        except (OverflowError, ValueError):  # inf and nan only exist as floats
+            return OPERATORS[calc_type](float(a), float(b))
+        return OPERATORS[calc_type](a, b)
+
+
+def _is_whole(value: Number) -> bool:
+    """Return True when a number has no fractional part (False for inf and nan)."""
+    if isinstance(value, int):
+        return True
+    try:
+        return value == int(value)
+    except (OverflowError, ValueError):
+        return False
+
+
+def _to_decimal(value: Number) -> "decimal.Decimal":
+    """Convert an operand to Decimal exactly (raises Inexact if it needs rounding)."""
+    if isinstance(value, float):
+        return decimal.Decimal(value)  # the exact binary value of the float
+    return decimal_context().create_decimal(value)
+
+
+FLOAT = FloatBackend()
+INT = IntBackend()
+DECIMAL = DecimalBackend()
+FRACTION = FractionBackend()
+
+BACKENDS: Dict[str, NumericBackend] = {backend.name: backend
+                                       for backend in (FLOAT, INT, DECIMAL, FRACTION)}
+_BY_RANK = sorted(BACKENDS.values(), key=lambda backend: backend.rank)
+
+# Backend rank implied by an operand's type (int and float are ambiguous and imply
+# nothing); filled in by _type_rank() as new types show up
+_TYPE_RANK: Dict[type, int] = {int: 0, float: 0}
+
+_session_backend: NumericBackend = FLOAT
+_listeners: List[Callable[[NumericBackend], None]] = []  # notified on session backend changes
+
+
+# -------------------------------
+# Backend Selection
+# -------------------------------
+def get_backend(name: Union[str, NumericBackend, None] = None) -> NumericBackend:
+    """Return a backend by name (None → the session backend)."""
+    if name is None:
+        return _session_backend
+    if isinstance(name, NumericBackend):
+        return name
+    try:
+        return BACKENDS[name.lower()]
+    except KeyError:
+        raise ValueError(
+            f"Unsupported numeric backend: '{name}'. Available: {', '.join(BACKENDS)}"
+        ) from None
+
+
+def set_backend(name: Union[str, NumericBackend]) -> NumericBackend:
+    """Select the session backend used by parse() and apply() by default."""
+    global _session_backend
+    backend = get_backend(name)
+    if backend is not _session_backend:
+        _session_backend = backend
+        for listener in _listeners:
+            listener(backend)
+    return backend
+
+
+def add_backend_listener(listener: Callable[[NumericBackend], None]) -> None:
+    """Call `listener(backend)` whenever the session backend changes."""
+    _listeners.append(listener)
+
+
+@contextlib.contextmanager
+def using(name: Union[str, NumericBackend]) -> Iterator[NumericBackend]:
+    """Temporarily switch the session backend inside a `with` block."""
+    previous = _session_backend
+    try:
+        yield set_backend(name)
+    finally:
+        set_backend(previous)
+
+
+# -------------------------------
+# Parsing and Arithmetic
+# -------------------------------
+def parse(text: str, backend: Union[str, NumericBackend, None] = None) -> Number:
+    """Parse an operand with the given (or session) backend."""
+    return get_backend(backend).parse(text)
+
+
+def apply(calc_type: str, a: Number, b: Number,
+          backend: Union[str, NumericBackend, None] = None) -> Number:
+    """
+    Apply "add", "subtract", "multiply" or "divide" to two numbers.
+
+    Args:
+        calc_type (str): operation name
+        a (Number): first operand
+        b (Number): second operand
+        backend (str): backend for this call (default: the session backend)
+
+    Returns:
+        Number: the result, in the highest-ranked backend among the requested
+        one and the operand types (or a promoted one)
+    """
+    selected = get_backend(backend)
+    try:
+        rank = max(selected.rank, _TYPE_RANK[type(a)], _TYPE_RANK[type(b)])
+    except KeyError:  # an operand type not seen before
+        rank = max(selected.rank, _type_rank(type(a)), _type_rank(type(b)))
+    return _BY_RANK[rank].apply(calc_type, a, b)
+
+
+def to_float(value: Number) -> float:
+    """Convert a number to float, saturating to ±inf beyond the float range (e.g. 10 ** 400)."""
+    try:
+        return float(value)
+    except OverflowError:
+        return math.inf if value > 0 else -math.inf
+
+
+def _type_rank(value_type: type) -> int:
+    """Return the lowest backend rank that can hold values of `value_type` exactly."""
+    try:
+        return _TYPE_RANK[value_type]
+    except KeyError:
+        pass
+    if issubclass(value_type, decimal.Decimal):
+        rank = DECIMAL.rank
+    elif issubclass(value_type, fractions.Fraction):
+        rank = FRACTION.rank
+    else:
+        rank = 0
+    _TYPE_RANK[value_type] = rank
+    return rank
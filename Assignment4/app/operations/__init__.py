@@ -7,28 +7,113 @@
 # This file is called "operations.py". 
 # It has four math functions: add, subtract, multiply, and divide.
 # Think of them as tools to do basic math.
+#
+# The numbers can be floats (the default) or exact values from a numeric
+# backend (int, Fraction, Decimal - see app/numeric). With the float backend
+# the functions below do plain Python math; choosing another backend with
+# numeric.set_backend() swaps them for versions that go through the backend.
+#
+# division() checks for a zero divisor and divides; quotient() is the same
+# arithmetic without the check. Callers that have already validated the
+# divisor (DivideCalculation) call quotient(), so the check runs once.
+#
+# Either number may also be a vector (see app/vectors), e.g. [1, 2, 3]: the
+# operation then runs element by element, and a plain number on the other side
+# is used for every element. Vectors have no + - * / of their own, so they end
+# up in the same fallback as number types that cannot be mixed directly.
 
 # app/operation/__init__.py
 
+from app import numeric
+
+
+def _promote(calc_type: str, a, b):
+    """Apply an operation the plain operator could not: vector operands or mixed number types."""
+    if type(a) is memoryview or type(b) is memoryview:
+        from app.vectors import elementwise  # deferred: only sessions that use vectors
+        return elementwise(numeric.OPERATORS[calc_type], a, b)
+    return numeric.apply(calc_type, a, b)
+
+
 class Operations:
     """A class that provides basic arithmetic operations."""
 
     @staticmethod
     def addition(a: float, b: float) -> float:
-        return a + b
+        try:
+            return a + b
+        except TypeError:  # e.g. Decimal + Fraction: let the numeric layer promote
+            return _promote("add", a, b)
 
     @staticmethod
     def subtraction(a: float, b: float) -> float:
-        return a - b
+        try:
+            return a - b
+        except TypeError:
+            return _promote("subtract", a, b)
 
     @staticmethod
     def multiplication(a: float, b: float) -> float:
-        return a * b
+        try:
+            return a * b
+        except TypeError:
+            return _promote("multiply", a, b)
 
     @staticmethod
     def division(a: float, b: float) -> float:
         if b == 0:
             raise ValueError("Division by zero is not allowed.")
-        return a / b
+        try:  # inlined rather than calling quotient(): this is the hottest path
+            return a / b
+        except TypeError:
+            return _promote("divide", a, b)
+
+    @staticmethod
+    def quotient(a: float, b: float) -> float:
+        # a / b for a divisor the caller has already checked (no zero check here)
+        try:
+            return a / b
+        except TypeError:
+            return _promote("divide", a, b)
+
+
+# Plain float versions, restored when the session goes back to the float backend
+_FLOAT_OPERATIONS = {name: Operations.__dict__[name]
+                     for name in ("addition", "subtraction", "multiplication", "division",
+                                  "quotient")}
+
+
+def _backend_operation(calc_type: str):
+    """Build an Operations method that always goes through the session backend."""
+
+    def operation(a, b):
+        return _promote(calc_type, a, b)
+
+    operation.__name__ = calc_type
+    return staticmethod(operation)
+
+
+def _backend_division(a, b):
+    """division() through the session backend, with its zero check."""
+    if b == 0:
+        raise ValueError("Division by zero is not allowed.")
+    return _promote("divide", a, b)
+
+
+_BACKEND_OPERATIONS = {
+    "addition": _backend_operation("add"),
+    "subtraction": _backend_operation("subtract"),
+    "multiplication": _backend_operation("multiply"),
+    "division": staticmethod(_backend_division),
+    "quotient": _backend_operation("divide"),
+}
+
+
+def _bind(backend: numeric.NumericBackend) -> None:
+    """Switch Operations between the plain float functions and the backend ones."""
+    table = _FLOAT_OPERATIONS if backend is numeric.FLOAT else _BACKEND_OPERATIONS
+    for name, function in table.items():
+        setattr(Operations, name, function)
 
 
+numeric.add_backend_listener(_bind)
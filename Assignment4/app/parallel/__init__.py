@@ -0,0 +1,224 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Date: 10/18/2026
+# Project: Assignment 4 - Professional Calculator CLI
+# ----------------------------------------------------------
+
+"""
+Parallel batch evaluation for the Professional Calculator.
+
+Large batches are split into chunks that run in a ProcessPoolExecutor.
+Operands and results are never pickled: the parent writes every column into
+one `multiprocessing.shared_memory` block and each worker reads and writes its
+own index range of that block directly.
+
+Block layout for `n` calculations:
+
+    a (float64 × n) | b (float64 × n) | result (float64 × n) |
+    opcode (uint8 × n) | status (uint8 × n)
+
+Because each chunk writes results at their original positions, results come
+back in input order without any merge step. The chunk size is picked from the
+input length and worker count unless given explicitly.
+"""
+
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Callable, Iterable, List, Optional, Sequence, TextIO, Tuple, Union
+
+from app.batch import FLUSH_EVERY, BatchSummary, new_summary
+from app.calculation import STATUS_DIVISION_BY_ZERO, STATUS_ERROR, STATUS_OK, CalculationFactory
+
+MIN_CHUNK_SIZE = 8192  # below this, task overhead outweighs the work
+CHUNKS_PER_WORKER = 4  # several chunks per worker even out uneven progress
+ROW_BYTES = 8 * 3 + 2  # a, b, result + opcode, status
+
+
+def auto_chunk_size(count: int, workers: int) -> int:
+    """Pick a chunk size giving each worker a few chunks, but never tiny ones."""
+    return max(MIN_CHUNK_SIZE, -(-count // (workers * CHUNKS_PER_WORKER)))
+
+
+def _evaluators(calc_types: Sequence[str]
+                ) -> List[Tuple[Callable[[float, float], float], Optional[Callable]]]:
+    """Return (element-wise function, validate) per calculation type (the kernel if available)."""
+    evaluators = []
+    for calc_type in calc_types:
+        calc_class = CalculationFactory.get_calculation_class(calc_type)
+        if calc_class.kernel is not None:
+            evaluators.append((calc_class.kernel, calc_class.validate))
+        else:
+            function = lambda x, y, calc_class=calc_class: calc_class(x, y).execute()  # noqa: E731
+            evaluators.append((function, calc_class.validate))
+    return evaluators
+
+
+def _evaluate_range(buf: memoryview, count: int, calc_types: Sequence[str], start: int,
+                    end: int) -> None:
+    """Evaluate rows [start, end) of a shared block in place."""
+    evaluators = _evaluators(calc_types)
+    a = buf[:8 * count].cast("d")
+    b = buf[8 * count:16 * count].cast("d")
+    result = buf[16 * count:24 * count].cast("d")
+    ops = buf[24 * count:25 * count]
+    status = buf[25 * count:26 * count]
+    try:
+        for i in range(start, end):
+            function, validate = evaluators[ops[i]]
+            x, y = a[i], b[i]
+            # e.g. a zero divisor, found without raising
+            code = validate(x, y) if validate is not None else STATUS_OK
+            if code == STATUS_OK:
+                try:
+                    result[i] = function(x, y)
+                except ZeroDivisionError:  # from a type without a validate check
+                    code = STATUS_DIVISION_BY_ZERO
+                except (ArithmeticError, ValueError):
+                    code = STATUS_ERROR
+            status[i] = code
+    finally:
+        for view in (a, b, result, ops, status):
+            view.release()  # the block cannot be closed while views exist
+
+
+def _evaluate_chunk(block_name: str, count: int, calc_types: Sequence[str], start: int,
+                    end: int) -> None:
+    """Worker entry point: attach to the shared block and evaluate one chunk."""
+    block = shared_memory.SharedMemory(name=block_name)
+    try:
+        _evaluate_range(block.buf, count, calc_types, start, end)
+    finally:
+        block.close()
+
+
+def execute_parallel(calc_types: Sequence[str], ops: Sequence[int],
+                     a: Sequence[float], b: Sequence[float],
+                     workers: Optional[int] = None,
+                     chunk_size: Optional[int] = None) -> Tuple[array, array]:
+    """
+    Evaluate many calculations across worker processes.
+
+    Args:
+        calc_types (Sequence[str]): registered type names; `ops` indexes into it
+        ops (Sequence[int]): operation index per row (array('B') works best)
+        a (Sequence[float]): first operands
+        b (Sequence[float]): second operands
+        workers (int): process count (default: os.cpu_count())
+        chunk_size (int): rows per task (default: auto_chunk_size)
+
+    Returns:
+        (array('d'), array('B')): results and a STATUS_* code per row, in input order
+    """
+    count = len(ops)
+    if not count == len(a) == len(b):
+        raise ValueError("ops, a and b must have the same length.")
+    if len(calc_types) > 256:
+        raise ValueError("At most 256 calculation types can be used in one batch.")
+    _evaluators(calc_types)  # fail fast on unknown types
+    if count == 0:
+        return array("d"), array("B")
+
+    workers = workers or os.cpu_count() or 1
+    chunk_size = chunk_size or auto_chunk_size(count, workers)
+
+    block = shared_memory.SharedMemory(create=True, size=ROW_BYTES * count)
+    try:
+        buf = block.buf
+        buf[:8 * count] = array("d", a).tobytes()
+        buf[8 * count:16 * count] = array("d", b).tobytes()
+        buf[24 * count:25 * count] = array("B", ops).tobytes()
+
+        if workers == 1 or count <= chunk_size:
+            _evaluate_range(buf, count, calc_types, 0, count)  # not worth a pool
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(_evaluate_chunk, block.name, count, list(calc_types),
+                                start, min(start + chunk_size, count))
+                    for start in range(0, count, chunk_size)
+                ]
+                for future in futures:
+                    future.result()
+
+        results = array("d", bytes(buf[16 * count:24 * count]))
+        statuses = array("B", bytes(buf[25 * count:26 * count]))
+        del buf
+    finally:
+        block.close()
+        block.unlink()
+    return results, statuses
+
+
+def run_batch_parallel(lines: Iterable[str], out: TextIO, workers: Optional[int] = None,
+                       chunk_size: Optional[int] = None, aggregate: bool = False) -> BatchSummary:
+    """
+    Parallel counterpart of app.batch.run_batch, with identical output.
+
+    Lines are parsed in this process into operand columns; the calculations
+    themselves run through execute_parallel. Result statistics (aggregate=True)
+    are collected here too, while the output is written.
+    """
+    summary = new_summary(aggregate)
+    add_result = summary.results.add if aggregate else None
+    calc_types: List[str] = []
+    codes = {}
+    ops, a, b = array("B"), array("d"), array("d")
+    rows: List[Union[Tuple[int, int], str]] = []  # (column index, line number) or an error line
+
+    for line_no, raw_line in enumerate(lines, start=1):
+        line = raw_line.strip()
+        if not line or line.startswith("#"):
+            continue
+        summary.processed += 1
+        try:
+            operation, num1_str, num2_str = line.split()
+            num1, num2 = float(num1_str), float(num2_str)
+        except ValueError:
+            summary.format_errors += 1
+            rows.append(f"Error (line {line_no}): Invalid format. Use: <operation> <num1> <num2>\n")
+            continue
+
+        key = operation.lower()
+        code = codes.get(key)
+        if code is None:
+            try:
+                CalculationFactory.get_calculation_class(key)
+            except ValueError as e:
+                summary.operation_errors += 1
+                rows.append(f"Error (line {line_no}): {e}\n")
+                continue
+            code = codes[key] = len(calc_types)
+            calc_types.append(key)
+        rows.append((len(ops), line_no))
+        ops.append(code)
+        a.append(num1)
+        b.append(num2)
+
+    results, statuses = execute_parallel(calc_types, ops, a, b, workers, chunk_size)
+
+    output: List[str] = []
+    for row in rows:
+        if len(output) >= FLUSH_EVERY:
+            out.write("".join(output))
+            output.clear()
+        if isinstance(row, str):
+            output.append(row)
+            continue
+        index, line_no = row
+        status = statuses[index]
+        if status == STATUS_OK:
+            summary.succeeded += 1
+            output.append(f"{results[index]}\n")
+            if add_result is not None:
+                add_result(calc_types[ops[index]], results[index])
+        elif status == STATUS_DIVISION_BY_ZERO:
+            summary.division_errors += 1
+            output.append(f"Error (line {line_no}): Division by zero is not allowed.\n")
+        else:
+            summary.operation_errors += 1
+            output.append(f"Error (line {line_no}): Calculation failed.\n")
+    if output:
+        out.write("".join(output))
+    return summary
@@ -0,0 +1,135 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Date: 10/18/2026
+# Project: Assignment 4 - Professional Calculator CLI
+# ----------------------------------------------------------
+
+"""
+Calculation plugins discovered through package entry points.
+
+A separately installed package can add calculation types by declaring them
+in the `calculator.calculations` entry point group, e.g. in its pyproject.toml:
+
+    [project.entry-points."calculator.calculations"]
+    power = "calc_power.operations:PowerCalculation"
+
+Scanning the metadata of every installed distribution is slow, so the result
+is kept as a manifest (type name → "module:Class") in a JSON cache file. The
+cache is reused as long as none of the sys.path directories holding package
+metadata (*.dist-info, *.egg-info) has changed, which is what installing or
+removing a package does. Other directories, such as the current one, are not
+watched: files the calculator writes there must not invalidate the cache.
+Nothing here imports a plugin: CalculationFactory imports each one the first
+time its type is used.
+"""
+
+import importlib
+import json
+import os
+import sys
+from typing import Any, Dict, List, Optional
+
+ENTRY_POINT_GROUP = "calculator.calculations"
+CACHE_ENV = "CALCULATOR_PLUGIN_CACHE"  # overrides the manifest cache location
+MANIFEST_VERSION = 1
+METADATA_SUFFIXES = (".dist-info", ".egg-info")  # one directory per installed distribution
+
+
+def default_cache_path() -> str:
+    """Return the manifest cache file ($CALCULATOR_PLUGIN_CACHE or ~/.cache/...)."""
+    return os.environ.get(CACHE_ENV) or os.path.join(
+        os.path.expanduser("~"), ".cache", "professional-calculator", "plugins.json"
+    )
+
+
+# -------------------------------
+# Discovery
+# -------------------------------
+def discover(group: str = ENTRY_POINT_GROUP) -> Dict[str, str]:
+    """
+    Scan installed distributions for calculation entry points.
+
+    Returns:
+        dict: lower-case type name → "module:Class"
+
+    Raises:
+        ValueError: when two plugins provide the same type name
+    """
+    from importlib.metadata import entry_points  # deferred: only needed on a cache miss
+
+    manifest: Dict[str, str] = {}
+    for entry_point in entry_points(group=group):
+        name = entry_point.name.lower()
+        if manifest.get(name, entry_point.value) != entry_point.value:
+            raise ValueError(
+                f"Calculation type '{name}' is provided by both "
+                f"{manifest[name]} and {entry_point.value}."
+            )
+        manifest[name] = entry_point.value
+    return manifest
+
+
+def _fingerprint() -> List[List[Any]]:
+    """Modification times of the sys.path directories that hold distribution metadata."""
+    fingerprint = []
+    for path in sys.path:
+        if not path:
+            continue  # the current directory: history logs and other output land there
+        try:
+            with os.scandir(path) as entries:
+                if any(entry.name.endswith(METADATA_SUFFIXES) for entry in entries):
+                    fingerprint.append([path, os.stat(path).st_mtime_ns])
+        except OSError:
+            continue  # e.g. a zip file or a directory that does not exist
+    return fingerprint
+
+
+# -------------------------------
+# Manifest Cache
+# -------------------------------
+def load_manifest(cache_path: Optional[str] = None) -> Dict[str, str]:
+    """
+    Return the plugin manifest, from the cache file when it is still valid.
+
+    Args:
+        cache_path (str): cache file (default: default_cache_path())
+    """
+    path = cache_path or default_cache_path()
+    fingerprint = _fingerprint()
+    try:
+        with open(path, encoding="utf-8") as cache:
+            cached = json.load(cache)
+    except (OSError, ValueError):
+        cached = None
+    if (isinstance(cached, dict) and cached.get("version") == MANIFEST_VERSION
+            and cached.get("fingerprint") == fingerprint):
+        return dict(cached["calculations"])
+
+    manifest = discover()
+    write_manifest(path, manifest, fingerprint)
+    return manifest
+
+
+def write_manifest(path: str, manifest: Dict[str, str], fingerprint: List[List[Any]]) -> None:
+    """Write the manifest cache atomically; failures are ignored (the cache is optional)."""
+    data = {"version": MANIFEST_VERSION, "fingerprint": fingerprint, "calculations": manifest}
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(temp_path, "w", encoding="utf-8") as cache:
+            json.dump(data, cache, indent=2, sort_keys=True)
+        os.replace(temp_path, path)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
+def import_target(target: str) -> Any:
+    """Import and return the object named by a "module:attribute" entry point value."""
+    module_name, _, attribute = target.partition(":")
+    value = importlib.import_module(module_name)
+    for part in filter(None, attribute.split(".")):
+        value = getattr(value, part)
+    return value
@@ -0,0 +1,173 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Date: 10/18/2026
+# Project: Assignment 4 - Professional Calculator CLI
+# ----------------------------------------------------------
+
+"""
+N-ary reductions for the Professional Calculator.
+
+add, multiply, min, max and mean accept any number of operands, both in the
+REPL (`add 1 2 3 4`) and from Python through CalculationFactory.reduce, which
+takes any iterable. Every reduction consumes its input once, value by value:
+generators and files are never materialised, so memory stays constant however
+many values there are.
+
+With the float backend the loops run in C:
+
+- sum     → math.fsum (correctly rounded: no error builds up over many values)
+- product → math.prod
+- min/max → the built-ins
+- mean    → math.fsum, with the values counted on the way by itertools.count
+
+math.fsum raises where plain float addition saturates: OverflowError when a
+partial sum leaves the float range, ValueError for inf - inf. Sums and means
+then give inf or nan, as `add 1e308 1e308` does (see _fsum).
+
+Exact backends fold the values through numeric.apply instead, so n-ary sums
+and products promote exactly as the binary operations do.
+
+read_numbers() turns lines of text into such an iterable, parsing lazily.
+"""
+
+import functools
+import itertools
+import math
+import operator
+from typing import Callable, Iterable, Iterator, List, Optional
+
+from app import numeric
+
+# Default of min()/max(), so a parse error in the input is never mistaken for "no values"
+_EMPTY = object()
+
+# Values of a one-pass input held at a time by _fsum, to finish a sum that fsum gives up on
+SUM_CHUNK = 4096
+
+
+def _fold(calc_type: str, values: Iterable[numeric.Number],
+          start: numeric.Number) -> numeric.Number:
+    """Exact backends: combine the values one by one through the session backend."""
+    return functools.reduce(functools.partial(numeric.apply, calc_type), values, start)
+
+
+def _fsum(values: Iterable[float]) -> float:
+    """
+    math.fsum, but a sum beyond float range is ±inf and inf - inf is nan, as with plain addition.
+
+    A container is summed again with sum() when fsum raises. A one-pass input
+    (a generator, a file) reaches fsum in chunks, with the plain sum of the
+    chunks already summed kept on the side, so the rest of the input can be
+    added to it without reading anything twice.
+    """
+    if iter(values) is not values:  # a list, tuple or array: it can be read again
+        try:
+            return math.fsum(values)
+        except (OverflowError, ValueError):  # intermediate overflow, or inf - inf
+            return sum(values, 0.0)
+
+    done, chunk, reading = 0.0, [], False
+
+    def chunks() -> Iterator[List[float]]:
+        nonlocal done, chunk, reading
+        while True:
+            done += sum(chunk)
+            reading = True
+            chunk = list(itertools.islice(values, SUM_CHUNK))
+            reading = False
+            if not chunk:
+                return
+            yield chunk
+
+    try:
+        return math.fsum(itertools.chain.from_iterable(chunks()))
+    except (OverflowError, ValueError):
+        if reading:  # raised by the input itself, e.g. a line that is not a number
+            raise
+        return sum(values, done + sum(chunk))
+
+
+# -------------------------------
+# Reductions
+# -------------------------------
+def total(values: Iterable[numeric.Number]) -> numeric.Number:
+    """Return the sum of the values (0 when there are none)."""
+    if numeric.get_backend() is numeric.FLOAT:
+        return _fsum(values)
+    return _fold("add", values, 0)
+
+
+def product(values: Iterable[numeric.Number]) -> numeric.Number:
+    """Return the product of the values (1 when there are none)."""
+    if numeric.get_backend() is numeric.FLOAT:
+        return math.prod(values, start=1.0)
+    return _fold("multiply", values, 1)
+
+
+def minimum(values: Iterable[numeric.Number]) -> numeric.Number:
+    """Return the smallest value."""
+    result = min(values, default=_EMPTY)
+    if result is _EMPTY:
+        raise ValueError("min needs at least one number.")
+    return result
+
+
+def maximum(values: Iterable[numeric.Number]) -> numeric.Number:
+    """Return the largest value."""
+    result = max(values, default=_EMPTY)
+    if result is _EMPTY:
+        raise ValueError("max needs at least one number.")
+    return result
+
+
+def mean(values: Iterable[numeric.Number]) -> numeric.Number:
+    """Return the arithmetic mean of the values, in a single pass."""
+    counter = itertools.count()
+    # zip() takes a count only after a value, so next(counter) is the number of values
+    counted = map(operator.itemgetter(0), zip(values, counter))
+    float_backend = numeric.get_backend() is numeric.FLOAT
+    summed = _fsum(counted) if float_backend else _fold("add", counted, 0)
+    count = next(counter)
+    if not count:
+        raise ValueError("mean needs at least one number.")
+    return summed / count if float_backend else numeric.apply("divide", summed, count)
+
+
+# -------------------------------
+# Reading Values
+# -------------------------------
+def read_numbers(lines: Iterable[str], parse: Optional[Callable[[str], numeric.Number]] = None
+                 ) -> Iterator[numeric.Number]:
+    """
+    Yield every number in some lines of text, one line at a time.
+
+    Numbers are separated by whitespace; blank lines and lines starting with
+    '#' are skipped, as in batch files.
+
+    Args:
+        lines (Iterable[str]): e.g. an open file or sys.stdin
+        parse (Callable): number parser (default: the session backend's)
+
+    Raises:
+        ValueError: on the first field that is not a number
+    """
+    parse = parse or numeric.get_backend().parse
+    for line_no, line in enumerate(lines, start=1):
+        fields = line.split()
+        if not fields or fields[0].startswith("#"):
+            continue
+        try:
+            numbers = list(map(parse, fields))
+        except ValueError:
+            bad = next(field for field in fields if not _parses(parse, field))
+            raise ValueError(f"Invalid number on line {line_no}: '{bad}'") from None
+        yield from numbers
+
+
+def _parses(parse: Callable[[str], numeric.Number], text: str) -> bool:
+    """Return True when `parse` accepts `text`."""
+    try:
+        parse(text)
+    except ValueError:
+        return False
+    return True
@@ -0,0 +1,115 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Date: 10/18/2026
+# Project: Assignment 4 - Professional Calculator CLI
+# ----------------------------------------------------------
+
+"""
+asyncio TCP server for the Professional Calculator.
+
+Clients send the same `<operation> <num1> <num2>` lines the REPL accepts, one
+per line, and receive exactly one response line per request:
+
+    add 2 3      →  Result: 5.0
+    divide 1 0   →  Error: Division by zero is not allowed.
+
+A request that fails in any way gets an `Error: ...` line of its own: one bad
+line never ends the connection or loses the answers queued around it.
+
+Sending `exit` closes the connection once earlier responses have been written.
+
+Pipelining: a client may send many requests without waiting for answers.
+Each connection has a reader that queues incoming lines and a responder that
+evaluates them in order, collecting every response that is ready into a
+single write. The queue is bounded: when it is full the reader stops reading,
+so TCP flow control pushes back on a client that sends faster than it reads.
+"""
+
+import asyncio
+import functools
+from typing import List, Optional
+
+from app.calculation import CalculationFactory
+
+DEFAULT_QUEUE_SIZE = 1024
+MAX_WRITE_BATCH = 512  # responses combined into one write at most
+
+
+def evaluate_line(line: str) -> str:
+    """Evaluate one request line and return its response line (with newline)."""
+    try:
+        operation, num1_str, num2_str = line.split()
+        num1, num2 = float(num1_str), float(num2_str)
+    except ValueError:
+        return "Error: Invalid format. Use: <operation> <num1> <num2>\n"
+    try:
+        result = CalculationFactory.create_calculation(operation, num1, num2).execute()
+    except ZeroDivisionError:
+        return "Error: Division by zero is not allowed.\n"
+    except (ArithmeticError, ValueError) as e:  # unsupported operation, overflow, ...
+        return f"Error: {e}\n"
+    except Exception as e:  # e.g. a failing plugin: answer it, so the connection keeps serving
+        return f"Error: An error occurred during calculation: {e}\n"
+    return f"Result: {result}\n"
+
+
+async def _respond(queue: "asyncio.Queue[Optional[str]]", writer: asyncio.StreamWriter) -> None:
+    """Evaluate queued requests in order and write their responses in batches."""
+    connected = True
+    while True:
+        items: List[Optional[str]] = [await queue.get()]
+        while len(items) < MAX_WRITE_BATCH and not queue.empty():
+            items.append(queue.get_nowait())
+
+        responses = [evaluate_line(item) for item in items if item is not None]
+        if responses and connected:
+            writer.write("".join(responses).encode("utf-8"))
+            try:
+                await writer.drain()
+            except ConnectionError:
+                connected = False  # keep consuming so the reader never blocks
+        if items[-1] is None:
+            return
+
+
+async def handle_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                            queue_size: int = DEFAULT_QUEUE_SIZE) -> None:
+    """Serve one client connection until EOF or `exit`."""
+    queue: "asyncio.Queue[Optional[str]]" = asyncio.Queue(maxsize=queue_size)
+    responder = asyncio.create_task(_respond(queue, writer))
+    try:
+        while True:
+            try:
+                raw_line = await reader.readline()
+            except (ConnectionError, ValueError):  # reset, or a line over the stream limit
+                break
+            if not raw_line:
+                break
+            line = raw_line.decode("utf-8", errors="replace").strip()
+            if line.lower() == "exit":
+                break
+            await queue.put(line)  # waits while the queue is full (backpressure)
+    finally:
+        await queue.put(None)
+        await responder
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+async def start_server(host: str = "127.0.0.1", port: int = 8765,
+                       queue_size: int = DEFAULT_QUEUE_SIZE) -> asyncio.AbstractServer:
+    """
+    Start listening and return the running asyncio server.
+
+    Args:
+        host (str): interface to bind
+        port (int): TCP port (0 picks a free one)
+        queue_size (int): maximum queued requests per connection
+    """
+    if queue_size <= 0:
+        raise ValueError("queue_size must be a positive integer.")
+    handler = functools.partial(handle_connection, queue_size=queue_size)
+    return await asyncio.start_server(handler, host, port)
@@ -0,0 +1,272 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Date: 10/18/2026
+# Project: Assignment 4 - Professional Calculator CLI
+# ----------------------------------------------------------
+
+"""
+Spreadsheet-style variables for the REPL.
+
+    >> x = add 3 4
+    x = 7.0
+    >> y = multiply x 2
+    y = 14.0
+    >> x = 10
+    x = 10.0
+    y = 20.0
+
+A Sheet holds named cells. A cell is defined as a number, the name of another
+cell, or an operation (any registered calculation type, evaluated with
+CalculationFactory) whose operands are numbers or cell names. The cells form a
+dependency graph: every cell knows the cells that use it (its dependents) and
+has a height, one more than the highest cell it uses, so evaluating cells by
+increasing height is a topological order. Definitions that would make a cell
+depend on itself are rejected, and so are names of REPL commands (`history = 5`
+would run a history query).
+
+When a cell is defined again, only the cells downstream of it are
+recomputed: they go through a heap ordered by height, so each is evaluated
+once, after every cell it uses. Values are cached in the cells, and a cell
+whose value comes out unchanged does not pass the change on. An update
+therefore costs time in proportion to the cells it changes, not to the size
+of the sheet.
+
+Cell values are also operands of REPL statements and expressions outside the
+sheet (`multiply x 2`, `x * 2`): see lookup() and values(). Those results are
+not cells and are not updated when a variable changes.
+"""
+
+import heapq
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from app import numeric
+from app.calculation import CalculationFactory
+from app.statements import COMMANDS  # a variable named like a command could not be used on its own
+
+
+Operand = Union[numeric.Number, "Cell"]  # a number, or a cell whose value is used
+
+
+class SheetError(ValueError):
+    """Raised for an invalid cell definition: unknown variable, bad name or circular reference."""
+
+
+# -------------------------------
+# Cells
+# -------------------------------
+class Cell:
+    """One named value of a Sheet, with its definition and its place in the dependency graph."""
+
+    __slots__ = ("name", "index", "definition", "operation", "operands", "value", "error", "height",
+                 "dependents")
+
+    def __init__(self, name: str, index: int) -> None:
+        self.name = name
+        self.index = index  # definition order: breaks ties between cells of equal height
+        self.definition = ""  # as typed after `=`, e.g. "multiply x 2"
+        self.operation: Optional[str] = None  # None: the value of the single operand
+        self.operands: Tuple[Operand, ...] = ()
+        self.value: Optional[numeric.Number] = None
+        self.error: Optional[str] = None  # why there is no value, e.g. division by zero
+        self.height = 0  # 0 for a cell that uses no other cell
+        self.dependents: Dict["Cell", None] = {}  # cells using this one (a dict keeps the order)
+
+    def inputs(self) -> Iterator["Cell"]:
+        """Yield the cells this one uses."""
+        return (operand for operand in self.operands if isinstance(operand, Cell))
+
+    def __str__(self) -> str:
+        return f"{self.name} = {self.value if self.error is None else 'Error: ' + self.error}"
+
+
+# -------------------------------
+# Sheet
+# -------------------------------
+class Sheet:
+    """Named cells that recompute incrementally when a cell they use changes."""
+
+    def __init__(self) -> None:
+        self.cells: Dict[str, Cell] = {}
+        self.evaluations = 0  # cells evaluated so far: what an update costs
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __getitem__(self, name: str) -> Cell:
+        return self.cells[name]
+
+    def define(self, name: str, words: Sequence[str]) -> List[Cell]:
+        """
+        Define (or redefine) cell `name` and recompute the cells that depend on it.
+
+        Args:
+            name (str): the variable name
+            words (Sequence[str]): the definition after `=`: a number, a cell name,
+                or an operation followed by numbers and cell names
+
+        Returns:
+            List[Cell]: the cell, then every downstream cell whose value changed, in evaluation
+                order
+
+        Raises:
+            SheetError: for a bad name, an unknown variable or a circular reference
+            ValueError: for an unsupported operation or number of operands
+        """
+        operation, operands = self._parse(name, words)
+        cell = self.cells.get(name)
+        if cell is None:
+            cell = self.cells[name] = Cell(name, len(self.cells))
+        else:
+            self._check_cycle(cell, operands)
+            for used in cell.inputs():
+                used.dependents.pop(cell, None)  # None: a cell used twice, e.g. add x x
+
+        cell.definition, cell.operation, cell.operands = " ".join(words), operation, operands
+        for used in cell.inputs():
+            used.dependents[cell] = None
+        cell.height = max((used.height + 1 for used in cell.inputs()), default=0)
+        self._raise_heights(cell)
+        return self._recompute(cell)
+
+    def render(self) -> str:
+        """Return every cell with its value and definition, as shown by the `cells` command."""
+        if not self.cells:
+            return "No variables yet."
+        return "\n".join(f"{cell}  ({cell.definition})" for cell in self.cells.values())
+
+    def lookup(self, name: str) -> numeric.Number:
+        """
+        Return the value of cell `name`, for use as a statement operand.
+
+        Raises:
+            SheetError: if there is no such cell or it has no value
+        """
+        cell = self.cells.get(name)
+        if cell is None:
+            raise SheetError(f"Unknown variable '{name}'")
+        if cell.error is not None:
+            raise SheetError(f"'{name}' has no value")
+        return cell.value
+
+    def values(self, names: Iterable[str]) -> Dict[str, numeric.Number]:
+        """Return name → value for the given names that are cells with a value (others left out)."""
+        cells = self.cells
+        return {name: cells[name].value for name in names
+                if name in cells and cells[name].error is None}
+
+    # -------------------------------
+    # Definitions
+    # -------------------------------
+    def _parse(self, name: str, words: Sequence[str]) -> Tuple[Optional[str], Tuple[Operand, ...]]:
+        """Return (operation, operands) for a definition, with cell names resolved to cells."""
+        parse = numeric.get_backend().parse
+        if not name.isidentifier() or name.lower() in CalculationFactory.available_calculations() \
+                or name.lower() in COMMANDS or _is_number(parse, name):
+            raise SheetError(f"'{name}' cannot be used as a variable name")
+        if not words:
+            raise SheetError(f"Missing definition after '{name} ='")
+        operation = None
+        if len(words) > 1:
+            operation = words[0].lower()
+            # ValueError if unknown
+            calc_class = CalculationFactory.get_calculation_class(operation)
+            if len(words) != 3 and calc_class.reduction is None:
+                raise SheetError(f"Calculation type '{operation}' takes exactly two numbers.")
+            words = words[1:]
+        return operation, tuple(self._operand(parse, word) for word in words)
+
+    def _operand(self, parse: Callable[[str], numeric.Number], word: str) -> Operand:
+        try:
+            return parse(word)
+        except ValueError:
+            pass
+        cell = self.cells.get(word)
+        if cell is None:
+            raise SheetError(f"Unknown variable '{word}'" if word.isidentifier()
+                             else f"'{word}' is not a number or a variable")
+        return cell
+
+    def _check_cycle(self, cell: Cell, operands: Sequence[Operand]) -> None:
+        """Raise SheetError if one of the new operands is `cell` or depends on it."""
+        targets = {operand for operand in operands if isinstance(operand, Cell)}
+        came_from: Dict[Cell, Optional[Cell]] = {cell: None}
+        stack = [cell]
+        while stack:
+            current = stack.pop()
+            if current in targets:
+                path = [cell.name]
+                while current is not cell:
+                    path.insert(1, current.name)
+                    current = came_from[current]
+                raise SheetError(f"Circular reference: {' → '.join(path + [cell.name])}")
+            for dependent in current.dependents:
+                if dependent not in came_from:
+                    came_from[dependent] = current
+                    stack.append(dependent)
+
+    @staticmethod
+    def _raise_heights(cell: Cell) -> None:
+        """Keep every dependent higher than the cells it uses after `cell` got its new height."""
+        stack = [cell]
+        while stack:
+            current = stack.pop()
+            for dependent in current.dependents:
+                if dependent.height <= current.height:
+                    dependent.height = current.height + 1
+                    stack.append(dependent)
+
+    # -------------------------------
+    # Evaluation
+    # -------------------------------
+    def _recompute(self, cell: Cell) -> List[Cell]:
+        """Evaluate `cell`, then the dependents of every cell that changed, lowest first."""
+        changed = [cell]
+        if not self._evaluate(cell):
+            return changed
+        queue = [(dependent.height, dependent.index, dependent) for dependent in cell.dependents]
+        heapq.heapify(queue)
+        queued = set(cell.dependents)
+        while queue:
+            current = heapq.heappop(queue)[2]
+            if self._evaluate(current):
+                changed.append(current)
+                for dependent in current.dependents:
+                    if dependent not in queued:
+                        queued.add(dependent)
+                        heapq.heappush(queue, (dependent.height, dependent.index, dependent))
+        return changed
+
+    def _evaluate(self, cell: Cell) -> bool:
+        """Compute the value of `cell` from the cached values it uses; return True if it changed."""
+        self.evaluations += 1
+        before = (cell.value, cell.error)
+        values = []
+        for operand in cell.operands:
+            if isinstance(operand, Cell):
+                if operand.error is not None:
+                    cell.value, cell.error = None, f"'{operand.name}' has no value"
+                    return (cell.value, cell.error) != before
+                operand = operand.value
+            values.append(operand)
+        try:
+            if cell.operation is None:
+                value = values[0]
+            elif len(values) == 2:
+                value = CalculationFactory.evaluate(cell.operation, values[0], values[1])
+            else:
+                value = CalculationFactory.reduce(cell.operation, values)
+        except ZeroDivisionError:
+            cell.value, cell.error = None, "Division by zero is not allowed."
+        except (ArithmeticError, ValueError) as e:
+            cell.value, cell.error = None, str(e)
+        else:
+            cell.value, cell.error = value, None
+        return (cell.value, cell.error) != before
+
+
+def _is_number(parse: Callable[[str], numeric.Number], word: str) -> bool:
+    try:
+        parse(word)
+    except ValueError:
+        return False
+    return True
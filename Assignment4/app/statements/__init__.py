@@ -0,0 +1,228 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Date: 10/18/2026
+# Project: Assignment 4 - Professional Calculator CLI
+# ----------------------------------------------------------
+
+"""
+Statement tokenizer for REPL lines.
+
+One line may hold several statements separated by `;`:
+
+    add 2 3; multiply 4 5; (1 + 2) * 3
+
+A statement is either `<operation> <num1> <num2>`, an n-ary
+`<operation> <num1> <num2> <num3> ...` (see CalculationFactory.reduce), an
+infix expression (see app.expression) or a variable definition,
+`<name> = <definition>` (see app.sheet). Operands of `<operation> <a> <b>`
+may be vectors, `[1, 2, 3]` or `@prices.bin` (see app.vectors).
+split_statements() cuts the line with str.split (once on `;`, then on
+whitespace), which keeps the common case entirely in C. Only the offset of
+each statement is tracked; exact columns are worked out for statements that
+contain an error, so problems are still reported precisely:
+
+    add 2 x; divide 1 2   →  Invalid format ('x' is not a number) at column 7
+
+A malformed statement does not stop the rest of the line: it is returned as a
+StatementError in its place.
+
+Given a `lookup` (the REPL passes Sheet.lookup once variables exist), an
+operand that is not a number is read as a variable name: `multiply x 2`.
+"""
+
+import re
+from typing import Any, Callable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from app import numeric
+from app.expression import looks_like_expression
+
+# First words of REPL commands (see app.calculator): a line starting with one may not be a statement
+COMMANDS = frozenset({"aggregate", "backend", "cells", "compact", "exit", "help", "history",
+                      "stats"})
+
+# Operand words of a vector statement: a whole `[...]` literal (spaces allowed inside),
+# or a plain word
+_VECTOR_WORDS = re.compile(r"\[[^\]]*\]?|[^\s\[]+")
+
+class StatementError(ValueError):
+    """Raised (or returned) when a statement cannot be parsed."""
+
+    def __init__(self, message: str, position: int) -> None:
+        super().__init__(f"{message} at column {position + 1}")
+        self.position = position
+
+
+class Statement(NamedTuple):
+    """One parsed statement of a line."""
+
+    operation: Optional[str]  # None for an infix expression
+    operands: Tuple[numeric.Number, ...]  # (num1, num2, ...); empty for an expression
+    text: str  # the statement as written, between separators
+    offset: int  # position of `text` in the line
+
+    @property
+    def source(self) -> str:
+        """The statement text without surrounding whitespace."""
+        return self.text.strip()
+
+    @property
+    def position(self) -> int:
+        """Column (0-based) of the first character of the statement."""
+        return self.offset + len(self.text) - len(self.text.lstrip())
+
+
+class Assignment(NamedTuple):
+    """A variable definition, `<name> = <definition>`; app.sheet reads the definition words."""
+
+    name: str
+    words: Tuple[str, ...]  # the words after `=`
+    text: str
+    offset: int
+
+
+class VectorStatement(NamedTuple):
+    """`<operation> <a> <b>` where at least one operand is a vector (see app.vectors)."""
+
+    operation: str
+    operands: Tuple[Any, Any]  # vectors (memoryview) and floats
+    text: str
+    offset: int
+
+
+# Builds a Statement without going through the Python-level NamedTuple __new__
+_new_statement = tuple.__new__
+
+
+def _column(text: str, fields: List[str], index: int) -> int:
+    """Return the position of fields[index] within its statement text."""
+    position = 0
+    for field in fields[:index + 1]:
+        position = text.index(field, position) + len(field)
+    return position - len(fields[index])
+
+
+def _build(text: str, fields: List[str], offset: int,
+           parse: Callable[[str], numeric.Number]
+           ) -> Union[Statement, Assignment, VectorStatement, StatementError]:
+    """
+    Handle a statement other than `<operation> <num1> <num2>`.
+
+    That is an expression, an n-ary statement, a definition, a vector statement or an error.
+    """
+    if len(fields) > 1 and fields[1] == "=":
+        return Assignment(fields[0], tuple(fields[2:]), text, offset)
+    if looks_like_expression(text.lstrip()):
+        return Statement(None, (), text, offset)
+    if "[" in text or "@" in text:
+        return _vector_statement(text, offset, parse)
+    if len(fields) < 3:
+        return StatementError("Invalid format", offset + len(text))
+    try:
+        return Statement(fields[0], tuple(map(parse, fields[1:])), text, offset)
+    except ValueError:
+        return _number_error(text, fields, offset, parse)
+
+
+def _vector_statement(text: str, offset: int,
+                      parse: Callable[[str], numeric.Number]
+                      ) -> Union[VectorStatement, StatementError]:
+    """Build `<operation> <a> <b>` with vector operands; plain numbers become floats."""
+    from app.vectors import parse_vector  # deferred: only sessions that use vectors
+
+    fields = _VECTOR_WORDS.findall(text)
+    operands = []
+    for index, word in enumerate(fields[1:], 1):
+        vector = word[0] in "[@"
+        try:
+            operands.append(parse_vector(word) if vector else float(parse(word)))
+        except ValueError as e:
+            message = str(e) if vector else f"Invalid format ('{word}' is not a number)"
+            return StatementError(message, offset + _column(text, fields, index))
+    if len(operands) != 2:
+        return StatementError("Vector operations take exactly two operands",
+                              offset + len(text.rstrip()))
+    return VectorStatement(fields[0], tuple(operands), text, offset)
+
+
+def _number_error(text: str, fields: List[str], offset: int,
+                  parse: Callable[[str], numeric.Number]) -> StatementError:
+    """Return the error for the first operand of `<operation> <num1> <num2> ...` not a number."""
+    index = 1
+    while index < len(fields) - 1:
+        try:
+            parse(fields[index])
+        except ValueError:
+            break
+        index += 1
+    return StatementError(f"Invalid format ('{fields[index]}' is not a number)",
+                          offset + _column(text, fields, index))
+
+
+def _with_variables(parse: Callable[[str], numeric.Number],
+                    lookup: Callable[[str], numeric.Number]) -> Callable[[str], numeric.Number]:
+    """Return a parse function that reads a word that is not a number as a variable name."""
+    def parse_operand(word: str) -> numeric.Number:
+        try:
+            return parse(word)
+        except ValueError:
+            return lookup(word)  # ValueError too for an unknown name
+
+    return parse_operand
+
+
+def _parser(lookup: Optional[Callable[[str], numeric.Number]]) -> Callable[[str], numeric.Number]:
+    """Return the operand parser for a line: the backend's, reading names through `lookup`."""
+    parse = numeric.get_backend().parse  # looked up once per line
+    return parse if lookup is None else _with_variables(parse, lookup)
+
+
+def _statement(text: str, offset: int, parse: Callable[[str], numeric.Number]
+               ) -> Union[Statement, Assignment, VectorStatement, StatementError, None]:
+    """Parse the text between two separators (None when it is blank)."""
+    fields = text.split()
+    # An operation name is an identifier, which is never an expression:
+    # the call is for odd first words
+    if len(fields) == 3 and (fields[0].isidentifier() or not looks_like_expression(fields[0])):
+        try:  # the common `<operation> <num1> <num2>` case, without further checks
+            operands = (parse(fields[1]), parse(fields[2]))
+            return _new_statement(Statement, (fields[0], operands, text, offset))
+        except ValueError:
+            # x = 5, x * 2 (an expression), or a bad number
+            return _build(text, fields, offset, parse)
+    return _build(text, fields, offset, parse) if fields else None
+
+
+def parse_statement(text: str, lookup: Optional[Callable[[str], numeric.Number]] = None
+                    ) -> Union[Statement, Assignment, VectorStatement, StatementError, None]:
+    """
+    Parse a line that holds one statement (no `;`), without the generator of split_statements().
+
+    Returns:
+        Statement, Assignment, VectorStatement or StatementError as split_statements() would
+        yield it, or None for a blank line
+    """
+    return _statement(text, 0, _parser(lookup))
+
+
+def split_statements(line: str, lookup: Optional[Callable[[str], numeric.Number]] = None
+                     ) -> Iterator[Union[Statement, Assignment, VectorStatement, StatementError]]:
+    """
+    Yield the statements of a line in order.
+
+    Empty statements (e.g. a trailing `;`) are skipped.
+
+    Args:
+        line (str): one line of REPL input
+        lookup (Callable): optional variable name → value, for operands that are not numbers
+
+    Yields:
+        Statement, Assignment, VectorStatement, or StatementError for a statement that cannot be
+        parsed
+    """
+    parse = _parser(lookup)
+    offset = 0
+    for text in line.split(";"):
+        statement = _statement(text, offset, parse)
+        if statement is not None:
+            yield statement
+        offset += len(text) + 1
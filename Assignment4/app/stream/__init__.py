@@ -0,0 +1,198 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Date: 10/18/2026
+# Project: Assignment 4 - Professional Calculator CLI
+# ----------------------------------------------------------
+
+"""
+Streaming CSV/JSONL evaluator for the Professional Calculator.
+
+Jobs arrive as tabular files with one calculation per row, e.g.
+
+    op,a,b,customer
+    add,2,3,acme
+    divide,1,0,globex
+
+They can be far larger than memory, so nothing is ever loaded whole. The work
+is a chain of generators, each holding only the row it is working on:
+
+    read_csv / read_jsonl  →  evaluate_records  →  write_csv / write_jsonl
+
+Every output row carries all input columns unchanged plus a `result` and an
+`error` column. A row that cannot be evaluated (bad number, unknown operation,
+division by zero) gets a message in `error` and the job carries on. The writer
+collects at most `flush_every` rows before writing them in one call, so memory
+use stays constant whatever the input size.
+"""
+
+import csv
+import io
+import json
+from typing import Dict, Iterable, Iterator, Optional, TextIO, Union
+
+from app.batch import FLUSH_EVERY, BatchSummary, new_summary
+from app.calculation import STATUS_DIVISION_BY_ZERO, STATUS_OK, CalculationFactory
+
+FORMATS = ("csv", "jsonl")
+
+# A parsed row, or an error message for input that could not be parsed at all
+Record = Union[Dict[str, object], str]
+
+
+def detect_format(path: str) -> str:
+    """Guess the format from a file name (CSV unless it ends in .jsonl/.ndjson)."""
+    return "jsonl" if path.lower().endswith((".jsonl", ".ndjson")) else "csv"
+
+
+# -------------------------------
+# Readers
+# -------------------------------
+def read_csv(source: Iterable[str]) -> Iterator[Record]:
+    """Yield one dict per CSV row, keyed by the header row."""
+    yield from csv.DictReader(source)
+
+
+def read_jsonl(source: Iterable[str]) -> Iterator[Record]:
+    """Yield one dict per JSON object line (blank lines are skipped)."""
+    for line_no, line in enumerate(source, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield f"Invalid JSON on line {line_no}."
+            continue
+        if isinstance(record, dict):
+            yield record
+        else:
+            yield f"Expected a JSON object on line {line_no}."
+
+
+# -------------------------------
+# Evaluation
+# -------------------------------
+def evaluate_records(records: Iterable[Record], summary: Optional[BatchSummary] = None,
+                     op_field: str = "op", a_field: str = "a", b_field: str = "b",
+                     result_field: str = "result", error_field: str = "error"
+                     ) -> Iterator[Dict[str, object]]:
+    """
+    Evaluate each record and yield it with its result and error columns filled in.
+
+    Args:
+        records (Iterable[Record]): rows from read_csv/read_jsonl
+        summary (BatchSummary): updated with success and failure counts (and results, if it
+            has an Aggregator), if given
+        op_field, a_field, b_field (str): input column names
+        result_field, error_field (str): output column names (added or overwritten)
+
+    Yields:
+        dict: the input record; `result` is None when `error` is set and vice versa
+    """
+    summary = summary if summary is not None else BatchSummary()
+    add_result = summary.results.add if summary.results is not None else None
+    evaluate = CalculationFactory.try_evaluate
+
+    for record in records:
+        summary.processed += 1
+        if isinstance(record, str):
+            summary.format_errors += 1
+            yield {result_field: None, error_field: record}
+            continue
+
+        result, error = None, None
+        try:
+            operation = record[op_field]
+            num1, num2 = float(record[a_field]), float(record[b_field])
+        except KeyError as e:
+            summary.format_errors += 1
+            error = f"Missing column {e}."
+        except (TypeError, ValueError):
+            summary.format_errors += 1
+            error = f"Invalid number in '{a_field}' or '{b_field}'."
+        else:
+            operation = str(operation)
+            result, status = evaluate(operation, num1, num2)
+            if status == STATUS_OK:
+                summary.succeeded += 1
+                if add_result is not None:
+                    add_result(operation.lower(), result)
+            else:
+                if status == STATUS_DIVISION_BY_ZERO:
+                    summary.division_errors += 1
+                else:
+                    summary.operation_errors += 1
+                result, error = None, CalculationFactory.status_message(status, operation)
+
+        record[result_field] = result
+        record[error_field] = error
+        yield record
+
+
+# -------------------------------
+# Writers
+# -------------------------------
+def write_csv(records: Iterable[Dict[str, object]], out: TextIO,
+              flush_every: int = FLUSH_EVERY) -> None:
+    """
+    Write records as CSV, taking the column order from the first record.
+
+    Columns that appear only in later rows are dropped; missing ones are left empty.
+    """
+    buffer = io.StringIO()
+    writer = None
+    pending = 0
+    for record in records:
+        if writer is None:
+            # None holds surplus CSV values
+            fieldnames = [name for name in record if name is not None]
+            writer = csv.DictWriter(buffer, fieldnames, extrasaction="ignore", lineterminator="\n")
+            writer.writeheader()
+        writer.writerow(record)
+        pending += 1
+        if pending >= flush_every:
+            out.write(buffer.getvalue())
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    out.write(buffer.getvalue())
+
+
+def write_jsonl(records: Iterable[Dict[str, object]], out: TextIO,
+                flush_every: int = FLUSH_EVERY) -> None:
+    """Write records as one JSON object per line."""
+    buffer = []
+    for record in records:
+        buffer.append(json.dumps(record) + "\n")
+        if len(buffer) >= flush_every:
+            out.write("".join(buffer))
+            buffer.clear()
+    out.write("".join(buffer))
+
+
+READERS = {"csv": read_csv, "jsonl": read_jsonl}
+WRITERS = {"csv": write_csv, "jsonl": write_jsonl}
+
+
+def evaluate_stream(source: Iterable[str], out: TextIO, fmt: str = "csv",
+                    flush_every: int = FLUSH_EVERY, aggregate: bool = False,
+                    **fields: str) -> BatchSummary:
+    """
+    Run the full reader → evaluator → writer pipeline.
+
+    Args:
+        source (Iterable[str]): input lines, e.g. an open file (use newline="" for CSV)
+        out (TextIO): destination for the output rows
+        fmt (str): "csv" or "jsonl"; the output uses the same format
+        flush_every (int): rows buffered before each write
+        aggregate (bool): also collect result statistics in summary.results
+        **fields: column names passed on to evaluate_records
+
+    Returns:
+        BatchSummary: counts of processed, successful and failed rows
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported format: '{fmt}'. Available: {', '.join(FORMATS)}")
+    summary = new_summary(aggregate)
+    records = evaluate_records(READERS[fmt](source), summary, **fields)
+    WRITERS[fmt](records, out, flush_every)
+    return summary
@@ -0,0 +1,138 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Date: 10/18/2026
+# Project: Assignment 4 - Professional Calculator CLI
+# ----------------------------------------------------------
+
+"""
+Vector operands: many numbers in one operand, e.g. `multiply [1,2,3] [4,5,6]`.
+
+A vector is a `memoryview` of 8-byte floats (format "d"). It comes from:
+
+- A literal, `[1, 2, 3]`, stored in an `array('d')`.
+- A file, `@prices.bin`, holding raw native-endian 8-byte floats (as written
+  by `array('d').tofile()` or `numpy.ndarray.tofile()`). The file is mapped
+  into memory and viewed in place: no element is copied or converted.
+
+Operations apply element-wise (see elementwise), and a plain number on either
+side is repeated for every element, so `add @prices.bin 1.05` adds 1.05 to
+every price. Operations and the Calculation classes accept vectors wherever
+they accept numbers; the result is a new vector.
+
+memoryview has no arithmetic of its own, so `a + b` on a vector raises
+TypeError and the scalar code paths need no check: vectors are picked up in
+the fallbacks that already handle mixed number types.
+
+Vector elements are always floats, whatever the numeric backend.
+"""
+
+import math
+import mmap
+import os
+from array import array
+from typing import Any, Callable
+
+# Longest vector that summarize() writes out in full
+SUMMARY_LIMIT = 8
+
+
+def is_vector(value: Any) -> bool:
+    """Return True for a vector operand (a memoryview)."""
+    return type(value) is memoryview
+
+
+def from_values(values: Any) -> memoryview:
+    """Return a vector holding the given numbers."""
+    return memoryview(array("d", values))
+
+
+def parse_vector(word: str) -> memoryview:
+    """
+    Read a vector operand: a `[...]` literal or an `@file` of 8-byte floats.
+
+    Raises:
+        ValueError: for a malformed literal or a file that cannot be read as a vector
+    """
+    if word.startswith("@"):
+        return read_vector(word[1:])
+    if not word.endswith("]"):
+        raise ValueError(f"Invalid vector '{word}' (missing ']')")
+    items = word[1:-1].replace(",", " ").split()
+    try:
+        return from_values(map(float, items))
+    except ValueError:
+        bad = next(item for item in items if not _is_float(item))
+        raise ValueError(f"Invalid vector '{word}' ('{bad}' is not a number)") from None
+
+
+def _is_float(text: str) -> bool:
+    try:
+        float(text)
+    except ValueError:
+        return False
+    return True
+
+
+def read_vector(path: str) -> memoryview:
+    """
+    Map a file of native 8-byte floats into memory and return it as a vector (zero-copy).
+
+    The mapping stays open for as long as the vector (or a slice of it) is alive.
+
+    Raises:
+        ValueError: if the file cannot be read or its size is not a multiple of 8 bytes
+    """
+    if not path:
+        raise ValueError("Missing file name after '@'")
+    try:
+        with open(path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if size % 8:
+                raise ValueError(f"'{path}' does not hold 8-byte floats ({size} bytes)")
+            if not size:  # an empty file cannot be mapped
+                return from_values(())
+            return memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)).cast("d")
+    except OSError as e:
+        raise ValueError(f"Cannot read '{path}' ({e.strerror})") from None
+
+
+def elementwise(kernel: Callable[[float, float], float], a: Any, b: Any) -> memoryview:
+    """
+    Apply a binary function element by element, repeating a plain number on either side.
+
+    Args:
+        kernel (Callable): binary function such as operator.add
+        a: first operand, a vector or a number
+        b: second operand, a vector or a number
+
+    Returns:
+        memoryview: the results, as a new vector
+
+    Raises:
+        ValueError: if two vectors differ in length
+        ZeroDivisionError: if a division meets a zero divisor
+    """
+    from app.kernels import apply_kernel  # deferred: may import NumPy
+
+    # Broadcast by repeating the number into a column (array repetition runs in C)
+    if not is_vector(a):
+        a = array("d", (a,)) * len(b)
+    elif not is_vector(b):
+        b = array("d", (b,)) * len(a)
+    return memoryview(apply_kernel(kernel, a, b))
+
+
+def summarize(vector: memoryview, limit: int = SUMMARY_LIMIT) -> str:
+    """
+    Return a vector as text: every element when it is short, a compact summary otherwise.
+
+        [1.0, 2.0, 3.0]
+        [1.0, 2.0, 3.0, ..., 998.0, 999.0, 1000.0] (1,000 values, min 1.0, max 1000.0, mean 500.5)
+    """
+    count = len(vector)
+    if count <= limit:
+        return f"[{', '.join(map(str, vector))}]"
+    head = ", ".join(map(str, vector[:3]))
+    tail = ", ".join(map(str, vector[-3:]))
+    return (f"[{head}, ..., {tail}] ({count:,} values, "
+            f"min {min(vector)}, max {max(vector)}, mean {math.fsum(vector) / count})")
@@ -0,0 +1,88 @@
+"""
+bench/bench_aggregates.py
+
+Cost, memory and accuracy of streaming result aggregates:
+
+- ns per Aggregator.add() and peak memory, against keeping every result in a
+  list and computing the same statistics at the end (statistics module, sorting)
+- p50/p99 and distinct-count error of the sketches against the exact values
+- batch throughput with and without --aggregate
+
+Usage (from the Assignment4 folder):
+    python -m bench.bench_aggregates [--size N]
+"""
+
+import argparse
+import bisect
+import io
+import random
+import statistics
+import time
+import tracemalloc
+
+from app.aggregates import Aggregator
+from app.batch import run_batch
+
+
+def measure(function):
+    """Return the result, seconds and peak traced bytes of `function()` (timed without tracing)."""
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Streaming aggregates benchmark")
+    parser.add_argument("--size", type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+
+    def results():
+        """The same results on every call, generated lazily: neither side gets them for free."""
+        rng = random.Random(601)
+        return (round(rng.lognormvariate(0, 1), 4) for _ in range(args.size))
+
+    def streaming():
+        aggregator = Aggregator()
+        for value in results():
+            aggregator.add("add", value)
+        return (aggregator.mean, aggregator.stdev, aggregator.quantiles.quantile(0.5),
+                aggregator.quantiles.quantile(0.99), aggregator.distinct.estimate())
+
+    def stored():
+        values = list(results())
+        ordered = sorted(values)
+        return (statistics.fmean(values), statistics.stdev(values), ordered[len(values) // 2],
+                ordered[int(len(values) * 0.99)], len(set(values)))
+
+    approx, approx_s, approx_peak = measure(streaming)
+    exact, exact_s, exact_peak = measure(stored)
+    ordered = sorted(results())
+
+    print(f"{args.size:,} results")
+    print(f"  {'':<22}{'ns/result':>10}{'peak memory':>14}")
+    print(f"  {'Aggregator':<22}{approx_s / args.size * 1e9:>10.0f}{approx_peak / 1024:>11.0f} KiB")
+    print(f"  {'list + statistics':<22}{exact_s / args.size * 1e9:>10.0f}{exact_peak / 1024:>11.0f} KiB")
+    for name, got, want in zip(["mean", "std dev", "p50", "p99", "distinct"], approx, exact):
+        if name.startswith("p"):  # sketch error is bounded in rank, not in value
+            rank_error = abs(bisect.bisect_left(ordered, got) - bisect.bisect_left(ordered, want)) / args.size
+            error = f"rank error {rank_error:.2%}"
+        else:
+            error = f"error {abs(got - want) / abs(want):.2%}"
+        print(f"  {name:<10} {got:>12.6g} vs exact {want:<12.6g} {error}")
+
+    rng = random.Random(601)
+    lines = [f"multiply {rng.uniform(0, 100):.3f} {rng.uniform(0, 100):.3f}\n" for _ in range(args.size // 4)]
+    for aggregate in (False, True):
+        start = time.perf_counter()
+        run_batch(lines, io.StringIO(), aggregate=aggregate)
+        rate = len(lines) / (time.perf_counter() - start)
+        print(f"  batch {'with' if aggregate else 'without'} --aggregate: {rate:,.0f} lines/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+bench/bench_compile.py
+
+Evaluating one formula over many variable bindings:
+
+- reparse + eval:   compile the text again for every row, then walk the tree
+- eval (AST):       walk the parsed tree through CalculationFactory for every row
+- compiled call:    the function from CompiledExpression.to_function(), called per row
+- map(rows):        CompiledExpression.map streaming the binding rows through it
+- evaluate_many:    one array('d') column per variable (NumPy ufuncs when installed)
+
+The slow interpreting paths run on the first --sample rows only; every path
+is reported as rows per second.
+
+Usage (from the Assignment4 folder):
+    python -m bench.bench_compile [--rows N] [--sample S] [--repeat R]
+"""
+
+import argparse
+import random
+import time
+from array import array
+
+import app.expression as expression
+
+SOURCE = "(x * 1.5 + y) / (z + 2) - max(x, y) * 0.25"
+
+
+def best_seconds(function, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compiled expression benchmark")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--sample", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(601)
+    columns = [array("d", (rng.uniform(0, 100) for _ in range(args.rows))) for _ in range(3)]
+    rows = list(zip(*columns))
+    sample = rows[:args.sample]
+    compiled = expression.compile_expression(SOURCE)
+    tree = expression.parse(SOURCE)
+    function = compiled.to_function()
+    names = compiled.variables
+
+    expected = [compiled.evaluate(*row) for row in sample]
+    assert [function(*row) for row in sample] == expected
+    assert list(compiled.evaluate_many(*columns)[:args.sample]) == expected
+
+    cases = [
+        ("reparse + eval", len(sample), lambda: [expression._compile(SOURCE).evaluate(*row) for row in sample]),
+        ("eval (AST)", len(sample), lambda: [expression.evaluate(tree, dict(zip(names, row))) for row in sample]),
+        ("eval (folded AST)", len(sample), lambda: [compiled.evaluate(*row) for row in sample]),
+        ("compiled call", len(rows), lambda: [function(*row) for row in rows]),
+        ("map(rows)", len(rows), lambda: list(compiled.map(rows))),
+        ("evaluate_many", len(rows), lambda: compiled.evaluate_many(*columns)),
+    ]
+    print(f"{SOURCE}  over {args.rows:,} bindings (best of {args.repeat})")
+    baseline = None
+    for name, count, run in cases:
+        rate = count / best_seconds(run, args.repeat)
+        baseline = baseline or rate
+        print(f"  {name:<20}{rate:>14,.0f} rows/s{rate / baseline:>9,.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+bench/bench_dispatch.py
+
+Per-call cost of the ways a single calculation can be dispatched:
+
+- create_calculation(...).execute()  → the object path (lower(), lookup, new object)
+- CalculationFactory.evaluate(...)   → the precompiled dispatch table
+- an if/elif chain over Operations   → the style of Assignment3's original REPL
+
+Usage (from the Assignment4 folder):
+    python -m bench.bench_dispatch [--number N] [--repeat R]
+"""
+
+import argparse
+import timeit
+
+from app.calculation import CalculationFactory
+from app.operations import Operations
+
+
+def if_elif(operation, a, b):
+    """Dispatch the way Assignment3's Calculator.run used to."""
+    if operation == "add":
+        return Operations.addition(a, b)
+    elif operation == "subtract":
+        return Operations.subtraction(a, b)
+    elif operation == "multiply":
+        return Operations.multiplication(a, b)
+    elif operation == "divide":
+        return Operations.division(a, b)
+    raise ValueError(operation)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Single-calculation dispatch benchmark")
+    parser.add_argument("--number", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    create = CalculationFactory.create_calculation
+    evaluate = CalculationFactory.evaluate
+    for operation in ("add", "divide"):
+        cases = {
+            "create + execute": lambda: create(operation, 22.0, 7.0).execute(),
+            "if/elif chain": lambda: if_elif(operation, 22.0, 7.0),
+            "evaluate": lambda: evaluate(operation, 22.0, 7.0),
+        }
+        print(f"{operation} (best of {args.repeat}, ns/call)")
+        baseline = None
+        for name, fn in cases.items():
+            ns = min(timeit.repeat(fn, number=args.number, repeat=args.repeat)) / args.number * 1e9
+            baseline = baseline or ns
+            print(f"  {name:<20} {ns:8.1f}  {baseline / ns:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
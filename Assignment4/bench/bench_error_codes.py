@@ -0,0 +1,82 @@
+"""
+bench/bench_error_codes.py
+
+Bulk division where a growing fraction of rows divides by zero:
+
+- raise (objects):  create_calculation(...).execute() inside try/except, as batch mode used to
+- raise (evaluate): CalculationFactory.evaluate inside try/except
+- try_evaluate:     (result, status) pairs, no exception for a failing row
+- try_execute_batch: one call for the whole column, NaN results plus an error bitmap
+
+Usage (from the Assignment4 folder):
+    python -m bench.bench_error_codes [--rows N] [--repeat R]
+"""
+
+import argparse
+import random
+import time
+from array import array
+
+from app.calculation import CalculationFactory
+
+
+def with_objects(a, b):
+    create = CalculationFactory.create_calculation
+    results = []
+    for x, y in zip(a, b):
+        try:
+            results.append(create("divide", x, y).execute())
+        except ZeroDivisionError:
+            results.append(None)
+    return results
+
+
+def with_evaluate(a, b):
+    evaluate = CalculationFactory.evaluate
+    results = []
+    for x, y in zip(a, b):
+        try:
+            results.append(evaluate("divide", x, y))
+        except ZeroDivisionError:
+            results.append(None)
+    return results
+
+
+def with_status(a, b):
+    evaluate = CalculationFactory.try_evaluate
+    return [evaluate("divide", x, y) for x, y in zip(a, b)]
+
+
+def best_seconds(function, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Error-code evaluation benchmark")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(601)
+    a = array("d", (rng.uniform(-100, 100) for _ in range(args.rows)))
+    cases = {
+        "raise (objects)": with_objects,
+        "raise (evaluate)": with_evaluate,
+        "try_evaluate": with_status,
+        "try_execute_batch": lambda a, b: CalculationFactory.try_execute_batch("divide", a, b),
+    }
+    print(f"{args.rows:,} divisions, thousands of rows/s (best of {args.repeat})")
+    print(f"  {'invalid':>8}" + "".join(f"{name:>20}" for name in cases))
+    for invalid in (0.0, 0.1, 0.5, 0.9):
+        b = array("d", (0.0 if rng.random() < invalid else rng.uniform(1, 100) for _ in range(args.rows)))
+        rates = [args.rows / best_seconds(lambda: run(a, b), args.repeat) / 1e3 for run in cases.values()]
+        print(f"  {invalid:>8.0%}" + "".join(f"{rate:>20,.0f}" for rate in rates))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+bench/bench_execute_batch.py
+
+Compares CalculationFactory.execute_batch with the per-object path
+(one create_calculation(...).execute() call per operand pair).
+
+Usage (from the Assignment4 folder):
+    python -m bench.bench_execute_batch [--size N] [--repeat R] [--op multiply]
+"""
+
+import argparse
+import random
+import timeit
+from array import array
+
+import app.kernels as kernels
+from app.calculation import CalculationFactory
+
+
+def per_object(op, a, b):
+    """The pre-existing path: one Calculation object per operand pair."""
+    create = CalculationFactory.create_calculation
+    return array("d", (create(op, x, y).execute() for x, y in zip(a, b)))
+
+
+def pure_array(op, a, b):
+    """execute_batch with NumPy disabled (map + array('d') fallback)."""
+    numpy_module, kernels.np = kernels.np, None
+    try:
+        return CalculationFactory.execute_batch(op, a, b)
+    finally:
+        kernels.np = numpy_module
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="execute_batch vs per-object benchmark")
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--op", default="multiply")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(601)
+    a = array("d", (rng.uniform(-1e3, 1e3) for _ in range(args.size)))
+    b = array("d", (rng.uniform(1, 1e3) for _ in range(args.size)))
+
+    cases = {
+        "per-object": lambda: per_object(args.op, a, b),
+        "execute_batch (array)": lambda: pure_array(args.op, a, b),
+    }
+    if kernels.np is not None:
+        na, nb = kernels.np.asarray(a), kernels.np.asarray(b)
+        cases["execute_batch (numpy)"] = lambda: CalculationFactory.execute_batch(args.op, na, nb)
+
+    print(f"{args.op} over {args.size:,} pairs (best of {args.repeat})")
+    baseline = None
+    for name, fn in cases.items():
+        best = min(timeit.repeat(fn, number=1, repeat=args.repeat))
+        baseline = baseline or best
+        print(f"  {name:<24} {best * 1e3:9.1f} ms  {baseline / best:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
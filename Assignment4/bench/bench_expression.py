@@ -0,0 +1,55 @@
+"""
+bench/bench_expression.py
+
+Measures infix expression throughput:
+- parse:         text → AST, no cache, no folding
+- compile:       parse + constant folding, no cache
+- eval (AST):    evaluating an unfolded AST through CalculationFactory
+- cached:        compile_expression + evaluate for re-entered text
+
+Usage (from the Assignment4 folder):
+    python -m bench.bench_expression [--expressions N] [--repeat R]
+"""
+
+import argparse
+import random
+import timeit
+
+import app.expression as expression
+
+
+def make_sources(count):
+    rng = random.Random(601)
+    templates = ["({} + {}) * {} / {}", "{} - {} * {} + {}", "{} / ({} + {}) - {}"]
+    return [
+        rng.choice(templates).format(*(rng.randint(1, 999) for _ in range(4)))
+        for _ in range(count)
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Expression engine benchmark")
+    parser.add_argument("--expressions", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    sources = make_sources(args.expressions)
+    trees = [expression.parse(s) for s in sources]
+    expression.set_cache_size(len(sources))
+    for source in sources:  # warm the cache, as a re-entered script would
+        expression.compile_expression(source)
+
+    cases = {
+        "parse": lambda: [expression.parse(s) for s in sources],
+        "compile (uncached)": lambda: [expression._compile(s) for s in sources],
+        "eval (AST)": lambda: [expression.evaluate(t) for t in trees],
+        "cached compile + eval": lambda: [expression.compile_expression(s).evaluate() for s in sources],
+    }
+    print(f"{args.expressions:,} expressions (best of {args.repeat})")
+    for name, fn in cases.items():
+        best = min(timeit.repeat(fn, number=1, repeat=args.repeat))
+        print(f"  {name:<24} {args.expressions / best:12,.0f} expr/s")
+
+
+if __name__ == "__main__":
+    main()
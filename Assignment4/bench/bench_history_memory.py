@@ -0,0 +1,66 @@
+"""
+bench/bench_history_memory.py
+
+Measures bytes per history entry for the old `List[Calculation]` history
+and the columnar HistoryStore, using tracemalloc.
+
+Usage (from the Assignment4 folder):
+    python -m bench.bench_history_memory [--entries N]
+"""
+
+import argparse
+import random
+import tracemalloc
+
+from app.calculation import CalculationFactory
+from app.history import HistoryStore
+
+OPERATIONS = ("add", "subtract", "multiply", "divide")
+
+
+def make_inputs(count):
+    rng = random.Random(601)
+    return [(rng.choice(OPERATIONS), rng.uniform(-1e6, 1e6), rng.uniform(1, 1e6)) for _ in range(count)]
+
+
+def measure(build):
+    """Return (bytes allocated, result) for one history-building function."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    history = build()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return used, history
+
+
+def build_list(inputs):
+    history = []
+    for op, a, b in inputs:
+        calc = CalculationFactory.create_calculation(op, a, b)
+        calc.execute()
+        history.append(calc)
+    return history
+
+
+def build_store(inputs):
+    history = HistoryStore(capacity=len(inputs))
+    for op, a, b in inputs:
+        calc = CalculationFactory.create_calculation(op, a, b)
+        history.append(calc.operation_name(), a, b, calc.execute())
+    return history
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="History memory benchmark")
+    parser.add_argument("--entries", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    inputs = make_inputs(args.entries)
+    print(f"History of {args.entries:,} entries")
+    for name, build in (("List[Calculation]", build_list), ("HistoryStore", build_store)):
+        used, _ = measure(lambda: build(inputs))
+        print(f"  {name:<18} {used / 1e6:8.2f} MB  {used / args.entries:7.1f} bytes/entry")
+
+
+if __name__ == "__main__":
+    main()
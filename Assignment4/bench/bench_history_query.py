@@ -0,0 +1,100 @@
+"""
+bench/bench_history_query.py
+
+History queries with a HistoryIndex against a full scan of the history:
+
+- time to build the index (first query) and its size
+- µs per query for operation filters, result/operand ranges, last-N and top-K
+- the cost of catching up with new entries before a query
+
+Usage (from the Assignment4 folder):
+    python -m bench.bench_history_query [--entries N] [--repeat R]
+"""
+
+import argparse
+import heapq
+import random
+import time
+
+from app.history import HistoryStore
+from app.history_query import HistoryIndex, parse_query
+
+OPERATIONS = ("Add", "Subtract", "Multiply", "Divide")
+QUERIES = [
+    "divide result > 1e6",
+    "result 100..100.5",
+    "a -0.01..0.01",
+    "last 20",
+    "divide last 20",
+    "top 10",
+    "multiply top 10",
+    "add result < 0 b > 999",
+]
+
+
+def fill(history, count, rng):
+    for _ in range(count):
+        a, b = rng.uniform(-1e3, 1e3), rng.uniform(-1e3, 1e3)
+        operation = rng.choice(OPERATIONS)
+        result = {"Add": a + b, "Subtract": a - b, "Multiply": a * b, "Divide": a / b}[operation]
+        history.append(operation, a, b, result)
+
+
+def scan(history, query):
+    """The same query answered by looking at every entry."""
+    matches = [
+        (i, entry) for i, entry in enumerate(history)
+        if (not query.operations or entry.operation.lower() in query.operations)
+        and all(condition.matches(getattr(entry, condition.field)) for condition in query.ranges)
+    ]
+    if query.last is not None:
+        matches = matches[-query.last:]
+    if query.top is not None:
+        matches = heapq.nlargest(query.top, matches, key=lambda match: match[1].result)
+    return matches
+
+
+def best_us(function, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="History query benchmark")
+    parser.add_argument("--entries", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(601)
+    history = HistoryStore(capacity=args.entries)
+    fill(history, args.entries, rng)
+    index = HistoryIndex(history)
+
+    start = time.perf_counter()
+    for field in ("result", "a", "b"):
+        index.select(parse_query(f"{field} = 0"))  # builds the posting lists and every column
+    print(f"{args.entries:,} entries: index built in {time.perf_counter() - start:.2f} s, "
+          f"{index.nbytes() / args.entries:.0f} bytes/entry (history {history.nbytes() / args.entries:.0f})")
+
+    print(f"  {'query':<28}{'matches':>9}{'index µs':>12}{'scan µs':>12}{'speedup':>9}")
+    for text in QUERIES:
+        query = parse_query(text)
+        matches = index.select(query)
+        assert [entry for _, entry in matches] == [entry for _, entry in scan(history, query)]
+        indexed = best_us(lambda: index.select(query), args.repeat)
+        scanned = best_us(lambda: scan(history, query), 1)
+        print(f"  {text:<28}{len(matches):>9,}{indexed:>12,.0f}{scanned:>12,.0f}{scanned / indexed:>8,.0f}x")
+
+    for new in (10, 1000):
+        fill(history, new, rng)  # the ring buffer is full: each append also evicts one
+        start = time.perf_counter()
+        index.select(parse_query("last 1"))
+        print(f"  catch up with {new:,} new entries: {(time.perf_counter() - start) * 1e6:,.0f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+bench/bench_metrics.py
+
+Cost of the built-in metrics: CalculationFactory.evaluate, Calculation.execute
+and whole REPL lines, with metrics off and on.
+
+Usage (from the Assignment4 folder):
+    python -m bench.bench_metrics [--number N] [--lines N]
+"""
+
+import argparse
+import builtins
+import contextlib
+import io
+import time
+import timeit
+
+from app import metrics
+from app.calculation import CalculationFactory
+from app.calculator import calculator
+
+REPL_LINES = ["add 12 30", "subtract 99 1.5", "multiply 6 7", "divide 22 7"]
+
+
+def repl_lines_per_second(count):
+    """Feed `count` lines (then exit) to the REPL with in-memory I/O."""
+    feed = iter([REPL_LINES[i % len(REPL_LINES)] for i in range(count)] + ["exit"])
+    original_input = builtins.input
+    builtins.input = lambda _prompt="": next(feed)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            try:
+                calculator(history_capacity=1024)
+            except SystemExit:
+                pass
+            return count / (time.perf_counter() - start)
+    finally:
+        builtins.input = original_input
+
+
+def measure(number, lines):
+    evaluate = CalculationFactory.evaluate
+    create = CalculationFactory.create_calculation
+    return {
+        "evaluate": min(timeit.repeat(lambda: evaluate("divide", 22.0, 7.0), number=number, repeat=5)) / number,
+        "execute": min(timeit.repeat(lambda: create("divide", 22.0, 7.0).execute(), number=number, repeat=5)) / number,
+        "repl": max(repl_lines_per_second(lines) for _ in range(3)),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Metrics overhead: off vs on")
+    parser.add_argument("--number", type=int, default=200_000)
+    parser.add_argument("--lines", type=int, default=50_000)
+    args = parser.parse_args(argv)
+
+    off = measure(args.number, args.lines)
+    metrics.set_enabled(True)
+    on = measure(args.number, args.lines)
+    metrics.set_enabled(False)
+
+    for name in ("evaluate", "execute"):
+        print(f"{name:<10} off {off[name] * 1e9:8.1f} ns   on {on[name] * 1e9:8.1f} ns   "
+              f"+{(on[name] - off[name]) * 1e9:.0f} ns per call")
+    print(f"{'REPL':<10} off {off['repl']:8,.0f} lines/s   on {on['repl']:8,.0f} lines/s")
+
+
+if __name__ == "__main__":
+    main()
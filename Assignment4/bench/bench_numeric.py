@@ -0,0 +1,71 @@
+"""
+bench/bench_numeric.py
+
+Cost of the numeric-backend layer.
+
+- "float path": Operations with the default float backend, next to a copy of
+  the original plain functions, to show the float path costs the same as before.
+- Exact backends: the same operations through int, fraction and decimal.
+
+Usage (from the Assignment4 folder):
+    python -m bench.bench_numeric [--number N] [--repeat R]
+"""
+
+import argparse
+import timeit
+from decimal import Decimal
+from fractions import Fraction
+
+from app import numeric
+from app.calculation import CalculationFactory
+from app.operations import Operations
+
+
+def plain_addition(a, b):
+    """Operations.addition as it was before backends existed."""
+    return a + b
+
+
+def plain_division(a, b):
+    """Operations.division as it was before backends existed."""
+    if b == 0:
+        raise ValueError("Division by zero is not allowed.")
+    return a / b
+
+
+def best_ns(fn, number, repeat):
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number * 1e9
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Numeric backend benchmark")
+    parser.add_argument("--number", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    create = CalculationFactory.create_calculation
+    float_cases = {
+        "plain addition (before)": lambda: plain_addition(12.0, 30.0),
+        "Operations.addition (float)": lambda: Operations.addition(12.0, 30.0),
+        "plain division (before)": lambda: plain_division(22.0, 7.0),
+        "Operations.division (float)": lambda: Operations.division(22.0, 7.0),
+        "create + execute (float)": lambda: create("divide", 22.0, 7.0).execute(),
+    }
+    print(f"Float path (best of {args.repeat}, ns/op)")
+    for name, fn in float_cases.items():
+        print(f"  {name:<30} {best_ns(fn, args.number, args.repeat):8.1f}")
+
+    operands = {
+        "int": (22, 7),
+        "fraction": (Fraction(22), Fraction(7)),
+        "decimal": (Decimal("22.5"), Decimal("7.5")),
+    }
+    print("Exact backends: divide through Operations (ns/op)")
+    for name, (a, b) in operands.items():
+        with numeric.using(name):
+            ns = best_ns(lambda: Operations.division(a, b), args.number // 10, args.repeat)
+        print(f"  {name:<30} {ns:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
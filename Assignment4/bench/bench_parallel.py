@@ -0,0 +1,50 @@
+"""
+bench/bench_parallel.py
+
+Scaling benchmark for the process-pool batch executor: the serial run_batch
+against run_batch_parallel with 1, 2, 4 and os.cpu_count() workers.
+
+Usage (from the Assignment4 folder):
+    python -m bench.bench_parallel [--lines N] [--repeat R]
+"""
+
+import argparse
+import io
+import os
+import random
+import timeit
+
+from app.batch import run_batch
+from app.parallel import run_batch_parallel
+
+OPERATIONS = ["add", "subtract", "multiply", "divide"]
+
+
+def make_lines(count):
+    rng = random.Random(601)
+    return [f"{rng.choice(OPERATIONS)} {rng.uniform(-1e3, 1e3):.3f} {rng.uniform(0, 1e3):.3f}"
+            for _ in range(count)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Parallel batch scaling benchmark")
+    parser.add_argument("--lines", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    lines = make_lines(args.lines)
+    cases = {"run_batch (serial)": lambda: run_batch(lines, io.StringIO())}
+    for workers in sorted({1, 2, 4, os.cpu_count() or 1}):
+        cases[f"parallel, {workers} worker(s)"] = (
+            lambda workers=workers: run_batch_parallel(lines, io.StringIO(), workers=workers))
+
+    print(f"{args.lines:,} batch lines on {os.cpu_count()} CPU(s) (best of {args.repeat})")
+    baseline = None
+    for name, fn in cases.items():
+        best = min(timeit.repeat(fn, number=1, repeat=args.repeat))
+        baseline = baseline or best
+        print(f"  {name:<26} {best * 1e3:9.1f} ms  {baseline / best:6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+bench/bench_plugins.py
+
+Cost of finding plugin calculation types: a full entry point scan of every
+installed distribution against a load of the cached manifest.
+
+Usage (from the Assignment4 folder):
+    python -m bench.bench_plugins [--number N]
+"""
+
+import argparse
+import os
+import tempfile
+import timeit
+
+from app import plugins
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Plugin discovery: entry point scan vs cached manifest")
+    parser.add_argument("--number", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as folder:
+        cache_path = os.path.join(folder, "plugins.json")
+        plugins.load_manifest(cache_path)  # writes the cache
+
+        scan = min(timeit.repeat(plugins.discover, number=args.number, repeat=3)) / args.number
+        cached = min(timeit.repeat(lambda: plugins.load_manifest(cache_path),
+                                   number=args.number, repeat=3)) / args.number
+
+    print(f"entry point scan   {scan * 1e3:8.3f} ms")
+    print(f"cached manifest    {cached * 1e3:8.3f} ms   {scan / cached:6.1f}x faster")
+
+
+if __name__ == "__main__":
+    main()
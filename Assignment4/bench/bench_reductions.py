@@ -0,0 +1,81 @@
+"""
+bench/bench_reductions.py
+
+Cost and accuracy of reducing many values to one:
+
+- a Python loop of CalculationFactory.evaluate("add", total, x) → what binary-only operations force
+- CalculationFactory.reduce over a list, an array('d') and a generator
+- reductions.read_numbers over a text stream (parsing included)
+
+The last line compares the float error of the evaluate loop and of reduce
+(math.fsum) against the exact sum of the same values.
+
+Usage (from the Assignment4 folder):
+    python -m bench.bench_reductions [--size N] [--repeat R]
+"""
+
+import argparse
+import io
+import random
+import time
+from array import array
+from fractions import Fraction
+
+from app.calculation import CalculationFactory
+from app.reductions import read_numbers
+
+
+def evaluate_loop(values):
+    """Sum the values one binary evaluate() call at a time."""
+    evaluate = CalculationFactory.evaluate
+    total = 0.0
+    for value in values:
+        total = evaluate("add", total, value)
+    return total
+
+
+def best_ns(function, repeat):
+    """Best wall time of `function()` over `repeat` runs, in nanoseconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        function()
+        times.append(time.perf_counter_ns() - start)
+    return min(times)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="N-ary reduction benchmark")
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(601)
+    values = [rng.uniform(-1e6, 1e6) for _ in range(args.size)]
+    column = array("d", values)
+    text = "\n".join(" ".join(map(repr, values[i:i + 10])) for i in range(0, len(values), 10))
+    reduce = CalculationFactory.reduce
+
+    cases = {
+        "evaluate loop (list)": lambda: evaluate_loop(values),
+        "reduce add (list)": lambda: reduce("add", values),
+        "reduce add (array)": lambda: reduce("add", column),
+        "reduce add (generator)": lambda: reduce("add", (x for x in values)),
+        "reduce mean (array)": lambda: reduce("mean", column),
+        "reduce max (array)": lambda: reduce("max", column),
+        "reduce add (read_numbers)": lambda: reduce("add", read_numbers(io.StringIO(text))),
+    }
+    print(f"{args.size:,} values (best of {args.repeat}, ns/value)")
+    baseline = None
+    for name, fn in cases.items():
+        ns = best_ns(fn, args.repeat) / args.size
+        baseline = baseline or ns
+        print(f"  {name:<28} {ns:8.1f}  {baseline / ns:6.1f}x")
+
+    exact = float(sum(map(Fraction, values)))
+    print(f"abs error vs exact sum: evaluate loop {abs(evaluate_loop(values) - exact):.3g}, "
+          f"reduce {abs(reduce('add', values) - exact):.3g}")
+
+
+if __name__ == "__main__":
+    main()
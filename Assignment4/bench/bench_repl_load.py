@@ -0,0 +1,297 @@
+"""
+bench/bench_repl_load.py
+
+End-to-end load on the interactive REPL: app.calculator.calculator() is run
+unchanged, with input() fed from a list of lines and stdout replaced by a sink
+that only counts characters, so the numbers include command dispatch, history,
+aggregates and output formatting but no terminal.
+
+The lines come from a workload generator, a weighted mix of line kinds:
+
+    calc       two-operand calculations         add 12.5 3
+    nary       n-ary calculations               mean 1 2 3 4
+    expr       infix expressions                (3 + 4.5) * 2
+    multi      several statements on one line   add 1 2; divide 3 4
+    assign     variable definitions             v3 = multiply v1 2
+    history    the full history listing         history
+    query      history queries                  history divide result > 100
+    aggregate  session statistics               aggregate
+    help       the help text                    help
+    malformed  lines that fail                  add 1 / modulus 1 2 / divide 1 0
+
+or from a recorded session (`python main.py --record-session session.txt`
+writes one input line per line; --replay reads that file back).
+
+Reported:
+
+- lines/s for the whole run and for each segment between checkpoints, so a
+  slowdown over a long run shows up as falling throughput
+- latency percentiles per line kind (each line timed from the input() call
+  that returns it to the next one)
+- memory growth: a second replay under tracemalloc reports traced memory at
+  each checkpoint, the growth per 1,000 lines over the second half of the run
+  (where bounded structures should have stopped growing), and the source
+  lines of the calculator that gained the most memory. History keeps every
+  calculation up to --history-capacity, so use a capacity well below the
+  number of lines to see whether memory levels off.
+
+`history` prints the whole history and a query every match, so their latency
+grows with the history by design; --mix history=0,query=0 leaves them out.
+
+Usage (from the Assignment4 folder):
+    python -m bench.bench_repl_load [--lines N] [--mix calc=50,history=2,...] [--seed S]
+                                    [--history-capacity C] [--checkpoints K] [--save FILE]
+                                    [--replay FILE] [--no-memory]
+"""
+
+import argparse
+import builtins
+import os
+import random
+import sys
+import time
+import tracemalloc
+from array import array
+from collections import defaultdict
+
+from app.calculator import calculator
+from app.history import DEFAULT_CAPACITY
+
+# Line kind → relative weight in the default workload
+DEFAULT_MIX = {
+    "calc": 50, "nary": 8, "expr": 10, "multi": 8, "assign": 6, "history": 1,
+    "query": 3, "aggregate": 2, "help": 1, "malformed": 11,
+}
+
+OPERATIONS = ("add", "subtract", "multiply", "divide")
+N_ARY = ("add", "multiply", "min", "max", "mean")
+COMMANDS = ("help", "history", "aggregate", "cells", "backend", "stats", "compact", "exit")
+VARIABLES = 20  # names v0..v19: a real session reuses a handful of variables
+
+
+# -------------------------------
+# Workload Generation
+# -------------------------------
+def _number(rng):
+    return str(rng.choice((rng.randint(-50, 500), round(rng.uniform(-1e3, 1e4), 2))))
+
+
+def _divisor(rng):
+    return str(rng.choice((rng.randint(1, 100), round(rng.uniform(0.5, 1e3), 2))))
+
+
+def _calculation(rng):
+    operation = rng.choice(OPERATIONS)
+    return f"{operation} {_number(rng)} {_divisor(rng) if operation == 'divide' else _number(rng)}"
+
+
+LINE_MAKERS = {
+    "calc": _calculation,
+    "nary": lambda rng: f"{rng.choice(N_ARY)} " + " ".join(_number(rng) for _ in range(rng.randint(3, 8))),
+    "expr": lambda rng: f"({_number(rng)} + {_number(rng)}) * {_number(rng)} / {_divisor(rng)}",
+    "multi": lambda rng: "; ".join(_calculation(rng) for _ in range(rng.randint(2, 4))),
+    "assign": lambda rng: (f"v{rng.randrange(VARIABLES)} = "
+                           + rng.choice((_number(rng), f"multiply v{rng.randrange(VARIABLES)} 2"))),
+    "history": lambda rng: "history",
+    "query": lambda rng: rng.choice(("history divide result > 100", "history top 5",
+                                     f"history a {rng.randint(-50, 0)}..{rng.randint(1, 500)} last 10")),
+    "aggregate": lambda rng: "aggregate",
+    "help": lambda rng: "help",
+    "malformed": lambda rng: rng.choice(("add 1", f"modulus {_number(rng)} 2", f"add {_number(rng)} x",
+                                         f"divide {_number(rng)} 0", "(1 + 2", "history bogus")),
+}
+
+
+def parse_mix(text):
+    """Read `kind=weight,...` into a mix; kinds left out keep their default weight (0 removes a kind)."""
+    mix = dict(DEFAULT_MIX)
+    for item in filter(None, text.split(",")):
+        kind, _, weight = item.partition("=")
+        if kind not in LINE_MAKERS:
+            raise argparse.ArgumentTypeError(f"unknown line kind {kind!r} (choose from {', '.join(LINE_MAKERS)})")
+        mix[kind] = float(weight)
+    return mix
+
+
+def generate_workload(lines, mix=DEFAULT_MIX, seed=601):
+    """Return (kinds, lines): `lines` REPL input lines drawn from the weighted mix, reproducibly."""
+    rng = random.Random(seed)
+    kinds = [kind for kind, weight in mix.items() if weight > 0]
+    chosen = rng.choices(kinds, weights=[mix[kind] for kind in kinds], k=lines)
+    return chosen, [LINE_MAKERS[kind](rng) for kind in chosen]
+
+
+def classify(line):
+    """Kind of a recorded line: its command word, "assign" for a definition, "statement" otherwise."""
+    words = line.split()
+    if not words:
+        return "empty"
+    if words[0].lower() in COMMANDS:
+        return "query" if words[0].lower() == "history" and len(words) > 1 else words[0].lower()
+    return "assign" if len(words) > 1 and words[1] == "=" else "statement"
+
+
+# -------------------------------
+# Replay
+# -------------------------------
+class _Feeder:
+    """Stands in for input(): hands out the lines and times each one until the next call."""
+
+    def __init__(self, lines, checkpoint_every=0, on_checkpoint=None):
+        self.lines = lines
+        self.index = 0
+        self.started = 0
+        self.durations = array("q", bytes(8 * len(lines)))  # nanoseconds per line
+        self.checkpoint_every = checkpoint_every
+        self.on_checkpoint = on_checkpoint
+
+    def __call__(self, prompt=""):
+        now = time.perf_counter_ns()
+        if self.index:
+            self.durations[self.index - 1] = now - self.started
+            if self.checkpoint_every and self.index % self.checkpoint_every == 0:
+                self.on_checkpoint(self.index)
+        if self.index == len(self.lines):
+            raise EOFError  # the REPL says goodbye and exits
+        line = self.lines[self.index]
+        self.index += 1
+        self.started = time.perf_counter_ns()
+        return line
+
+
+class _Sink:
+    """Stands in for sys.stdout: counts what the REPL writes and keeps none of it."""
+
+    def __init__(self):
+        self.characters = 0
+
+    def write(self, text):
+        self.characters += len(text)
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+def replay(lines, history_capacity=DEFAULT_CAPACITY, checkpoint_every=0, on_checkpoint=None):
+    """
+    Run calculator() over `lines` with in-memory I/O.
+
+    Returns:
+        (feeder, seconds, sink): per-line durations, wall time and output size
+    """
+    feeder = _Feeder(lines, checkpoint_every, on_checkpoint)
+    sink = _Sink()
+    saved_input, saved_stdout = builtins.input, sys.stdout
+    builtins.input, sys.stdout = feeder, sink
+    start = time.perf_counter()
+    try:
+        calculator(history_capacity=history_capacity)
+    except SystemExit:
+        pass
+    finally:
+        builtins.input, sys.stdout = saved_input, saved_stdout
+    return feeder, time.perf_counter() - start, sink
+
+
+# -------------------------------
+# Reporting
+# -------------------------------
+def percentile(ordered, fraction):
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def report_latency(kinds, feeder):
+    by_kind = defaultdict(list)
+    for kind, duration in zip(kinds, feeder.durations[:feeder.index]):
+        by_kind[kind].append(duration / 1e3)
+    print(f"  {'kind':<11}{'lines':>9}{'p50 µs':>10}{'p90 µs':>10}{'p99 µs':>10}{'max µs':>11}")
+    for kind, values in sorted(by_kind.items(), key=lambda item: -len(item[1])):
+        values.sort()
+        print(f"  {kind:<11}{len(values):>9,}" + "".join(
+            f"{percentile(values, fraction):>10,.1f}" for fraction in (0.5, 0.9, 0.99)) + f"{values[-1]:>11,.1f}")
+
+
+def report_segments(feeder, every):
+    print(f"  {'lines':>9}{'lines/s':>12}")
+    for end in range(every, feeder.index + 1, every):
+        seconds = sum(feeder.durations[end - every:end]) / 1e9
+        print(f"  {end:>9,}{every / seconds:>12,.0f}")
+
+
+def report_memory(lines, history_capacity, every):
+    checkpoints = []
+
+    def sample(index):
+        checkpoints.append((index, tracemalloc.get_traced_memory()[0]))
+        if len(checkpoints) == 1:
+            snapshots.append(tracemalloc.take_snapshot())
+
+    snapshots = []
+    tracemalloc.start()
+    try:
+        replay(lines, history_capacity, every, sample)
+        snapshots.append(tracemalloc.take_snapshot())
+    finally:
+        tracemalloc.stop()
+
+    print(f"  {'lines':>9}{'traced MB':>11}")
+    for index, traced in checkpoints:
+        print(f"  {index:>9,}{traced / 1e6:>11.2f}")
+    if len(checkpoints) >= 2:
+        (mid_lines, mid_bytes), (end_lines, end_bytes) = checkpoints[len(checkpoints) // 2], checkpoints[-1]
+        if end_lines > mid_lines:
+            growth = (end_bytes - mid_bytes) / (end_lines - mid_lines) * 1000
+            print(f"  growth over the second half: {growth:,.0f} bytes per 1,000 lines")
+    if len(snapshots) == 2:
+        app_only = [tracemalloc.Filter(True, os.path.join("*", "app", "*"))]
+        first, last = (snapshot.filter_traces(app_only) for snapshot in snapshots)
+        print("  largest growth by source line (after the first checkpoint):")
+        grown = sorted((stat for stat in last.compare_to(first, "lineno") if stat.size_diff > 0),
+                       key=lambda stat: -stat.size_diff)
+        for stat in grown[:5]:
+            frame = stat.traceback[0]
+            print(f"    {stat.size_diff / 1e3:>+10,.1f} kB  {stat.count_diff:>+8,} blocks  "
+                  f"{os.path.relpath(frame.filename)}:{frame.lineno}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="REPL load generator and session replay")
+    parser.add_argument("--lines", type=int, default=20_000, help="generated lines (ignored with --replay)")
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX,
+                        help="line kind weights, e.g. calc=80,history=0 (others keep their defaults)")
+    parser.add_argument("--seed", type=int, default=601)
+    parser.add_argument("--history-capacity", type=int, default=DEFAULT_CAPACITY)
+    parser.add_argument("--checkpoints", type=int, default=10, help="throughput and memory samples per run")
+    parser.add_argument("--save", metavar="FILE", help="write the generated lines to FILE (replayable)")
+    parser.add_argument("--replay", metavar="FILE", help="replay a recorded session instead of generating")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    args = parser.parse_args(argv)
+
+    if args.replay:
+        with open(args.replay, encoding="utf-8") as source:
+            lines = source.read().splitlines()
+        kinds = [classify(line) for line in lines]
+        print(f"Replaying {len(lines):,} lines from {args.replay}")
+    else:
+        kinds, lines = generate_workload(args.lines, args.mix, args.seed)
+        print(f"Replaying {len(lines):,} generated lines (seed {args.seed})")
+        if args.save:
+            with open(args.save, "w", encoding="utf-8") as target:
+                target.writelines(line + "\n" for line in lines)
+    every = max(1, len(lines) // max(1, args.checkpoints))
+
+    feeder, seconds, sink = replay(lines, args.history_capacity)
+    print(f"  {feeder.index:,} lines in {seconds:.2f} s: {feeder.index / seconds:,.0f} lines/s, "
+          f"{sink.characters / 1e6:.1f} MB of output")
+    print("Latency per line kind")
+    report_latency(kinds, feeder)
+    print("Throughput by segment")
+    report_segments(feeder, every)
+    if not args.no_memory:
+        print("Memory (second replay, under tracemalloc)")
+        report_memory(lines, args.history_capacity, every)
+
+
+if __name__ == "__main__":
+    main()
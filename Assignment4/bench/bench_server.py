@@ -0,0 +1,94 @@
+"""
+bench/bench_server.py
+
+Load-test client for the asyncio calculator server. Opens several connections,
+keeps up to `--window` pipelined requests in flight on each, and reports
+throughput plus p50/p99 request latency.
+
+Usage (from the Assignment4 folder):
+    python -m bench.bench_server                                # starts a local server in-process
+    python -m bench.bench_server --port 8765 --external         # targets `python main.py --serve`
+    python -m bench.bench_server --connections 8 --requests 20000 --window 128
+"""
+
+import argparse
+import asyncio
+import collections
+import statistics
+import time
+
+from app.server import start_server
+
+REQUESTS = [b"add 12 30\n", b"subtract 99 1.5\n", b"multiply 6 7\n", b"divide 22 7\n"]
+
+
+async def run_connection(host, port, requests, window, latencies):
+    """Send `requests` pipelined requests, at most `window` unanswered at a time."""
+    reader, writer = await asyncio.open_connection(host, port)
+    in_flight = asyncio.Semaphore(window)
+    sent_at = collections.deque()
+
+    async def send():
+        for i in range(requests):
+            await in_flight.acquire()
+            sent_at.append(time.perf_counter())
+            writer.write(REQUESTS[i % len(REQUESTS)])
+            if len(sent_at) >= window:
+                await writer.drain()
+        await writer.drain()
+
+    async def receive():
+        for _ in range(requests):
+            await reader.readline()
+            latencies.append(time.perf_counter() - sent_at.popleft())
+            in_flight.release()
+
+    await asyncio.gather(send(), receive())
+    writer.write_eof()
+    await reader.read()  # wait for the server to finish with this connection
+    writer.close()
+    await writer.wait_closed()
+
+
+async def load_test(args):
+    server = None
+    host, port = args.host, args.port
+    if not args.external:
+        server = await start_server(host, 0, queue_size=args.queue_size)
+        host, port = server.sockets[0].getsockname()[:2]
+
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        run_connection(host, port, args.requests, args.window, latencies)
+        for _ in range(args.connections)
+    ))
+    elapsed = time.perf_counter() - start
+
+    if server is not None:
+        server.close()
+        await server.wait_closed()
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    total = args.connections * args.requests
+    print(f"{total:,} requests over {args.connections} connections (window {args.window})")
+    print(f"  throughput   {total / elapsed:12,.0f} req/s")
+    print(f"  latency p50  {quantiles[49] * 1e3:12.3f} ms")
+    print(f"  latency p99  {quantiles[98] * 1e3:12.3f} ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Calculator server load test")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--external", action="store_true", help="use an already running server")
+    parser.add_argument("--connections", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=10_000, help="requests per connection")
+    parser.add_argument("--window", type=int, default=64, help="pipelined requests in flight per connection")
+    parser.add_argument("--queue-size", type=int, default=1024, help="per-connection queue (local server)")
+    args = parser.parse_args(argv)
+    asyncio.run(load_test(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+bench/bench_sheet.py
+
+Cost of updating one variable in sheets of growing size:
+
+- incremental: Sheet.define() recomputes only the cells downstream of the change
+- full: every cell evaluated again in topological order (what a sheet without
+  a dependency graph has to do)
+
+Each sheet is made of chains `c<j>_0 = <number>`, `c<j>_<i> = add c<j>_<i-1> 1`,
+so changing the start of a chain changes exactly `--chain` cells, however many
+cells the sheet holds.
+
+Usage (from the Assignment4 folder):
+    python -m bench.bench_sheet [--chain L] [--sizes N ...] [--repeat R]
+"""
+
+import argparse
+import time
+
+from app.sheet import Sheet
+
+
+def build(cells, chain):
+    sheet = Sheet()
+    for j in range(cells // chain):
+        sheet.define(f"c{j}_0", ["1"])
+        for i in range(1, chain):
+            sheet.define(f"c{j}_{i}", ["add", f"c{j}_{i - 1}", "1"])
+    return sheet
+
+
+def full_recompute(sheet):
+    for cell in sorted(sheet.cells.values(), key=lambda cell: cell.height):
+        sheet._evaluate(cell)
+
+
+def best_us(function, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Incremental recompute benchmark")
+    parser.add_argument("--chain", type=int, default=100)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(f"One update changing {args.chain} cells (best of {args.repeat})")
+    print(f"  {'cells':>9}{'incremental µs':>16}{'evaluated':>11}{'full µs':>14}{'speedup':>9}")
+    for cells in args.sizes:
+        sheet = build(cells, args.chain)
+        values = iter(range(2, 2 + args.repeat * 2))
+        sheet.evaluations = 0
+        incremental = best_us(lambda: sheet.define("c0_0", [str(next(values))]), args.repeat)
+        evaluated = sheet.evaluations // args.repeat
+        full = best_us(lambda: full_recompute(sheet), min(args.repeat, 3))
+        print(f"  {cells:>9,}{incremental:>16,.0f}{evaluated:>11,}{full:>14,.0f}{full / incremental:>8,.0f}x")
+
+    sheet = build(max(args.sizes), max(args.sizes))  # one long chain
+    print(f"Changes of growing size in one chain of {max(args.sizes):,} cells")
+    for changed in (10, 100, 1_000, 10_000):
+        start, before = f"c0_{max(args.sizes) - changed}", f"c0_{max(args.sizes) - changed - 1}"
+        steps = iter(range(2, 2 + args.repeat))  # a new value each time, so every cell changes
+        update = best_us(lambda: sheet.define(start, ["add", before, str(next(steps))]), args.repeat)
+        print(f"  {changed:>9,} cells changed  {update:>12,.0f} µs  {update / changed:6.1f} µs/cell")
+
+
+if __name__ == "__main__":
+    main()
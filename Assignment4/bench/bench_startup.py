@@ -0,0 +1,87 @@
+"""
+bench/bench_startup.py
+
+Cold-start import cost of each calculator entry point, measured with
+`python -X importtime` in a fresh interpreter, against a fixed budget.
+
+For every entry point the best of several runs is compared with its budget,
+and the modules it imports are checked against those it must leave alone
+(e.g. the REPL must not pull in readline when stdin is not a terminal). The
+exit status is 1 when any entry point is over budget or imports a forbidden
+module, so the script can run as a CI gate.
+
+Usage (from the Assignment4 folder):
+    python -m bench.bench_startup [--repeat R] [--budget-scale X] [--show N]
+"""
+
+import argparse
+import compileall
+import re
+import subprocess
+import sys
+
+# Entry point → (module imported, budget in milliseconds, modules it must not import)
+ENTRY_POINTS = {
+    "repl": ("app.calculator", 40.0, ("readline", "app.history_log", "decimal", "fractions", "dataclasses")),
+    "batch": ("app.batch", 35.0, ("app.calculator", "readline", "decimal", "fractions", "dataclasses")),
+    "stream": ("app.stream", 45.0, ("app.calculator", "readline", "decimal", "fractions", "dataclasses")),
+    "server": ("app.server", 120.0, ("app.calculator", "readline", "decimal", "fractions", "dataclasses")),
+}
+
+# "import time:  self [us] | cumulative | imported package", indented by nesting depth
+_LINE_RE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+
+
+def import_profile(module):
+    """
+    Import `module` in a fresh interpreter and return its import-time profile.
+
+    Returns:
+        (float, list): milliseconds spent importing `module` itself (cumulative),
+        and (self µs, module name) for every module loaded along the way
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    )
+    total, loaded = 0.0, []
+    for match in _LINE_RE.finditer(completed.stderr):
+        self_us, cumulative_us, indent, name = match.groups()
+        loaded.append((int(self_us), name))
+        if name == module and not indent:
+            total = int(cumulative_us) / 1000
+    return total, loaded
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Entry point import time against a budget")
+    parser.add_argument("--repeat", type=int, default=7, help="runs per entry point; the best one counts")
+    parser.add_argument("--budget-scale", type=float, default=1.0,
+                        help="multiply every budget, e.g. 2 on a slow machine")
+    parser.add_argument("--show", type=int, default=5, help="slowest modules listed per entry point")
+    args = parser.parse_args(argv)
+
+    # Time imports from up-to-date bytecode, as an installed copy would run
+    compileall.compile_dir("app", quiet=1)
+
+    failed = False
+    for entry, (module, budget_ms, forbidden) in ENTRY_POINTS.items():
+        budget_ms *= args.budget_scale
+        best_ms, loaded = min((import_profile(module) for _ in range(args.repeat)), key=lambda run: run[0])
+        names = {name for _, name in loaded}
+        offenders = sorted(name for name in forbidden if name in names)
+        over = best_ms > budget_ms
+        failed = failed or over or bool(offenders)
+
+        status = "OVER BUDGET" if over else "ok"
+        print(f"{entry:<7} import {module:<15} {best_ms:7.1f} ms / {budget_ms:5.1f} ms  {status}")
+        for self_us, name in sorted(loaded, reverse=True)[:args.show]:
+            print(f"          {self_us / 1000:6.2f} ms  {name}")
+        if offenders:
+            print(f"          imports {', '.join(offenders)}, which should load lazily")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+bench/bench_statements.py
+
+REPL throughput on dense scripts: the same calculations fed one per line
+(the previous way) and packed several per line with `;`.
+
+Usage (from the Assignment4 folder):
+    python -m bench.bench_statements [--calculations N] [--per-line K] [--repeat R]
+"""
+
+import argparse
+import builtins
+import contextlib
+import io
+import time
+
+from app.calculator import calculator
+
+OPERATIONS = ["add 12 30", "subtract 99 1.5", "multiply 6 7", "divide 22 7"]
+
+
+def run_repl(lines):
+    """Feed `lines` (then exit) to the REPL with in-memory I/O; return seconds taken."""
+    feed = iter(lines + ["exit"])
+    original_input = builtins.input
+    builtins.input = lambda _prompt="": next(feed)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            try:
+                calculator(history_capacity=1024)
+            except SystemExit:
+                pass
+            return time.perf_counter() - start
+    finally:
+        builtins.input = original_input
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Multi-statement REPL throughput")
+    parser.add_argument("--calculations", type=int, default=100_000)
+    parser.add_argument("--per-line", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    calculations = [OPERATIONS[i % len(OPERATIONS)] for i in range(args.calculations)]
+    print(f"{args.calculations:,} calculations (best of {args.repeat})")
+    baseline = None
+    for per_line in args.per_line:
+        lines = ["; ".join(calculations[i:i + per_line]) for i in range(0, len(calculations), per_line)]
+        best = min(run_repl(lines) for _ in range(args.repeat))
+        baseline = baseline or best
+        print(f"  {per_line:>3} per line  {args.calculations / best:12,.0f} calculations/s  {baseline / best:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+bench/bench_stream.py
+
+Throughput and peak memory of the streaming CSV evaluator for growing inputs.
+Rows are generated on the fly and the output is discarded, so the peak shown
+(measured with tracemalloc) is the pipeline's own working set.
+
+Usage (from the Assignment4 folder):
+    python -m bench.bench_stream [--sizes 10000 100000 1000000]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from app.stream import evaluate_stream
+
+OPERATIONS = ["add", "subtract", "multiply", "divide"]
+
+
+class NullWriter:
+    """A text sink that discards everything written to it."""
+
+    def write(self, s):
+        return len(s)
+
+
+def rows(count):
+    yield "op,a,b,customer\n"
+    for i in range(count):
+        yield f"{OPERATIONS[i % 4]},{i},{i % 7},customer-{i % 100}\n"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Streaming evaluator benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args(argv)
+
+    for size in args.sizes:
+        start = time.perf_counter()
+        evaluate_stream(rows(size), NullWriter())
+        elapsed = time.perf_counter() - start
+
+        tracemalloc.start()
+        evaluate_stream(rows(size), NullWriter())
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"  {size:>10,} rows  {size / elapsed:12,.0f} rows/s  peak {peak / 1024:8.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+bench/bench_vectors.py
+
+Scaling a column of prices by 1.05 in the REPL:
+
+- scalar lines:    one `multiply <price> 1.05` statement per element
+- vector literal:  one `multiply [p1, p2, ...] 1.05` statement
+- @file:           one `multiply @prices.bin 1.05` statement (the file is mapped, not read)
+- read + multiply: array('d').fromfile() followed by the same element-wise multiply
+                   and summary, for comparison with the zero-copy mapping
+
+Vector statements include the printed summary (min, max and mean: three more
+passes over the result).
+
+The slow scalar path runs on the first --sample elements only; every path is
+reported as elements per second.
+
+Usage (from the Assignment4 folder):
+    python -m bench.bench_vectors [--size N] [--sample S] [--repeat R]
+"""
+
+import argparse
+import operator
+import os
+import random
+import tempfile
+import time
+from array import array
+
+from app.calculator import run_statements
+from app.history import HistoryStore
+from app.vectors import elementwise, summarize
+
+
+def best_seconds(function, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def read_and_multiply(path, size):
+    values = array("d")
+    with open(path, "rb") as file:
+        values.fromfile(file, size)
+    return summarize(elementwise(operator.mul, memoryview(values), 1.05))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Vector operand benchmark")
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--sample", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(601)
+    prices = array("d", (round(rng.uniform(1, 500), 2) for _ in range(args.size)))
+    history = HistoryStore()
+    scalar_lines = "\n".join(f"multiply {price} 1.05" for price in prices[:args.sample]).splitlines()
+    literal = f"multiply [{', '.join(map(str, prices))}] 1.05"
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "prices.bin")
+        with open(path, "wb") as file:
+            prices.tofile(file)
+        cases = [
+            ("scalar lines", args.sample, lambda: [run_statements(line, history) for line in scalar_lines]),
+            ("vector literal", args.size, lambda: run_statements(literal, history)),
+            ("@file", args.size, lambda: run_statements(f"multiply @{path} 1.05", history)),
+            ("read + multiply", args.size, lambda: read_and_multiply(path, args.size)),
+        ]
+        print(f"multiply by 1.05 over {args.size:,} prices (best of {args.repeat})")
+        baseline = None
+        for name, count, run in cases:
+            rate = count / best_seconds(run, args.repeat)
+            baseline = baseline or rate
+            print(f"  {name:<18}{rate:>16,.0f} elements/s{rate / baseline:>9,.0f}x")
+
+
+if __name__ == "__main__":
+    main()
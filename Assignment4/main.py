@@ -2,18 +2,212 @@
 main.py
 
 This is the entry point for the Professional Calculator application.
-It imports the calculator REPL and runs it when executed directly.
+Without arguments it starts the interactive calculator REPL. With --batch it
+evaluates a file of calculations (or stdin when given '-') without prompts;
+--stream does the same for CSV/JSONL job files, one row at a time, and
+--reduce folds every number of a file into one result (sum, product, ...).
 
 Usage:
     python main.py
+    python main.py --history-file history.log
+    python main.py --backend decimal
+    python main.py --metrics-file metrics.prom
+    python main.py --record-session session.txt
+    python main.py --batch calculations.txt
+    cat calculations.txt | python main.py --batch -
+    python main.py --batch calculations.txt --workers 4
+    python main.py --batch calculations.txt --aggregate
+    python main.py --stream jobs.csv > results.csv
+    python main.py --stream - --format jsonl < jobs.jsonl
+    python main.py --reduce add numbers.txt
+    python main.py --serve --port 8765
 """
 
-from app.calculator import calculator
+import argparse
+import sys
 
 
-def main():
-    """Run the calculator REPL."""
-    calculator()
+def parse_args(argv=None):
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Professional Calculator")
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="evaluate '<operation> <num1> <num2>' lines from FILE ('-' for stdin) instead of "
+             "starting the REPL; operands are floats, one calculation per line (no ';', "
+             "expressions, variables or n-ary operations)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        metavar="N",
+        help="with --batch: evaluate in N worker processes (0 = one per CPU core)",
+    )
+    parser.add_argument(
+        "--aggregate",
+        action="store_true",
+        help="with --batch or --stream: add result statistics (mean, quantiles, distinct count) "
+             "to the summary",
+    )
+    parser.add_argument(
+        "--stream",
+        metavar="FILE",
+        help="evaluate a CSV/JSONL job file ('-' for stdin) row by row, writing rows to stdout",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["csv", "jsonl"],
+        help="with --stream: input/output format (default: from the file extension, else csv)",
+    )
+    parser.add_argument(
+        "--reduce",
+        nargs=2,
+        metavar=("OP", "FILE"),
+        help="apply an n-ary operation (add, multiply, min, max, mean) to every number in FILE "
+             "('-' for stdin)",
+    )
+    parser.add_argument(
+        "--history-file",
+        metavar="PATH",
+        help="keep REPL history in a persistent log at PATH",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["float", "int", "fraction", "decimal"],
+        help="numeric backend for the REPL session or --reduce (default: float); batch, stream "
+             "and server modes always use floats",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        metavar="PATH",
+        help="collect REPL metrics and write them to PATH (Prometheus text format) on exit",
+    )
+    parser.add_argument(
+        "--record-session",
+        metavar="PATH",
+        help="append every REPL input line to PATH, for replay with bench/bench_repl_load.py",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="run the calculator as a TCP server speaking the REPL line protocol",
+    )
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="server interface (default: %(default)s)")
+    parser.add_argument("--port", type=int, default=8765, help="server port (default: %(default)s)")
+    args = parser.parse_args(argv)
+    if args.backend is not None and (args.batch is not None or args.stream is not None
+                                     or args.serve):
+        parser.error("--backend applies to the REPL and --reduce only; "
+                     "--batch, --stream and --serve use floats")
+    return args
+
+
+def run_batch_mode(path: str, workers=None, aggregate: bool = False) -> int:
+    """Run a batch file (or stdin) and return the process exit status."""
+    import functools
+
+    if workers is None:
+        from app.batch import run_batch
+    else:
+        from app.parallel import run_batch_parallel
+
+        run_batch = functools.partial(run_batch_parallel, workers=workers or None)
+    run_batch = functools.partial(run_batch, aggregate=aggregate)
+
+    if path == "-":
+        summary = run_batch(sys.stdin, sys.stdout)
+    else:
+        try:
+            with open(path, encoding="utf-8") as source:
+                summary = run_batch(source, sys.stdout)
+        except OSError as e:
+            print(f"Cannot read batch file: {e}", file=sys.stderr)
+            return 2
+    sys.stdout.flush()
+    print(summary, file=sys.stderr)
+    return summary.exit_status
+
+
+def run_stream_mode(path: str, fmt=None, aggregate: bool = False) -> int:
+    """Stream a CSV/JSONL job file (or stdin) to stdout and return the exit status."""
+    from app.stream import detect_format, evaluate_stream
+
+    fmt = fmt or detect_format(path)
+    if path == "-":
+        summary = evaluate_stream(sys.stdin, sys.stdout, fmt, aggregate=aggregate)
+    else:
+        try:
+            with open(path, encoding="utf-8", newline="") as source:
+                summary = evaluate_stream(source, sys.stdout, fmt, aggregate=aggregate)
+        except OSError as e:
+            print(f"Cannot read stream file: {e}", file=sys.stderr)
+            return 2
+    sys.stdout.flush()
+    print(summary, file=sys.stderr)
+    return summary.exit_status
+
+
+def run_reduce_mode(operation: str, path: str, backend=None) -> int:
+    """Reduce every number in a file (or stdin) to one result, print it; return the exit status."""
+    from app import numeric
+    from app.calculation import CalculationFactory
+    from app.reductions import read_numbers
+
+    if backend is not None:
+        numeric.set_backend(backend)
+    try:
+        if path == "-":
+            result = CalculationFactory.reduce(operation, read_numbers(sys.stdin))
+        else:
+            with open(path, encoding="utf-8") as source:  # read line by line, never loaded whole
+                result = CalculationFactory.reduce(operation, read_numbers(source))
+    except OSError as e:
+        print(f"Cannot read numbers file: {e}", file=sys.stderr)
+        return 2
+    except (ArithmeticError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    print(result)
+    return 0
+
+
+def run_server_mode(host: str, port: int) -> None:
+    """Serve calculations over TCP until interrupted."""
+    import asyncio
+    from app.server import start_server
+
+    async def serve():
+        server = await start_server(host, port)
+        addresses = ", ".join(str(sock.getsockname()) for sock in server.sockets)
+        print(f"Calculator server listening on {addresses}")
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
+
+
+def main(argv=None):
+    """Run the calculator REPL, or a batch/stream/reduce/server mode when requested."""
+    args = parse_args(argv)
+    if args.batch is not None:
+        sys.exit(run_batch_mode(args.batch, args.workers, args.aggregate))
+    if args.stream is not None:
+        sys.exit(run_stream_mode(args.stream, args.format, args.aggregate))
+    if args.reduce is not None:
+        sys.exit(run_reduce_mode(*args.reduce, backend=args.backend))
+    if args.serve:
+        run_server_mode(args.host, args.port)
+        return
+
+    # Imported here so batch runs never load the interactive REPL (and readline).
+    from app.calculator import calculator
+
+    calculator(history_path=args.history_file, backend=args.backend, metrics_path=args.metrics_file,
+               record_path=args.record_session)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,42 @@
+"""
+tests/conftest.py
+
+Shared fixtures: keep the plugin manifest cache (see app.plugins) out of the
+user's home directory while the tests run, including in subprocesses, and run
+main.py as a subprocess.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from app.plugins import CACHE_ENV
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(autouse=True, scope="session")
+def plugin_cache(tmp_path_factory):
+    """Point the plugin manifest cache at a temporary file for the whole session."""
+    monkeypatch = pytest.MonkeyPatch()
+    path = tmp_path_factory.mktemp("plugins") / "plugins.json"
+    monkeypatch.setenv(CACHE_ENV, str(path))
+    yield path
+    monkeypatch.undo()
+
+
+@pytest.fixture
+def run_main():
+    """Return a function that runs main.py with arguments and stdin, returning the process."""
+    def run(*args, stdin=""):
+        return subprocess.run(
+            [sys.executable, "main.py", *args],
+            input=stdin,
+            capture_output=True,
+            text=True,
+            cwd=PROJECT_ROOT,
+            check=False,
+        )
+
+    return run
@@ -0,0 +1,169 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Date: 10/18/2026
+# Project: Assignment 4 - Professional Calculator CLI
+# ----------------------------------------------------------
+
+"""
+tests/test_aggregates.py
+
+Unit tests for streaming aggregates.
+Covers:
+- Welford mean/variance, min/max and per-operation counts
+- Accuracy and bounded size of the KLL quantile sketch
+- HyperLogLog distinct counts, small and large
+- Aggregates in batch, parallel batch and stream summaries
+"""
+
+import io
+import math
+import random
+import statistics
+from fractions import Fraction
+
+import pytest
+from app.aggregates import Aggregator, HyperLogLog, QuantileSketch
+from app.batch import BatchSummary, run_batch
+from app.parallel import run_batch_parallel
+from app.stream import evaluate_stream
+
+
+# -------------------------------------------------------------------
+# Exact Statistics
+# -------------------------------------------------------------------
+
+def test_running_statistics_match_statistics_module():
+    # Large mean: a naive variance cancels
+    values = [random.Random(7).gauss(1e9, 3.0) for _ in range(1000)]
+    aggregator = Aggregator()
+    for value in values:
+        aggregator.add("add", value)
+    assert aggregator.count == 1000
+    assert aggregator.mean == pytest.approx(statistics.fmean(values), rel=1e-15)
+    assert aggregator.variance == pytest.approx(statistics.variance(values), rel=1e-9)
+    assert aggregator.stdev == pytest.approx(statistics.stdev(values), rel=1e-9)
+    assert (aggregator.min, aggregator.max) == (min(values), max(values))
+
+
+def test_group_by_operation_and_exact_results():
+    aggregator = Aggregator()
+    assert aggregator.variance == 0.0
+    aggregator.add("divide", Fraction(1, 3))
+    aggregator.add("add", 2)
+    aggregator.add("divide", Fraction(10) ** 400)  # beyond float range
+    aggregator.add("multiply", -Fraction(10) ** 400)
+    assert aggregator.operations == {"divide": 2, "add": 1, "multiply": 1}
+    assert (aggregator.min, aggregator.max) == (-math.inf, math.inf)
+
+
+def test_results_far_from_the_mean_saturate_the_variance():
+    aggregator = Aggregator()
+    aggregator.add("multiply", 1e200)
+    for value in range(255):  # the 256th result flushes the buffer
+        aggregator.add("add", float(value))
+    assert aggregator.count == 256
+    assert aggregator.variance == math.inf
+    assert aggregator.render().startswith(
+        f"Results: 256 (min 0, max 1e+200, mean {1e200 / 256:g}, std dev inf)")
+
+
+def test_render():
+    aggregator = Aggregator()
+    assert aggregator.render() == "No results yet."
+    for value, operation in [(2.0, "add"), (4.0, "add"), (6.0, "multiply")]:
+        aggregator.add(operation, value)
+    assert aggregator.render() == (
+        "Results: 3 (min 2, max 6, mean 4, std dev 2)\n"
+        "Quantiles (approx.): p50 4, p99 6\n"
+        "Distinct results (approx.): 3\n"
+        "By operation: add 2, multiply 1"
+    )
+
+
+# -------------------------------------------------------------------
+# Quantile Sketch
+# -------------------------------------------------------------------
+
+def test_quantile_sketch_is_accurate_and_bounded():
+    values = list(range(100_000))
+    random.Random(601).shuffle(values)
+    sketch = QuantileSketch()
+    for value in values:
+        sketch.add(value)
+    assert sketch.count == 100_000
+    assert len(sketch) < 1000
+    for fraction in (0.01, 0.5, 0.99):
+        assert abs(sketch.quantile(fraction) - fraction * 100_000) < 1500  # rank error under 1.5%
+    assert sketch.quantile(1.5) == max(value for level in sketch.levels for value in level)
+
+
+def test_quantile_sketch_small_inputs_are_exact():
+    sketch = QuantileSketch()
+    assert sketch.quantile(0.5) is None
+    for value in [5, 1, 4, 2, 3]:
+        sketch.add(value)
+    assert [sketch.quantile(q) for q in (0.0, 0.2, 0.5, 1.0)] == [1, 1, 3, 5]
+
+
+def test_quantile_sketch_size_is_checked():
+    with pytest.raises(ValueError, match="at least 8"):
+        QuantileSketch(4)
+
+
+# -------------------------------------------------------------------
+# HyperLogLog
+# -------------------------------------------------------------------
+
+@pytest.mark.parametrize("distinct", [10, 3000, 200_000])
+def test_hyperloglog_estimates(distinct):
+    counter = HyperLogLog()
+    for i in range(distinct):
+        counter.add(i * 0.5)
+        counter.add(i * 0.5)  # repeats do not count
+    assert counter.estimate() == pytest.approx(distinct, rel=0.05)
+
+
+def test_hyperloglog_counts_equal_numbers_once():
+    counter = HyperLogLog()
+    for value in (2, 2.0, Fraction(2)):
+        counter.add(value)
+    assert counter.estimate() == 1
+
+
+def test_hyperloglog_precision_is_checked():
+    with pytest.raises(ValueError, match="between 4 and 16"):
+        HyperLogLog(20)
+
+
+# -------------------------------------------------------------------
+# Batch and Stream Summaries
+# -------------------------------------------------------------------
+
+LINES = ["add 1 2\n", "multiply 2 3\n", "divide 1 0\n", "ADD 2 2\n", "bad line\n"]
+
+
+def test_batch_aggregate():
+    summary = run_batch(LINES, io.StringIO(), aggregate=True)
+    assert summary.results.operations == {"add": 2, "multiply": 1}
+    assert summary.results.mean == pytest.approx(13 / 3)
+    expected = "Results: 3 (min 3, max 6, mean 4.33333, std dev 1.52753)"
+    assert str(summary).splitlines()[1] == expected
+    assert run_batch(LINES, io.StringIO()).results is None
+
+
+def test_summary_equality_ignores_results():
+    assert BatchSummary(1, 1, results=Aggregator()) == BatchSummary(1, 1)
+    assert "results" not in repr(BatchSummary(results=Aggregator()))
+
+
+def test_parallel_batch_aggregate_matches_serial():
+    serial = run_batch(LINES, io.StringIO(), aggregate=True)
+    parallel = run_batch_parallel(LINES, io.StringIO(), workers=1, aggregate=True)
+    assert str(parallel) == str(serial)
+
+
+def test_stream_aggregate():
+    source = io.StringIO("op,a,b\nadd,1,2\ndivide,1,0\nmean,2,4\n")
+    summary = evaluate_stream(source, io.StringIO(), "csv", aggregate=True)
+    assert summary.results.operations == {"add": 1, "mean": 1}
+    assert summary.results.max == 3.0
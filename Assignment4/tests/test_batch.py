@@ -0,0 +1,166 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Date: 10/18/2026
+# Project: Assignment 4 - Professional Calculator CLI
+# ----------------------------------------------------------
+
+"""
+tests/test_batch.py
+
+Unit tests for the non-interactive batch mode.
+Covers:
+- Valid calculations written one result per line
+- Format, operation and division-by-zero errors with line numbers
+- Comments, blank lines and chunked output writes
+- The summary text and exit status
+- The `main.py --batch` entry point (via subprocess)
+"""
+
+import subprocess
+import sys
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from app.batch import BatchSummary, run_batch
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+# -------------------------------------------------------------------
+# Positive Tests
+# -------------------------------------------------------------------
+
+def test_batch_valid_lines():
+    out = StringIO()
+    summary = run_batch(["add 2 3\n", "subtract 5 2\n", "multiply 4 5\n", "divide 10 4\n"], out)
+    assert out.getvalue() == "5.0\n3.0\n20.0\n2.5\n"
+    assert summary.processed == 4
+    assert summary.succeeded == 4
+    assert summary.errors == 0
+    assert summary.exit_status == 0
+
+
+def test_batch_skips_blank_lines_and_comments():
+    out = StringIO()
+    summary = run_batch(["# header\n", "\n", "   \n", "add 1 1\n"], out)
+    assert out.getvalue() == "2.0\n"
+    assert summary.processed == 1
+
+
+# -------------------------------------------------------------------
+# Negative Tests
+# -------------------------------------------------------------------
+
+@pytest.mark.parametrize("line, message, field", [
+    ("add two three", "Invalid format", "format_errors"),
+    ("add 1", "Invalid format", "format_errors"),
+    ("modulus 5 3", "Unsupported calculation type", "operation_errors"),
+    ("divide 5 0", "Division by zero is not allowed.", "division_errors"),
+])
+def test_batch_errors_are_reported_per_line(line, message, field):
+    out = StringIO()
+    summary = run_batch(["add 1 1", line], out)
+    first, second = out.getvalue().splitlines()
+    assert first == "2.0"
+    assert second.startswith("Error (line 2):")
+    assert message in second
+    assert getattr(summary, field) == 1
+    assert summary.errors == 1
+    assert summary.exit_status == 1
+
+
+# -------------------------------------------------------------------
+# Buffering and Summary
+# -------------------------------------------------------------------
+
+def test_batch_writes_in_chunks():
+    class CountingWriter(StringIO):
+        def __init__(self):
+            super().__init__()
+            self.writes = 0
+
+        def write(self, s):
+            self.writes += 1
+            return super().write(s)
+
+    out = CountingWriter()
+    summary = run_batch([f"add {i} 1" for i in range(10)], out, flush_every=4)
+    assert summary.succeeded == 10
+    assert out.writes == 3  # 4 + 4 + final 2
+    assert out.getvalue().splitlines()[-1] == "10.0"
+
+
+def test_batch_empty_input_writes_nothing():
+    out = StringIO()
+    summary = run_batch([], out)
+    assert out.getvalue() == ""
+    assert summary.processed == 0
+
+
+def test_summary_str():
+    summary = BatchSummary(processed=5, succeeded=2, format_errors=1, operation_errors=1,
+                           division_errors=1)
+    assert str(summary) == (
+        "Processed 5 calculations: 2 succeeded, 3 failed "
+        "(format: 1, operation: 1, division by zero: 1)"
+    )
+
+
+def test_summary_equality_and_repr():
+    summary = BatchSummary(processed=2, succeeded=1, division_errors=1)
+    assert summary == BatchSummary(2, 1, 0, 0, 1)
+    assert summary != BatchSummary(processed=2)
+    assert summary != "summary"
+    assert repr(summary) == (
+        "BatchSummary(processed=2, succeeded=1, format_errors=0, operation_errors=0, "
+        "division_errors=1)"
+    )
+
+
+# -------------------------------------------------------------------
+# Entry Point Tests
+# -------------------------------------------------------------------
+
+def test_main_batch_from_stdin(run_main):
+    proc = run_main("--batch", "-", stdin="add 2 3\ndivide 1 0\n")
+    assert proc.returncode == 1
+    assert proc.stdout.splitlines()[0] == "5.0"
+    assert "Processed 2 calculations: 1 succeeded, 1 failed" in proc.stderr
+
+
+def test_main_batch_from_file(tmp_path, run_main):
+    script = tmp_path / "calcs.txt"
+    script.write_text("multiply 6 7\n", encoding="utf-8")
+    proc = run_main("--batch", str(script))
+    assert proc.returncode == 0
+    assert proc.stdout == "42.0\n"
+
+
+def test_main_batch_aggregate(run_main):
+    proc = run_main("--batch", "-", "--aggregate", stdin="add 2 3\nmultiply 2 2\n")
+    assert proc.returncode == 0
+    assert "Results: 2 (min 4, max 5, mean 4.5, std dev 0.707107)" in proc.stderr
+
+
+def test_batch_import_stays_light():
+    """Batch runs must not load dataclasses, the REPL or the exact-number modules."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.batch"],
+        capture_output=True, text=True, cwd=PROJECT_ROOT, check=True,
+    )
+    loaded = {line.rsplit("|", 1)[-1].strip() for line in proc.stderr.splitlines()}
+    assert "app.batch" in loaded
+    assert not loaded & {"dataclasses", "app.calculator", "readline", "decimal", "fractions"}
+
+
+def test_main_batch_missing_file(tmp_path, run_main):
+    proc = run_main("--batch", str(tmp_path / "missing.txt"))
+    assert proc.returncode == 2
+    assert "Cannot read batch file" in proc.stderr
+
+
+def test_main_batch_rejects_backend(run_main):
+    proc = run_main("--batch", "-", "--backend", "decimal", stdin="add 2 3\n")
+    assert proc.returncode == 2
+    assert "--backend applies to the REPL and --reduce only" in proc.stderr
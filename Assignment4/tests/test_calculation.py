@@ -13,18 +13,33 @@ Advanced unit tests for Calculation classes and CalculationFactory.
   string/repr formatting are correct.
 - Includes parameterized tests for efficiency.
 - Exercises abstract base class behavior for full coverage.
+- Checks that batch execution agrees with the per-object path.
+- Verifies memoized results and the shared LRU result cache.
+- Locks in slot-based memory use and flyweight interning (via tracemalloc).
 """
 
+import math
+import operator
+import tracemalloc
 import pytest
+from array import array
+from decimal import Decimal
+from fractions import Fraction
 from unittest.mock import patch
+from app import numeric
 from app.operations import Operations
 from app.calculation import (
+    STATUS_DIVISION_BY_ZERO,
+    STATUS_ERROR,
+    STATUS_OK,
+    STATUS_UNSUPPORTED_OPERATION,
     CalculationFactory,
     AddCalculation,
     SubtractCalculation,
     MultiplyCalculation,
     DivideCalculation,
     Calculation,
+    ResultCache,
 )
 
 
@@ -64,11 +79,12 @@ def test_multiply_calculation_execute_positive(mock_mul):
     assert result == 50
 
 
-@patch.object(Operations, "division", return_value=2)
-def test_divide_calculation_execute_positive(mock_div):
+@patch.object(Operations, "division", side_effect=AssertionError("divisor checked twice"))
+@patch.object(Operations, "quotient", return_value=2)
+def test_divide_calculation_execute_positive(mock_div, _):
     calc = DivideCalculation(10, 5)
     result = calc.execute()
-    mock_div.assert_called_once_with(10, 5)
+    mock_div.assert_called_once_with(10, 5)  # the class checks the divisor; quotient does not again
     assert result == 2
 
 
@@ -140,8 +156,436 @@ def test_calculation_abstract_cannot_instantiate():
     ("subtract", 10, 5, 5),
     ("multiply", 10, 5, 50),
     ("divide", 20, 5, 4),
+    ("min", 10, 5, 5),
+    ("max", 10, 5, 10),
+    ("mean", 10, 5, 7.5),
 ])
 def test_parameterized_execute(calc_type, a, b, expected):
     calc = CalculationFactory.create_calculation(calc_type, a, b)
     result = calc.execute()
     assert result == expected
+
+
+# -------------------------------------------------------------------
+# Batch execution
+# -------------------------------------------------------------------
+
+@pytest.mark.parametrize("calc_type, expected", [
+    ("add", [5.0, 7.0, 9.0]),
+    ("subtract", [-3.0, -3.0, -3.0]),
+    ("multiply", [4.0, 10.0, 18.0]),
+    ("divide", [0.25, 0.4, 0.5]),
+    ("min", [1.0, 2.0, 3.0]),
+    ("max", [4.0, 5.0, 6.0]),
+    ("mean", [2.5, 3.5, 4.5]),
+])
+def test_execute_batch_matches_scalar_path(calc_type, expected):
+    a = array("d", [1, 2, 3])
+    b = array("d", [4, 5, 6])
+    result = CalculationFactory.execute_batch(calc_type, a, b)
+    assert list(result) == expected
+    assert list(result) == [
+        CalculationFactory.create_calculation(calc_type, x, y).execute() for x, y in zip(a, b)
+    ]
+
+
+def test_execute_batch_accepts_memoryview_and_lists():
+    a = memoryview(array("d", [1.5, 2.5]))
+    result = CalculationFactory.execute_batch("ADD", a, [1, 1])
+    assert len(result) == 2
+    assert list(result) == [2.5, 3.5]
+
+
+def test_execute_batch_divide_by_zero():
+    with pytest.raises(ZeroDivisionError, match="Cannot divide by zero."):
+        CalculationFactory.execute_batch("divide", array("d", [1, 2]), array("d", [1, 0]))
+
+
+def test_execute_batch_unknown_type():
+    with pytest.raises(ValueError, match="Unsupported calculation type"):
+        CalculationFactory.execute_batch("modulus", [1], [1])
+
+
+def test_execute_batch_without_kernel_uses_objects(monkeypatch):
+    monkeypatch.setattr(MultiplyCalculation, "kernel", None)
+    result = CalculationFactory.execute_batch("multiply", [2, 3], [4, 5])
+    assert isinstance(result, array)
+    assert list(result) == [8.0, 15.0]
+
+
+def test_execute_batch_without_kernel_checks_lengths(monkeypatch):
+    monkeypatch.setattr(MultiplyCalculation, "kernel", None)
+    with pytest.raises(ValueError, match="same length"):
+        CalculationFactory.execute_batch("multiply", [1, 2], [1])
+
+
+# -------------------------------------------------------------------
+# Memoized results and cached rendering
+# -------------------------------------------------------------------
+
+@pytest.fixture
+def result_cache():
+    """Enable a small shared result cache for one test."""
+    cache = CalculationFactory.enable_result_cache(maxsize=2)
+    yield cache
+    CalculationFactory.disable_result_cache()
+
+
+@patch.object(Operations, "addition", return_value=15)
+def test_execute_runs_operation_once(mock_add):
+    calc = AddCalculation(10, 5)
+    assert calc.execute() == 15
+    assert calc.execute() == 15
+    assert str(calc) == "10 Add 5 = 15"
+    assert str(calc) == "10 Add 5 = 15"
+    mock_add.assert_called_once_with(10, 5)
+
+
+def test_failed_execute_is_not_cached():
+    calc = AddCalculation(1, 2)
+    with patch.object(Operations, "addition", side_effect=Exception("Addition error")):
+        with pytest.raises(Exception, match="Addition error"):
+            calc.execute()
+    assert calc.execute() == 3
+
+
+def test_registered_classes_know_their_type():
+    assert AddCalculation.calc_type == "add"
+    assert DivideCalculation.calc_type == "divide"
+    assert Calculation.calc_type is None
+
+
+def test_intermediate_abstract_subclass_is_not_wrapped():
+    class Intermediate(Calculation):
+        pass
+
+    assert Intermediate.execute is Calculation.execute
+    with pytest.raises(TypeError):
+        Intermediate(1, 2)
+
+
+# -------------------------------------------------------------------
+# Process-wide LRU result cache
+# -------------------------------------------------------------------
+
+def test_result_cache_disabled_by_default():
+    assert CalculationFactory.result_cache is None
+    assert CalculationFactory.cache_info() is None
+
+
+def test_result_cache_hits_and_misses(result_cache):
+    with patch.object(Operations, "multiplication", return_value=50) as mock_mul:
+        first = CalculationFactory.create_calculation("multiply", 10, 5)
+        second = CalculationFactory.create_calculation("MULTIPLY", 10, 5)
+        assert first.execute() == 50
+        assert second.execute() == 50
+    mock_mul.assert_called_once_with(10, 5)
+    assert CalculationFactory.cache_info() == {
+        "hits": 1, "misses": 1, "evictions": 0, "size": 1, "maxsize": 2,
+    }
+
+
+def test_result_cache_evicts_least_recently_used(result_cache):
+    CalculationFactory.create_calculation("add", 1, 1).execute()
+    CalculationFactory.create_calculation("add", 2, 2).execute()
+    CalculationFactory.create_calculation("add", 1, 1).execute()  # refresh (1, 1)
+    CalculationFactory.create_calculation("add", 3, 3).execute()  # evicts (2, 2)
+    assert result_cache.evictions == 1
+    assert len(result_cache) == 2
+    CalculationFactory.create_calculation("add", 1, 1).execute()
+    assert result_cache.hits == 2
+
+
+def test_result_cache_keeps_operand_types_apart(result_cache):
+    third = CalculationFactory.create_calculation("divide", Fraction(1), Fraction(3)).execute()
+    assert third == Fraction(1, 3)
+    # Equal operands, other types
+    result = CalculationFactory.create_calculation("divide", 1.0, 3.0).execute()
+    assert type(result) is float and result == 1 / 3
+    assert type(CalculationFactory.create_calculation("add", 1, 2).execute()) is int
+    assert type(CalculationFactory.create_calculation("add", 1.0, 2.0).execute()) is float
+    assert result_cache.hits == 0
+
+
+def test_result_cache_skips_unregistered_classes(result_cache):
+    class Unregistered(Calculation):
+        def execute(self):
+            return self.a
+
+    assert Unregistered(7, 0).execute() == 7
+    assert result_cache.info()["misses"] == 0
+
+
+def test_result_cache_does_not_store_errors(result_cache):
+    calc = CalculationFactory.create_calculation("divide", 1, 0)
+    with pytest.raises(ZeroDivisionError):
+        calc.execute()
+    assert len(result_cache) == 0
+
+
+def test_result_cache_clear_and_invalid_size(result_cache):
+    CalculationFactory.create_calculation("add", 1, 1).execute()
+    result_cache.clear()
+    assert result_cache.info() == {"hits": 0, "misses": 0, "evictions": 0, "size": 0, "maxsize": 2}
+    with pytest.raises(ValueError, match="positive integer"):
+        ResultCache(0)
+
+
+# -------------------------------------------------------------------
+# Slots, immutability and interning
+# -------------------------------------------------------------------
+
+def test_calculations_have_no_instance_dict():
+    for calc_class in (AddCalculation, SubtractCalculation, MultiplyCalculation, DivideCalculation):
+        calc = calc_class(1, 2)
+        assert not hasattr(calc, "__dict__")
+        with pytest.raises(AttributeError):
+            calc.extra = 1
+
+
+def test_operands_are_read_only():
+    calc = AddCalculation(1, 2)
+    with pytest.raises(AttributeError):
+        calc.a = 5
+    with pytest.raises(AttributeError):
+        calc.b = 5
+
+
+def test_equal_calculations_compare_and_hash_equal():
+    assert AddCalculation(1, 2) == AddCalculation(1, 2)
+    assert hash(AddCalculation(1, 2)) == hash(AddCalculation(1, 2))
+    assert AddCalculation(1, 2) != SubtractCalculation(1, 2)
+    assert AddCalculation(1, 2) != AddCalculation(2, 1)
+    assert AddCalculation(1, 2) != (1, 2)
+    assert len({AddCalculation(1, 2), AddCalculation(1, 2), MultiplyCalculation(1, 2)}) == 2
+
+
+def test_interned_calculations_are_shared():
+    first = CalculationFactory.create_calculation("add", 1.5, 2.5, intern=True)
+    second = CalculationFactory.create_calculation("ADD", 1.5, 2.5, intern=True)
+    assert first is second
+    assert CalculationFactory.create_calculation("add", 1.5, 2.5) is not first
+    assert CalculationFactory.create_calculation("subtract", 1.5, 2.5, intern=True) is not first
+
+
+def test_interning_keeps_operand_types_apart():
+    as_int = CalculationFactory.create_calculation("add", 1, 2, intern=True)
+    as_float = CalculationFactory.create_calculation("add", 1.0, 2.0, intern=True)
+    assert as_int is not as_float
+    assert repr(as_int.execute()) == "3"
+    assert repr(as_float.execute()) == "3.0"
+
+
+def test_interned_instances_are_bounded(monkeypatch):
+    monkeypatch.setattr("app.calculation.INTERN_SIZE", 3)
+    CalculationFactory._interned.clear()
+    first = CalculationFactory.create_calculation("multiply", 1.0, 2.0, intern=True)
+    for b in (3.0, 4.0, 5.0):
+        CalculationFactory.create_calculation("multiply", 1.0, b, intern=True)
+    assert len(CalculationFactory._interned) == 3
+    again = CalculationFactory.create_calculation("multiply", 1.0, 2.0, intern=True)
+    assert again is not first  # the oldest was dropped
+
+
+def test_backend_switch_drops_interned_instances():
+    first = CalculationFactory.create_calculation("add", 7.0, 8.0, intern=True)
+    numeric.set_backend("fraction")
+    numeric.set_backend("float")
+    assert CalculationFactory.create_calculation("add", 7.0, 8.0, intern=True) is not first
+
+
+def test_subclass_without_slots_still_registers():
+    @CalculationFactory.register_calculation("power_for_test")
+    class PowerCalculation(Calculation):
+        def execute(self):
+            return self.a ** self.b
+
+    try:
+        calc = CalculationFactory.create_calculation("power_for_test", 2, 3, intern=True)
+        assert calc.execute() == 8
+        assert calc is CalculationFactory.create_calculation("power_for_test", 2, 3, intern=True)
+    finally:
+        del CalculationFactory._calculations["power_for_test"]
+        CalculationFactory._rebuild_dispatch()
+
+
+def _allocated_per_object(make, count=2000):
+    """Return the bytes allocated per object while building `count` of them."""
+    operands = [(float(i), float(i + 1)) for i in range(count)]
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objects = [make(a, b) for a, b in operands]
+        used = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    assert len(objects) == count
+    return used / count
+
+
+def test_slotted_calculations_stay_small():
+    class DictAdd:
+        def __init__(self, a, b):
+            self.a = a
+            self.b = b
+            self._result = None
+            self._text = None
+
+    slotted = _allocated_per_object(AddCalculation)
+    with_dict = _allocated_per_object(DictAdd)
+    assert slotted <= 100  # object header + four slots
+    assert slotted < with_dict
+
+
+def test_interning_avoids_per_request_allocations():
+    shared = CalculationFactory.create_calculation("add", 4.0, 5.0, intern=True)
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        repeats = [CalculationFactory.create_calculation("add", 4.0, 5.0, intern=True)
+                   for _ in range(2000)]
+        used = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    assert all(calc is shared for calc in repeats)
+    assert used / len(repeats) <= 16  # only the list slot holding each reference
+
+
+# -------------------------------------------------------------------
+# Object-free evaluation (dispatch table)
+# -------------------------------------------------------------------
+
+@pytest.mark.parametrize("calc_type, a, b, expected", [
+    ("add", 2.0, 3.0, 5.0),
+    ("SUBTRACT", 5.0, 2.0, 3.0),
+    ("Multiply", 4.0, 5.0, 20.0),
+    ("dIvIdE", 10.0, 4.0, 2.5),
+    ("MIN", 4.0, -5.0, -5.0),
+    ("mean", 1.0, 4.0, 2.5),
+])
+def test_evaluate_matches_objects(calc_type, a, b, expected):
+    assert CalculationFactory.evaluate(calc_type, a, b) == expected
+    assert CalculationFactory.create_calculation(calc_type, a, b).execute() == expected
+
+
+def test_evaluate_errors():
+    with pytest.raises(ZeroDivisionError):
+        CalculationFactory.evaluate("divide", 1.0, 0.0)
+    with pytest.raises(ValueError, match="Unsupported calculation type: 'modulus'"):
+        CalculationFactory.evaluate("modulus", 1.0, 2.0)
+
+
+def test_evaluate_creates_no_calculation_objects():
+    with patch.object(AddCalculation, "__init__", side_effect=AssertionError("object created")):
+        assert CalculationFactory.evaluate("add", 1.0, 2.0) == 3.0
+
+
+def test_binary_function_is_the_kernel_under_float():
+    assert CalculationFactory.binary_function("Divide") is operator.truediv
+    assert CalculationFactory.binary_function("dIvIdE") is operator.truediv  # rare spelling
+    with numeric.using("fraction"):
+        assert CalculationFactory.binary_function("divide")(1, 3) == Fraction(1, 3)
+
+
+def test_evaluate_mixed_exact_types_fall_back_to_objects():
+    from decimal import Decimal
+    from fractions import Fraction
+
+    assert CalculationFactory.evaluate("add", Decimal("0.5"), Fraction(1, 4)) == Fraction(3, 4)
+
+
+def test_evaluate_class_without_kernel():
+    @CalculationFactory.register_calculation("power_for_test")
+    class PowerCalculation(Calculation):
+        __slots__ = ()
+
+        def execute(self):
+            return self.a ** self.b
+
+    try:
+        assert CalculationFactory.evaluate("power_for_test", 2, 10) == 1024
+        assert CalculationFactory.display_name("POWER_FOR_TEST") == "Power"
+    finally:
+        del CalculationFactory._calculations["power_for_test"]
+        CalculationFactory._rebuild_dispatch()
+
+
+@pytest.mark.parametrize("calc_type, name",
+                         [("add", "Add"), ("DIVIDE", "Divide"), ("mUlTiPlY", "Multiply")])
+def test_display_name(calc_type, name):
+    assert CalculationFactory.display_name(calc_type) == name
+
+
+def test_evaluate_allocates_less_than_objects():
+    operands = [(float(i), float(i + 1)) for i in range(2000)]
+
+    def allocated(fn):
+        tracemalloc.start()
+        try:
+            for a, b in operands:
+                fn("add", a, b)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    create = CalculationFactory.create_calculation
+    with_objects = allocated(lambda op, a, b: create(op, a, b).execute())
+    assert allocated(CalculationFactory.evaluate) < with_objects
+
+
+# -------------------------------------------------------------------
+# Non-raising evaluation (status codes and error bitmaps)
+# -------------------------------------------------------------------
+
+@pytest.mark.parametrize("calc_type, a, b, result, status", [
+    ("add", 2.0, 3.0, 5.0, STATUS_OK),
+    ("dIvIdE", 10.0, 4.0, 2.5, STATUS_OK),
+    ("DIVIDE", 1.0, 0.0, None, STATUS_DIVISION_BY_ZERO),
+    ("mean", 1.0, 4.0, 2.5, STATUS_OK),
+    ("modulus", 1.0, 2.0, None, STATUS_UNSUPPORTED_OPERATION),
+    ("multiply", Fraction(10 ** 400), 1.5, None, STATUS_ERROR),  # beyond float range
+    ("add", Decimal("0.5"), Fraction(1, 4), Fraction(3, 4), STATUS_OK),  # mixed exact types
+])
+def test_try_evaluate(calc_type, a, b, result, status):
+    value, code = CalculationFactory.try_evaluate(calc_type, a, b)
+    assert code == status
+    assert value == result if result is not None else math.isnan(value)
+
+
+def test_try_evaluate_raises_nothing_for_invalid_operands():
+    with patch.object(DivideCalculation, "execute", side_effect=AssertionError("object path")), \
+            patch.object(Operations, "quotient", side_effect=AssertionError("divided")):
+        assert CalculationFactory.try_evaluate("divide", 1.0, 0.0)[1] == STATUS_DIVISION_BY_ZERO
+    with numeric.using("fraction"):  # no kernels: the check still comes first
+        assert CalculationFactory.try_evaluate("divide", 1, 0)[1] == STATUS_DIVISION_BY_ZERO
+        assert CalculationFactory.try_evaluate("divide", 1, 3) == (Fraction(1, 3), STATUS_OK)
+
+
+def test_try_evaluate_broken_plugin_is_unsupported(monkeypatch):
+    def broken(name):
+        raise ValueError(f"Cannot load calculation type '{name}'")
+
+    monkeypatch.setattr(CalculationFactory, "_load_plugin", broken)
+    assert CalculationFactory.try_evaluate("broken", 1.0, 2.0)[1] == STATUS_UNSUPPORTED_OPERATION
+
+
+def test_status_message():
+    message = CalculationFactory.status_message(STATUS_DIVISION_BY_ZERO)
+    assert message == "Division by zero is not allowed."
+    assert CalculationFactory.status_message(STATUS_ERROR) == "Calculation failed."
+    message = CalculationFactory.status_message(STATUS_UNSUPPORTED_OPERATION, "modulus")
+    with pytest.raises(ValueError) as exc_info:
+        CalculationFactory.get_calculation_class("modulus")
+    assert message == str(exc_info.value)
+
+
+def test_try_execute_batch():
+    results, bitmap = CalculationFactory.try_execute_batch("divide", array("d", [1, 2, 3]),
+                                                           [0.0, 4.0, 0.0])
+    assert bitmap == bytearray([0b101])
+    assert math.isnan(results[0]) and results[1] == 0.5 and math.isnan(results[2])
+    # No kernel
+    results, bitmap = CalculationFactory.try_execute_batch("mean", [1.0, 2.0], [3.0, 4.0])
+    assert (results, bitmap) == (array("d", [2.0, 3.0]), bytearray(1))
+    with pytest.raises(ValueError, match="Unsupported calculation type"):
+        CalculationFactory.try_execute_batch("modulus", [1.0], [1.0])
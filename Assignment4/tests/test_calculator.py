@@ -19,11 +19,15 @@ Uses:
 - capsys to capture console output
 """
 
+import subprocess
 import sys
 import pytest
 from io import StringIO
+from pathlib import Path
 from app.calculator import calculator
 
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
 
 # -------------------------------------------------------------------
 # Helper Function: Simulate REPL Input and Capture Output
@@ -81,6 +85,29 @@ def test_division(monkeypatch):
     assert "Result: 5.0" in output
 
 
+def test_infix_expression(monkeypatch):
+    inputs = ["(3 + 4) * 2 / 7", "history", "exit"]
+    output = run_calculator_with_input(monkeypatch, inputs)
+    assert "Result: 2.0" in output
+    assert "1. 14.0 Divide 7.0 = 2.0" in output
+
+
+def test_expression_starting_with_a_name(monkeypatch):
+    inputs = ["max(3, 4) * 2", "min(3,4)", "add -1 2", "rate * 2", "history", "exit"]
+    output = run_calculator_with_input(monkeypatch, inputs)
+    assert "Result: 8.0" in output and "Result: 3.0" in output
+    assert "Result: 1.0" in output  # an operation and a negative number stay a statement
+    assert "Invalid expression: Unknown variable 'rate' at column 1" in output
+    assert "1. 4.0 Multiply 2.0 = 8.0" in output
+
+
+def test_infix_number_is_not_added_to_history(monkeypatch):
+    inputs = ["42", "history", "exit"]
+    output = run_calculator_with_input(monkeypatch, inputs)
+    assert "Result: 42.0" in output
+    assert "No calculations yet." in output
+
+
 # -------------------------------------------------------------------
 # Negative Tests: Invalid Inputs and Errors
 # -------------------------------------------------------------------
@@ -97,6 +124,19 @@ def test_invalid_input_format(monkeypatch):
     assert "Invalid format" in output
 
 
+def test_invalid_expression(monkeypatch):
+    inputs = ["(1 + 2", "2 * rate", "exit"]
+    output = run_calculator_with_input(monkeypatch, inputs)
+    assert "Invalid expression: Missing ')' at column 7" in output
+    assert "Invalid expression: Unknown variable 'rate' at column 5" in output
+
+
+def test_expression_division_by_zero(monkeypatch):
+    inputs = ["1 / (2 - 2)", "exit"]
+    output = run_calculator_with_input(monkeypatch, inputs)
+    assert "Division by zero is not allowed" in output
+
+
 def test_division_by_zero(monkeypatch):
     inputs = ["divide 5 0", "exit"]
     output = run_calculator_with_input(monkeypatch, inputs)
@@ -114,6 +154,15 @@ def test_help_command(monkeypatch):
     assert "Supported operations:" in output
 
 
+def test_help_lists_plugin_operations(monkeypatch):
+    from app.calculation import CalculationFactory
+
+    monkeypatch.setattr(CalculationFactory, "_plugins", {"power": "calc_power:PowerCalculation"})
+    monkeypatch.setattr(CalculationFactory, "_plugins_discovered", True)
+    output = run_calculator_with_input(monkeypatch, ["help", "exit"])
+    assert "plugins   → power" in output
+
+
 def test_history_command(monkeypatch):
     inputs = ["add 2 2", "history", "exit"]
     output = run_calculator_with_input(monkeypatch, inputs)
@@ -121,6 +170,286 @@ def test_history_command(monkeypatch):
     assert "Result: 4.0" in output
 
 
+def test_history_lists_entries_in_order(monkeypatch):
+    inputs = ["add 2 2", "divide 9 3", "history", "exit"]
+    output = run_calculator_with_input(monkeypatch, inputs)
+    assert "1. 2.0 Add 2.0 = 4.0" in output
+    assert "2. 9.0 Divide 3.0 = 3.0" in output
+
+
+def test_history_query(monkeypatch):
+    inputs = ["add 2 2; divide 9 3; divide 1 4; multiply 5 5", "history divide result > 1",
+              "history top 2", "history subtract", "history result >", "exit"]
+    output = run_calculator_with_input(monkeypatch, inputs)
+    assert "Matching calculations (1 of 4):\n2. 9.0 Divide 3.0 = 3.0\n" in output
+    assert ("Matching calculations (2 of 4):\n4. 5.0 Multiply 5.0 = 25.0\n"
+            "1. 2.0 Add 2.0 = 4.0\n") in output
+    assert "No matching calculations." in output
+    assert "Expected a number after 'result >'. Use: history [<operation>...]" in output
+
+
+def test_variables(monkeypatch):
+    inputs = ["cells", "x = add 3 4; y = multiply x 2", "x = 10", "x = add y 1", "cells", "exit"]
+    output = run_calculator_with_input(monkeypatch, inputs)
+    assert "No variables yet." in output
+    assert "x = 7.0\n\ny = 14.0\n" in output
+    assert "x = 10.0\ny = 20.0\n" in output  # y is recomputed
+    assert "Circular reference: x → y → x" in output
+    assert "x = 10.0  (10)\ny = 20.0  (multiply x 2)" in output
+
+
+def test_variables_as_operands(monkeypatch):
+    inputs = ["x = add 3 4", "multiply x 2", "x * 2 + max(x, 10)", "add x z", "z * 2",
+              "y = divide x 0", "add y 1", "cells = 5", "history", "exit"]
+    output = run_calculator_with_input(monkeypatch, inputs)
+    assert "Result: 14.0" in output and "Result: 24.0" in output
+    assert "Invalid format ('z' is not a number) at column 7" in output
+    assert "Invalid expression: Unknown variable 'z' at column 1" in output
+    assert "Invalid format ('y' is not a number) at column 5" in output  # y has no value
+    assert "'cells' cannot be used as a variable name" in output
+    assert "1. 7.0 Multiply 2.0 = 14.0" in output  # the value is recorded, not the name
+
+
+def test_history_capacity_evicts_oldest(monkeypatch):
+    input_iterator = iter(["add 1 1", "add 2 2", "history", "exit"])
+    monkeypatch.setattr("builtins.input", lambda _: next(input_iterator))
+    captured_output = StringIO()
+    monkeypatch.setattr(sys, "stdout", captured_output)
+    with pytest.raises(SystemExit):
+        calculator(history_capacity=1)
+    output = captured_output.getvalue()
+    assert "1. 2.0 Add 2.0 = 4.0" in output
+    assert "1.0 Add 1.0" not in output
+
+
+def run_calculator_with_log(monkeypatch, inputs, **kwargs):
+    input_iterator = iter(inputs)
+    monkeypatch.setattr("builtins.input", lambda _: next(input_iterator))
+    captured_output = StringIO()
+    monkeypatch.setattr(sys, "stdout", captured_output)
+    with pytest.raises(SystemExit):
+        calculator(**kwargs)
+    return captured_output.getvalue()
+
+
+def test_history_persists_across_sessions(monkeypatch, tmp_path):
+    path = str(tmp_path / "history.log")
+    run_calculator_with_log(monkeypatch, ["add 2 3", "exit"], history_path=path)
+    output = run_calculator_with_log(monkeypatch, ["history", "exit"], history_path=path)
+    assert "Loaded 1 calculations" in output
+    assert "1. 2.0 Add 3.0 = 5.0" in output
+
+
+def test_history_log_reports_recovered_record(monkeypatch, tmp_path):
+    path = tmp_path / "history.log"
+    run_calculator_with_log(monkeypatch, ["add 2 3", "exit"], history_path=str(path))
+    with open(path, "ab") as f:
+        f.write(b"torn")
+    output = run_calculator_with_log(monkeypatch, ["exit"], history_path=str(path))
+    assert "Discarded an incomplete record" in output
+
+
+def test_compact_command(monkeypatch, tmp_path):
+    path = str(tmp_path / "history.log")
+    inputs = ["add 1 1", "add 2 2", "add 3 3", "compact", "history", "exit"]
+    output = run_calculator_with_log(monkeypatch, inputs, history_path=path, history_capacity=2)
+    assert "removed 1 old calculations" in output
+    assert "1. 2.0 Add 2.0 = 4.0" in output
+
+
+def test_compact_without_log(monkeypatch):
+    output = run_calculator_with_input(monkeypatch, ["compact", "exit"])
+    assert "No history log in use" in output
+
+
+def test_multiple_statements_per_line(monkeypatch):
+    inputs = ["add 1 2; multiply 3 4; (1 + 2) * 3", "history", "exit"]
+    output = run_calculator_with_input(monkeypatch, inputs)
+    assert "Result: 3.0\n\nResult: 12.0\n\nResult: 9.0\n" in output
+    assert "3. 3.0 Multiply 3.0 = 9.0" in output
+
+
+def test_n_ary_operations(monkeypatch):
+    inputs = ["add 1 2 3 4; mean 1 2 3 4; max 3 9 4; subtract 9 1 1", "history", "exit"]
+    output = run_calculator_with_input(monkeypatch, inputs)
+    assert "Result: 10.0\n\nResult: 2.5\n\nResult: 9.0\n" in output
+    assert "Calculation type 'subtract' takes exactly two numbers." in output
+    assert "No calculations yet." in output  # history entries hold two operands
+
+
+def test_aggregate_command(monkeypatch):
+    inputs = ["aggregate", "add 1 2; ADD 3 4; 2 * 3; mean 1 2 3; 1 + x; divide 1 0", "aggregate",
+              "exit"]
+    output = run_calculator_with_input(monkeypatch, inputs)
+    assert "No results yet." in output
+    assert "Results: 4 (min 2, max 7, mean 4.5, std dev 2.38048)" in output
+    assert "By operation: add 2, mean 1, multiply 1" in output
+
+
+def test_vector_operands(monkeypatch, tmp_path):
+    from array import array
+
+    path = tmp_path / "prices.bin"
+    with open(path, "wb") as file:
+        array("d", range(1, 101)).tofile(file)
+    inputs = [
+        "multiply [1,2,3] [4, 5, 6]; min [1,5] 3",
+        f"multiply @{path} 2",
+        "divide [1,2] [1,0]; add [1] [1,2]; modulus [1] 2",
+        "history", "aggregate", "exit",
+    ]
+    output = run_calculator_with_input(monkeypatch, inputs)
+    assert "Result: [4.0, 10.0, 18.0]\n\nResult: [1.0, 3.0]\n" in output
+    assert ("Result: [2.0, 4.0, 6.0, ..., 196.0, 198.0, 200.0] "
+            "(100 values, min 2.0, max 200.0, mean 101.0)") in output
+    assert "Error: Division by zero is not allowed." in output
+    assert "Operand columns must have the same length (got 1 and 2)." in output
+    assert "Unsupported calculation type: 'modulus'" in output
+    # Vectors are not recorded
+    assert "No calculations yet." in output and "No results yet." in output
+
+
+def test_run_statements_without_aggregator():
+    from app.calculator import run_statements
+    from app.history import HistoryStore
+
+    history = HistoryStore()
+    assert run_statements("add 1 2; 2 * 3", history) == "Result: 3.0\n\nResult: 6.0\n\n"
+    assert [entry.operation for entry in history] == ["Add", "Multiply"]
+    assert run_statements("x = 1", history) == "Variables are not available here.\n"
+    assert run_statements("  ", history) == run_statements(" ; ", history) == ""
+
+
+def test_statement_errors_do_not_stop_the_line(monkeypatch):
+    inputs = ["add 2 x; divide 1 0; modulus 1 2; 3 + (4; subtract 5 1", "exit"]
+    output = run_calculator_with_input(monkeypatch, inputs)
+    assert ("Invalid format ('x' is not a number) at column 7. "
+            "Use: <operation> <num1> <num2>") in output
+    assert "Error: Division by zero is not allowed." in output
+    assert "Unsupported calculation type: 'modulus'" in output
+    assert "Invalid expression: Missing ')' at column 41" in output
+    assert "Result: 4.0" in output
+
+
+def test_each_line_is_written_once(monkeypatch):
+    writes = []
+    monkeypatch.setattr(sys.stdout, "write", writes.append, raising=False)
+    inputs = iter(["add 1 2; add 3 4; add 5 6", "exit"])
+    monkeypatch.setattr("builtins.input", lambda _: next(inputs))
+    with pytest.raises(SystemExit):
+        calculator()
+    assert "Result: 3.0\n\nResult: 7.0\n\nResult: 11.0\n\n" in writes
+
+
+def test_backend_command(monkeypatch):
+    inputs = ["backend", "backend int", "divide 7 2", "backend decimal", "add 0.1 0.2",
+              "0.1 + 0.2", "backend nope", "exit"]
+    output = run_calculator_with_input(monkeypatch, inputs)
+    assert "Numeric backend: float" in output
+    assert "Numeric backend: int" in output
+    assert "Result: 7/2" in output
+    assert output.count("Result: 0.3\n") == 2
+    assert "Unsupported numeric backend: 'nope'" in output
+
+
+@pytest.mark.parametrize("backend, line, result", [
+    ("float", f"add {10 ** 400} 1", 10 ** 400 + 1),  # promoted to an exact type beyond float range
+    ("int", f"multiply {-10 ** 400} 10", -10 ** 401),
+])
+def test_results_beyond_float_range_keep_the_session_going(monkeypatch, backend, line, result):
+    inputs = [f"backend {backend}", line, "history", "aggregate", "add 1 2", "exit"]
+    output = run_calculator_with_input(monkeypatch, inputs)
+    assert f"Result: {result}\n" in output
+    # History keeps floats: the exact result saturates
+    assert f"= {'-' if result < 0 else ''}inf" in output
+    assert "Result: 3" in output
+    assert "Unexpected error" not in output
+
+
+def test_history_log_records_results_beyond_float_range(monkeypatch, tmp_path):
+    path = str(tmp_path / "history.log")
+    run_calculator_with_log(monkeypatch, ["add 1" + "0" * 400 + " 1", "exit"], history_path=path)
+    output = run_calculator_with_log(monkeypatch, ["history", "exit"], history_path=path)
+    assert "1. inf Add 1.0 = inf" in output
+
+
+def test_backend_is_restored_after_session(monkeypatch):
+    from app import numeric
+
+    output = run_calculator_with_log(monkeypatch, ["add 1/3 1/6", "exit"], backend="fraction")
+    assert "Result: 1/2" in output
+    assert numeric.get_backend() is numeric.FLOAT
+
+
+def test_readline_loads_only_for_a_terminal(monkeypatch):
+    class Terminal(StringIO):
+        def isatty(self):
+            return True
+
+    monkeypatch.delitem(sys.modules, "readline", raising=False)
+    run_calculator_with_input(monkeypatch, ["exit"])
+    assert "readline" not in sys.modules
+    monkeypatch.setattr(sys, "stdin", Terminal())
+    run_calculator_with_input(monkeypatch, ["exit"])
+    assert "readline" in sys.modules
+
+
+def test_import_leaves_optional_modules_unloaded():
+    """Importing the REPL must not load terminal, history log or exact-number modules."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.calculator"],
+        capture_output=True, text=True, cwd=PROJECT_ROOT, check=True,
+    )
+    loaded = {line.rsplit("|", 1)[-1].strip() for line in proc.stderr.splitlines()}
+    assert "app.calculator" in loaded
+    assert not loaded & {"readline", "app.history_log", "decimal", "fractions"}
+
+
+def test_stats_command(monkeypatch, tmp_path):
+    from app import metrics
+
+    dump = tmp_path / "metrics.prom"
+    inputs = ["stats", "stats on", "add 1 2; divide 1 0; add x", "1 +", "modulus 1 2", "stats",
+              f"stats save {dump}", f"stats save {tmp_path / 'missing' / 'm.prom'}", "stats what",
+              "stats reset", "stats", "stats off", "exit"]
+    try:
+        output = run_calculator_with_input(monkeypatch, inputs)
+    finally:
+        metrics.set_enabled(False)
+        metrics.METRICS.reset()
+    assert "Metrics collection is off. Use 'stats on' to start it." in output
+    assert "Metrics collection is on." in output
+    assert "REPL lines" in output
+    assert "Errors: division_by_zero (divide): 1, parse: 2, unsupported_operation: 1" in output
+    assert f"Metrics written to {dump}." in output
+    assert 'calculator_operation_seconds_count{operation="add"} 1' in dump.read_text()
+    assert "Cannot write metrics" in output
+    assert "Usage: stats [on|off|reset|save <file>]" in output
+    assert "Metrics reset.\nNo calculations recorded yet." in output
+    assert "Metrics collection is off." in output
+
+
+def test_session_is_recorded_for_replay(monkeypatch, tmp_path):
+    path = tmp_path / "session.txt"
+    run_calculator_with_log(monkeypatch, ["add 2 3", "", "  history ", "exit"],
+                            record_path=str(path))
+    run_calculator_with_log(monkeypatch, ["bad line", "exit"], record_path=str(path))  # appended
+    assert path.read_text(encoding="utf-8") == "add 2 3\n\n  history \nexit\nbad line\nexit\n"
+
+
+def test_metrics_file_written_on_exit(monkeypatch, tmp_path):
+    from app import metrics
+
+    dump = tmp_path / "metrics.prom"
+    try:
+        run_calculator_with_log(monkeypatch, ["multiply 2 3", "exit"], metrics_path=str(dump))
+        assert not metrics.enabled  # switched off again with the session
+    finally:
+        metrics.METRICS.reset()
+    assert 'calculator_operation_seconds_count{operation="multiply"} 1' in dump.read_text()
+    assert "calculator_repl_line_seconds_count 1" in dump.read_text()
+
+
 def test_display_history_empty(monkeypatch):
     """Covers the 'No calculations yet.' branch in display_history."""
     inputs = ["history", "exit"]
@@ -143,12 +472,11 @@ def test_empty_input(monkeypatch):
 
 
 def test_generic_execution_error(monkeypatch):
-    """Trigger a generic exception inside calculation.execute() """
-    class FaultyCalculation:
-        def execute(self):
-            raise Exception("Execution failed")
+    """Trigger a generic exception while evaluating a calculation."""
+    def faulty_evaluate(*_):
+        raise Exception("Execution failed")
 
-    monkeypatch.setattr("app.calculation.CalculationFactory.create_calculation", lambda *_: FaultyCalculation())
+    monkeypatch.setattr("app.calculation.CalculationFactory.evaluate", faulty_evaluate)
 
     inputs = ["add 1 1", "exit"]
     output = run_calculator_with_input(monkeypatch, inputs)
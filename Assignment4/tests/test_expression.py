@@ -0,0 +1,306 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Date: 10/18/2026
+# Project: Assignment 4 - Professional Calculator CLI
+# ----------------------------------------------------------
+
+"""
+tests/test_expression.py
+
+Unit tests for the infix expression engine.
+Covers:
+- Tokenizing and parsing with precedence, associativity and parentheses
+- Constant folding (including subtrees that must not be folded)
+- The LRU compile cache
+- Syntax errors with column positions
+- Variables, operation calls and compiled functions (call, map, evaluate_many)
+"""
+
+import math
+import random
+from array import array
+from fractions import Fraction
+from unittest.mock import patch
+
+import pytest
+import app.expression as expression
+from app.expression import (
+    BinaryOp,
+    ExpressionError,
+    Number,
+    Variable,
+    compile_expression,
+    compile_function,
+    evaluate,
+    fold_constants,
+    looks_like_expression,
+    parse,
+    walk,
+)
+from app import numeric
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    """Give every test an empty compile cache."""
+    expression.set_cache_size(expression.DEFAULT_CACHE_SIZE)
+    yield
+
+
+# -------------------------------------------------------------------
+# Parsing
+# -------------------------------------------------------------------
+
+def test_parse_respects_precedence():
+    assert parse("1 + 2 * 3") == BinaryOp(
+        "add", Number(1.0), BinaryOp("multiply", Number(2.0), Number(3.0))
+    )
+
+
+def test_parse_is_left_associative():
+    assert parse("8 - 2 - 1") == BinaryOp(
+        "subtract", BinaryOp("subtract", Number(8.0), Number(2.0)), Number(1.0)
+    )
+
+
+def test_parse_unary_operators():
+    assert parse("+2") == Number(2.0)
+    assert parse("-2") == BinaryOp("multiply", Number(-1.0), Number(2.0))
+
+
+@pytest.mark.parametrize("source, expected", [
+    ("(3 + 4) * 2 / 7", 2.0),
+    ("1+2*3", 7.0),
+    ("8 / 2 / 2", 2.0),
+    ("-(2 - 5)", 3.0),
+    ("1e3 + .5", 1000.5),
+    ("2.5*4", 10.0),
+    ("((1))", 1.0),
+])
+def test_evaluate_expressions(source, expected):
+    assert compile_expression(source).evaluate() == expected
+    assert evaluate(parse(source)) == expected
+
+
+@pytest.mark.parametrize("source, message", [
+    ("2 * (3", "Missing ')' at column 7"),
+    ("2 +", "Unexpected end of expression at column 4"),
+    ("2 3", "Unexpected '3' at column 3"),
+    ("2 + )", "Unexpected ')' at column 5"),
+    ("2 % 3", "Unexpected character '%' at column 3"),
+    ("", "Unexpected end of expression at column 1"),
+    ("max(1)", "'max' takes exactly two arguments at column 1"),
+    ("2 * min(1, 2, 3)", "'min' takes exactly two arguments at column 5"),
+    ("modulus(7, 2)", "Unknown operation 'modulus' at column 1"),
+    ("max(1, 2", "Missing ')' at column 9"),
+    ("1, 2", "Unexpected ',' at column 2"),
+])
+def test_syntax_errors_report_columns(source, message):
+    with pytest.raises(ExpressionError) as exc_info:
+        compile_expression(source)
+    assert str(exc_info.value) == message
+
+
+# -------------------------------------------------------------------
+# Constant Folding
+# -------------------------------------------------------------------
+
+def test_constant_subtrees_are_folded():
+    compiled = compile_expression("(3 + 4) * 2 / 7")
+    assert compiled.tree == Number(2.0)
+    assert compiled.step == ("divide", 14.0, 7.0)
+    assert repr(compiled) == "CompiledExpression('(3 + 4) * 2 / 7')"
+
+
+def test_folded_expression_evaluates_without_operations():
+    compiled = compile_expression("6 * 7")
+    with patch("app.expression.CalculationFactory.create_calculation") as create:
+        assert compiled.evaluate() == 42.0
+    create.assert_not_called()
+
+
+def test_failing_subtree_is_kept_for_evaluation():
+    compiled = compile_expression("1 + 2 / (1 - 1)")
+    assert compiled.tree == BinaryOp("add", Number(1.0),
+                                     BinaryOp("divide", Number(2.0), Number(0.0)))
+    assert compiled.step is None
+    with pytest.raises(ZeroDivisionError):
+        compiled.evaluate()
+
+
+def test_plain_number_has_no_step():
+    compiled = compile_expression("5")
+    assert compiled.step is None
+    assert compiled.evaluate() == 5.0
+
+
+def test_fold_constants_leaves_numbers_alone():
+    assert fold_constants(Number(1.0)) == Number(1.0)
+
+
+# -------------------------------------------------------------------
+# Compile Cache
+# -------------------------------------------------------------------
+
+def test_compile_cache_reuses_compiled_expressions():
+    first = compile_expression("1 + 1")
+    with patch("app.expression.parse") as mock_parse:
+        assert compile_expression("1 + 1") is first
+    mock_parse.assert_not_called()
+    info = expression.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_set_cache_size():
+    expression.set_cache_size(1)
+    compile_expression("1 + 1")
+    compile_expression("2 + 2")
+    assert expression.cache_info().currsize == 1
+    with pytest.raises(ValueError, match="positive integer"):
+        expression.set_cache_size(0)
+
+
+# -------------------------------------------------------------------
+# Variables and Compiled Functions
+# -------------------------------------------------------------------
+
+SOURCES = [
+    "x * 2 + y",
+    "-(x - y) / (y + 3.5)",
+    "max(x, 0) * min(y, 1) - x",
+    "MEAN(x, y) + 2 * 3",
+    "x / 1e-300 * 1e300",
+]
+
+
+def test_parse_variables_and_calls():
+    assert parse("max(rate, 1) * x") == BinaryOp(
+        "multiply", BinaryOp("max", Variable("rate", 4), Number(1.0)), Variable("x", 15)
+    )
+    assert [type(node).__name__ for node in walk(parse("(a + 1) * b"))] == [
+        "BinaryOp", "BinaryOp", "Variable", "Number", "Variable"
+    ]
+
+
+def test_variables_in_order_of_first_use():
+    compiled = compile_expression("y * (x + y)")
+    assert compiled.variables == ("y", "x")
+    assert compiled.evaluate(2.0, 3.0) == 10.0
+    assert compile_expression("6 * 7").variables == ()
+
+
+def test_missing_or_extra_values():
+    compiled = compile_expression("1 + y * x")
+    with pytest.raises(ExpressionError, match="Unknown variable 'y' at column 5"):
+        compiled.evaluate()  # e.g. typed at the REPL
+    with pytest.raises(ValueError, match=r"Expected 2 values \(y, x\), got 1"):
+        compiled.evaluate(1.0)
+    with pytest.raises(ValueError, match=r"Expected 0 values \(no variables\), got 1"):
+        compile_expression("1 + 1").evaluate(5.0)
+    with pytest.raises(ExpressionError, match="Unknown variable 'x'"):
+        evaluate(parse("x"), {"y": 1.0})
+
+
+@pytest.mark.parametrize("source", SOURCES)
+def test_compiled_function_matches_the_tree(source):
+    compiled = compile_expression(source)
+    function = compiled.to_function()
+    assert compiled.to_function() is function  # built once
+    rng = random.Random(601)
+    for _ in range(50):
+        values = [rng.uniform(-10, 10) for _ in compiled.variables]
+        assert function(*values) == compiled.evaluate(*values)
+
+
+def test_compiled_function_creates_no_calculations():
+    function = compile_expression("(x + 1) * y / 2 - max(x, y)").to_function()
+    with patch("app.expression.CalculationFactory.create_calculation") as create:
+        assert function(3.0, 4.0) == 4.0
+    create.assert_not_called()
+
+
+def test_compile_function_binds_what_has_no_literal():
+    function = compile_function(BinaryOp("add", Variable("a", 0), Number(math.inf)), ["a"])
+    assert function(1.0) == math.inf
+    assert compile_function(Number(2.5), [])() == 2.5
+
+
+@pytest.mark.parametrize("source", ["().__class__", "x.__class__.__bases__", "__import__('os')"])
+def test_attribute_access_is_rejected_before_compilation(source):
+    with patch("app.expression.compile_function") as compile_function_mock:
+        with pytest.raises(ExpressionError, match="Unexpected character"):
+            compile_expression(source).to_function()
+    compile_function_mock.assert_not_called()
+
+
+def test_compiled_function_never_holds_variable_names():
+    name = "__import__('os').getcwd()"  # names reach the function only as _v0, _v1, ...
+    function = compile_function(BinaryOp("multiply", Variable(name, 0), Number(2.0)), [name])
+    assert function(5.0) == 10.0
+    assert function.__code__.co_varnames == ("_v0",)
+
+
+@pytest.mark.parametrize("source", ["x * 1e999 - 1", "1e999 / x"])
+def test_compiled_function_with_promoted_constants(source):
+    compiled = compile_expression(source)  # 1e999 is kept as a Decimal: mixed operand types
+    assert compiled.to_function()(4.0) == compiled.evaluate(4.0)
+
+
+def test_compiled_function_under_exact_backend():
+    with numeric.using("fraction"):
+        compiled = compile_expression("x / 3 + 1")
+        assert compiled.to_function()(Fraction(1, 2)) == Fraction(7, 6)
+
+
+def test_compiled_division_by_zero():
+    with pytest.raises(ZeroDivisionError):
+        compile_expression("1 / x").to_function()(0.0)
+
+
+def test_map_streams_rows():
+    compiled = compile_expression("a * b + 1")
+    rows = ((i, 2.0) for i in range(3))
+    results = compiled.map(rows)
+    assert next(results) == 1.0  # lazy: one row at a time
+    assert list(results) == [3.0, 5.0]
+
+
+def test_evaluate_many_over_columns():
+    compiled = compile_expression("x * 2 + max(y, 0)")
+    xs, ys = array("d", [1.0, 2.0, 3.0]), [-1.0, 5.0, 0.5]
+    assert compiled.evaluate_many(xs, ys) == array("d", [2.0, 9.0, 6.5])
+    assert compiled.evaluate_many(memoryview(xs), ys) == array("d", [2.0, 9.0, 6.5])
+
+
+@pytest.mark.parametrize("source, columns, error, message", [
+    ("x + y", ([1.0],), ValueError, r"Expected one column per variable \(x, y\), got 1"),
+    ("1 + 2", (), ValueError, r"Expected one column per variable \(none\), got 0"),
+    ("x + y", ([1.0, 2.0], [1.0]), ValueError, r"same length \(got 1 and 2\)"),
+    ("1 / x", ([1.0, 0.0],), ZeroDivisionError, "Cannot divide by zero."),
+])
+def test_evaluate_many_errors(source, columns, error, message):
+    with pytest.raises(error, match=message):
+        compile_expression(source).evaluate_many(*columns)
+
+
+# -------------------------------------------------------------------
+# REPL Detection
+# -------------------------------------------------------------------
+
+@pytest.mark.parametrize("text, expected", [
+    ("(1 + 2)", True),
+    ("3 * 4", True),
+    ("-1 + 2", True),
+    (".5 * 2", True),
+    ("max(3, 4) * 2", True),
+    ("max (3, 4)", True),
+    ("x * 2", True),
+    ("x/2", True),
+    ("x - 1", True),
+    ("add 1 2", False),
+    ("add -1 2", False),
+    ("add", False),
+    ("", False),
+])
+def test_looks_like_expression(text, expected):
+    assert looks_like_expression(text) is expected
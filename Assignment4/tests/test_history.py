@@ -0,0 +1,131 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Date: 10/18/2026
+# Project: Assignment 4 - Professional Calculator CLI
+# ----------------------------------------------------------
+
+"""
+tests/test_history.py
+
+Unit tests for the columnar HistoryStore.
+Covers appending, ring-buffer eviction, indexing, iteration order,
+opcode assignment and memory accounting.
+"""
+
+import math
+from fractions import Fraction
+
+import pytest
+from app.history import HistoryEntry, HistoryStore
+
+
+def fill(store, count, operation="Add"):
+    for i in range(count):
+        store.append(operation, float(i), 1.0, i + 1.0)
+
+
+# -------------------------------------------------------------------
+# Appending and Reading
+# -------------------------------------------------------------------
+
+def test_empty_store():
+    store = HistoryStore(capacity=3)
+    assert len(store) == 0
+    assert not store
+    assert list(store) == []
+
+
+def test_append_and_iterate_in_order():
+    store = HistoryStore(capacity=5)
+    store.append("Add", 2.0, 3.0, 5.0)
+    store.append("Divide", 9.0, 3.0, 3.0)
+    assert len(store) == 2
+    assert list(store) == [HistoryEntry("Add", 2.0, 3.0, 5.0),
+                           HistoryEntry("Divide", 9.0, 3.0, 3.0)]
+    assert str(store[0]) == "2.0 Add 3.0 = 5.0"
+    assert store[-1].operation == "Divide"
+
+
+def test_index_out_of_range():
+    store = HistoryStore(capacity=2)
+    store.append("Add", 1.0, 1.0, 2.0)
+    with pytest.raises(IndexError):
+        store[1]
+    with pytest.raises(IndexError):
+        store[-2]
+
+
+# -------------------------------------------------------------------
+# Ring-buffer Eviction
+# -------------------------------------------------------------------
+
+def test_ring_buffer_evicts_oldest():
+    store = HistoryStore(capacity=3)
+    fill(store, 5)
+    assert len(store) == 3
+    assert store.evicted == 2
+    assert [entry.a for entry in store] == [2.0, 3.0, 4.0]
+    assert store[0].a == 2.0
+    assert store[-1].a == 4.0
+
+
+def test_numbers_beyond_float_range_are_recorded_as_infinity():
+    huge = 10 ** 400
+    store = HistoryStore(capacity=2)
+    store.append("Add", 1.0, huge, huge + 1)  # fails on the second column: the first is rolled back
+    store.append("Multiply", -huge, 2, Fraction(-huge, 3))
+    store.append("Add", huge, 1.0, 2.0)  # full: overwrites the oldest slot
+    assert [tuple(entry) for entry in store] == [
+        ("Multiply", -math.inf, 2.0, -math.inf), ("Add", math.inf, 1.0, 2.0),
+    ]
+    assert [len(store.column(field)) for field in ("a", "b", "result", "operation")] == [2, 2, 2, 2]
+
+
+def test_clear_resets_entries():
+    store = HistoryStore(capacity=2)
+    fill(store, 3)
+    store.clear()
+    assert len(store) == 0
+    store.append("Multiply", 2.0, 4.0, 8.0)
+    assert list(store) == [HistoryEntry("Multiply", 2.0, 4.0, 8.0)]
+
+
+def test_clear_counts_entries_as_evicted():
+    store = HistoryStore(capacity=3)
+    fill(store, 4)
+    store.clear()
+    assert store.evicted == 4  # evicted + index keeps numbering every entry ever appended
+
+
+def test_entries_from_index_and_columns():
+    store = HistoryStore(capacity=3)
+    fill(store, 3, "Add")
+    fill(store, 2, "Divide")  # wraps around the ring buffer
+    assert [entry.a for entry in store.entries(1)] == [0.0, 1.0]
+    assert store.column("operation") == ["Add", "Divide", "Divide"]
+    assert list(store.column("a")) == [2.0, 0.0, 1.0]
+    assert list(store.column("result")) == [3.0, 1.0, 2.0]
+
+
+def test_invalid_capacity():
+    with pytest.raises(ValueError, match="positive integer"):
+        HistoryStore(capacity=0)
+
+
+# -------------------------------------------------------------------
+# Opcodes and Memory
+# -------------------------------------------------------------------
+
+def test_opcode_table_is_limited_to_one_byte():
+    store = HistoryStore(capacity=300)
+    for code in range(256):
+        store.append(f"op{code}", 0.0, 0.0, 0.0)
+    assert store[255].operation == "op255"
+    with pytest.raises(ValueError, match="at most 256"):
+        store.append("one-too-many", 0.0, 0.0, 0.0)
+
+
+def test_nbytes_counts_column_storage():
+    store = HistoryStore(capacity=10)
+    fill(store, 10)
+    assert store.nbytes() == 10 * (8 * 3 + 1)
@@ -0,0 +1,202 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Date: 10/18/2026
+# Project: Assignment 4 - Professional Calculator CLI
+# ----------------------------------------------------------
+
+"""
+tests/test_history_log.py
+
+Unit tests for the persistent HistoryLog.
+Covers:
+- Appending, batched fsync and reopening through mmap
+- Reading while appending (the mapping is refreshed)
+- Recovery from a torn last record or a torn header
+- Compaction and invalid inputs
+"""
+
+import math
+import os
+from fractions import Fraction
+
+import pytest
+from app.history import HistoryEntry
+from app.history_log import HEADER_SIZE, MAX_OPERATIONS, NAME_SIZE, RECORD, HistoryLog
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    return str(tmp_path / "history.log")
+
+
+def fill(log, count):
+    for i in range(count):
+        log.append("Add", float(i), 1.0, i + 1.0, timestamp=1000.0 + i)
+
+
+# -------------------------------------------------------------------
+# Appending and Reloading
+# -------------------------------------------------------------------
+
+def test_new_log_is_empty(log_path):
+    with HistoryLog(log_path) as log:
+        assert len(log) == 0
+        assert not log
+        assert list(log) == []
+    assert os.path.getsize(log_path) == HEADER_SIZE
+
+
+def test_append_and_reopen(log_path):
+    with HistoryLog(log_path) as log:
+        log.append("Add", 2.0, 3.0, 5.0, timestamp=1.5)
+        log.append("Divide", 9.0, 3.0, 3.0)
+    assert os.path.getsize(log_path) == HEADER_SIZE + 2 * RECORD.size
+
+    with HistoryLog(log_path) as log:
+        assert len(log) == 2
+        assert log[0] == HistoryEntry("Add", 2.0, 3.0, 5.0)
+        assert log.record(0) == ("Add", 2.0, 3.0, 5.0, 1.5)
+        assert log[-1].operation == "Divide"
+        assert str(log[1]) == "9.0 Divide 3.0 = 3.0"
+
+
+def test_numbers_beyond_float_range_are_recorded_as_infinity(log_path):
+    with HistoryLog(log_path) as log:
+        log.append("Add", 10 ** 400, 1.0, 10 ** 400 + 1)
+        log.append("Divide", -10 ** 400, 3, Fraction(-10 ** 400, 3))
+        assert list(log) == [HistoryEntry("Add", math.inf, 1.0, math.inf),
+                             HistoryEntry("Divide", -math.inf, 3.0, -math.inf)]
+
+
+def test_reads_see_records_appended_after_mapping(log_path):
+    with HistoryLog(log_path) as log:
+        fill(log, 2)
+        assert log[1].a == 1.0  # maps the file
+        log.append("Multiply", 4.0, 5.0, 20.0)
+        assert log[2] == HistoryEntry("Multiply", 4.0, 5.0, 20.0)
+        assert [entry.a for entry in log] == [0.0, 1.0, 4.0]
+
+
+def test_iteration_spans_chunks(log_path, monkeypatch):
+    monkeypatch.setattr("app.history_log.CHUNK_RECORDS", 3)
+    with HistoryLog(log_path) as log:
+        fill(log, 7)
+        assert [entry.a for entry in log] == [float(i) for i in range(7)]
+        assert [record[4] for record in log.records(5)] == [1005.0, 1006.0]
+
+
+def test_columns(log_path):
+    with HistoryLog(log_path) as log:
+        fill(log, 3)
+        log.append("Divide", 8.0, 2.0, 4.0)
+        assert log.column("operation") == ["Add", "Add", "Add", "Divide"]
+        assert list(log.column("b")) == [1.0, 1.0, 1.0, 2.0]
+        assert list(log.column("result")) == [1.0, 2.0, 3.0, 4.0]
+        assert [entry.a for entry in log.entries(2)] == [2.0, 8.0]
+
+
+def test_index_out_of_range(log_path):
+    with HistoryLog(log_path) as log:
+        fill(log, 1)
+        with pytest.raises(IndexError):
+            log[1]
+        with pytest.raises(IndexError):
+            log[-2]
+
+
+def test_batched_fsync(log_path, monkeypatch):
+    calls = []
+    real_fsync = os.fsync
+    monkeypatch.setattr("app.history_log.os.fsync", lambda fd: calls.append(fd) or real_fsync(fd))
+    with HistoryLog(log_path, sync_every=3) as log:
+        log.append("Add", 0.0, 0.0, 0.0)  # new operation name → one header fsync
+        calls.clear()
+        log.append("Add", 0.0, 0.0, 0.0)
+        assert calls == []
+        log.append("Add", 0.0, 0.0, 0.0)
+        assert len(calls) == 1
+    log.close()  # closing twice is harmless
+
+
+# -------------------------------------------------------------------
+# Crash Recovery
+# -------------------------------------------------------------------
+
+def test_torn_last_record_is_discarded(log_path):
+    with HistoryLog(log_path) as log:
+        fill(log, 3)
+    with open(log_path, "ab") as f:
+        f.write(RECORD.pack(0, 9.0, 9.0, 9.0, 9.0)[:17])
+
+    with HistoryLog(log_path) as log:
+        assert log.truncated_bytes == 17
+        assert len(log) == 3
+        log.append("Add", 5.0, 5.0, 10.0)
+    with HistoryLog(log_path) as log:
+        assert log.truncated_bytes == 0
+        assert log[-1] == HistoryEntry("Add", 5.0, 5.0, 10.0)
+
+
+def test_torn_header_is_recreated(log_path):
+    with open(log_path, "wb") as f:
+        f.write(b"CALC")
+    with HistoryLog(log_path) as log:
+        assert len(log) == 0
+
+
+@pytest.mark.parametrize("content", [b"not a log", b"X" * (HEADER_SIZE + 40)])
+def test_foreign_file_is_rejected(log_path, content):
+    with open(log_path, "wb") as f:
+        f.write(content)
+    with pytest.raises(ValueError, match="not a calculator history log"):
+        HistoryLog(log_path)
+
+
+# -------------------------------------------------------------------
+# Compaction
+# -------------------------------------------------------------------
+
+def test_compact_keeps_most_recent(log_path):
+    with HistoryLog(log_path) as log:
+        fill(log, 10)
+        assert log.compact(keep_last=4) == 6
+        assert len(log) == 4
+        assert log.evicted == 6
+        assert log.record(0) == ("Add", 6.0, 1.0, 7.0, 1006.0)
+        log.append("Subtract", 1.0, 1.0, 0.0)
+    assert not os.path.exists(log_path + ".compact")
+    with HistoryLog(log_path) as log:
+        assert [entry.a for entry in log] == [6.0, 7.0, 8.0, 9.0, 1.0]
+
+
+def test_compact_removes_stale_temporary_file(log_path):
+    with open(log_path + ".compact", "wb") as f:
+        f.write(b"junk")
+    with HistoryLog(log_path) as log:
+        fill(log, 2)
+        assert log.compact(keep_last=5) == 0
+        assert len(log) == 2
+
+
+# -------------------------------------------------------------------
+# Invalid Inputs
+# -------------------------------------------------------------------
+
+def test_invalid_arguments(log_path):
+    with pytest.raises(ValueError, match="sync_every"):
+        HistoryLog(log_path, sync_every=0)
+    with HistoryLog(log_path) as log:
+        with pytest.raises(ValueError, match="must not be negative"):
+            log.compact(-1)
+        with pytest.raises(ValueError, match="longer than"):
+            log.append("x" * (NAME_SIZE + 1), 0.0, 0.0, 0.0)
+
+
+def test_operation_table_limit(log_path):
+    with HistoryLog(log_path) as log:
+        for code in range(MAX_OPERATIONS):
+            log.append(f"op{code}", 0.0, 0.0, 0.0)
+        with pytest.raises(ValueError, match="at most"):
+            log.append("one-too-many", 0.0, 0.0, 0.0)
+    with HistoryLog(log_path) as log:
+        assert log[-1].operation == f"op{MAX_OPERATIONS - 1}"
@@ -0,0 +1,192 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Date: 10/18/2026
+# Project: Assignment 4 - Professional Calculator CLI
+# ----------------------------------------------------------
+
+"""
+tests/test_history_query.py
+
+Unit tests for indexed history queries.
+Covers:
+- Parsing operation filters, ranges, last-N and top-K, and query errors
+- SortedColumn order, ranges, block splits and NaN
+- HistoryIndex results against a full scan, while entries are appended,
+  evicted, cleared and compacted
+"""
+
+import heapq
+import math
+import random
+
+import pytest
+from app.history import HistoryStore
+from app.history_log import HistoryLog
+from app.history_query import (FieldRange, HistoryIndex, HistoryQuery, QueryError, SortedColumn,
+                               parse_query)
+
+OPERATIONS = ("Add", "Subtract", "Multiply", "Divide")
+QUERIES = [
+    "divide result > 50",
+    "a -5..5 last 10",
+    "add multiply top 3",
+    "top 5",
+    "result = 5",
+    "result <= 0 b >= 2",
+    "last 4",
+    "result 10..20 top 2",
+    "b < -9.5 result >= 0 last 3 top 1",
+    "subtract",
+    "result 20..10",
+    "add divide last 7",
+    "b > 9 top 2",
+]
+
+
+def fill(history, count, rng):
+    for _ in range(count):
+        result = rng.choice([rng.uniform(-100, 100), 5.0])  # repeated results too
+        history.append(rng.choice(OPERATIONS), rng.uniform(-10, 10), rng.uniform(-10, 10), result)
+
+
+def scan(history, query):
+    """Answer a query by looking at every entry."""
+    matches = [
+        (i, entry) for i, entry in enumerate(history)
+        if (not query.operations or entry.operation.lower() in query.operations)
+        and all(condition.matches(getattr(entry, condition.field)) for condition in query.ranges)
+    ]
+    if query.last is not None:
+        matches = matches[-query.last:]
+    if query.top is not None:
+        matches = heapq.nlargest(query.top, matches, key=lambda match: match[1].result)
+    return matches
+
+
+def check_queries(index):
+    for text in QUERIES:
+        query = parse_query(text)
+        if query.top is None:
+            assert index.select(query) == scan(index.history, query), text
+        else:  # ties may come in any order
+            got, want = index.select(query), scan(index.history, query)
+            assert [entry.result for _, entry in got] == [entry.result for _, entry in want], text
+
+
+# -------------------------------------------------------------------
+# Parsing
+# -------------------------------------------------------------------
+
+def test_parse_query():
+    assert parse_query("Divide result>1e6 last 3") == HistoryQuery(
+        frozenset({"divide"}), (FieldRange("result", low=1e6, low_open=True),), last=3)
+    assert parse_query("add multiply a -1..1 b <= 2 top 5") == HistoryQuery(
+        frozenset({"add", "multiply"}), (FieldRange("a", -1.0, 1.0), FieldRange("b", high=2.0)),
+        top=5)
+    assert parse_query("result == 4 b < 0") == HistoryQuery(
+        ranges=(FieldRange("result", 4.0, 4.0), FieldRange("b", high=0.0, high_open=True)))
+    assert parse_query("") == HistoryQuery()
+
+
+@pytest.mark.parametrize("text, message", [
+    ("result", "Expected a comparison after 'result'"),
+    ("a >", "Expected a number after 'a >'"),
+    ("b 1..x", "Expected a number after 'b'"),
+    ("result 5", "Expected <, <=, >, >=, = or a low..high range after 'result'"),
+    ("last", "Expected a positive whole number after 'last'"),
+    ("top 0", "Expected a positive whole number after 'top'"),
+    ("last -2", "Expected a positive whole number after 'last'"),
+    ("> 5", "Unexpected '>' in history query"),
+])
+def test_parse_errors(text, message):
+    with pytest.raises(QueryError, match=message):
+        parse_query(text)
+
+
+@pytest.mark.parametrize("condition, inside, outside", [
+    (FieldRange("a", 1.0, 2.0), [1.0, 1.5, 2.0], [0.5, 2.5]),
+    (FieldRange("a", low=1.0, low_open=True), [1.5, math.inf], [1.0]),
+    (FieldRange("a", high=2.0, high_open=True), [-math.inf, 1.5], [2.0]),
+])
+def test_field_range_matches(condition, inside, outside):
+    assert all(map(condition.matches, inside))
+    assert not any(map(condition.matches, outside))
+
+
+# -------------------------------------------------------------------
+# Sorted Column
+# -------------------------------------------------------------------
+
+def test_sorted_column_ranges(monkeypatch):
+    monkeypatch.setattr("app.history_query.BLOCK_SIZE", 4)
+    values = [random.Random(5).randint(0, 20) * 1.0 for _ in range(40)] + [math.nan]
+    column = SortedColumn(values[:20], first=100)
+    for seq, value in enumerate(values[20:], 120):
+        column.insert(value, seq)  # splits blocks as they pass 8 values
+    assert len(column) == 40
+    for condition in (FieldRange("a", 5.0, 9.0), FieldRange("a", low=5.0, low_open=True),
+                      FieldRange("a"), FieldRange("a", high=3.0, high_open=True),
+                      FieldRange("a", 9.0, 5.0), FieldRange("a", 50.0)):
+        expected = sorted((value, seq) for seq, value in enumerate(values[:40], 100)
+                          if condition.matches(value))
+        assert list(column.ascending(condition)) == [seq for _, seq in expected]
+        assert list(column.descending(condition)) == [seq for _, seq in reversed(expected)]
+        assert column.count(condition) == len(expected)
+
+
+def test_sorted_column_descending_and_nan():
+    column = SortedColumn([3.0, math.nan, 1.0, 3.0], first=10)
+    assert len(column) == 3
+    assert list(column.descending(FieldRange("result"))) == [13, 10, 12]
+    empty = SortedColumn()
+    assert empty.count(FieldRange("result")) == 0
+    empty.insert(math.nan, 0)
+    empty.insert(2.0, 1)
+    assert list(empty.ascending(FieldRange("result"))) == [1]
+
+
+# -------------------------------------------------------------------
+# History Index
+# -------------------------------------------------------------------
+
+def test_index_matches_full_scan_as_history_changes(monkeypatch):
+    monkeypatch.setattr("app.history_query.BLOCK_SIZE", 16)
+    rng = random.Random(601)
+    history = HistoryStore(capacity=500)
+    index = HistoryIndex(history)
+    fill(history, 300, rng)
+    check_queries(index)  # first query: built from scratch
+    for new in (3, 40, 5, 260, 400):  # one by one, or rebuilt; the ring buffer evicts from 500 on
+        fill(history, new, rng)
+        check_queries(index)
+    history.clear()
+    check_queries(index)
+    fill(history, 10, rng)
+    check_queries(index)
+
+
+def test_index_over_history_log(tmp_path):
+    rng = random.Random(7)
+    with HistoryLog(str(tmp_path / "history.log")) as log:
+        fill(log, 200, rng)
+        index = HistoryIndex(log)
+        check_queries(index)
+        log.compact(keep_last=150)
+        fill(log, 5, rng)
+        check_queries(index)
+        assert index.nbytes() > 0
+
+
+def test_operation_names_ignore_case():
+    history = HistoryStore()
+    history.append("Power", 2.0, 3.0, 8.0)  # e.g. recorded by a plugin in an earlier session
+    history.append("Add", 2.0, 3.0, 5.0)
+    index = HistoryIndex(history)
+    assert [entry.operation for _, entry in index.select(parse_query("POWER"))] == ["Power"]
+    assert index.select(parse_query("subtract top 1")) == []
+
+
+def test_unknown_operation():
+    index = HistoryIndex(HistoryStore())
+    with pytest.raises(QueryError, match="Unknown operation 'dvide'"):
+        index.select(parse_query("dvide"))
@@ -0,0 +1,97 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Date: 10/18/2026
+# Project: Assignment 4 - Professional Calculator CLI
+# ----------------------------------------------------------
+
+"""
+tests/test_kernels.py
+
+Unit tests for the vectorized kernels.
+Covers the pure-array path, length checks and divide-by-zero handling,
+and the non-raising apply_checked with its error bitmap.
+The NumPy path is exercised only when NumPy is installed.
+"""
+
+import math
+import operator
+from array import array
+
+import pytest
+import app.kernels as kernels
+from app.kernels import apply_checked, apply_kernel, check_lengths, error_rows
+
+
+@pytest.fixture
+def no_numpy(monkeypatch):
+    """Force the pure-array fallback even when NumPy is installed."""
+    monkeypatch.setattr(kernels, "np", None)
+
+
+@pytest.mark.parametrize("kernel, expected", [
+    (operator.add, [11.0, 22.0]),
+    (operator.sub, [9.0, 18.0]),
+    (operator.mul, [10.0, 40.0]),
+    (operator.truediv, [10.0, 10.0]),
+])
+def test_apply_kernel_pure_array(no_numpy, kernel, expected):
+    result = apply_kernel(kernel, array("d", [10, 20]), memoryview(array("d", [1, 2])))
+    assert isinstance(result, array)
+    assert result.typecode == "d"
+    assert list(result) == expected
+
+
+def test_apply_kernel_empty_columns(no_numpy):
+    assert list(apply_kernel(operator.add, array("d"), array("d"))) == []
+
+
+def test_apply_kernel_divide_by_zero(no_numpy):
+    with pytest.raises(ZeroDivisionError, match="Cannot divide by zero."):
+        apply_kernel(operator.truediv, [1.0], [0.0])
+
+
+def zero_divisor(a, b):
+    return 1 if b == 0 else 0
+
+
+def test_apply_checked_marks_invalid_rows(no_numpy):
+    a = array("d", range(1, 11))
+    b = array("d", [1, 0, 2, 0, 4, 5, 1, 1, 1, 0])
+    results, bitmap = apply_checked(operator.truediv, zero_divisor, a, b)
+    assert bitmap == bytearray([0b00001010, 0b00000010])
+    assert list(error_rows(bitmap)) == [1, 3, 9]
+    assert [i for i, value in enumerate(results) if math.isnan(value)] == [1, 3, 9]
+    assert results[4] == 1.25
+    assert b[1] == 0.0  # the caller's columns are not changed
+
+
+def test_apply_checked_without_failures(no_numpy):
+    results, bitmap = apply_checked(operator.mul, None, [1.0, 2.0, 3.0], [2.0, 2.0, 2.0])
+    assert results == array("d", [2.0, 4.0, 6.0])
+    assert bitmap == bytearray(1) and list(error_rows(bitmap)) == []
+    assert apply_checked(operator.truediv, zero_divisor, [], []) == (array("d"), bytearray())
+
+
+def test_apply_checked_finds_unpredicted_failures(no_numpy):
+    results, bitmap = apply_checked(operator.pow, None, [10.0, 2.0, 10.0], [400.0, 3.0, 2.0])
+    assert list(error_rows(bitmap)) == [0]  # OverflowError, which no check predicted
+    assert math.isnan(results[0]) and list(results[1:]) == [8.0, 100.0]
+
+
+def test_check_lengths():
+    assert check_lengths([1, 2], [3, 4]) == 2
+    with pytest.raises(ValueError, match="same length"):
+        check_lengths([1, 2], [3])
+
+
+def test_apply_kernel_numpy():
+    np = pytest.importorskip("numpy")
+    a = np.arange(1.0, 4.0)
+    b = np.full(3, 2.0)
+    assert isinstance(apply_kernel(operator.mul, a, b), np.ndarray)
+    assert list(apply_kernel(operator.mul, a, b)) == [2.0, 4.0, 6.0]
+    buffered = apply_kernel(operator.add, array("d", [1, 2]), array("d", [3, 4]))
+    assert isinstance(buffered, array)
+    assert list(buffered) == [4.0, 6.0]
+    with pytest.raises(ZeroDivisionError):
+        apply_kernel(operator.truediv, a, np.zeros(3))
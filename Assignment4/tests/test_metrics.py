@@ -0,0 +1,204 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Date: 10/18/2026
+# Project: Assignment 4 - Professional Calculator CLI
+# ----------------------------------------------------------
+
+"""
+tests/test_metrics.py
+
+Unit tests for the built-in metrics.
+Covers:
+- Log-bucketed histograms and percentiles
+- Timed wrappers: call counts, latency and division-by-zero errors
+- Switching metrics on and off (plain functions come back when off)
+- The stats summary and the Prometheus text dump
+"""
+
+import operator
+
+import pytest
+from app import metrics, numeric
+from app.calculation import AddCalculation, CalculationFactory
+from app.metrics import BUCKET_COUNT, Histogram, Metrics
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    yield
+    metrics.set_enabled(False)
+    metrics.METRICS.reset()
+    numeric.set_backend("float")
+
+
+# -------------------------------------------------------------------
+# Histograms
+# -------------------------------------------------------------------
+
+@pytest.mark.parametrize("elapsed_ns, bucket", [
+    (0, 0), (1, 0), (64, 0), (65, 1), (128, 1), (129, 2),
+    (2 ** 30, BUCKET_COUNT - 1), (2 ** 30 + 1, BUCKET_COUNT),
+])
+def test_histogram_buckets(elapsed_ns, bucket):
+    histogram = Histogram()
+    histogram.observe(elapsed_ns)
+    assert histogram.counts[bucket] == 1
+    assert histogram.count == 1
+    assert histogram.total_ns == elapsed_ns
+
+
+def test_histogram_percentiles():
+    histogram = Histogram()
+    assert histogram.percentile(0.5) is None
+    for elapsed_ns in [100] * 98 + [1000, 5000]:
+        histogram.observe(elapsed_ns)
+    assert histogram.percentile(0.5) == 128
+    assert histogram.percentile(0.99) == 1024
+    assert histogram.percentile(1.0) == 8192
+    histogram.observe(2 ** 40)
+    assert histogram.percentile(1.0) == float("inf")
+    counts = histogram.counts
+    histogram.clear()
+    assert histogram.counts is counts and histogram.count == 0 and histogram.total_ns == 0
+
+
+# -------------------------------------------------------------------
+# Timed Wrappers
+# -------------------------------------------------------------------
+
+def test_timed_counts_calls_and_division_errors():
+    divide = metrics.timed(operator.truediv, "divide")
+    assert divide(1, 4) == 0.25
+    with pytest.raises(ZeroDivisionError):
+        divide(1, 0)
+    with pytest.raises(TypeError):
+        divide("1", 4)  # passes through unrecorded
+    assert metrics.METRICS.histogram("divide").count == 1
+    assert metrics.METRICS.errors == {("division_by_zero", "divide"): 1}
+    assert divide.__wrapped__ is operator.truediv
+
+
+def test_metrics_off_leaves_plain_kernels():
+    assert CalculationFactory._dispatch["add"] is operator.add
+    metrics.set_enabled(True)
+    assert CalculationFactory._dispatch["add"] is not operator.add
+    metrics.set_enabled(False)
+    assert CalculationFactory._dispatch["ADD"] is operator.add
+    assert AddCalculation.execute.__wrapped__ is AddCalculation._raw_execute
+
+
+def test_listeners_run_only_on_change():
+    calls = []
+    metrics.add_listener(calls.append)
+    try:
+        metrics.set_enabled(True)
+        metrics.set_enabled(True)
+        metrics.set_enabled(False)
+    finally:
+        metrics._listeners.remove(calls.append)
+    assert calls == [True, False]
+
+
+def test_evaluate_and_execute_are_counted():
+    metrics.set_enabled(True)
+    assert CalculationFactory.evaluate("add", 1, 2) == 3
+    calculation = CalculationFactory.create_calculation("multiply", 2, 3)
+    assert calculation.execute() == calculation.execute() == 6  # memoized: counted once
+    with pytest.raises(ZeroDivisionError):
+        CalculationFactory.evaluate("divide", 1, 0)
+    numeric.set_backend("fraction")  # no kernels: evaluate() goes through the timed execute()
+    assert CalculationFactory.evaluate("subtract", 1, 3) == -2
+    assert {name: h.count for name, h in metrics.METRICS.operations.items() if h.count} == {
+        "add": 1, "multiply": 1, "subtract": 1,
+    }
+    assert metrics.METRICS.errors == {("division_by_zero", "divide"): 1}
+
+
+def test_non_raising_division_by_zero_is_counted():
+    metrics.set_enabled(True)
+    CalculationFactory.try_evaluate("Divide", 1.0, 0.0)  # caught by the check, before the kernel
+    assert metrics.METRICS.errors == {("division_by_zero", "divide"): 1}
+
+
+def test_types_registered_while_on_are_timed():
+    metrics.set_enabled(True)
+    calculations = dict(CalculationFactory._calculations)
+    try:
+        @CalculationFactory.register_calculation("plus")
+        class PlusCalculation(AddCalculation):  # inherits execute(): timed as its parent
+            __slots__ = ()
+
+        @CalculationFactory.register_calculation("square_sum")
+        class SquareSumCalculation(AddCalculation):
+            __slots__ = ()
+            kernel = None
+
+            def execute(self):
+                return self.a ** 2 + self.b ** 2
+
+        assert CalculationFactory.evaluate("square_sum", 1, 2) == 5
+        assert CalculationFactory.evaluate("plus", 1, 2) == 3
+        assert metrics.METRICS.histogram("square_sum").count == 1
+        assert metrics.METRICS.histogram("plus").count == 1  # kernel inherited from AddCalculation
+    finally:
+        CalculationFactory._calculations.clear()
+        CalculationFactory._calculations.update(calculations)
+        CalculationFactory._rebuild_dispatch()
+
+
+# -------------------------------------------------------------------
+# Reports
+# -------------------------------------------------------------------
+
+def test_render():
+    report = Metrics()
+    assert report.render() == "No calculations recorded yet."
+    report.histogram("add").observe(500)
+    report.histogram("divide")  # never called: not listed
+    report.lines.observe(3_000_000)
+    report.record_error("parse")
+    report.record_error("division_by_zero", "divide")
+    lines = report.render().splitlines()
+    assert lines[0].split() == ["Operation", "Calls", "Mean", "p50", "p99"]
+    assert lines[1].split() == ["add", "1", "500", "ns", "≤512", "ns", "≤512", "ns"]
+    assert lines[2].split()[:5] == ["REPL", "lines", "1", "3.0", "ms"]
+    assert lines[3] == "Errors: division_by_zero (divide): 1, parse: 1"
+
+    errors_only = Metrics()
+    errors_only.record_error("parse")
+    assert errors_only.render().splitlines()[1:] == ["Errors: parse: 1"]
+    calls_only = Metrics()
+    calls_only.histogram("add").observe(500)
+    assert len(calls_only.render().splitlines()) == 2
+
+
+@pytest.mark.parametrize("ns, text", [
+    (12, "12 ns"), (1500, "1.5 µs"), (2_500_000, "2.5 ms"), (3e9, "3.0 s"), (float("inf"), "inf"),
+])
+def test_duration_format(ns, text):
+    assert metrics._duration(ns) == text
+
+
+def test_prometheus_dump(tmp_path):
+    report = Metrics()
+    histogram = report.histogram("add")
+    for elapsed_ns in (50, 100, 2 ** 40):
+        histogram.observe(elapsed_ns)
+    report.record_error("parse")
+    report.record_error("division_by_zero", "divide")
+    text = report.to_prometheus()
+    lines = text.splitlines()
+    assert "# TYPE calculator_operation_seconds histogram" in lines
+    assert 'calculator_operation_seconds_bucket{operation="add",le="6.4e-08"} 1' in lines
+    assert 'calculator_operation_seconds_bucket{operation="add",le="1.28e-07"} 2' in lines
+    assert 'calculator_operation_seconds_bucket{operation="add",le="1.073741824"} 2' in lines
+    assert 'calculator_operation_seconds_bucket{operation="add",le="+Inf"} 3' in lines
+    assert 'calculator_operation_seconds_count{operation="add"} 3' in lines
+    assert "calculator_repl_line_seconds_count 0" in lines
+    assert 'calculator_errors_total{kind="division_by_zero",operation="divide"} 1' in lines
+    assert 'calculator_errors_total{kind="parse"} 1' in lines
+
+    path = tmp_path / "metrics.prom"
+    report.write_prometheus(str(path))
+    assert path.read_text() == text
+    assert [p.name for p in tmp_path.iterdir()] == ["metrics.prom"]
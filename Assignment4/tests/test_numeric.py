@@ -0,0 +1,213 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Date: 10/18/2026
+# Project: Assignment 4 - Professional Calculator CLI
+# ----------------------------------------------------------
+
+"""
+tests/test_numeric.py
+
+Unit tests for the numeric backends.
+Covers:
+- Parsing with each backend, including promotion of inexact literals
+- Exact arithmetic and automatic promotion (int → fraction, decimal → fraction)
+- Mixing operand types and per-call / per-session backend selection
+- Operations and Calculation objects following the session backend
+"""
+
+import math
+import sys
+import types
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+from app import numeric
+from app.calculation import CalculationFactory
+from app.expression import compile_expression
+from app.operations import Operations
+
+
+@pytest.fixture(autouse=True)
+def float_session():
+    yield
+    numeric.set_backend("float")
+
+
+# -------------------------------------------------------------------
+# Parsing
+# -------------------------------------------------------------------
+
+@pytest.mark.parametrize("backend, text, expected, kind", [
+    ("float", "2.5", 2.5, float),
+    ("float", "9007199254740992", 9007199254740992.0, float),
+    ("float", "9007199254740993", Decimal("9007199254740993"), Decimal),
+    ("float", "1e400", Decimal("1e400"), Decimal),
+    ("int", "42", 42, int),
+    ("int", "2.5", Fraction(5, 2), Fraction),
+    ("fraction", "1/3", Fraction(1, 3), Fraction),
+    ("decimal", "0.10", Decimal("0.10"), Decimal),
+])
+def test_parse(backend, text, expected, kind):
+    value = numeric.parse(text, backend)
+    assert value == expected
+    assert type(value) is kind
+
+
+@pytest.mark.parametrize("text", ["inf", "-Infinity", "nan", "123456789012345678.5"])
+def test_float_parse_keeps_special_and_fractional_literals(text):
+    assert type(numeric.parse(text)) is float
+
+
+@pytest.mark.parametrize("backend, text",
+                         [("float", "x"), ("int", "x"), ("fraction", "1/0"), ("decimal", "1.2.3")])
+def test_parse_invalid(backend, text):
+    with pytest.raises(ValueError):
+        numeric.parse(text, backend)
+
+
+# -------------------------------------------------------------------
+# Arithmetic and Promotion
+# -------------------------------------------------------------------
+
+@pytest.mark.parametrize("backend, calc_type, a, b, expected, kind", [
+    ("float", "add", 0.1, 0.2, 0.1 + 0.2, float),
+    ("int", "multiply", 10**20, 10**20, 10**40, int),
+    ("int", "divide", 8, 2, 4, int),
+    ("int", "divide", 7, 2, Fraction(7, 2), Fraction),
+    ("int", "add", 2.5, 1, Fraction(7, 2), Fraction),
+    ("decimal", "add", Decimal("1.10"), Decimal("2.20"), Decimal("3.30"), Decimal),
+    ("decimal", "divide", Decimal(1), Decimal(3), Fraction(1, 3), Fraction),
+    ("decimal", "subtract", 0.5, 0.25, Decimal("0.25"), Decimal),
+    ("fraction", "subtract", Fraction(1, 2), Fraction(1, 3), Fraction(1, 6), Fraction),
+])
+def test_apply(backend, calc_type, a, b, expected, kind):
+    result = numeric.apply(calc_type, a, b, backend)
+    assert result == expected
+    assert type(result) is kind
+
+
+def test_decimal_overflow_promotes_to_fraction():
+    result = numeric.apply("multiply", Decimal("1e999999"), Decimal("1e10"), "decimal")
+    assert result == Fraction(10) ** 1000009
+
+
+def test_float_backend_promotes_huge_integers():
+    assert numeric.apply("multiply", 10**400, 2.0) == 2 * 10**400
+
+
+@pytest.mark.parametrize("backend, a, b", [
+    ("int", math.inf, 1),
+    ("decimal", Decimal("inf"), Decimal("-inf")),
+])
+def test_non_finite_values_fall_back_to_float(backend, a, b):
+    result = numeric.apply("add", a, b, backend)
+    assert type(result) is float
+    assert math.isinf(result) or math.isnan(result)
+
+
+def test_operand_types_raise_the_backend():
+    assert numeric.apply("add", Decimal("0.1"), Fraction(1, 3)) == Fraction(13, 30)
+    assert numeric.apply("add", Decimal("0.1"), 1) == Decimal("1.1")
+
+
+def test_backend_base_class_is_abstract():
+    with pytest.raises(TypeError):
+        numeric.NumericBackend()  # abstract parse() and apply() not implemented
+
+    class ParseOnly(numeric.NumericBackend):
+        def parse(self, text):
+            return float(text)
+
+    with pytest.raises(TypeError, match="apply"):
+        ParseOnly()
+
+
+# -------------------------------------------------------------------
+# Backend Selection
+# -------------------------------------------------------------------
+
+def test_get_and_set_backend():
+    assert numeric.get_backend() is numeric.FLOAT
+    assert numeric.get_backend(numeric.INT) is numeric.INT
+    assert numeric.set_backend("DECIMAL") is numeric.DECIMAL
+    assert repr(numeric.get_backend()) == "<decimal backend>"
+    with pytest.raises(ValueError, match="Unsupported numeric backend: 'bignum'"):
+        numeric.set_backend("bignum")
+
+
+def test_using_restores_the_previous_backend():
+    with numeric.using("int") as backend:
+        assert backend is numeric.INT
+        assert numeric.apply("divide", 1, 4) == Fraction(1, 4)
+    assert numeric.get_backend() is numeric.FLOAT
+
+
+# -------------------------------------------------------------------
+# Operations and Calculations
+# -------------------------------------------------------------------
+
+def test_operations_float_path_is_unchanged():
+    assert Operations.division(7, 2) == 3.5
+    assert Operations.addition.__name__ == "addition"
+
+
+@pytest.mark.parametrize("method, expected", [
+    ("addition", Fraction(13, 30)),
+    ("subtraction", Fraction(-7, 30)),
+    ("multiplication", Fraction(1, 30)),
+    ("division", Fraction(3, 10)),
+])
+def test_operations_promote_mixed_exact_types(method, expected):
+    assert getattr(Operations, method)(Decimal("0.1"), Fraction(1, 3)) == expected
+
+
+def test_operations_follow_the_session_backend():
+    numeric.set_backend("int")
+    assert Operations.addition(2, 3) == 5
+    assert Operations.subtraction(2, 3) == -1
+    assert Operations.multiplication(4, 3) == 12
+    assert Operations.division(7, 2) == Fraction(7, 2)
+    with pytest.raises(ValueError, match="Division by zero is not allowed."):
+        Operations.division(1, 0)
+    numeric.set_backend("float")
+    assert Operations.division(7, 2) == 3.5
+
+
+def test_backend_switch_clears_shared_results():
+    cache = CalculationFactory.enable_result_cache()
+    try:
+        assert CalculationFactory.create_calculation("divide", 7, 2, intern=True).execute() == 3.5
+        numeric.set_backend("int")
+        assert len(cache) == 0
+        calculation = CalculationFactory.create_calculation("divide", 7, 2, intern=True)
+        assert calculation.execute() == Fraction(7, 2)
+    finally:
+        CalculationFactory.disable_result_cache()
+
+
+def test_expressions_use_the_session_backend():
+    assert compile_expression("0.1 + 0.2").evaluate() == 0.1 + 0.2
+    numeric.set_backend("decimal")
+    assert compile_expression("0.1 + 0.2").evaluate() == Decimal("0.3")
+
+
+# -------------------------------------------------------------------
+# Lazy Loading
+# -------------------------------------------------------------------
+
+def test_lazy_import_defers_loading(monkeypatch):
+    monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+    module = numeric._lazy_import("colorsys")
+    assert sys.modules["colorsys"] is module
+    assert type(module) is not types.ModuleType  # not executed yet
+    assert module.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    assert numeric._lazy_import("colorsys") is module
+
+
+def test_type_rank_of_subclasses():
+    class Money(Decimal):
+        pass
+
+    assert numeric.apply("add", Money("0.1"), 2) == Decimal("2.1")
+    assert numeric.apply("add", True, 2) == 3.0
@@ -84,3 +84,22 @@ def test_division_by_zero():
     """Ensure division by zero raises ValueError with clear message."""
     with pytest.raises(ValueError, match="Division by zero is not allowed."):
         Operations.division(1, 0)
+
+
+def test_quotient_does_not_check_the_divisor():
+    """quotient() is the unchecked arithmetic under division(): the caller has validated."""
+    assert Operations.quotient(7, 2) == 3.5
+    with pytest.raises(ZeroDivisionError):
+        Operations.quotient(1.0, 0.0)  # plain float division, no ValueError
+
+
+def test_division_under_an_exact_backend():
+    """With an exact backend, division() goes through the backend and still checks the divisor."""
+    from fractions import Fraction
+    from app import numeric
+
+    with numeric.using("int"):
+        assert Operations.division(7, 2) == Fraction(7, 2)
+        with pytest.raises(ValueError, match="Division by zero is not allowed."):
+            Operations.division(7, 0)
+    assert Operations.division(7, 2) == 3.5  # plain float division again
@@ -0,0 +1,172 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Date: 10/18/2026
+# Project: Assignment 4 - Professional Calculator CLI
+# ----------------------------------------------------------
+
+"""
+tests/test_parallel.py
+
+Unit tests for the process-pool batch executor.
+Covers:
+- Results and status codes in input order (inline and multi-process)
+- Chunk-size auto-tuning
+- The worker entry point attaching to a shared-memory block
+- run_batch_parallel producing the same output as run_batch
+"""
+
+from array import array
+from io import StringIO
+from multiprocessing import shared_memory
+
+import pytest
+from app.batch import run_batch
+from app.calculation import CalculationFactory, MultiplyCalculation
+from app.parallel import (
+    MIN_CHUNK_SIZE,
+    ROW_BYTES,
+    STATUS_DIVISION_BY_ZERO,
+    STATUS_ERROR,
+    STATUS_OK,
+    _evaluate_chunk,
+    auto_chunk_size,
+    execute_parallel,
+    run_batch_parallel,
+)
+
+CALC_TYPES = ["add", "subtract", "multiply", "divide"]
+
+
+def make_columns(count):
+    ops = array("B", (i % 4 for i in range(count)))
+    a = array("d", (float(i) for i in range(count)))
+    b = array("d", (float(i % 5) for i in range(count)))
+    return ops, a, b
+
+
+def expected_results(ops, a, b):
+    results, statuses = [], []
+    for op, x, y in zip(ops, a, b):
+        try:
+            results.append(CalculationFactory.create_calculation(CALC_TYPES[op], x, y).execute())
+            statuses.append(STATUS_OK)
+        except ZeroDivisionError:
+            results.append(None)
+            statuses.append(STATUS_DIVISION_BY_ZERO)
+    return results, statuses
+
+
+def assert_matches(results, statuses, ops, a, b):
+    expected, expected_statuses = expected_results(ops, a, b)
+    assert list(statuses) == expected_statuses
+    for got, want in zip(results, expected):
+        if want is not None:
+            assert got == want
+
+
+# -------------------------------------------------------------------
+# execute_parallel
+# -------------------------------------------------------------------
+
+def test_execute_inline_single_worker():
+    ops, a, b = make_columns(100)
+    results, statuses = execute_parallel(CALC_TYPES, ops, a, b, workers=1)
+    assert len(results) == len(statuses) == 100
+    assert_matches(results, statuses, ops, a, b)
+
+
+def test_execute_across_processes_keeps_input_order():
+    ops, a, b = make_columns(2000)
+    results, statuses = execute_parallel(CALC_TYPES, ops, a, b, workers=2, chunk_size=300)
+    assert_matches(results, statuses, ops, a, b)
+
+
+def test_execute_empty_input():
+    results, statuses = execute_parallel(CALC_TYPES, array("B"), array("d"), array("d"))
+    assert len(results) == len(statuses) == 0
+
+
+def test_execute_without_kernel_and_with_errors(monkeypatch):
+    monkeypatch.setattr(MultiplyCalculation, "kernel", None)
+    results, statuses = execute_parallel(["multiply", "add"], [0, 1, 1], [3.0, 1e308, 1.0],
+                                         [4.0, 1e308, 1.0], workers=1)
+    assert list(results)[0] == 12.0
+    assert list(statuses) == [STATUS_OK, STATUS_OK, STATUS_OK]
+
+    monkeypatch.setattr(MultiplyCalculation, "kernel", staticmethod(lambda x, y: x ** y))
+    _, statuses = execute_parallel(["multiply"], [0], [10.0], [400.0], workers=1)
+    assert list(statuses) == [STATUS_ERROR]  # OverflowError
+
+    # A kernel without a validate check
+    monkeypatch.setattr(MultiplyCalculation, "kernel", staticmethod(lambda x, y: x / y))
+    _, statuses = execute_parallel(["multiply", "divide"], [0, 1], [1.0, 1.0], [0.0, 0.0],
+                                   workers=1)
+    assert list(statuses) == [STATUS_DIVISION_BY_ZERO, STATUS_DIVISION_BY_ZERO]
+
+
+def test_execute_validates_arguments():
+    with pytest.raises(ValueError, match="same length"):
+        execute_parallel(CALC_TYPES, [0, 1], [1.0], [1.0, 2.0])
+    with pytest.raises(ValueError, match="Unsupported calculation type"):
+        execute_parallel(["modulus"], [0], [1.0], [1.0])
+    with pytest.raises(ValueError, match="At most 256"):
+        execute_parallel(["add"] * 257, [0], [1.0], [1.0])
+
+
+def test_auto_chunk_size():
+    assert auto_chunk_size(100, 4) == MIN_CHUNK_SIZE
+    assert auto_chunk_size(1_000_000, 4) == 62_500
+    assert auto_chunk_size(1_000_001, 4) == 62_501
+
+
+def test_worker_entry_point_writes_its_range():
+    count = 4
+    block = shared_memory.SharedMemory(create=True, size=ROW_BYTES * count)
+    try:
+        block.buf[:8 * count] = array("d", [1, 2, 3, 4]).tobytes()
+        block.buf[8 * count:16 * count] = array("d", [1, 1, 1, 0]).tobytes()
+        block.buf[24 * count:25 * count] = array("B", [0, 0, 3, 3]).tobytes()
+        _evaluate_chunk(block.name, count, CALC_TYPES, 2, 4)
+        assert list(array("d", bytes(block.buf[16 * count:24 * count])))[2] == 3.0
+        assert list(block.buf[25 * count:26 * count]) == [0, 0, STATUS_OK, STATUS_DIVISION_BY_ZERO]
+    finally:
+        block.close()
+        block.unlink()
+
+
+# -------------------------------------------------------------------
+# run_batch_parallel
+# -------------------------------------------------------------------
+
+@pytest.mark.parametrize("workers, chunk_size", [(1, None), (2, 2)])
+def test_run_batch_parallel_matches_run_batch(workers, chunk_size):
+    lines = ["# comment", "add 2 3", "", "divide 1 0", "add two three",
+             "modulus 1 2", "MULTIPLY 4 5", "subtract 9 1", "divide 9 3"]
+    serial_out, parallel_out = StringIO(), StringIO()
+    serial = run_batch(lines, serial_out)
+    parallel = run_batch_parallel(lines, parallel_out, workers=workers, chunk_size=chunk_size)
+    assert parallel_out.getvalue() == serial_out.getvalue()
+    assert parallel == serial
+
+
+def test_run_batch_parallel_reports_failed_calculations(monkeypatch):
+    monkeypatch.setattr(MultiplyCalculation, "kernel", staticmethod(lambda x, y: x ** y))
+    out = StringIO()
+    summary = run_batch_parallel(["multiply 10 400"], out, workers=1)
+    assert out.getvalue() == "Error (line 1): Calculation failed.\n"
+    assert summary.operation_errors == 1
+
+
+def test_run_batch_parallel_flushes_in_chunks(monkeypatch):
+    monkeypatch.setattr("app.parallel.FLUSH_EVERY", 2)
+    out = StringIO()
+    summary = run_batch_parallel([f"add {i} 0" for i in range(5)], out, workers=1)
+    assert summary.succeeded == 5
+    assert out.getvalue().splitlines() == ["0.0", "1.0", "2.0", "3.0", "4.0"]
+
+
+def test_run_batch_parallel_empty_input():
+    out = StringIO()
+    summary = run_batch_parallel(["", "# only comments"], out)
+    assert summary.processed == 0
+    assert out.getvalue() == ""
@@ -0,0 +1,264 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Date: 10/18/2026
+# Project: Assignment 4 - Professional Calculator CLI
+# ----------------------------------------------------------
+
+"""
+tests/test_plugins.py
+
+Unit tests for entry point plugins.
+Covers:
+- Discovery of calculation types from installed distributions
+- The on-disk manifest cache and when it is rebuilt
+- Lazy loading through CalculationFactory (listed, imported on first use)
+- Duplicate registration checks before and after a plugin is loaded
+"""
+
+import json
+import os
+import sys
+
+import pytest
+from app import plugins
+from app.calculation import Calculation, CalculationFactory
+
+PLUGIN_MODULE = '''
+import operator
+from app.calculation import Calculation, CalculationFactory
+
+
+@CalculationFactory.register_calculation("power")
+class PowerCalculation(Calculation):
+    __slots__ = ()
+
+    def execute(self):
+        return self.a ** self.b
+
+
+class ModuloCalculation(Calculation):  # registered by the factory when loaded
+    __slots__ = ()
+    kernel = staticmethod(operator.mod)
+
+    def execute(self):
+        return self.a % self.b
+
+
+NOT_A_CALCULATION = 42
+'''
+
+
+def make_distribution(root, name, entry_points):
+    """Create an installed-looking distribution with the given calculation entry points."""
+    dist_info = root / f"{name}-1.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text(f"Metadata-Version: 2.1\nName: {name}\nVersion: 1.0\n")
+    lines = [f"{key} = {value}" for key, value in entry_points.items()]
+    (dist_info / "entry_points.txt").write_text(
+        f"[{plugins.ENTRY_POINT_GROUP}]\n" + "\n".join(lines) + "\n")
+
+
+@pytest.fixture
+def factory_state():
+    """Restore the factory registry after a test adds plugin types."""
+    calculations = dict(CalculationFactory._calculations)
+    pending, discovered = CalculationFactory._plugins, CalculationFactory._plugins_discovered
+    CalculationFactory._plugins, CalculationFactory._plugins_discovered = {}, False
+    yield
+    CalculationFactory._calculations.clear()
+    CalculationFactory._calculations.update(calculations)
+    CalculationFactory._plugins, CalculationFactory._plugins_discovered = pending, discovered
+    CalculationFactory._rebuild_dispatch()
+
+
+@pytest.fixture
+def plugin_path(tmp_path, monkeypatch, factory_state):
+    """A sys.path entry holding one plugin distribution and its module."""
+    site = tmp_path / "site"
+    site.mkdir()
+    (site / "calc_plugin_ops.py").write_text(PLUGIN_MODULE)
+    make_distribution(site, "calc_plugin", {
+        "power": "calc_plugin_ops:PowerCalculation",
+        "modulo": "calc_plugin_ops:ModuloCalculation",
+    })
+    monkeypatch.setenv(plugins.CACHE_ENV, str(tmp_path / "cache" / "plugins.json"))
+    monkeypatch.syspath_prepend(str(site))
+    yield site
+    sys.modules.pop("calc_plugin_ops", None)
+
+
+# -------------------------------------------------------------------
+# Discovery and Manifest Cache
+# -------------------------------------------------------------------
+
+def test_discover_finds_entry_points(plugin_path):
+    assert plugins.discover() == {
+        "power": "calc_plugin_ops:PowerCalculation",
+        "modulo": "calc_plugin_ops:ModuloCalculation",
+    }
+
+
+def test_discover_rejects_conflicting_plugins(plugin_path):
+    make_distribution(plugin_path, "other_plugin", {"power": "other_ops:Power"})
+    with pytest.raises(ValueError, match="'power' is provided by both"):
+        plugins.discover()
+
+
+def test_manifest_is_cached_until_sys_path_changes(plugin_path, monkeypatch):
+    cache_path = plugin_path.parent / "cache" / "plugins.json"
+    manifest = plugins.load_manifest()
+    assert json.loads(cache_path.read_text())["calculations"] == manifest
+
+    def fail():
+        raise AssertionError("the cache should have been used")
+
+    monkeypatch.setattr(plugins, "discover", fail)
+    assert plugins.load_manifest() == manifest
+
+    monkeypatch.undo()
+    monkeypatch.syspath_prepend(str(plugin_path))
+    os.utime(plugin_path, ns=(0, 0))  # as if a package had been installed there
+    calls = []
+    monkeypatch.setattr(plugins, "discover", lambda: calls.append(1) or {})
+    assert plugins.load_manifest(str(cache_path)) == {}
+    assert calls == [1]
+
+
+@pytest.mark.parametrize("content", ["not json", "[]", '{"version": 0}'])
+def test_invalid_cache_is_rebuilt(plugin_path, content):
+    cache_path = plugin_path.parent / "plugins.json"
+    cache_path.write_text(content)
+    assert "power" in plugins.load_manifest(str(cache_path))
+    assert json.loads(cache_path.read_text())["version"] == plugins.MANIFEST_VERSION
+
+
+def test_unwritable_cache_is_ignored(plugin_path):
+    blocker = plugin_path.parent / "blocker"
+    blocker.write_text("")
+    # The folder cannot be created
+    assert "power" in plugins.load_manifest(str(blocker / "plugins.json"))
+
+    folder = plugin_path.parent / "folder.json"
+    folder.mkdir()
+    assert "power" in plugins.load_manifest(str(folder))  # cannot replace a directory
+    assert os.listdir(folder) == []
+    assert not list(plugin_path.parent.glob("folder.json.*.tmp"))
+
+
+def test_fingerprint_watches_only_metadata_directories(monkeypatch, tmp_path):
+    site, script, missing = tmp_path / "site", tmp_path / "script", tmp_path / "missing"
+    site.mkdir()
+    script.mkdir()
+    (site / "pkg-1.0.dist-info").mkdir()
+    (script / "main.py").write_text("")
+    monkeypatch.chdir(script)
+    monkeypatch.setattr(sys, "path",
+                        ["", str(script), str(site), str(missing), str(script / "main.py")])
+    fingerprint = plugins._fingerprint()
+    assert fingerprint == [[str(site), os.stat(site).st_mtime_ns]]
+
+    (script / "history.log").write_text("")  # output of the calculator itself
+    os.utime(script, ns=(1, 1))
+    assert plugins._fingerprint() == fingerprint
+
+
+def test_default_cache_path(monkeypatch):
+    monkeypatch.setenv(plugins.CACHE_ENV, "/tmp/manifest.json")
+    assert plugins.default_cache_path() == "/tmp/manifest.json"
+    monkeypatch.delenv(plugins.CACHE_ENV)
+    expected = os.path.join(".cache", "professional-calculator", "plugins.json")
+    assert plugins.default_cache_path().endswith(expected)
+
+
+def test_import_target():
+    assert plugins.import_target("os.path:join") is os.path.join
+    assert plugins.import_target("collections:OrderedDict.fromkeys").__name__ == "fromkeys"
+    assert plugins.import_target("json") is json
+
+
+# -------------------------------------------------------------------
+# Lazy Loading through the Factory
+# -------------------------------------------------------------------
+
+def test_plugins_are_listed_without_being_imported(plugin_path):
+    assert CalculationFactory.available_calculations() == [
+        "add", "subtract", "multiply", "divide", "min", "max", "mean", "power", "modulo",
+    ]
+    assert "calc_plugin_ops" not in sys.modules
+
+
+def test_built_in_types_never_load_the_manifest(factory_state):
+    assert CalculationFactory.evaluate("add", 2, 3) == 5
+    assert CalculationFactory.create_calculation("Divide", 1, 4).execute() == 0.25
+    assert not CalculationFactory._plugins_discovered
+
+
+def test_plugin_is_imported_on_first_use(plugin_path):
+    assert CalculationFactory.evaluate("power", 2, 10) == 1024
+    assert "calc_plugin_ops" in sys.modules
+    assert CalculationFactory.create_calculation("POWER", 3, 2).execute() == 9
+    assert CalculationFactory.display_name("power") == "Power"
+    assert CalculationFactory.available_calculations().count("power") == 1
+
+
+def test_undecorated_plugin_class_is_registered(plugin_path):
+    assert CalculationFactory.evaluate("modulo", 7, 3) == 1
+    calc_class = CalculationFactory.get_calculation_class("modulo")
+    assert calc_class.__name__ == "ModuloCalculation"
+    assert calc_class.calc_type == "modulo"
+
+
+def test_unknown_type_lists_plugins(plugin_path):
+    available = "Available: add, subtract, multiply, divide, min, max, mean, power, modulo"
+    with pytest.raises(ValueError, match=available):
+        CalculationFactory.create_calculation("modulus", 2, 3)
+
+
+@pytest.mark.parametrize("target, message", [
+    ("calc_missing_module:Thing", "Cannot load calculation type 'broken'"),
+    ("calc_plugin_ops:Missing", "Cannot load calculation type 'broken'"),
+    ("calc_plugin_ops:NOT_A_CALCULATION", "is not a Calculation class"),
+])
+def test_broken_plugin(plugin_path, target, message):
+    CalculationFactory.add_plugins({"broken": target})
+    with pytest.raises(ValueError, match=message):
+        CalculationFactory.evaluate("broken", 1, 2)
+
+
+# -------------------------------------------------------------------
+# Duplicate Registration
+# -------------------------------------------------------------------
+
+def test_plugin_cannot_replace_a_built_in_type(factory_state):
+    with pytest.raises(ValueError, match="'add' is already registered"):
+        CalculationFactory.add_plugins({"add": "calc_plugin_ops:PowerCalculation"})
+
+
+def test_plugins_cannot_share_a_name(factory_state):
+    CalculationFactory.add_plugins({"power": "calc_plugin_ops:PowerCalculation"})
+    # The same target: fine
+    CalculationFactory.add_plugins({"power": "calc_plugin_ops:PowerCalculation"})
+    with pytest.raises(ValueError, match="'Power' is already registered"):
+        CalculationFactory.add_plugins({"Power": "other_ops:Power"})
+
+
+def test_name_of_a_pending_plugin_cannot_be_taken(plugin_path):
+    CalculationFactory.available_calculations()  # discovered, not imported
+    with pytest.raises(ValueError, match="'power' is already registered"):
+        @CalculationFactory.register_calculation("power")
+        class ImpostorPower(Calculation):
+            def execute(self):
+                return 0
+
+
+def test_loaded_plugin_keeps_its_name(plugin_path):
+    CalculationFactory.evaluate("power", 2, 2)
+    # Rediscovered: fine
+    CalculationFactory.add_plugins({"power": "calc_plugin_ops:PowerCalculation"})
+    with pytest.raises(ValueError, match="'power' is already registered"):
+        CalculationFactory.add_plugins({"power": "other_ops:Power"})
+    with pytest.raises(ValueError, match="'power' is already registered"):
+        @CalculationFactory.register_calculation("power")
+        class ImpostorPower(Calculation):
+            def execute(self):
+                return 0
@@ -0,0 +1,184 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Date: 10/18/2026
+# Project: Assignment 4 - Professional Calculator CLI
+# ----------------------------------------------------------
+
+"""
+tests/test_reductions.py
+
+Unit tests for n-ary operations.
+Covers:
+- Accurate float sums, products, min/max and mean over any iterable
+- Exact folding with the int, fraction and decimal backends
+- Lazy reading of numbers from text streams
+- CalculationFactory.reduce and the `main.py --reduce` entry point (via subprocess)
+"""
+
+import itertools
+import math
+from array import array
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+from app import numeric, reductions
+from app.calculation import CalculationFactory
+
+
+# -------------------------------------------------------------------
+# Float Reductions
+# -------------------------------------------------------------------
+
+def test_total_is_correctly_rounded():
+    values = [0.1] * 10
+    assert sum(values) != 1.0
+    assert reductions.total(values) == 1.0
+    assert reductions.total([1e100, 1.0, -1e100]) == 1.0
+
+
+@pytest.mark.parametrize("reduction, expected", [
+    (reductions.total, 10.0),
+    (reductions.product, 24.0),
+    (reductions.minimum, 1.0),
+    (reductions.maximum, 4.0),
+    (reductions.mean, 2.5),
+])
+def test_reductions_consume_generators(reduction, expected):
+    values = (float(x) for x in [3, 1, 4, 2])
+    assert reduction(values) == expected
+    assert next(values, None) is None
+
+
+def test_long_stream_is_not_materialised():
+    assert reductions.mean(itertools.repeat(2.0, 1_000_000)) == 2.0
+    assert reductions.total(array("d", [0.5] * 1000)) == 500.0
+
+
+@pytest.mark.parametrize("values, expected", [
+    ([1e308, 1e308], math.inf),  # fsum: "intermediate overflow"
+    ([-1e308, -1e308, 1.0], -math.inf),
+    ([math.inf, -math.inf], math.nan),  # fsum: "-inf + inf"
+])
+def test_sums_beyond_float_range_saturate(values, expected):
+    results = [
+        reductions.total(values),
+        reductions.total(iter(values)),
+        reductions.mean(values),
+        # Past the first chunk
+        reductions.total(itertools.chain([0.5] * (reductions.SUM_CHUNK + 1), values)),
+    ]
+    assert results == [expected] * 4 or math.isnan(expected) and all(map(math.isnan, results))
+
+
+def test_input_errors_are_not_taken_for_overflow():
+    with pytest.raises(ValueError, match="Invalid number on line 2: 'x'"):
+        reductions.total(reductions.read_numbers(["1e308 1e308", "x"]))
+
+
+def test_empty_input():
+    assert reductions.total([]) == 0.0
+    assert reductions.product([]) == 1.0
+    for reduction, name in [(reductions.minimum, "min"), (reductions.maximum, "max"),
+                            (reductions.mean, "mean")]:
+        with pytest.raises(ValueError, match=f"{name} needs at least one number"):
+            reduction(iter([]))
+
+
+# -------------------------------------------------------------------
+# Exact Backends
+# -------------------------------------------------------------------
+
+def test_exact_backends_fold_exactly():
+    with numeric.using("int"):
+        assert reductions.total([1, 2, 3]) == 6
+        assert reductions.mean([1, 2]) == Fraction(3, 2)
+        assert reductions.product([2, 3, 4]) == 24
+    with numeric.using("fraction"):
+        assert reductions.total([Fraction(1, 3)] * 3) == 1
+        assert reductions.mean(Fraction(1, n) for n in (1, 2, 3)) == Fraction(11, 18)
+    with numeric.using("decimal"):
+        assert reductions.total([Decimal("0.1")] * 3) == Decimal("0.3")
+        # Promoted
+        assert reductions.mean([Decimal("1"), Decimal("2"), Decimal("2")]) == Fraction(5, 3)
+
+
+# -------------------------------------------------------------------
+# Reading Numbers
+# -------------------------------------------------------------------
+
+def test_read_numbers_is_lazy_and_skips_comments():
+    lines = iter(["# header\n", "1 2\n", "\n", "  3\n", "bad line\n"])
+    numbers = reductions.read_numbers(lines)
+    assert [next(numbers), next(numbers), next(numbers)] == [1.0, 2.0, 3.0]
+    assert next(lines) == "bad line\n"  # later lines not read yet
+
+
+def test_read_numbers_reports_the_bad_field():
+    with pytest.raises(ValueError, match="Invalid number on line 2: '2x'"):
+        reductions.maximum(reductions.read_numbers(["1\n", "5 2x\n"]))
+
+
+def test_read_numbers_uses_the_session_backend():
+    with numeric.using("fraction"):
+        assert list(reductions.read_numbers(["1/3 2"])) == [Fraction(1, 3), 2]
+    assert list(reductions.read_numbers(["7"], parse=int)) == [7]
+
+
+# -------------------------------------------------------------------
+# CalculationFactory.reduce
+# -------------------------------------------------------------------
+
+@pytest.mark.parametrize("calc_type, expected", [
+    ("add", 15.0), ("Multiply", 120.0), ("MIN", 1.0), ("max", 5.0), ("mean", 3.0),
+])
+def test_factory_reduce(calc_type, expected):
+    assert CalculationFactory.reduce(calc_type, array("d", [1, 2, 3, 4, 5])) == expected
+
+
+@pytest.mark.parametrize("calc_type, message", [
+    ("subtract", "'subtract' takes exactly two numbers"),
+    ("divide", "'divide' takes exactly two numbers"),
+    ("modulus", "Unsupported calculation type: 'modulus'"),
+])
+def test_factory_reduce_errors(calc_type, message):
+    with pytest.raises(ValueError, match=message):
+        CalculationFactory.reduce(calc_type, [1.0, 2.0, 3.0])
+
+
+# -------------------------------------------------------------------
+# main.py --reduce
+# -------------------------------------------------------------------
+
+def test_main_reduce_file(tmp_path, run_main):
+    numbers = tmp_path / "numbers.txt"
+    numbers.write_text("# readings\n0.1 0.1 0.1\n0.1 0.1 0.1 0.1\n0.1 0.1 0.1\n", encoding="utf-8")
+    proc = run_main("--reduce", "add", str(numbers))
+    assert (proc.returncode, proc.stdout) == (0, "1.0\n")
+
+
+def test_main_reduce_stdin_with_backend(run_main):
+    proc = run_main("--reduce", "mean", "-", "--backend", "fraction", stdin="1 2\n2\n")
+    assert (proc.returncode, proc.stdout) == (0, "5/3\n")
+
+
+@pytest.mark.parametrize("operation, stdin, expected", [
+    ("add", "1e308 1e308\n1\n", "inf\n"),
+    ("mean", "1e308\n1e308\n", "inf\n"),
+    ("add", "inf -inf\n", "nan\n"),
+])
+def test_main_reduce_saturates(operation, stdin, expected, run_main):
+    proc = run_main("--reduce", operation, "-", stdin=stdin)
+    assert (proc.returncode, proc.stdout, proc.stderr) == (0, expected, "")
+
+
+@pytest.mark.parametrize("args, stdin, status, message", [
+    (["--reduce", "subtract", "-"], "1 2 3", 1,
+     "Error: Calculation type 'subtract' takes exactly two numbers."),
+    (["--reduce", "max", "-"], "1 x", 1, "Error: Invalid number on line 1: 'x'"),
+    (["--reduce", "add", "missing.txt"], "", 2, "Cannot read numbers file"),
+])
+def test_main_reduce_errors(args, stdin, status, message, run_main):
+    proc = run_main(*args, stdin=stdin)
+    assert proc.returncode == status
+    assert message in proc.stderr
@@ -0,0 +1,143 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Date: 10/18/2026
+# Project: Assignment 4 - Professional Calculator CLI
+# ----------------------------------------------------------
+
+"""
+tests/test_server.py
+
+Unit tests for the asyncio calculator server.
+Covers:
+- Response lines for valid and invalid requests
+- Pipelined requests answered in order (including with a tiny queue)
+- The `exit` command, client disconnects and oversized lines
+"""
+
+import asyncio
+
+import pytest
+from app.calculation import CalculationFactory
+from app.server import evaluate_line, start_server
+
+
+# -------------------------------------------------------------------
+# Helpers
+# -------------------------------------------------------------------
+
+def run_with_server(client, queue_size=16):
+    """Start a server on a free port, run `client(host, port)`, then shut down."""
+    async def scenario():
+        server = await start_server("127.0.0.1", 0, queue_size=queue_size)
+        host, port = server.sockets[0].getsockname()[:2]
+        async with server:
+            return await client(host, port)
+
+    return asyncio.run(scenario())
+
+
+async def exchange(host, port, payload):
+    """Send `payload` in one write and read responses until the server closes."""
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(payload.encode())
+    await writer.drain()
+    writer.write_eof()
+    data = await reader.read()
+    writer.close()
+    await writer.wait_closed()
+    return data.decode().splitlines()
+
+
+# -------------------------------------------------------------------
+# Request Evaluation
+# -------------------------------------------------------------------
+
+@pytest.mark.parametrize("line, response", [
+    ("add 2 3", "Result: 5.0\n"),
+    ("divide 9 3", "Result: 3.0\n"),
+    ("divide 1 0", "Error: Division by zero is not allowed.\n"),
+    ("add two three", "Error: Invalid format. Use: <operation> <num1> <num2>\n"),
+    ("", "Error: Invalid format. Use: <operation> <num1> <num2>\n"),
+])
+def test_evaluate_line(line, response):
+    assert evaluate_line(line) == response
+
+
+def test_evaluate_line_unknown_operation():
+    assert evaluate_line("modulus 5 3").startswith("Error: Unsupported calculation type")
+
+
+# -------------------------------------------------------------------
+# Server Behaviour
+# -------------------------------------------------------------------
+
+def test_pipelined_requests_are_answered_in_order():
+    lines = [f"add {i} 1" for i in range(200)]
+    responses = run_with_server(lambda h, p: exchange(h, p, "\n".join(lines) + "\n"))
+    assert responses == [f"Result: {i + 1.0}" for i in range(200)]
+
+
+def test_small_queue_applies_backpressure_without_losing_requests():
+    lines = [f"multiply {i} 2" for i in range(500)]
+    responses = run_with_server(lambda h, p: exchange(h, p, "\n".join(lines) + "\n"), queue_size=1)
+    assert len(responses) == 500
+    assert responses[-1] == "Result: 998.0"
+
+
+def test_exit_closes_connection_after_pending_responses():
+    responses = run_with_server(lambda h, p: exchange(h, p, "add 1 1\nEXIT\nadd 2 2\n"))
+    assert responses == ["Result: 2.0"]
+
+
+def test_errors_do_not_break_the_stream():
+    responses = run_with_server(lambda h, p: exchange(h, p, "divide 1 0\nbad\nsubtract 5 2\n"))
+    assert responses == [
+        "Error: Division by zero is not allowed.",
+        "Error: Invalid format. Use: <operation> <num1> <num2>",
+        "Result: 3.0",
+    ]
+
+
+def test_unexpected_errors_are_answered_in_place(monkeypatch):
+    create = CalculationFactory.create_calculation
+
+    def failing(calc_type, a, b):
+        if calc_type == "multiply":
+            raise OverflowError("math range error")
+        if calc_type == "max":
+            raise RuntimeError("plugin crashed")
+        return create(calc_type, a, b)
+
+    monkeypatch.setattr(CalculationFactory, "create_calculation", failing)
+    lines = [f"add {i} 1" for i in range(100)] + ["multiply 2 2", "max 1 2"]
+    lines += [f"add {i} 2" for i in range(100)]
+    responses = run_with_server(lambda h, p: exchange(h, p, "\n".join(lines) + "\n"))
+    assert responses[:100] == [f"Result: {i + 1.0}" for i in range(100)]
+    assert responses[100:102] == [
+        "Error: math range error",
+        "Error: An error occurred during calculation: plugin crashed",
+    ]
+    assert responses[102:] == [f"Result: {i + 2.0}" for i in range(100)]
+
+
+def test_oversized_line_closes_connection():
+    responses = run_with_server(lambda h, p: exchange(h, p, "add 1 1\n" + "x" * 100_000 + "\n"))
+    assert responses == ["Result: 2.0"]
+
+
+def test_client_disconnect_while_responses_pending():
+    async def client(host, port):
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(("add 1 1\n" * 50_000).encode())
+        await writer.drain()
+        writer.transport.abort()  # vanish without reading any response
+        await asyncio.sleep(0.2)
+        # The server keeps serving other clients
+        return await exchange(host, port, "add 2 2\n")
+
+    assert run_with_server(client) == ["Result: 4.0"]
+
+
+def test_invalid_queue_size():
+    with pytest.raises(ValueError, match="queue_size"):
+        asyncio.run(start_server("127.0.0.1", 0, queue_size=0))
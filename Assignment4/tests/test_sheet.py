@@ -0,0 +1,178 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Date: 10/18/2026
+# Project: Assignment 4 - Professional Calculator CLI
+# ----------------------------------------------------------
+
+"""
+tests/test_sheet.py
+
+Unit tests for spreadsheet-style variables.
+Covers:
+- Defining cells from numbers, other cells and (n-ary) operations
+- Recomputing only downstream cells, in topological order, with early cutoff
+- Errors that flow to dependents, circular references and invalid definitions
+- Reading cell values from outside the sheet
+"""
+
+from fractions import Fraction
+
+import pytest
+from app import numeric
+from app.sheet import Sheet, SheetError
+
+
+def values(sheet):
+    return {name: cell.value for name, cell in sheet.cells.items()}
+
+
+def define(sheet, line):
+    """Define from `name = word word ...` and return the names of the changed cells."""
+    name, _, definition = line.partition("=")
+    return [cell.name for cell in sheet.define(name.strip(), definition.split())]
+
+
+# -------------------------------------------------------------------
+# Definitions
+# -------------------------------------------------------------------
+
+def test_define_numbers_copies_and_operations():
+    sheet = Sheet()
+    assert define(sheet, "x = add 3 4") == ["x"]
+    define(sheet, "y = multiply x 2")
+    define(sheet, "z = y")
+    define(sheet, "m = mean x y z 1")
+    assert values(sheet) == {"x": 7.0, "y": 14.0, "z": 14.0, "m": 9.0}
+    assert str(sheet["m"]) == "m = 9.0"
+    assert len(sheet) == 4
+
+
+def test_render():
+    sheet = Sheet()
+    assert sheet.render() == "No variables yet."
+    define(sheet, "x = 2")
+    define(sheet, "y = divide 1 x")
+    assert sheet.render() == "x = 2.0  (2)\ny = 0.5  (divide 1 x)"
+
+
+def test_uses_the_numeric_backend():
+    sheet = Sheet()
+    with numeric.using("fraction"):
+        define(sheet, "third = divide 1 3")
+    assert sheet["third"].value == Fraction(1, 3)
+
+
+# -------------------------------------------------------------------
+# Incremental Recompute
+# -------------------------------------------------------------------
+
+def test_only_downstream_cells_are_recomputed():
+    sheet = Sheet()
+    for line in ["a = 1", "b = 2", "c = add a 1", "d = add c 1", "e = add b 1", "f = add d e"]:
+        define(sheet, line)
+    sheet.evaluations = 0
+    assert define(sheet, "a = 5") == ["a", "c", "d", "f"]  # b and e are untouched
+    assert sheet.evaluations == 4
+    assert values(sheet) == {"a": 5.0, "b": 2.0, "c": 6.0, "d": 7.0, "e": 3.0, "f": 10.0}
+
+
+def test_diamond_is_evaluated_once_in_topological_order():
+    sheet = Sheet()
+    for line in ["x = 1", "left = add x 1", "right = multiply x 2", "deep = add right 0",
+                 "both = add left deep"]:
+        define(sheet, line)
+    sheet.evaluations = 0
+    assert define(sheet, "x = 3") == ["x", "left", "right", "deep", "both"]
+    assert sheet.evaluations == 5
+    assert sheet["both"].value == 10.0
+
+
+def test_unchanged_values_stop_the_recompute():
+    sheet = Sheet()
+    for line in ["x = 3", "big = max x 10", "after = multiply big 2"]:
+        define(sheet, line)
+    sheet.evaluations = 0
+    assert define(sheet, "x = 4") == ["x"]  # big is still 10: after is not evaluated
+    assert sheet.evaluations == 2
+    assert define(sheet, "x = add 2 2") == ["x"]  # a new definition with the same value
+
+
+def test_redefining_moves_dependencies():
+    sheet = Sheet()
+    for line in ["a = 1", "b = 2", "c = add a a", "d = add c 1"]:
+        define(sheet, line)
+    define(sheet, "c = multiply b 10")  # c no longer uses a; d moves up with it
+    assert define(sheet, "a = 100") == ["a"]
+    assert define(sheet, "b = 3") == ["b", "c", "d"]
+    assert values(sheet)["d"] == 31.0
+    define(sheet, "chain = add d 1")
+    define(sheet, "c = 7")  # height drops: d and chain still come after it
+    assert [sheet["d"].value, sheet["chain"].value] == [8.0, 9.0]
+    define(sheet, "c = add a 0")
+    define(sheet, "a = add b 0")  # a, then c, d and chain move up behind b
+    assert define(sheet, "b = 4") == ["b", "a", "c", "d", "chain"]
+    assert sheet["chain"].value == 6.0
+
+
+# -------------------------------------------------------------------
+# Errors
+# -------------------------------------------------------------------
+
+def test_errors_flow_to_dependents_and_recover():
+    sheet = Sheet()
+    for line in ["x = 2", "inverse = divide 1 x", "plus = add inverse 1"]:
+        define(sheet, line)
+    assert define(sheet, "x = 0") == ["x", "inverse", "plus"]
+    assert str(sheet["inverse"]) == "inverse = Error: Division by zero is not allowed."
+    assert str(sheet["plus"]) == "plus = Error: 'inverse' has no value"
+    assert define(sheet, "x = 4") == ["x", "inverse", "plus"]
+    assert sheet["plus"].value == 1.25
+
+
+def test_calculation_errors_are_kept_in_the_cell():
+    sheet = Sheet()
+    with numeric.using("fraction"):
+        define(sheet, "exact = 1e400")
+    define(sheet, "scaled = multiply exact 1.5")  # beyond float range
+    assert sheet["scaled"].value is None
+    assert "too large" in sheet["scaled"].error
+
+
+@pytest.mark.parametrize("lines, message", [
+    (["x = 1", "y = add x 1", "z = add y 1", "x = add z 1"], "Circular reference: x → y → z → x"),
+    (["x = 1", "x = add x 1"], "Circular reference: x → x"),
+    (["x = add y 1"], "Unknown variable 'y'"),
+    (["x = add 2x 1"], "'2x' is not a number or a variable"),
+    (["add = 1"], "'add' cannot be used as a variable name"),
+    (["inf = 1"], "'inf' cannot be used as a variable name"),
+    (["history = 1"], "'history' cannot be used as a variable name"),
+    (["Cells = 1"], "'Cells' cannot be used as a variable name"),
+    (["x ="], "Missing definition after 'x ='"),
+    (["x = subtract 1 2 3"], "Calculation type 'subtract' takes exactly two numbers."),
+    (["x = modulus 1 2"], "Unsupported calculation type: 'modulus'"),
+])
+def test_invalid_definitions(lines, message):
+    sheet = Sheet()
+    for line in lines[:-1]:
+        define(sheet, line)
+    before = values(sheet)
+    with pytest.raises(SheetError if "Unsupported" not in message else ValueError, match=message):
+        define(sheet, lines[-1])
+    assert values(sheet) == before  # a rejected definition changes nothing
+
+
+
+# -------------------------------------------------------------------
+# Values Outside the Sheet
+# -------------------------------------------------------------------
+
+def test_lookup_and_values():
+    sheet = Sheet()
+    define(sheet, "x = add 3 4")
+    define(sheet, "y = divide x 0")
+    assert sheet.lookup("x") == 7.0
+    with pytest.raises(SheetError, match="Unknown variable 'z'"):
+        sheet.lookup("z")
+    with pytest.raises(SheetError, match="'y' has no value"):
+        sheet.lookup("y")
+    assert sheet.values(["x", "y", "z"]) == {"x": 7.0}
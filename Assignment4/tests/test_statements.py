@@ -0,0 +1,120 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Date: 10/18/2026
+# Project: Assignment 4 - Professional Calculator CLI
+# ----------------------------------------------------------
+
+"""
+tests/test_statements.py
+
+Unit tests for the REPL statement tokenizer.
+Covers:
+- Single and `;`-separated statements, including infix expressions
+- Empty statements and surrounding whitespace
+- Format and number errors with column positions
+- Vector operands: literals with spaces, files and their errors
+- Variable names as operands, through a lookup
+- parse_statement() for lines without `;`, as split_statements() reads them
+"""
+
+import pytest
+from app.statements import (Assignment, Statement, StatementError, VectorStatement, parse_statement,
+                            split_statements)
+
+
+def test_single_statement():
+    assert list(split_statements("add 2 3")) == [Statement("add", (2.0, 3.0), "add 2 3", 0)]
+
+
+def test_multiple_statements_and_expressions():
+    statements = list(split_statements("add 1 2;multiply 3 4 ; (1 + 2) * 3"))
+    assert [(s.operation, s.operands) for s in statements] == [
+        ("add", (1.0, 2.0)), ("multiply", (3.0, 4.0)), (None, ()),
+    ]
+    assert [s.source for s in statements] == ["add 1 2", "multiply 3 4", "(1 + 2) * 3"]
+    assert [s.position for s in statements] == [0, 8, 23]
+
+
+@pytest.mark.parametrize("line", ["", "   ", ";", " ; ;; "])
+def test_empty_statements_are_skipped(line):
+    assert list(split_statements(line)) == []
+
+
+@pytest.mark.parametrize("line, message", [
+    ("add 1", "Invalid format at column 6"),
+    ("add 1 2 3x 4", "Invalid format ('3x' is not a number) at column 9"),
+    ("add x 2", "Invalid format ('x' is not a number) at column 5"),
+    ("add 2 2x", "Invalid format ('2x' is not a number) at column 7"),
+    ("add 2 2 ; sub 4", "Invalid format at column 16"),
+    ("add 1 2; divide 4 y", "Invalid format ('y' is not a number) at column 19"),
+])
+def test_errors_report_columns(line, message):
+    error = list(split_statements(line))[-1]
+    assert isinstance(error, StatementError)
+    assert str(error) == message
+
+
+def test_n_ary_statement():
+    statement, = split_statements("  add 1 2 3 4")
+    assert (statement.operation, statement.operands, statement.position) == (
+        "add", (1.0, 2.0, 3.0, 4.0), 2)
+
+
+def test_error_does_not_stop_the_line():
+    first, second = split_statements("add 1; subtract 5 2")
+    assert isinstance(first, StatementError)
+    assert first.position == 5
+    assert (second.operation, second.operands, second.position) == ("subtract", (5.0, 2.0), 7)
+
+
+def test_assignments():
+    short, long, calculation = split_statements("x = 5; y = add x 2 3; add 1 2")
+    assert short == Assignment("x", ("5",), "x = 5", 0)
+    assert (long.name, long.words, long.offset) == ("y", ("add", "x", "2", "3"), 6)
+    assert calculation.operation == "add"
+
+
+def test_variables_as_operands():
+    variables = {"x": 7.0}
+
+    def lookup(name):
+        if name not in variables:
+            raise ValueError(name)
+        return variables[name]
+
+    line = "multiply x 2; add 1 x x; add [1] x; add x y"
+    calculation, n_ary, vector, error = split_statements(line, lookup)
+    assert calculation.operands == (7.0, 2.0)
+    assert n_ary.operands == (1.0, 7.0, 7.0)
+    assert vector.operands[1] == 7.0
+    assert str(error) == "Invalid format ('y' is not a number) at column 43"
+    error = list(split_statements("multiply x 2"))[0]
+    assert str(error) == "Invalid format ('x' is not a number) at column 10"
+
+
+def test_vector_statements():
+    literal, number = split_statements("multiply [1, 2, 3] [4,5,6]; add 2 [1]")
+    assert isinstance(literal, VectorStatement)
+    assert literal.operation == "multiply"
+    assert [operand.tolist() for operand in literal.operands] == [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+    assert number.operands[0] == 2.0 and type(number.operands[0]) is float
+
+
+@pytest.mark.parametrize("line, message", [
+    ("add [1, x] 2", "Invalid vector '[1, x]' ('x' is not a number) at column 5"),
+    ("add 1; add [1] 2z", "Invalid format ('2z' is not a number) at column 16"),
+    ("add @ 1", "Missing file name after '@' at column 5"),
+    ("add [1] 2 3", "Vector operations take exactly two operands at column 12"),
+    ("add [1 2", "Invalid vector '[1 2' (missing ']') at column 5"),
+])
+def test_vector_errors_report_columns(line, message):
+    error = list(split_statements(line))[-1]
+    assert isinstance(error, StatementError)
+    assert str(error) == message
+
+
+@pytest.mark.parametrize("line",
+                         ["add 2 3", " x = add 1 2", "(1 + 2) * 3", "add 2 x", "max 1 2 3", "  "])
+def test_parse_statement_matches_split_statements(line):
+    # str() also compares StatementErrors, which are equal only to themselves
+    assert [str(parse_statement(line))] == ([str(s) for s in split_statements(line)] or [str(None)])
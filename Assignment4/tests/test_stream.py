@@ -0,0 +1,188 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Date: 10/18/2026
+# Project: Assignment 4 - Professional Calculator CLI
+# ----------------------------------------------------------
+
+"""
+tests/test_stream.py
+
+Unit tests for the streaming CSV/JSONL evaluator.
+Covers:
+- Results and passthrough columns for CSV and JSONL
+- Per-row errors reported in the error column
+- Bounded writes and constant memory on large inputs
+- The `main.py --stream` entry point (via subprocess)
+"""
+
+import json
+import tracemalloc
+from io import StringIO
+
+import pytest
+from app.stream import detect_format, evaluate_records, evaluate_stream, read_jsonl
+
+
+# -------------------------------------------------------------------
+# CSV
+# -------------------------------------------------------------------
+
+def test_csv_results_and_passthrough_columns():
+    out = StringIO()
+    summary = evaluate_stream(["op,a,b,customer\n", "add,2,3,acme\n", "divide,9,3,globex\n"], out)
+    assert out.getvalue() == (
+        "op,a,b,customer,result,error\n"
+        "add,2,3,acme,5.0,\n"
+        "divide,9,3,globex,3.0,\n"
+    )
+    assert summary.succeeded == 2
+    assert summary.exit_status == 0
+
+
+@pytest.mark.parametrize("row, message, field", [
+    ("divide,1,0", "Division by zero is not allowed.", "division_errors"),
+    ("modulus,1,2", "Unsupported calculation type: 'modulus'", "operation_errors"),
+    ("add,two,3", "Invalid number in 'a' or 'b'.", "format_errors"),
+    ("add,1", "Invalid number in 'a' or 'b'.", "format_errors"),
+])
+def test_csv_errors_go_to_the_error_column(row, message, field):
+    out = StringIO()
+    summary = evaluate_stream(["op,a,b\n", row + "\n", "add,1,1\n"], out)
+    lines = out.getvalue().splitlines()
+    assert message in lines[1]
+    assert lines[2] == "add,1,1,2.0,"  # the job carries on
+    assert getattr(summary, field) == 1
+    assert summary.processed == 2
+
+
+def test_csv_surplus_values_are_dropped():
+    out = StringIO()
+    evaluate_stream(["op,a,b\n", "add,1,2,extra\n"], out)
+    assert out.getvalue().splitlines()[1] == "add,1,2,3.0,"
+
+
+def test_custom_column_names():
+    out = StringIO()
+    summary = evaluate_stream(["kind,x,y\n", "multiply,4,5\n"], out, op_field="kind", a_field="x",
+                              b_field="y", result_field="value", error_field="problem")
+    assert out.getvalue() == "kind,x,y,value,problem\nmultiply,4,5,20.0,\n"
+    assert summary.succeeded == 1
+
+
+# -------------------------------------------------------------------
+# JSONL
+# -------------------------------------------------------------------
+
+def test_jsonl_results_and_errors():
+    lines = [
+        '{"op": "add", "a": 1, "b": "2", "id": 7}\n',
+        "\n",
+        "[1, 2]\n",
+        "{not json\n",
+        '{"op": "add", "a": 1}\n',
+        '{"op": "divide", "a": 1, "b": 0}\n',
+    ]
+    out = StringIO()
+    summary = evaluate_stream(lines, out, "jsonl")
+    rows = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert rows[0] == {"op": "add", "a": 1, "b": "2", "id": 7, "result": 3.0, "error": None}
+    assert rows[1] == {"result": None, "error": "Expected a JSON object on line 3."}
+    assert rows[2] == {"result": None, "error": "Invalid JSON on line 4."}
+    assert rows[3]["error"] == "Missing column 'b'."
+    assert rows[4]["error"] == "Division by zero is not allowed."
+    assert (summary.processed, summary.succeeded, summary.format_errors) == (5, 1, 3)
+
+
+def test_evaluate_records_without_summary():
+    records = list(evaluate_records(read_jsonl(['{"op": "subtract", "a": 5, "b": 2}'])))
+    assert records == [{"op": "subtract", "a": 5, "b": 2, "result": 3.0, "error": None}]
+
+
+def test_unknown_format():
+    with pytest.raises(ValueError, match="Unsupported format"):
+        evaluate_stream([], StringIO(), "xml")
+
+
+@pytest.mark.parametrize("path, fmt", [
+    ("jobs.csv", "csv"), ("jobs.JSONL", "jsonl"), ("jobs.ndjson", "jsonl"), ("-", "csv"),
+])
+def test_detect_format(path, fmt):
+    assert detect_format(path) == fmt
+
+
+# -------------------------------------------------------------------
+# Streaming Behaviour
+# -------------------------------------------------------------------
+
+class CountingWriter(StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, s):
+        self.writes += 1
+        return super().write(s)
+
+
+@pytest.mark.parametrize("fmt, lines", [
+    ("csv", ["op,a,b\n"] + [f"add,{i},1\n" for i in range(10)]),
+    ("jsonl", [json.dumps({"op": "add", "a": i, "b": 1}) for i in range(10)]),
+])
+def test_writes_in_bounded_chunks(fmt, lines):
+    out = CountingWriter()
+    summary = evaluate_stream(lines, out, fmt, flush_every=4)
+    assert summary.succeeded == 10
+    assert out.writes == 3  # 4 + 4 + final 2
+
+
+def test_empty_input_writes_nothing():
+    out = StringIO()
+    assert evaluate_stream([], out).processed == 0
+    assert out.getvalue() == ""
+
+
+def test_memory_does_not_grow_with_input_size():
+    class NullWriter:
+        def write(self, s):
+            return len(s)
+
+    def rows(count):
+        yield "op,a,b,note\n"
+        for i in range(count):
+            yield f"multiply,{i},1.5,row-{i}\n"
+
+    def peak(count):
+        tracemalloc.start()
+        try:
+            evaluate_stream(rows(count), NullWriter(), flush_every=256)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    small, large = peak(2_000), peak(40_000)
+    assert large < small * 2
+
+
+# -------------------------------------------------------------------
+# Entry Point Tests
+# -------------------------------------------------------------------
+
+def test_main_stream_csv_file(tmp_path, run_main):
+    jobs = tmp_path / "jobs.csv"
+    jobs.write_text("op,a,b\nadd,2,3\ndivide,1,0\n", encoding="utf-8")
+    proc = run_main("--stream", str(jobs))
+    assert proc.returncode == 1
+    assert proc.stdout.splitlines()[1] == "add,2,3,5.0,"
+    assert "Processed 2 calculations: 1 succeeded, 1 failed" in proc.stderr
+
+
+def test_main_stream_jsonl_from_stdin(run_main):
+    proc = run_main("--stream", "-", "--format", "jsonl", stdin='{"op": "add", "a": 1, "b": 1}\n')
+    assert proc.returncode == 0
+    assert json.loads(proc.stdout)["result"] == 2.0
+
+
+def test_main_stream_missing_file(tmp_path, run_main):
+    proc = run_main("--stream", str(tmp_path / "missing.csv"))
+    assert proc.returncode == 2
+    assert "Cannot read stream file" in proc.stderr
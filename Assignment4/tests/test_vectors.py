@@ -0,0 +1,150 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Date: 10/18/2026
+# Project: Assignment 4 - Professional Calculator CLI
+# ----------------------------------------------------------
+
+"""
+tests/test_vectors.py
+
+Unit tests for vector operands.
+Covers:
+- Vector literals and files of 8-byte floats (mapped, not copied)
+- Element-wise operations with number broadcasting, in Operations and the Calculation classes
+- Compact summaries of long results
+"""
+
+import operator
+from array import array
+from fractions import Fraction
+
+import pytest
+from app import numeric
+from app.calculation import CalculationFactory
+from app.operations import Operations
+from app.vectors import elementwise, from_values, is_vector, parse_vector, read_vector, summarize
+
+
+def write_floats(path, values):
+    with open(path, "wb") as file:
+        array("d", values).tofile(file)
+    return str(path)
+
+
+# -------------------------------------------------------------------
+# Reading Vectors
+# -------------------------------------------------------------------
+
+@pytest.mark.parametrize("word, expected", [
+    ("[1,2,3]", [1.0, 2.0, 3.0]),
+    ("[1, 2.5 , -3e2]", [1.0, 2.5, -300.0]),
+    ("[]", []),
+])
+def test_parse_literal(word, expected):
+    vector = parse_vector(word)
+    assert is_vector(vector) and vector.format == "d"
+    assert vector.tolist() == expected
+
+
+@pytest.mark.parametrize("word, message", [
+    ("[1,x,3]", r"Invalid vector '\[1,x,3\]' \('x' is not a number\)"),
+    ("[1,2", r"Invalid vector '\[1,2' \(missing '\]'\)"),
+    ("@", "Missing file name after '@'"),
+    ("@no/such/file.bin", r"Cannot read 'no/such/file.bin' \(No such file or directory\)"),
+])
+def test_invalid_vectors(word, message):
+    with pytest.raises(ValueError, match=message):
+        parse_vector(word)
+
+
+def test_file_is_mapped_in_place(tmp_path):
+    path = write_floats(tmp_path / "prices.bin", [1.5, 2.5, 4.0])
+    vector = parse_vector(f"@{path}")
+    assert vector.tolist() == [1.5, 2.5, 4.0]
+    assert vector.readonly and vector.obj is not None  # a view of the mapping, not a copy
+    assert read_vector(write_floats(tmp_path / "empty.bin", [])).tolist() == []
+
+
+def test_file_must_hold_whole_floats(tmp_path):
+    path = tmp_path / "odd.bin"
+    path.write_bytes(b"\0" * 12)
+    with pytest.raises(ValueError, match=r"does not hold 8-byte floats \(12 bytes\)"):
+        read_vector(str(path))
+
+
+# -------------------------------------------------------------------
+# Element-wise Operations
+# -------------------------------------------------------------------
+
+def test_elementwise_broadcasts_numbers():
+    v = from_values([1, 2, 3])
+    assert elementwise(operator.add, v, from_values([4, 5, 6])).tolist() == [5.0, 7.0, 9.0]
+    assert elementwise(operator.sub, v, 1).tolist() == [0.0, 1.0, 2.0]
+    assert elementwise(operator.truediv, 6, v).tolist() == [6.0, 3.0, 2.0]
+    with pytest.raises(ValueError, match="same length"):
+        elementwise(operator.add, v, from_values([1, 2]))
+    with pytest.raises(ZeroDivisionError, match="Cannot divide by zero."):
+        elementwise(operator.truediv, v, from_values([1, 0, 1]))
+
+
+def test_operations_apply_element_wise():
+    v, w = from_values([2, 4]), from_values([1, 2])
+    assert Operations.addition(v, w).tolist() == [3.0, 6.0]  # not concatenation
+    assert Operations.subtraction(10, v).tolist() == [8.0, 6.0]
+    assert Operations.multiplication(v, 3).tolist() == [6.0, 12.0]  # not repetition
+    assert Operations.division(v, w).tolist() == [2.0, 2.0]
+    with pytest.raises(ValueError, match="Division by zero is not allowed."):
+        Operations.division(v, 0)
+
+
+def test_operations_under_an_exact_backend():
+    with numeric.using("fraction"):
+        assert Operations.addition(from_values([1, 2]), Fraction(1, 2)).tolist() == [1.5, 2.5]
+        assert Operations.addition(Fraction(1, 3), Fraction(1, 6)) == Fraction(1, 2)
+
+
+@pytest.mark.parametrize("calc_type, expected", [
+    ("add", [5.0, 3.0, 9.0]),
+    ("subtract", [-3.0, 1.0, -3.0]),
+    ("multiply", [4.0, 2.0, 18.0]),
+    ("divide", [0.25, 2.0, 0.5]),
+    ("min", [1.0, 1.0, 3.0]),
+    ("max", [4.0, 2.0, 6.0]),
+    ("mean", [2.5, 1.5, 4.5]),  # no kernel: one Calculation per element
+])
+def test_calculation_classes_apply_element_wise(calc_type, expected):
+    calculation = CalculationFactory.create_calculation(calc_type, from_values([1, 2, 3]),
+                                                        from_values([4, 1, 6]))
+    assert calculation.execute().tolist() == expected
+    assert calculation.execute() is calculation.execute()  # memoized like any result
+
+
+def test_calculations_broadcast_and_check_divisors():
+    calculation = CalculationFactory.create_calculation("max", 2, from_values([1, 3]))
+    assert calculation.execute().tolist() == [2.0, 3.0]
+    with pytest.raises(ZeroDivisionError, match="Cannot divide by zero."):
+        CalculationFactory.create_calculation("divide", from_values([1, 2]), 0).execute()
+
+
+def test_vectors_skip_the_result_cache():
+    CalculationFactory.enable_result_cache()
+    try:
+        calculation = CalculationFactory.create_calculation("add", from_values([1]), 1)
+        assert calculation.execute().tolist() == [2.0]
+        assert CalculationFactory.cache_info()["misses"] == 0
+    finally:
+        CalculationFactory.disable_result_cache()
+
+
+# -------------------------------------------------------------------
+# Summaries
+# -------------------------------------------------------------------
+
+def test_summarize():
+    assert summarize(from_values([1, 2.5])) == "[1.0, 2.5]"
+    assert summarize(from_values([])) == "[]"
+    assert summarize(from_values(range(1, 1001))) == (
+        "[1.0, 2.0, 3.0, ..., 998.0, 999.0, 1000.0] (1,000 values, min 1.0, max 1000.0, mean 500.5)"
+    )
+    summary = summarize(from_values(range(4)), limit=3)
+    assert summary.startswith("[0.0, 1.0, 2.0, ..., 1.0, 2.0, 3.0] (4 values")
@@ -0,0 +1,164 @@
+"""
+bench/cases.py
+
+Benchmark cases for one calculator variant. This script is run by bench/run.py
+in a separate process per variant, with the variant folder as the working
+directory, because every variant ships its own top-level `app` package.
+
+Usage:
+    python ../bench/cases.py <variant> [--number N] [--repeat R]
+
+Every case is sampled R times, and each sample is taken right after a sample
+of a fixed pure-Python loop ("calibration.loop"), so both see the same machine
+state (frequency scaling, other load). Prints a JSON object mapping case names
+to {"ns": median nanoseconds per operation, "relative": median of the
+per-sample case/calibration ratios}; the ratio is what run.py compares.
+"""
+
+import argparse
+import builtins
+import contextlib
+import inspect
+import io
+import json
+import os
+import statistics
+import sys
+import timeit
+
+CALIBRATION_CASE = "calibration.loop"
+
+# Lines fed to each REPL; a realistic mix of the four operations
+REPL_LINES = ["add 12 30", "subtract 99 1.5", "multiply 6 7", "divide 22 7"]
+
+
+def run_repl(start, lines):
+    """Drive a REPL entry point over `lines` (followed by exit) with in-memory I/O."""
+    feed = iter(lines + ["exit"])
+    original_input = builtins.input
+    builtins.input = lambda _prompt="": next(feed)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            try:
+                start()
+            except SystemExit:
+                pass
+    finally:
+        builtins.input = original_input
+
+
+def calibration_workload():
+    """Interpreter-bound reference work whose cost only depends on the machine."""
+    total = 0.0
+    for i in range(20):
+        total += i * 0.5
+    return total
+
+
+def parse_line(line):
+    """The `<operation> <num1> <num2>` parsing every REPL variant performs inline."""
+    operation, num1, num2 = line.split()
+    return operation, float(num1), float(num2)
+
+
+# -------------------------------
+# Variant Case Tables
+# -------------------------------
+def module2_cases(repl_lines):
+    from app.calculator import calculator
+    from app.operations import addition, division
+
+    return {
+        "dispatch.function_add": lambda: addition(12.0, 30.0),
+        "dispatch.function_divide": lambda: division(22.0, 7.0),
+        "parse.split_float": lambda: parse_line("multiply 6 7"),
+        "repl.lines": lambda: run_repl(calculator, repl_lines),
+    }
+
+
+def assignment3_cases(repl_lines):
+    from app.calculator import Calculator
+    from app.operations import Operations
+
+    cases = {
+        "dispatch.staticmethod_add": lambda: Operations.addition(12.0, 30.0),
+        "dispatch.staticmethod_divide": lambda: Operations.division(22.0, 7.0),
+        "parse.split_float": lambda: parse_line("multiply 6 7"),
+        "repl.lines": lambda: run_repl(Calculator().run, repl_lines),
+    }
+    if hasattr(Calculator, "OPERATIONS"):  # the dispatch table is newer than the baseline tree
+        table = Calculator.OPERATIONS
+        cases["dispatch.table_divide"] = lambda: table["divide"](22.0, 7.0)
+    return cases
+
+
+def assignment4_cases(repl_lines):
+    from app.calculation import CalculationFactory
+    from app.calculator import calculator
+    from app.operations import Operations
+
+    create = CalculationFactory.create_calculation
+    cases = {
+        "dispatch.staticmethod_add": lambda: Operations.addition(12.0, 30.0),
+        "dispatch.staticmethod_divide": lambda: Operations.division(22.0, 7.0),
+        "dispatch.factory_execute": lambda: create("divide", 22.0, 7.0).execute(),
+        "factory.create": lambda: create("add", 12.0, 30.0),
+        "parse.split_float": lambda: parse_line("multiply 6 7"),
+        "repl.lines": lambda: run_repl(calculator, repl_lines),
+    }
+    # Cases for later additions; the baseline tree (see run.py) predates them, so they are
+    # only measured where they exist and are reported without a baseline
+    if hasattr(CalculationFactory, "evaluate"):
+        cases["dispatch.factory_evaluate"] = lambda: CalculationFactory.evaluate("divide", 22.0, 7.0)
+    if "intern" in inspect.signature(create).parameters:
+        # Against factory.create and dispatch.factory_execute: a repeat is served from the pool
+        cases["factory.create_interned"] = lambda: create("add", 12.0, 30.0, intern=True)
+        cases["dispatch.interned_execute"] = lambda: create("divide", 22.0, 7.0, intern=True).execute()
+    return cases
+
+
+VARIANTS = {
+    "Module2-Calculator": module2_cases,
+    "Assignment3": assignment3_cases,
+    "Assignment4": assignment4_cases,
+}
+
+
+def measure(cases, number, repeat, repl_lines):
+    """Return the median time per operation and its median ratio to the calibration loop, for every case."""
+    calibration = timeit.Timer(calibration_workload)
+    timers = {name: timeit.Timer(fn) for name, fn in cases.items()}
+    samples = {name: [] for name in [CALIBRATION_CASE, *cases]}
+    ratios = {name: [] for name in cases}
+    # Rounds over all cases, calibration first each time: a slow spell of the machine
+    # shows in both timings of a pair instead of in one case only
+    for _ in range(repeat):
+        for name, timer in timers.items():
+            reference = calibration.timeit(number) / number
+            # One REPL sample runs every line once; the other cases are single calls
+            per_op = timer.timeit(1) / len(repl_lines) if name.startswith("repl.") else timer.timeit(number) / number
+            samples[CALIBRATION_CASE].append(reference)
+            samples[name].append(per_op)
+            ratios[name].append(per_op / reference)
+    results = {name: {"ns": round(statistics.median(times) * 1e9, 2)} for name, times in samples.items()}
+    for name, values in ratios.items():
+        results[name]["relative"] = round(statistics.median(values), 4)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the benchmark cases of one variant")
+    parser.add_argument("variant", choices=sorted(VARIANTS))
+    parser.add_argument("--number", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=15)
+    parser.add_argument("--repl-lines", type=int, default=2_000)
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, os.getcwd())
+    repl_lines = [REPL_LINES[i % len(REPL_LINES)] for i in range(args.repl_lines)]
+    cases = VARIANTS[args.variant](repl_lines)
+    json.dump(measure(cases, args.number, args.repeat, repl_lines), sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+bench/run.py
+
+Stdlib-only microbenchmark suite for every calculator variant in the repository:
+
+- Module2-Calculator → module-level operation functions and its REPL
+- Assignment3        → Operations static methods and the if/elif Calculator.run REPL
+- Assignment4        → Operations, CalculationFactory + Calculation objects and its REPL
+
+Each variant is measured in its own process (see bench/cases.py). Results are
+written as JSON and compared against a checked-in baseline; the run fails when
+any case is slower than the baseline by more than the regression threshold.
+
+baseline.json was recorded once, on the tree before the performance work began
+(commit ca540bc), and is kept fixed: every change is measured against the same
+reference, so a slowdown cannot be absorbed by re-recording it. Cases added
+since then are reported without a baseline.
+
+What is compared is each case's time relative to a fixed pure-Python loop
+("calibration.loop") sampled right before it, so a baseline recorded on a
+faster or slower machine stays usable and a busy spell slows both timings of
+a pair alike. cases.py keeps the median ratio of its samples, and the
+variants are measured in several interleaved rounds (one process each) whose
+medians are combined, again by the median.
+
+Usage (from the repository root):
+    python bench/run.py                          # measure and compare
+    python bench/run.py --threshold 0.5          # allow up to 50% slowdown
+    python bench/run.py --rounds 5               # more processes per variant: steadier, slower
+    python bench/run.py --update-baseline        # record a new baseline (on the reference tree only)
+    python bench/run.py --variant Assignment4 --output results.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_ROOT = BENCH_DIR.parent
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+DEFAULT_OUTPUT = BENCH_DIR / "results.json"
+VARIANTS = ["Module2-Calculator", "Assignment3", "Assignment4"]
+DEFAULT_THRESHOLD = float(os.environ.get("BENCH_THRESHOLD", "0.30"))
+CALIBRATION_CASE = "calibration.loop"
+
+
+def run_variant(variant, number, repeat):
+    """Run bench/cases.py for one variant and return its {case: {"ns": ..., "relative": ...}} results."""
+    proc = subprocess.run(
+        [sys.executable, str(BENCH_DIR / "cases.py"), variant,
+         "--number", str(number), "--repeat", str(repeat)],
+        cwd=REPO_ROOT / variant,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Benchmarks for {variant} failed:\n{proc.stderr}")
+    return json.loads(proc.stdout)
+
+
+def combine(rounds):
+    """Merge the results of several rounds of one variant: the median of every value."""
+    return {
+        case: {key: round(statistics.median(result[case][key] for result in rounds), 4) for key in values}
+        for case, values in rounds[0].items()
+    }
+
+
+def measure(variants, number, repeat, rounds):
+    """Measure every variant `rounds` times, in turn, and return {variant: combined results}."""
+    measured = {variant: [] for variant in variants}
+    for _ in range(rounds):
+        for variant in variants:
+            measured[variant].append(run_variant(variant, number, repeat))
+    return {variant: combine(results) for variant, results in measured.items()}
+
+
+def compare(results, baseline, threshold):
+    """
+    Compare results with a baseline, by their time relative to the calibration loop.
+
+    Returns:
+        list[str]: one line per case (marked REGRESSION when over the threshold)
+        bool: True when at least one case regressed
+    """
+    lines, regressed = [], False
+    for variant, cases in results.items():
+        reference_cases = baseline.get(variant, {})
+        for case, current in cases.items():
+            if case == CALIBRATION_CASE:
+                continue
+            reference = reference_cases.get(case)
+            if reference is None:
+                lines.append(f"  {variant:<19} {case:<30} {current['ns']:10.1f} ns   (no baseline)")
+                continue
+            change = current["relative"] / reference["relative"] - 1
+            status = ""
+            if change > threshold:
+                status = "  REGRESSION"
+                regressed = True
+            lines.append(f"  {variant:<19} {case:<30} {current['ns']:10.1f} ns  {change:+7.1%}{status}")
+    return lines, regressed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Calculator microbenchmark suite")
+    parser.add_argument("--variant", action="append", choices=VARIANTS,
+                        help="variant to measure (repeatable; default: all)")
+    parser.add_argument("--number", type=int, default=20_000, help="calls per timing sample")
+    parser.add_argument("--repeat", type=int, default=15, help="timing samples per case and round (median is kept)")
+    parser.add_argument("--rounds", type=int, default=3, help="processes per variant, interleaved (median is kept)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown as a fraction of the baseline (default: %(default)s)")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="write the results to the baseline file instead of comparing")
+    args = parser.parse_args(argv)
+
+    results = measure(args.variant or VARIANTS, args.number, args.repeat, args.rounds)
+    report = {"python": platform.python_version(), "machine": platform.machine(), "results": results}
+    args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --update-baseline first.")
+        return 1
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))["results"]
+    lines, regressed = compare(results, baseline, args.threshold)
+    print(f"Results (threshold {args.threshold:.0%}, written to {args.output}):")
+    print("\n".join(lines))
+    if regressed:
+        print("Benchmark regression detected.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())